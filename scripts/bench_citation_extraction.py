@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Benchmark citation decoding on citation-heavy answers (100+ citations).
+
+Compares three strategies over a synthetic stream of cumulative answer frames:
+
+- per-frame: decode every frame's citations from scratch (the historical
+  behaviour before frames were parsed incrementally)
+- shared index: decode every frame through one _CitationIndex, so passages
+  already seen in earlier frames are reused
+- final only: decode the winning frame once (what query() does today)
+
+Run with: uv run python scripts/bench_citation_extraction.py [--citations 150] [--frames 50]
+
+No network access or authentication required.
+"""
+
+import argparse
+import time
+
+from notebooklm_tools.core.conversation import ConversationMixin, _CitationIndex
+
+
+def make_cell(text: str) -> list:
+    return [0, 10, [[0, len(text), [[[0, len(text), text]]]]]]
+
+
+def build_passage(index: int, n_sources: int) -> list:
+    """Build a passage with wrapped text segments and, every 10th one, a table."""
+    segments: list = [
+        [[0, 80, [[[0, 80, [f"Passage {index}, sentence {k}, quoted from the source."]]]]]]
+        for k in range(4)
+    ]
+    if index % 10 == 0:
+        rows = [[r * 51, r * 51 + 50, [make_cell(f"r{r}c{c}") for c in range(4)]] for r in range(6)]
+        segments.append([0, 200, None, None, [4, 6, rows]])
+    return [
+        [f"passage-{index}"],
+        [
+            None,
+            None,
+            0.8,
+            [[None, 0, 320]],
+            segments,
+            [[[f"source-{index % n_sources}"], "hash"]],
+            [f"passage-{index}"],
+        ],
+    ]
+
+
+def build_frames(citations: int, frames: int, n_sources: int = 25) -> list[list]:
+    """Build the type_info list of each cumulative frame."""
+    passages = [build_passage(i, n_sources) for i in range(citations)]
+    result = []
+    for k in range(1, frames + 1):
+        upto = citations * k // frames
+        result.append([None, None, None, passages[:upto], 1])
+    return result
+
+
+def timed(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--citations", type=int, default=150, help="Citations in final answer")
+    parser.add_argument("--frames", type=int, default=50, help="Number of cumulative frames")
+    parser.add_argument("--repeat", type=int, default=5, help="Best-of-N repetitions")
+    args = parser.parse_args()
+
+    frames = build_frames(args.citations, args.frames)
+
+    def per_frame() -> dict:
+        data: dict = {}
+        for type_info in frames:
+            data = ConversationMixin._extract_citation_data(type_info)
+        return data
+
+    def shared_index() -> dict:
+        index = _CitationIndex()
+        data: dict = {}
+        for type_info in frames:
+            data = index.build(type_info)
+        return data
+
+    def final_only() -> dict:
+        return ConversationMixin._extract_citation_data(frames[-1])
+
+    expected = final_only()
+    assert per_frame() == expected, "per-frame decode disagrees"
+    assert shared_index() == expected, "shared-index decode disagrees"
+
+    t_per_frame = timed(per_frame, args.repeat)
+    t_shared = timed(shared_index, args.repeat)
+    t_final = timed(final_only, args.repeat)
+
+    print(
+        f"{args.citations} citations over {len(expected['sources_used'])} sources, {args.frames} frames"
+    )
+    print(f"per-frame decode:    {t_per_frame * 1000:8.2f} ms")
+    print(f"shared index:        {t_shared * 1000:8.2f} ms  ({t_per_frame / t_shared:.1f}x)")
+    print(f"final frame only:    {t_final * 1000:8.2f} ms  ({t_per_frame / t_final:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Benchmark data table export on a large synthetic table.
+
+Builds a rich-text data table shaped like artifact[18] of a completed data
+table (every cell a deeply nested array of position markers and text runs)
+and exports it to CSV two ways, each in a fresh subprocess so peak RSS is
+measured independently:
+
+- legacy: recursive cell extraction, whole table parsed into lists, then
+  written with ``writerows`` (the pre-streaming download_data_table)
+- streaming: iterative cell extraction feeding the CSV writer row by row
+  (``_iter_data_table`` + ``_write_data_table``)
+
+Run with: uv run python scripts/bench_data_table_export.py [--rows 10000] [--cols 10]
+          [--repeat 5]
+
+No network access or authentication required.
+"""
+
+import argparse
+import csv
+import gc
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+from notebooklm_tools.core.download import DownloadMixin
+
+
+def build_cell(row: int, col: int) -> list:
+    """One cell: text runs wrapped in position-marker layers, like the real payload."""
+    text = f"r{row}c{col} value with a few words of text"
+    return [0, len(text), [[0, len(text), [[0, 20, [text[:20]]], [20, len(text), [text[20:]]]]]]]
+
+
+def build_table(rows: int, cols: int) -> list:
+    """Build raw_data with a header row plus `rows` data rows of `cols` cells."""
+    table_rows = [[0, 10, [build_cell(-1, c) for c in range(cols)]]]
+    table_rows += [[0, 10, [build_cell(r, c) for c in range(cols)]] for r in range(rows)]
+    return [[[[[None, None, None, None, [None, None, table_rows]]]]]]
+
+
+def legacy_extract(cell: Any, depth: int = 0) -> str:
+    """The pre-streaming recursive cell extractor."""
+    if depth > 100 or cell is None:
+        return ""
+    if isinstance(cell, str):
+        return cell.strip()
+    if isinstance(cell, (int, float)):
+        return ""
+    if isinstance(cell, list):
+        parts = []
+        for item in cell:
+            text = legacy_extract(item, depth + 1)
+            if text:
+                parts.append(text)
+        return " ".join(parts) if parts else ""
+    return str(cell).strip()
+
+
+def legacy_export(mixin: DownloadMixin, raw_data: list, output: Path) -> None:
+    rows_array = mixin._data_table_rows_array(raw_data)
+    headers: list[str] = []
+    rows: list[list[str]] = []
+    for i, row_section in enumerate(rows_array):
+        values = [legacy_extract(cell) for cell in row_section[2]]
+        if i == 0:
+            headers = values
+        else:
+            rows.append((values + [""] * len(headers))[: len(headers)])
+    with open(output, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f)
+        writer.writerow(headers)
+        writer.writerows(rows)
+
+
+def streaming_export(mixin: DownloadMixin, raw_data: list, output: Path) -> None:
+    mixin._write_data_table(mixin._iter_data_table(raw_data), output, "csv")
+
+
+EXPORTERS = {"legacy": legacy_export, "streaming": streaming_export}
+
+
+def measure(mode: str, rows: int, cols: int, repeat: int) -> dict:
+    """Export in this process and report best time, RSS growth and traced peak."""
+    mixin = DownloadMixin(cookies={"bench": "1"}, csrf_token="bench")
+    raw_data = build_table(rows, cols)
+    export = EXPORTERS[mode]
+    gc.collect()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp) / "table.csv"
+        baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        elapsed = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            export(mixin, raw_data, output)
+            elapsed = min(elapsed, time.perf_counter() - start)
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        size = output.stat().st_size
+
+        tracemalloc.start()
+        export(mixin, raw_data, output)
+        _, traced_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    return {
+        "seconds": elapsed,
+        "rss_growth": (peak_rss - baseline) * scale,
+        "traced_peak": traced_peak,
+        "bytes": size,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000, help="Data rows")
+    parser.add_argument("--cols", type=int, default=10, help="Columns")
+    parser.add_argument("--repeat", type=int, default=5, help="Best-of-N repetitions")
+    parser.add_argument("--mode", choices=sorted(EXPORTERS), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(measure(args.mode, args.rows, args.cols, args.repeat)))
+        return
+
+    results = {}
+    for mode in ("legacy", "streaming"):
+        out = subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                f"--mode={mode}",
+                f"--rows={args.rows}",
+                f"--cols={args.cols}",
+                f"--repeat={args.repeat}",
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        results[mode] = json.loads(out)
+
+    legacy, streaming = results["legacy"], results["streaming"]
+    assert legacy["bytes"] == streaming["bytes"], "exports differ in size"
+
+    mib = 1024 * 1024
+    print(f"table: {args.rows} rows x {args.cols} cols ({args.rows * args.cols} cells)")
+    print(f"csv: {streaming['bytes'] / mib:.1f} MiB")
+    print(f"{'':12}{'time':>10}{'RSS growth':>14}{'traced peak':>14}")
+    for mode in ("legacy", "streaming"):
+        r = results[mode]
+        print(
+            f"{mode:12}{r['seconds'] * 1000:8.0f} ms"
+            f"{r['rss_growth'] / mib:10.1f} MiB{r['traced_peak'] / mib:10.1f} MiB"
+        )
+    print(f"speedup:    {legacy['seconds'] / streaming['seconds']:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Benchmark query response parsing on long, citation-heavy answers.
+
+Builds a synthetic streamed response shaped like the GenerateFreeFormStreamed
+endpoint (every frame re-sends the cumulative answer and its citations) and
+compares the incremental parser against the legacy per-frame strategy, which
+decoded citations for every frame.
+
+Run with: uv run python scripts/bench_query_parsing.py [--chars 20000] [--frames 200]
+
+No network access or authentication required.
+"""
+
+import argparse
+import json
+import time
+
+from notebooklm_tools.core.conversation import ConversationMixin
+
+
+def build_passage(index: int, n_sources: int) -> list:
+    """Build one source passage entry (see ConversationMixin._extract_citation_data)."""
+    text = f"Passage {index} quoted from the source document with some context. " * 3
+    return [
+        [f"passage-{index}"],
+        [
+            None,
+            None,
+            0.8,
+            [[None, 0, len(text)]],
+            [[[0, len(text), [[[0, len(text), [text]]]]]]],
+            [[[f"source-{index % n_sources}"], "hash"]],
+            [f"passage-{index}"],
+        ],
+    ]
+
+
+def build_response(total_chars: int, frames: int, n_sources: int = 20) -> str:
+    """Build a raw response with `frames` cumulative answer frames."""
+    sentence = "The notebook explains this point in considerable detail [n]. "
+    parts = [")]}'"]
+    answer = ""
+    citations = 0
+    for k in range(1, frames + 1):
+        target = total_chars * k // frames
+        while len(answer) < target:
+            answer += sentence
+            citations += 1
+        passages = [build_passage(i, n_sources) for i in range(citations)]
+        first_elem = [answer, None, ["conv-id", "hash", 1], None, [None, None, None, passages, 1]]
+        inner = json.dumps([first_elem])
+        frame = json.dumps([["wrb.fr", None, inner]])
+        parts.append(str(len(frame)))
+        parts.append(frame)
+    return "\n".join(parts)
+
+
+def legacy_parse(mixin: ConversationMixin, response_text: str) -> tuple[str, dict]:
+    """Reference implementation of the pre-streaming parser (per-frame citations)."""
+    if response_text.startswith(")]}'"):
+        response_text = response_text[4:]
+    lines = response_text.strip().split("\n")
+    longest = ""
+    cdata_best: dict = {}
+    i = 0
+    while i < len(lines):
+        line = lines[i].strip()
+        if not line:
+            i += 1
+            continue
+        try:
+            int(line)
+            i += 1
+            chunk = lines[i] if i < len(lines) else ""
+        except ValueError:
+            chunk = line
+        i += 1
+        if mixin._extract_error_from_chunk(chunk):
+            continue
+        text, is_answer, cdata, _ = mixin._extract_answer_from_chunk(chunk)
+        if text and is_answer and len(text) > len(longest):
+            longest = text
+            if cdata:
+                cdata_best = cdata
+    return longest, cdata_best
+
+
+def timed(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chars", type=int, default=20_000, help="Final answer length")
+    parser.add_argument("--frames", type=int, default=200, help="Number of streamed frames")
+    parser.add_argument("--repeat", type=int, default=5, help="Best-of-N repetitions")
+    args = parser.parse_args()
+
+    mixin = ConversationMixin(cookies={"bench": "1"}, csrf_token="bench")
+    raw = build_response(args.chars, args.frames)
+
+    new_answer, new_cdata, _ = mixin._parse_query_response(raw)
+    old_answer, old_cdata = legacy_parse(mixin, raw)
+    assert new_answer == old_answer, "parsers disagree on the answer"
+    assert new_cdata == old_cdata, "parsers disagree on citation data"
+
+    legacy = timed(lambda: legacy_parse(mixin, raw), args.repeat)
+    incremental = timed(lambda: mixin._parse_query_response(raw), args.repeat)
+
+    print(
+        f"response: {len(raw) / 1e6:.1f} MB, {args.frames} frames, {len(new_answer)} answer chars"
+    )
+    print(f"citations in final answer: {len(new_cdata.get('citations', {}))}")
+    print(f"legacy per-frame parse:  {legacy * 1000:8.1f} ms")
+    print(f"incremental parse:       {incremental * 1000:8.1f} ms")
+    print(f"speedup:                 {legacy / incremental:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
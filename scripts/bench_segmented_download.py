@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Benchmark segmented (parallel byte-range) artifact downloads.
+
+Starts a local range-capable HTTP server that caps each connection's
+throughput, like Google's media CDNs do, and downloads the same file through
+`DownloadMixin._download_url` with one stream and with N concurrent ranges.
+
+Run with: uv run python scripts/bench_segmented_download.py [--size-mb 32] [--segments 1,4,8]
+
+No network access or authentication required.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from notebooklm_tools.core.download import DownloadMixin
+
+
+def make_handler(payload: bytes, per_connection_bps: int) -> type[BaseHTTPRequestHandler]:
+    """Build a handler serving `payload` with Range support and a per-connection rate cap."""
+    etag = '"' + hashlib.sha1(payload).hexdigest() + '"'
+    chunk = 64 * 1024
+
+    class RangeHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):  # noqa: A002
+            pass
+
+        def do_GET(self) -> None:
+            start, end = 0, len(payload) - 1
+            match = re.fullmatch(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+            ranged = match and self.headers.get("If-Range", etag) == etag
+            if ranged:
+                start = int(match.group(1))
+                end = min(int(match.group(2)), end) if match.group(2) else end
+            body = memoryview(payload)[start : end + 1]
+
+            self.send_response(206 if ranged else 200)
+            self.send_header("Content-Type", "video/mp4")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("ETag", etag)
+            if ranged:
+                self.send_header("Content-Range", f"bytes {start}-{end}/{len(payload)}")
+            self.end_headers()
+
+            for offset in range(0, len(body), chunk):
+                piece = body[offset : offset + chunk]
+                self.wfile.write(piece)
+                time.sleep(len(piece) / per_connection_bps)
+
+    return RangeHandler
+
+
+async def timed_download(url: str, output: Path, segments: int) -> float:
+    mixin = DownloadMixin(cookies={"bench": "1"}, csrf_token="bench")
+    start = time.perf_counter()
+    await mixin._download_url(url, str(output), segments=segments)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=32, help="File size in MiB")
+    parser.add_argument("--rate-mbps", type=float, default=8.0, help="Per-connection cap in MiB/s")
+    parser.add_argument(
+        "--segments", default="1,4,8", help="Comma-separated segment counts to compare"
+    )
+    args = parser.parse_args()
+
+    payload = os.urandom(args.size_mb * 1024 * 1024)
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), make_handler(payload, int(args.rate_mbps * 1024 * 1024))
+    )
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/artifact.mp4"
+
+    print(f"file: {args.size_mb} MiB, per-connection cap: {args.rate_mbps:.1f} MiB/s")
+    baseline = None
+    with tempfile.TemporaryDirectory() as tmp:
+        for segments in (int(n) for n in args.segments.split(",")):
+            output = Path(tmp) / f"artifact-{segments}.mp4"
+            elapsed = asyncio.run(timed_download(url, output, segments))
+            assert output.read_bytes() == payload, "downloaded bytes differ"
+            baseline = baseline or elapsed
+            throughput = args.size_mb / elapsed
+            print(
+                f"segments={segments:<3} {elapsed:7.2f} s  {throughput:7.1f} MiB/s  "
+                f"speedup {baseline / elapsed:5.2f}x"
+            )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -202,6 +202,7 @@ nlm notebook query <id> "question"     # Chat with sources
 nlm notebook query <id> "question" --json  # JSON output
 nlm notebook query <id> "follow up" --conversation-id <cid>  # Persists in web UI history
 nlm notebook query <id> "question" --source-ids <id1,id2>
+nlm notebook query-batch <id> --file questions.txt --concurrency 4 -o answers.jsonl  # One question per line, JSONL results
 ```
 
 **Verb-First:**
@@ -231,6 +232,11 @@ nlm source add <notebook-id> --url "https://youtube.com/..." # Add YouTube
 nlm source add <notebook-id> --text "content" --title "Title"  # Add text
 nlm source add <notebook-id> --file /path/to/doc.pdf        # Upload local file
 nlm source add <notebook-id> --file doc.pdf --wait          # Upload and wait until processed
+nlm source add <notebook-id> --file a.pdf --file b.pdf -c 8 # Upload many files concurrently
+nlm source add <notebook-id> --file talk.mp3 --resume       # Resume an interrupted upload
+nlm source add <notebook-id> --file a.pdf --dedupe          # Skip content the notebook already has
+nlm source add-dir <notebook-id> ./papers --glob '**/*.pdf' # Upload a directory (re-run resumes)
+nlm source add-urls <notebook-id> urls.txt --report r.jsonl  # Bulk-add URLs in chunks, per-URL status
 nlm source add <notebook-id> --drive <doc-id>              # Add Drive doc
 nlm source add <notebook-id> --drive <doc-id> --type slides  # Add Drive slides
 # Types: doc, slides, sheets, pdf
@@ -243,11 +249,15 @@ nlm source describe <source-id> --json # JSON output
 nlm source content <source-id>         # Raw text content
 nlm source content <source-id> --json  # JSON output
 nlm source content <source-id> --output file.txt  # Export to file
+nlm source content <source-id> --limit 20000 --offset 40000  # One page of a large source
+nlm source export-all <notebook-id> --out sources.jsonl  # All sources' text as JSONL (cached)
+nlm search "terms" --notebook <notebook-id>  # Ranked snippets from a local full-text index
 nlm source rename <source-id> "New Title" --notebook <notebook-id>  # Rename source
 nlm source delete <source-id> --confirm  # Delete source
 nlm source stale <notebook-id>         # List stale Drive sources
 nlm source sync <notebook-id> --confirm  # Sync all stale
 nlm source sync <notebook-id> --source-ids <ids> --confirm  # Sync specific
+nlm source drive-sync <nb-1> <nb-2> -c 16 --confirm  # Parallel check + sync across notebooks
 ```
 
 **Verb-First:**
@@ -524,12 +534,16 @@ nlm delete artifact <notebook-id> <artifact-id> --confirm  # Delete artifact
 nlm download audio <notebook-id> --id <artifact-id>              # Download specific audio
 nlm download audio <notebook-id> --output podcast.mp3          # Download latest audio to file
 nlm download video <notebook-id>                               # Download latest video (default filename)
+nlm download video <notebook-id> --segments 8                  # Parallel byte ranges (large files)
+nlm download audio <notebook-id> --output - | ffmpeg -i pipe:0 out.mp3  # Stream to stdout
 nlm download report <notebook-id> --output report.md           # Download report
 nlm download mind-map <notebook-id>                            # Download mind map
 nlm download slide-deck <notebook-id>                          # Download slides (PDF)
 nlm download slide-deck <notebook-id> --format pptx            # Download slides (PPTX)
 nlm download infographic <notebook-id>                         # Download infographic
-nlm download data-table <notebook-id>                          # Download data table
+nlm download data-table <notebook-id>                          # Download data table (CSV)
+nlm download data-table <notebook-id> --format jsonl           # One JSON object per row
+nlm download all --notebooks <id1>,<id2> --out ./artifacts     # All completed artifacts (--all, --types)
 ```
 
 **Download Workflow:**
@@ -632,6 +646,9 @@ nlm batch add-source "https://..." --tags "research"
 nlm batch create "Project A, Project B, Project C"        # Create multiple
 nlm batch delete --notebooks "id1,id2" --confirm
 nlm batch studio audio --tags "research"
+nlm batch studio audio --all --queue --download ./podcasts  # Durable queue: track, retry, download
+nlm batch queue-run --wait-for-quota                       # Resume the queue
+nlm batch queue-status                                     # Jobs and learned quota
 ```
 
 ### Cross-Notebook Query
@@ -1,5 +1,7 @@
 """Batch CLI commands — perform operations across multiple notebooks."""
 
+import time
+
 import typer
 from rich.table import Table
 
@@ -147,16 +149,54 @@ def batch_studio(
     ),
     tags: str | None = typer.Option(None, "--tags", "-t", help="Comma-separated tags"),
     all_notebooks: bool = typer.Option(False, "--all", "-a", help="Generate for ALL notebooks"),
+    queue: bool = typer.Option(
+        False,
+        "--queue",
+        "-q",
+        help="Add to the durable studio queue and run it: track each generation, retry failures, respect quota",
+    ),
+    download: str | None = typer.Option(
+        None,
+        "--download",
+        "-d",
+        help="With --queue: download finished artifacts into this directory",
+    ),
+    concurrency: int = typer.Option(
+        2, "--concurrency", "-c", help="With --queue: max generations in flight (1-8)"
+    ),
+    daily_limit: int | None = typer.Option(
+        None, "--daily-limit", help="With --queue: max generations started per 24 hours"
+    ),
+    max_attempts: int = typer.Option(
+        3, "--max-attempts", help="With --queue: generations to try per notebook"
+    ),
+    profile: str | None = typer.Option(None, "--profile", "-p", help="Profile to use"),
 ) -> None:
     """Generate studio artifacts across multiple notebooks."""
     from notebooklm_tools.cli.utils import get_client
     from notebooklm_tools.services import batch as batch_service
 
     try:
-        client = get_client()
+        client = get_client(profile)
         names = [n.strip() for n in notebooks.split(",") if n.strip()] if notebooks else None
         tag_list = [t.strip() for t in tags.split(",") if t.strip()] if tags else None
 
+        if queue:
+            account = _queue_account(profile)
+            job_ids = batch_service.queue_batch_studio(
+                client,
+                artifact_type,
+                names,
+                tag_list,
+                all_notebooks,
+                account=account,
+                download_dir=download,
+                max_attempts=max_attempts,
+            )
+            console.print(f"Queued {len(job_ids)} {artifact_type} job(s) for {account}.")
+            _run_queue(client, account, concurrency, daily_limit, wait_for_quota=False)
+            return
+
         with console.status(f"[dim]Generating {artifact_type} artifacts...[/dim]"):
             result = batch_service.batch_studio(
                 client, artifact_type, names, tag_list, all_notebooks
@@ -165,3 +205,115 @@ def batch_studio(
     except ServiceError as e:
         console.print(f"[red]Error:[/red] {e.user_message}")
         raise typer.Exit(1) from e
+
+
+@app.command("queue-run")
+def batch_queue_run(
+    concurrency: int = typer.Option(
+        2, "--concurrency", "-c", help="Max generations in flight (1-8)"
+    ),
+    daily_limit: int | None = typer.Option(
+        None, "--daily-limit", help="Max generations started per 24 hours (default: learned)"
+    ),
+    wait_for_quota: bool = typer.Option(
+        False, "--wait-for-quota", help="Sleep through quota pauses instead of exiting"
+    ),
+    profile: str | None = typer.Option(None, "--profile", "-p", help="Profile to use"),
+) -> None:
+    """Run (or resume) the durable studio queue until it is empty."""
+    from notebooklm_tools.cli.utils import get_client
+
+    try:
+        client = get_client(profile)
+        _run_queue(client, _queue_account(profile), concurrency, daily_limit, wait_for_quota)
+    except ServiceError as e:
+        console.print(f"[red]Error:[/red] {e.user_message}")
+        raise typer.Exit(1) from e
+
+
+@app.command("queue-status")
+def batch_queue_status(
+    state: str | None = typer.Option(
+        None,
+        "--state",
+        "-s",
+        help="Only jobs in this state (queued, generating, completed, failed)",
+    ),
+    profile: str | None = typer.Option(None, "--profile", "-p", help="Profile to use"),
+) -> None:
+    """Show the durable studio queue's jobs and the account's learned quota."""
+    from notebooklm_tools.core.studio_jobs import get_studio_job_store
+
+    account = _queue_account(profile)
+    store = get_studio_job_store()
+    counts = store.counts(account)
+    daily_limit, paused_until = store.quota(account)
+
+    table = Table(title=f"Studio queue for {account}")
+    table.add_column("Job", justify="right")
+    table.add_column("Notebook", style="cyan")
+    table.add_column("Type")
+    table.add_column("State")
+    table.add_column("Tries", justify="right")
+    table.add_column("Details", style="dim")
+    for job in store.jobs(account, state):
+        details = job["error"] or job["path"] or job["artifact_id"] or ""
+        table.add_row(
+            str(job["job_id"]),
+            job["notebook_id"][:12],
+            job["artifact_type"],
+            job["state"],
+            f"{job['attempts']}/{job['max_attempts']}",
+            details[:80],
+        )
+    console.print(table)
+    console.print(
+        ", ".join(f"{name}: {count}" for name, count in sorted(counts.items())) or "Queue is empty."
+    )
+    console.print(
+        f"Started in the last 24h: {store.starts_today(account)}"
+        f" (learned daily limit: {daily_limit or 'unknown'})"
+    )
+    if paused_until > time.time():
+        console.print(f"[yellow]Paused until {time.ctime(paused_until)}[/yellow]")
+
+
+def _queue_account(profile: str | None) -> str:
+    """Queue jobs and quota are kept per profile (one Google account each)."""
+    from notebooklm_tools.utils.config import get_config
+
+    return profile or get_config().auth.default_profile
+
+
+def _run_queue(
+    client, account: str, concurrency: int, daily_limit: int | None, wait_for_quota: bool
+) -> None:
+    from notebooklm_tools.services import studio_queue as studio_queue_service
+
+    styles = {"completed": "green", "failed": "red", "retrying": "yellow", "paused": "yellow"}
+
+    def on_event(event: studio_queue_service.QueueEvent) -> None:
+        style = styles.get(event["state"], "dim")
+        detail = event["error"] or event["path"] or event["artifact_id"] or ""
+        console.print(
+            f"[{style}]{event['state']:>9}[/{style}] job {event['job_id']}"
+            f" {event['artifact_type']} in {event['notebook_id'][:12]}  [dim]{detail}[/dim]"
+        )
+
+    result = studio_queue_service.run_studio_queue(
+        client,
+        account=account,
+        concurrency=concurrency,
+        daily_limit=daily_limit,
+        wait_for_quota=wait_for_quota,
+        on_event=on_event,
+    )
+    console.print(
+        f"Completed {result['completed']}, failed {result['failed']};"
+        f" {result['queued']} still queued."
+    )
+    if result["paused_until"]:
+        console.print(
+            f"[yellow]Quota paused until {time.ctime(result['paused_until'])}.[/yellow]"
+            " Run `nlm batch queue-run` then (or pass --wait-for-quota)."
+        )
@@ -1,13 +1,18 @@
 """Download CLI commands."""
 
 import asyncio
+import os
+import sys
+import time
 from collections.abc import Callable
 from typing import Any
 
 import typer
+from rich import filesize
 from rich.progress import (
     BarColumn,
     DownloadColumn,
+    MofNCompleteColumn,
     Progress,
     TextColumn,
     TimeRemainingColumn,
@@ -17,6 +22,7 @@ from rich.progress import (
 from notebooklm_tools.cli.utils import get_client, handle_error, make_console
 from notebooklm_tools.core.alias import get_alias_manager
 from notebooklm_tools.core.errors import ArtifactNotReadyError
+from notebooklm_tools.core.exceptions import NLMError
 from notebooklm_tools.services import ServiceError
 from notebooklm_tools.services import downloads as downloads_service
 
@@ -64,12 +70,19 @@ def _streaming_download(
     default_suffix: str,
     description: str,
     slide_deck_format: str = "pdf",
+    segments: int = 1,
 ) -> None:
     """Common pattern for streaming (async with progress) downloads."""
     notebook_id = get_alias_manager().resolve(notebook_id)
     downloads_service.validate_artifact_type(artifact_type)
 
     client = get_client()
+    if output == "-":
+        if segments > 1:
+            err_console.print("[red]Error:[/red] --segments needs a file output, not stdout.")
+            raise typer.Exit(1)
+        _stream_to_stdout(client, notebook_id, artifact_type, artifact_id, slide_deck_format)
+        return
     path = output or f"{notebook_id}_{default_suffix}"
 
     try:
@@ -83,6 +96,7 @@ def _streaming_download(
                     artifact_id=artifact_id,
                     progress_callback=cb,
                     slide_deck_format=slide_deck_format,
+                    segments=segments,
                 )
             )["path"],
             description,
@@ -101,12 +115,47 @@ def _streaming_download(
         handle_error(e)
 
 
+def _stream_to_stdout(
+    client: Any,
+    notebook_id: str,
+    artifact_type: str,
+    artifact_id: str | None,
+    slide_deck_format: str,
+) -> None:
+    """Write an artifact to stdout as it downloads (`--output -`), for pipes."""
+    out = sys.stdout.buffer
+
+    async def _pump() -> None:
+        async for chunk in downloads_service.stream_artifact(
+            client,
+            notebook_id,
+            artifact_type,
+            artifact_id=artifact_id,
+            slide_deck_format=slide_deck_format,
+        ):
+            out.write(chunk)
+        out.flush()
+
+    try:
+        asyncio.run(_pump())
+    except BrokenPipeError:
+        # The reader (e.g. `head` or ffmpeg) exited early; silence the flush at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        raise typer.Exit(1) from None
+    except ServiceError as e:
+        err_console.print(f"[red]Error:[/red] {e.user_message}")
+        raise typer.Exit(1) from e
+    except Exception as e:
+        handle_error(e)
+
+
 def _simple_download(
     notebook_id: str,
     artifact_type: str,
     output: str | None,
     artifact_id: str | None,
     default_suffix: str,
+    output_format: str = "json",
 ) -> None:
     """Common pattern for simple (synchronous) downloads."""
     notebook_id = get_alias_manager().resolve(notebook_id)
@@ -122,6 +171,7 @@ def _simple_download(
             artifact_type,
             path,
             artifact_id=artifact_id,
+            output_format=output_format,
         )
         console.print(
             f"[green]✓[/green] Downloaded {artifact_type.replace('_', ' ')} to: {result['path']}"
@@ -190,14 +240,27 @@ def _interactive_download(
 def download_audio(
     notebook_id: str = typer.Argument(..., help="Notebook ID"),
     output: str | None = typer.Option(
-        None, "--output", "-o", help="Output path (default: ./{notebook_id}_audio.m4a)"
+        None,
+        "--output",
+        "-o",
+        help="Output path, or - for stdout (default: ./{notebook_id}_audio.m4a)",
     ),
     artifact_id: str | None = typer.Option(None, "--id", help="Specific artifact ID"),
     no_progress: bool = typer.Option(False, "--no-progress", help="Disable download progress bar"),
+    segments: int = typer.Option(
+        1, "--segments", help="Fetch N byte ranges in parallel (1-16) for faster large downloads"
+    ),
 ):
     """Download Audio Overview."""
     _streaming_download(
-        notebook_id, "audio", output, artifact_id, no_progress, "audio.m4a", "Downloading audio"
+        notebook_id,
+        "audio",
+        output,
+        artifact_id,
+        no_progress,
+        "audio.m4a",
+        "Downloading audio",
+        segments=segments,
     )
 
 
@@ -205,14 +268,27 @@ def download_audio(
 def download_video(
     notebook_id: str = typer.Argument(..., help="Notebook ID"),
     output: str | None = typer.Option(
-        None, "--output", "-o", help="Output path (default: ./{notebook_id}_video.mp4)"
+        None,
+        "--output",
+        "-o",
+        help="Output path, or - for stdout (default: ./{notebook_id}_video.mp4)",
     ),
     artifact_id: str | None = typer.Option(None, "--id", help="Specific artifact ID"),
     no_progress: bool = typer.Option(False, "--no-progress", help="Disable download progress bar"),
+    segments: int = typer.Option(
+        1, "--segments", help="Fetch N byte ranges in parallel (1-16) for faster large downloads"
+    ),
 ):
     """Download Video Overview."""
     _streaming_download(
-        notebook_id, "video", output, artifact_id, no_progress, "video.mp4", "Downloading video"
+        notebook_id,
+        "video",
+        output,
+        artifact_id,
+        no_progress,
+        "video.mp4",
+        "Downloading video",
+        segments=segments,
     )
 
 
@@ -220,7 +296,10 @@ def download_video(
 def download_slide_deck(
     notebook_id: str = typer.Argument(..., help="Notebook ID"),
     output: str | None = typer.Option(
-        None, "--output", "-o", help="Output path (default: ./{notebook_id}_slides.{ext})"
+        None,
+        "--output",
+        "-o",
+        help="Output path, or - for stdout (default: ./{notebook_id}_slides.{ext})",
     ),
     artifact_id: str | None = typer.Option(None, "--id", help="Specific artifact ID"),
     no_progress: bool = typer.Option(False, "--no-progress", help="Disable download progress bar"),
@@ -248,7 +327,10 @@ def download_slide_deck(
 def download_infographic(
     notebook_id: str = typer.Argument(..., help="Notebook ID"),
     output: str | None = typer.Option(
-        None, "--output", "-o", help="Output path (default: ./{notebook_id}_infographic.png)"
+        None,
+        "--output",
+        "-o",
+        help="Output path, or - for stdout (default: ./{notebook_id}_infographic.png)",
     ),
     artifact_id: str | None = typer.Option(None, "--id", help="Specific artifact ID"),
     no_progress: bool = typer.Option(False, "--no-progress", help="Disable download progress bar"),
@@ -296,12 +378,19 @@ def download_mind_map(
 def download_data_table(
     notebook_id: str = typer.Argument(..., help="Notebook ID"),
     output: str | None = typer.Option(
-        None, "--output", "-o", help="Output path (default: ./{notebook_id}_table.csv)"
+        None, "--output", "-o", help="Output path (default: ./{notebook_id}_table.{ext})"
     ),
     artifact_id: str | None = typer.Option(None, "--id", help="Specific artifact ID"),
+    format: str = typer.Option(
+        "csv", "--format", "-f", help="File format: csv (default) or jsonl (one object per row)"
+    ),
 ):
-    """Download Data Table (CSV)."""
-    _simple_download(notebook_id, "data_table", output, artifact_id, "table.csv")
+    """Download Data Table (CSV or JSONL)."""
+    fmt = format.lower()
+    if fmt not in downloads_service.DATA_TABLE_FORMATS:
+        err_console.print("[red]Error:[/red] --format must be 'csv' or 'jsonl'")
+        raise typer.Exit(1)
+    _simple_download(notebook_id, "data_table", output, artifact_id, f"table.{fmt}", fmt)
 
 
 # --- Interactive format downloads (quiz/flashcards) ---
@@ -335,3 +424,124 @@ def download_flashcards_cmd(
 ):
     """Download Flashcards."""
     _interactive_download(notebook_id, "flashcards", output, artifact_id, format)
+
+
+# --- Bulk download ---
+
+
+@app.command("all")
+def download_all(
+    notebooks: str | None = typer.Option(
+        None, "--notebooks", "-n", help="Comma-separated notebook IDs or aliases"
+    ),
+    all_notebooks: bool = typer.Option(False, "--all", help="Download from every notebook"),
+    types: str | None = typer.Option(
+        None,
+        "--types",
+        "-t",
+        help="Comma-separated types, e.g. audio,video,report (default: all)",
+    ),
+    out: str = typer.Option(".", "--out", "-o", help="Directory to download into"),
+    concurrency: int = typer.Option(6, "--concurrency", "-c", help="Files in flight (1-16)"),
+    per_host: int = typer.Option(
+        4, "--per-host", help="Files in flight from one media host (1-16)"
+    ),
+    format: str = typer.Option(
+        "json", "--format", "-f", help="Quiz/flashcards format: json, markdown, or html"
+    ),
+    no_progress: bool = typer.Option(False, "--no-progress", help="Disable download progress bar"),
+):
+    """Download every completed artifact from one or more notebooks.
+
+    Each notebook's artifacts are listed once, then all files download
+    concurrently into <out>/<notebook-id>/<type>_<artifact-id>.<ext>.
+    Files already on disk are skipped, so re-running resumes a bulk download.
+
+    Examples:
+        nlm download all --notebooks <nb-a>,<nb-b> --types audio,video --out ./artifacts
+        nlm download all --all --types report,data-table -o ./exports
+    """
+    if bool(notebooks) == all_notebooks:
+        err_console.print("[red]Error:[/red] Pass either --notebooks or --all.")
+        raise typer.Exit(1)
+    type_list = (
+        [t.strip().replace("-", "_") for t in types.split(",") if t.strip()] if types else None
+    )
+
+    try:
+        client = get_client()
+        if all_notebooks:
+            notebook_ids = [nb.id for nb in client.list_notebooks()]
+        else:
+            notebook_ids = [
+                get_alias_manager().resolve(nb.strip()) for nb in notebooks.split(",") if nb.strip()
+            ]
+
+        started = time.monotonic()
+        plan = downloads_service.plan_bulk_download(
+            client, notebook_ids, out, types=type_list, output_format=format
+        )
+        items = plan["items"]
+        if not items:
+            console.print("[dim]No completed artifacts to download.[/dim]")
+            return
+
+        counts: dict[str, int] = {}
+
+        async def _run(progress: Progress | None) -> None:
+            task_id = (
+                progress.add_task("Downloading", total=len(items), transferred="")
+                if progress
+                else None
+            )
+
+            def on_bytes(done: int, total: int) -> None:
+                rate = done / max(time.monotonic() - started, 1e-3)
+                progress.update(
+                    task_id,
+                    transferred=f"{filesize.decimal(done)} at {filesize.decimal(int(rate))}/s",
+                )
+
+            results = downloads_service.run_bulk_download(
+                client,
+                plan,
+                concurrency=concurrency,
+                per_host=per_host,
+                output_format=format,
+                progress_callback=on_bytes if progress else None,
+            )
+            async for item in results:
+                counts[item["status"]] = counts.get(item["status"], 0) + 1
+                if progress:
+                    progress.advance(task_id)
+                if item["status"] == "failed":
+                    console.print(
+                        f"[red]✗[/red] {item['artifact_type']} {item['artifact_id']} "
+                        f"({item['notebook_id']}): {item['error']}",
+                        highlight=False,
+                    )
+
+        if no_progress:
+            asyncio.run(_run(None))
+        else:
+            # One aggregate display: files done out of planned, plus bytes moved
+            with Progress(
+                TextColumn("[bold blue]{task.description}"),
+                BarColumn(bar_width=None),
+                MofNCompleteColumn(),
+                TextColumn("[dim]{task.fields[transferred]}"),
+                console=console,
+                transient=True,
+            ) as progress:
+                asyncio.run(_run(progress))
+
+        elapsed = time.monotonic() - started
+        summary = ", ".join(f"{n} {status}" for status, n in sorted(counts.items()))
+        console.print(f"{summary} [dim]({elapsed:.1f}s) → {out}[/dim]")
+        if counts.get("failed"):
+            raise typer.Exit(1)
+    except ServiceError as e:
+        err_console.print(f"[red]Error:[/red] {e.user_message}")
+        raise typer.Exit(1) from e
+    except NLMError as e:
+        handle_error(e)
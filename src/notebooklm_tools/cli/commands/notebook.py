@@ -1,5 +1,9 @@
 """Notebook CLI commands."""
 
+import json
+import sys
+from pathlib import Path
+
 import typer
 
 from notebooklm_tools.cli.formatters import detect_output_format, get_formatter
@@ -183,3 +187,80 @@ def query_notebook(
         formatter.format_item(result, title="Query Response")
     except (ServiceError, NLMError) as e:
         handle_error(e, json_output=locals().get("json_output", False))
+
+
+@app.command("query-batch")
+def query_batch(
+    notebook_id: str = typer.Argument(..., help="Notebook ID"),
+    file: str = typer.Option(
+        ..., "--file", "-f", help="Questions file, one per line ('-' for stdin)"
+    ),
+    output: str | None = typer.Option(
+        None, "--output", "-o", help="Write JSONL results to file (default: stdout)"
+    ),
+    concurrency: int = typer.Option(
+        4, "--concurrency", "-n", help="Questions in flight at once (1-16)"
+    ),
+    source_ids: str | None = typer.Option(
+        None,
+        "--source-ids",
+        "-s",
+        help="Comma-separated source IDs to query (default: all)",
+    ),
+    profile: str | None = typer.Option(None, "--profile", "-p", help="Profile to use"),
+    timeout: float | None = typer.Option(
+        None, "--timeout", "-t", help="Per-question timeout in seconds (default: 120)"
+    ),
+) -> None:
+    """Ask many questions of one notebook, streaming results as JSONL.
+
+    Each question is answered in its own conversation. One JSON object is
+    written per line as soon as its answer arrives, so results are in
+    completion order; use the "index" field (0-based input line, counting
+    blank lines) to match them to input lines.
+    """
+    try:
+        if file == "-":
+            lines = sys.stdin.read().splitlines()
+        else:
+            try:
+                lines = Path(file).read_text(encoding="utf-8").splitlines()
+            except OSError as e:
+                console.print(f"[red]Error:[/red] Cannot read questions file: {e}")
+                raise typer.Exit(1) from e
+        sources = source_ids.split(",") if source_ids else None
+        notebook_id = get_alias_manager().resolve(notebook_id)
+
+        with get_client(profile) as client:
+            results = chat_service.query_many(
+                client,
+                notebook_id,
+                lines,
+                source_ids=sources,
+                concurrency=concurrency,
+                timeout=timeout,
+            )
+            out = open(output, "w", encoding="utf-8") if output else sys.stdout  # noqa: SIM115
+            failed = 0
+            total = 0
+            try:
+                for item in results:
+                    total += 1
+                    if item["error"]:
+                        failed += 1
+                    out.write(json.dumps(item, ensure_ascii=False) + "\n")
+                    out.flush()
+                    if output:
+                        console.print(f"[dim]{total} answered ({failed} failed)[/dim]", end="\r")
+            finally:
+                if output:
+                    out.close()
+
+        if output:
+            console.print(
+                f"[green]✓[/green] {total - failed}/{total} questions answered → {output}"
+            )
+        if failed:
+            raise typer.Exit(1)
+    except (ServiceError, NLMError) as e:
+        handle_error(e)
@@ -2,9 +2,13 @@
 
 import contextlib
 import re
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 
+from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
+from rich.spinner import Spinner
 
 from notebooklm_tools.cli.utils import get_client, handle_error, make_console
 from notebooklm_tools.core.alias import get_alias_manager
@@ -55,25 +59,59 @@ def _parse_citations(text: str) -> set[int]:
     return citations
 
 
+def _result_or(future: Future | None, default):
+    """Wait for a prefetch future, returning `default` if it is absent or failed."""
+    if future is None:
+        return default
+    try:
+        result = future.result()
+    except Exception:
+        return default
+    return result if result is not None else default
+
+
+@contextlib.contextmanager
+def _prefetcher() -> Iterator[ThreadPoolExecutor]:
+    """Worker pool for warm-up tasks, drained on exit.
+
+    Exit it before the client it submits work for is closed: queued tasks are
+    cancelled, and running ones are waited for so they never touch (or reopen
+    connections on) a closed client.
+    """
+    executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="nlm-repl-prefetch")
+    try:
+        yield executor
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 def run_chat_repl(notebook_id: str, profile: str | None = None) -> None:
     """Run interactive chat session with a notebook."""
     notebook_id = get_alias_manager().resolve(notebook_id)
 
+    # Background warm-up: while the user reads the banner and types the first
+    # question, fetch /sources metadata and the persistent conversation ID and
+    # open the query connection, so the first answer costs the same as later ones.
     try:
-        with get_client(profile) as client:
+        with get_client(profile) as client, _prefetcher() as prefetch:
             # Use normalized notebook metadata so notebooks with source_count
             # but no inline sources still display the correct banner.
             notebook = notebook_service.get_notebook(client, notebook_id)
             notebook_title = notebook.get("title", "Notebook")
             source_count = notebook.get("source_count", 0)
-            sources_list = notebook.get("sources", [])
+            summary_sources = notebook.get("sources", [])
+            source_ids = [src["id"] for src in summary_sources if src.get("id")] or None
 
             # REPL /sources needs typed source metadata, which may not be
             # present in normalized notebook details. Fetch it separately when
             # the notebook is not empty, falling back to summary data on error.
-            if source_count > 0:
-                with contextlib.suppress(Exception):
-                    sources_list = client.get_notebook_sources_with_types(notebook_id)
+            sources_future = (
+                prefetch.submit(client.get_notebook_sources_with_types, notebook_id)
+                if source_count > 0
+                else None
+            )
+            conversation_future = prefetch.submit(client.get_conversation_id, notebook_id)
+            prefetch.submit(client.warm_query_client)
 
             # Welcome banner
             console.print(
@@ -115,6 +153,7 @@ def run_chat_repl(notebook_id: str, profile: str | None = None) -> None:
                             continue
 
                         elif cmd == "/sources":
+                            sources_list = _result_or(sources_future, summary_sources)
                             if sources_list:
                                 console.print("\n[bold]Sources:[/bold]")
                                 for i, src in enumerate(sources_list, 1):
@@ -140,25 +179,43 @@ def run_chat_repl(notebook_id: str, profile: str | None = None) -> None:
                     # Query the notebook
                     turn_number += 1
 
-                    with console.status("[dim]Thinking...[/dim]", spinner="dots"):
+                    # The first question of a session joins the notebook's
+                    # persistent conversation, which was looked up in the
+                    # background; later turns (and turns after /clear) follow
+                    # the ID returned by the previous answer.
+                    if conversation_id is None and conversation_future is not None:
+                        conversation_id = _result_or(conversation_future, None)
+                        conversation_future = None
+
+                    # Render the answer as it streams in, with the notebook
+                    # title as label and a spinner until the first frame.
+                    console.print()
+                    console.print(f"[bold green]{notebook_title}:[/bold green]")
+                    with Live(
+                        Spinner("dots", text="[dim]Thinking...[/dim]"),
+                        console=console,
+                        refresh_per_second=8,
+                    ) as live:
                         result = client.query(
                             notebook_id,
                             query_text=user_input,
+                            source_ids=source_ids,
                             conversation_id=conversation_id,
+                            on_answer=lambda text: live.update(Markdown(text)),
                         )
+                        if result:
+                            live.update(Markdown(result.get("answer") or "No response."))
+                        else:
+                            live.update("[red]No response from AI.[/red]")
 
                     if result:
                         conversation_id = result.get("conversation_id")
                         answer = result.get("answer", "No response.")
 
-                        # Render response with notebook title as label
-                        console.print()
-                        console.print(f"[bold green]{notebook_title}:[/bold green]")
-                        console.print(Markdown(answer))
-
                         # Parse and display citation legend
                         cited_nums = _parse_citations(answer)
                         citations_map = result.get("citations", {})
+                        sources_list = _result_or(sources_future, summary_sources)
 
                         if cited_nums and sources_list:
                             # Build UUID -> title lookup
@@ -186,7 +243,7 @@ def run_chat_repl(notebook_id: str, profile: str | None = None) -> None:
 
                         console.print()
                     else:
-                        console.print("[red]No response from AI.[/red]\n")
+                        console.print()
 
                 except KeyboardInterrupt:
                     console.print("\n\n[dim]Interrupted. Type /exit to quit.[/dim]\n")
@@ -0,0 +1,78 @@
+"""Local full-text search over source content."""
+
+import typer
+from rich.markup import escape
+
+from notebooklm_tools.cli.formatters import print_json
+from notebooklm_tools.cli.utils import get_client, handle_error, make_console
+from notebooklm_tools.core.alias import get_alias_manager
+from notebooklm_tools.core.exceptions import NLMError
+from notebooklm_tools.services import ServiceError
+from notebooklm_tools.services import sources as sources_service
+
+console = make_console()
+
+
+def search(
+    query: str = typer.Argument(..., help="Search terms (all must match; 'term*' for prefix)"),
+    notebook_id: str | None = typer.Option(
+        None, "--notebook", "-n", help="Sync and search only this notebook"
+    ),
+    limit: int = typer.Option(10, "--limit", "-l", help="Max results (1-100)"),
+    no_sync: bool = typer.Option(
+        False, "--no-sync", help="Search the index as-is, without checking for new sources"
+    ),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="Re-fetch and re-index every source of the notebook first"
+    ),
+    json_output: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
+    profile: str | None = typer.Option(None, "--profile", "-p", help="Profile to use"),
+) -> None:
+    """Find which sources mention a term, with ranked snippets.
+
+    Source text is kept in a local full-text index, so searches take
+    milliseconds. With --notebook, the notebook's index entries are synced
+    first: removed sources are dropped, renamed ones are re-indexed and only
+    new ones are fetched (--refresh re-fetches them all, e.g. after sources
+    were edited). Without it, every notebook synced so far is searched
+    offline.
+
+    Examples:
+        nlm search "transformer attention" --notebook <notebook-id>
+        nlm search "retriev*" --limit 20
+    """
+    try:
+        sync = None
+        if notebook_id:
+            notebook_id = get_alias_manager().resolve(notebook_id)
+            if not no_sync:
+                with get_client(profile) as client:
+                    sync = sources_service.sync_search_index(client, notebook_id, refresh=refresh)
+        hits = sources_service.search_sources(query, notebook_id=notebook_id, limit=limit)
+
+        if json_output:
+            print_json({"query": query, "sync": sync, "count": len(hits), "results": hits})
+            return
+        if sync and (sync["added"] or sync["updated"] or sync["removed"] or sync["pending"]):
+            updated = f", {sync['updated']} updated" if sync["updated"] else ""
+            pending = f", {sync['pending']} still processing" if sync["pending"] else ""
+            console.print(
+                f"[dim]Index synced: {sync['added']} added{updated}, "
+                f"{sync['removed']} removed{pending}[/dim]"
+            )
+        if not hits:
+            console.print(f"[dim]No matches for {escape(query)!r}.[/dim]")
+            if not notebook_id:
+                console.print(
+                    "\n[dim]Only synced notebooks are searched. "
+                    "Use --notebook <id> to index one.[/dim]"
+                )
+            return
+        for rank, hit in enumerate(hits, 1):
+            console.print(
+                f"[bold]{rank}. {escape(hit['title'] or '(untitled)')}[/bold] "
+                f"[dim]({hit['source_type']}, {hit['source_id']})[/dim]"
+            )
+            console.print(f"   {escape(hit['snippet'])}")
+    except (ServiceError, NLMError) as e:
+        handle_error(e, json_output=json_output)
@@ -1,6 +1,20 @@
 """Source CLI commands."""
 
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
 import typer
+from rich.progress import (
+    BarColumn,
+    DownloadColumn,
+    MofNCompleteColumn,
+    Progress,
+    TextColumn,
+    TransferSpeedColumn,
+)
 
 from notebooklm_tools.cli.formatters import detect_output_format, get_formatter
 from notebooklm_tools.cli.utils import get_client, handle_error, make_console
@@ -67,7 +81,9 @@ def add_source(
     youtube: list[str] | None = typer.Option(  # noqa: B008
         None, "--youtube", "-y", help="YouTube URL (repeatable for bulk)"
     ),
-    file: str | None = typer.Option(None, "--file", "-f", help="Local file to upload (PDF, etc.)"),
+    file: list[str] | None = typer.Option(  # noqa: B008
+        None, "--file", "-f", help="Local file to upload (PDF, etc.; repeatable for bulk)"
+    ),
     title: str = typer.Option("", "--title", help="Title for the source"),
     doc_type: str = typer.Option("doc", "--type", help="Drive doc type: doc, slides, sheets, pdf"),
     wait: bool = typer.Option(False, "--wait", "-w", help="Wait for source processing to complete"),
@@ -76,6 +92,17 @@ def add_source(
         "--wait-timeout",
         help="Max seconds to wait when --wait is set (default 600; raise for very long audio)",
     ),
+    concurrency: int = typer.Option(
+        4, "--concurrency", "-c", help="Max files uploading at once with repeated --file (1-16)"
+    ),
+    resume: bool = typer.Option(
+        False, "--resume", help="Continue an interrupted --file upload from where it stopped"
+    ),
+    dedupe: bool = typer.Option(
+        False,
+        "--dedupe",
+        help="Skip URLs, text and files this notebook already has (tracked in a local index)",
+    ),
     profile: str | None = typer.Option(None, "--profile", "-p", help="Profile to use"),
 ) -> None:
     """Add a source to a notebook.
@@ -85,6 +112,9 @@ def add_source(
         nlm source add <notebook-id> --url https://a.com --url https://b.com
         nlm source add <notebook-id> --url https://example.com --wait
         nlm source add <notebook-id> --file document.pdf --wait
+        nlm source add <notebook-id> --file a.pdf --file b.pdf --file c.pdf
+        nlm source add <notebook-id> --file lecture.mp3 --resume
+        nlm source add <notebook-id> --file a.pdf --file b.pdf --dedupe
         nlm source add <notebook-id> --youtube https://youtu.be/a --youtube https://youtu.be/b
     """
     notebook_id = get_alias_manager().resolve(notebook_id)
@@ -101,8 +131,14 @@ def add_source(
         youtubes = [youtubes]
     has_youtube = len(youtubes) > 0
 
+    # Normalize file list: typer gives None or a list
+    files = file or []
+    if isinstance(files, str):
+        files = [files]
+    has_file = len(files) > 0
+
     # Validate that exactly one source type is provided (CLI-specific UX)
-    source_count = sum(1 for x in [has_url, text, drive, has_youtube, file] if x)
+    source_count = sum(1 for x in [has_url, text, drive, has_youtube, has_file] if x)
     if source_count == 0:
         console.print(
             "[red]Error:[/red] Please specify a source: --url, --text, --file, --drive, or --youtube"
@@ -129,14 +165,27 @@ def add_source(
                     [{"source_type": "url", "url": u} for u in all_urls],
                     wait=wait,
                     wait_timeout=wait_timeout,
+                    dedupe=dedupe,
                 )
                 ready_msg = " (ready)" if wait else ""
                 for r in bulk_result["results"]:
-                    console.print(f"[green]✓[/green] Added source: {r['title']}{ready_msg}")
+                    if r.get("deduplicated"):
+                        console.print(f"[dim]= Already in notebook: {r['title']}[/dim]")
+                    else:
+                        console.print(f"[green]✓[/green] Added source: {r['title']}{ready_msg}")
                     console.print(f"[dim]  Source ID: {r['source_id']}[/dim]")
                 console.print(f"\n[green]✓[/green] {bulk_result['added_count']} source(s) added.")
                 return
 
+            # Bulk file upload: multiple --file flags, uploaded concurrently
+            if len(files) > 1:
+                failed = _upload_files_with_progress(
+                    client, notebook_id, files, concurrency, wait, wait_timeout, resume, dedupe
+                )
+                if failed:
+                    raise typer.Exit(1)
+                return
+
             # Single URL add (including youtube)
             if has_youtube:
                 source_type, source_url = "url", youtubes[0]
@@ -155,6 +204,7 @@ def add_source(
                     url=source_url,
                     wait=wait,
                     wait_timeout=wait_timeout,
+                    dedupe=dedupe,
                 )
             elif text:
                 if wait:
@@ -167,6 +217,7 @@ def add_source(
                     title=title or None,
                     wait=wait,
                     wait_timeout=wait_timeout,
+                    dedupe=dedupe,
                 )
             elif drive:
                 if wait:
@@ -183,12 +234,12 @@ def add_source(
                     wait=wait,
                     wait_timeout=wait_timeout,
                 )
-            elif file:
+            elif has_file:
                 from pathlib import Path
 
-                file_path = Path(file).expanduser().resolve()
+                file_path = Path(files[0]).expanduser().resolve()
                 if not file_path.exists():
-                    console.print(f"[red]Error:[/red] File not found: {file}")
+                    console.print(f"[red]Error:[/red] File not found: {files[0]}")
                     raise typer.Exit(1)
                 console.print(
                     f"[blue]Uploading {file_path.name}{'...' if not wait else ' and waiting for processing...'}[/blue]"
@@ -201,18 +252,334 @@ def add_source(
                     title=title or None,
                     wait=wait,
                     wait_timeout=wait_timeout,
+                    resume=resume,
+                    dedupe=dedupe,
                 )
             else:
                 raise typer.Exit(1)
 
         # Show result
         ready_msg = " (ready)" if wait else ""
-        console.print(f"[green]✓[/green] Added source: {result['title']}{ready_msg}")
+        if result.get("deduplicated"):
+            console.print(f"[dim]= Already in notebook: {result['title']}[/dim]")
+        else:
+            console.print(f"[green]✓[/green] Added source: {result['title']}{ready_msg}")
         console.print(f"[dim]Source ID: {result['source_id']}[/dim]")
     except (ServiceError, NLMError) as e:
         handle_error(e, json_output=locals().get("json_output", False))
 
 
+def _upload_files_with_progress(
+    client,
+    notebook_id: str,
+    files: list[str],
+    concurrency: int,
+    wait: bool,
+    wait_timeout: float,
+    resume: bool = False,
+    dedupe: bool = False,
+) -> int:
+    """Upload files concurrently with per-file progress bars. Returns the failure count."""
+    uploaded_bytes = 0
+    failed = 0
+    skipped = 0
+    started = time.monotonic()
+    suffix = " and waiting for processing" if wait else ""
+    console.print(f"[blue]Uploading {len(files)} files ({concurrency} at a time){suffix}...[/blue]")
+
+    with Progress(
+        TextColumn("[bold blue]{task.description}"),
+        BarColumn(bar_width=None),
+        DownloadColumn(),
+        TransferSpeedColumn(),
+        console=console,
+        transient=True,
+    ) as progress:
+        tasks = [progress.add_task(f.split("/")[-1], total=None) for f in files]
+
+        def on_progress(index: int, sent: int, total: int) -> None:
+            progress.update(tasks[index], completed=sent, total=total)
+
+        for item in sources_service.upload_files(
+            client,
+            notebook_id,
+            files,
+            concurrency=concurrency,
+            wait=wait,
+            wait_timeout=wait_timeout,
+            on_progress=on_progress,
+            resume=resume,
+            dedupe=dedupe,
+        ):
+            progress.remove_task(tasks[item["index"]])
+            if item["error"]:
+                failed += 1
+                progress.console.print(
+                    f"[red]✗[/red] {item['file_path']}: {item['error']}", highlight=False
+                )
+                continue
+            if item["deduplicated"]:
+                skipped += 1
+                progress.console.print(f"[dim]= Already in notebook: {item['title']}[/dim]")
+                progress.console.print(f"[dim]  Source ID: {item['source_id']}[/dim]")
+                continue
+            uploaded_bytes += item["bytes"]
+            ready_msg = " (ready)" if wait else ""
+            progress.console.print(f"[green]✓[/green] Added source: {item['title']}{ready_msg}")
+            progress.console.print(f"[dim]  Source ID: {item['source_id']}[/dim]")
+
+    elapsed = max(time.monotonic() - started, 1e-6)
+    added = len(files) - failed - skipped
+    skipped_msg = f", {skipped} already in notebook" if skipped else ""
+    console.print(
+        f"\n[green]✓[/green] {added}/{len(files)} file(s) added{skipped_msg} "
+        f"[dim]({uploaded_bytes / 1e6:.1f} MB in {elapsed:.1f}s, "
+        f"{uploaded_bytes / 1e6 / elapsed:.1f} MB/s)[/dim]"
+    )
+    return failed
+
+
+@app.command("add-dir")
+def add_directory(
+    notebook_id: str = typer.Argument(..., help="Notebook ID"),
+    directory: str = typer.Argument(..., help="Local directory to upload"),
+    glob: str = typer.Option(
+        "**/*", "--glob", "-g", help="Files to include, relative to the directory"
+    ),
+    concurrency: int = typer.Option(4, "--concurrency", "-c", help="Max files at once (1-16)"),
+    wait: bool = typer.Option(False, "--wait", "-w", help="Wait for source processing to complete"),
+    wait_timeout: float = typer.Option(
+        600.0, "--wait-timeout", help="Max seconds to wait per source when --wait is set"
+    ),
+    dedupe: bool = typer.Option(
+        False, "--dedupe", help="Skip files whose bytes this notebook already has"
+    ),
+    manifest: str | None = typer.Option(
+        None, "--manifest", help="Manifest file (default: under ~/.notebooklm-mcp-cli/manifests/)"
+    ),
+    profile: str | None = typer.Option(None, "--profile", "-p", help="Profile to use"),
+) -> None:
+    """Upload every supported file in a directory, resumably.
+
+    Progress is recorded in a manifest as each file lands, so re-running the
+    same command after a crash or Ctrl-C skips finished files and resumes the
+    rest. Unsupported file types are filtered out before anything is sent.
+
+    Examples:
+        nlm source add-dir <notebook-id> ./papers --glob '**/*.pdf'
+        nlm source add-dir <notebook-id> ./corpus -c 8 --wait
+    """
+    notebook_id = get_alias_manager().resolve(notebook_id)
+    try:
+        plan, ingest_manifest = sources_service.plan_directory_ingest(
+            notebook_id, directory, pattern=glob, manifest_path=manifest
+        )
+        console.print(
+            f"[blue]{plan['total']} file(s) in {plan['directory']}: "
+            f"{plan['to_upload']} to upload ({plan['total_bytes'] / 1e6:.1f} MB), "
+            f"{plan['done']} already done[/blue]"
+        )
+        console.print(f"[dim]Manifest: {plan['manifest_path']}[/dim]")
+
+        counts: dict[str, int] = {}
+        started = time.monotonic()
+        with (
+            get_client(profile) as client,
+            Progress(
+                TextColumn("[bold blue]{task.description}"),
+                BarColumn(bar_width=None),
+                DownloadColumn(),
+                TransferSpeedColumn(),
+                console=console,
+                transient=True,
+            ) as progress,
+        ):
+            tasks: dict[str, Any] = {}
+
+            def on_progress(path: str, sent: int, total: int) -> None:
+                if path not in tasks:
+                    tasks[path] = progress.add_task(path, total=total)
+                progress.update(tasks[path], completed=sent)
+
+            for item in sources_service.add_directory(
+                client,
+                notebook_id,
+                plan,
+                ingest_manifest,
+                concurrency=concurrency,
+                wait=wait,
+                wait_timeout=wait_timeout,
+                dedupe=dedupe,
+                on_progress=on_progress,
+            ):
+                if item["path"] in tasks:
+                    progress.remove_task(tasks.pop(item["path"]))
+                counts[item["status"]] = counts.get(item["status"], 0) + 1
+                if item["status"] == "failed":
+                    progress.console.print(
+                        f"[red]✗[/red] {item['path']}: {item['error']}", highlight=False
+                    )
+                elif item["status"] in ("uploaded", "ready"):
+                    progress.console.print(
+                        f"[green]✓[/green] {item['path']} [dim]{item['source_id']}[/dim]",
+                        highlight=False,
+                    )
+
+        elapsed = time.monotonic() - started
+        summary = ", ".join(f"{n} {status}" for status, n in sorted(counts.items()))
+        console.print(f"\n{summary} [dim]({elapsed:.1f}s)[/dim]")
+        if counts.get("failed"):
+            console.print("[dim]Re-run the same command to retry the failed files.[/dim]")
+            raise typer.Exit(1)
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Interrupted.[/yellow] Re-run the same command to resume.")
+        raise typer.Exit(130) from None
+    except (ServiceError, NLMError) as e:
+        handle_error(e)
+
+
+@app.command("add-urls")
+def add_urls(
+    notebook_id: str = typer.Argument(..., help="Notebook ID"),
+    urls_file: str = typer.Argument(..., help="File with one URL per line ('-' for stdin)"),
+    chunk_size: int = typer.Option(50, "--chunk-size", "-s", help="URLs per request (1-100)"),
+    concurrency: int = typer.Option(4, "--concurrency", "-c", help="Requests in flight (1-8)"),
+    max_attempts: int = typer.Option(
+        3, "--max-attempts", help="Sends per URL before it is reported failed"
+    ),
+    report: str | None = typer.Option(
+        None, "--report", "-r", help="Write a per-URL status report (JSONL)"
+    ),
+    profile: str | None = typer.Option(None, "--profile", "-p", help="Profile to use"),
+) -> None:
+    """Add a large list of URLs in concurrent chunks.
+
+    When a chunk fails or times out, the notebook's sources are checked to see
+    which of its URLs landed anyway, and only the missing ones are retried.
+    Blank lines and lines starting with # are ignored.
+
+    Examples:
+        nlm source add-urls <notebook-id> urls.txt --report report.jsonl
+        cat urls.txt | nlm source add-urls <notebook-id> - -s 25 -c 8
+    """
+    try:
+        if urls_file == "-":
+            lines = sys.stdin.read().splitlines()
+        else:
+            try:
+                lines = Path(urls_file).read_text(encoding="utf-8").splitlines()
+            except (OSError, UnicodeDecodeError) as e:
+                console.print(f"[red]Error:[/red] Cannot read URLs file: {e}")
+                raise typer.Exit(1) from e
+        urls = [line.strip() for line in lines if line.strip() and not line.startswith("#")]
+        notebook_id = get_alias_manager().resolve(notebook_id)
+
+        counts: dict[str, int] = {}
+        started = time.monotonic()
+        try:
+            report_file = open(report, "w", encoding="utf-8") if report else None  # noqa: SIM115
+        except OSError as e:
+            console.print(f"[red]Error:[/red] Cannot write report file: {e}")
+            raise typer.Exit(1) from e
+        try:
+            with (
+                get_client(profile) as client,
+                Progress(
+                    TextColumn("[bold blue]Adding URLs"),
+                    BarColumn(bar_width=None),
+                    MofNCompleteColumn(),
+                    console=console,
+                    transient=True,
+                ) as progress,
+            ):
+                items = sources_service.ingest_urls(
+                    client,
+                    notebook_id,
+                    urls,
+                    chunk_size=chunk_size,
+                    concurrency=concurrency,
+                    max_attempts=max_attempts,
+                )
+                task = progress.add_task("urls", total=len(urls))
+                for item in items:
+                    counts[item["status"]] = counts.get(item["status"], 0) + 1
+                    progress.advance(task)
+                    if report_file:
+                        report_file.write(json.dumps(item, ensure_ascii=False) + "\n")
+                    if item["status"] == "failed":
+                        progress.console.print(
+                            f"[red]✗[/red] {item['url']}: {item['error']}", highlight=False
+                        )
+        finally:
+            if report_file:
+                report_file.close()
+
+        elapsed = time.monotonic() - started
+        summary = ", ".join(f"{n} {status}" for status, n in sorted(counts.items()))
+        console.print(f"{summary} [dim]({len(urls)} URLs, {elapsed:.1f}s)[/dim]")
+        if report:
+            console.print(f"[dim]Report: {report}[/dim]")
+        if counts.get("failed"):
+            raise typer.Exit(1)
+    except (ServiceError, NLMError) as e:
+        handle_error(e)
+
+
+@app.command("export-all")
+def export_all_sources(
+    notebook_id: str = typer.Argument(..., help="Notebook ID"),
+    out: str | None = typer.Option(
+        None, "--out", "-o", help="Write JSONL records to file (default: stdout)"
+    ),
+    concurrency: int = typer.Option(8, "--concurrency", "-c", help="Fetches in flight (1-16)"),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="Ignore the local cache and re-fetch every source"
+    ),
+    profile: str | None = typer.Option(None, "--profile", "-p", help="Profile to use"),
+) -> None:
+    """Export the full text of every source as JSONL.
+
+    One JSON object per source is written as soon as it arrives, so memory use
+    stays flat for large notebooks. Fetched text is cached locally by source
+    ID; re-running only fetches sources added since.
+
+    Examples:
+        nlm source export-all <notebook-id> --out sources.jsonl
+        nlm source export-all <notebook-id> -c 16 | jq -r .title
+    """
+    try:
+        notebook_id = get_alias_manager().resolve(notebook_id)
+        with get_client(profile) as client:
+            records = sources_service.export_source_fulltexts(
+                client, notebook_id, concurrency=concurrency, refresh=refresh
+            )
+            stream = open(out, "w", encoding="utf-8") if out else sys.stdout  # noqa: SIM115
+            total = failed = cached = chars = 0
+            try:
+                for record in records:
+                    total += 1
+                    failed += bool(record["error"])
+                    cached += record["cached"]
+                    chars += record["char_count"]
+                    stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    stream.flush()
+                    if out:
+                        console.print(f"[dim]{total} exported ({failed} failed)[/dim]", end="\r")
+            finally:
+                if out:
+                    stream.close()
+
+        if out:
+            console.print(
+                f"[green]✓[/green] {total - failed}/{total} sources exported → {out} "
+                f"[dim]({chars:,} chars, {cached} from cache)[/dim]"
+            )
+        if failed:
+            raise typer.Exit(1)
+    except (ServiceError, NLMError) as e:
+        handle_error(e)
+
+
 @app.command("get")
 def get_source(
     source_id: str = typer.Argument(..., help="Source ID"),
@@ -256,13 +623,24 @@ def get_source_content(
     source_id: str = typer.Argument(..., help="Source ID"),
     json_output: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
     output: str | None = typer.Option(None, "--output", "-o", help="Write content to file"),
+    offset: int = typer.Option(0, "--offset", help="First character to return"),
+    limit: int | None = typer.Option(
+        None, "--limit", "-l", help="Max characters to return (default: all)"
+    ),
     profile: str | None = typer.Option(None, "--profile", "-p", help="Profile to use"),
 ) -> None:
-    """Get raw source content (no AI processing)."""
+    """Get raw source content (no AI processing).
+
+    Use --limit and --offset to read a large source one page at a time.
+    """
+    if offset < 0 or (limit is not None and limit < 1):
+        console.print("[red]Error:[/red] --offset must be 0 or greater and --limit at least 1")
+        raise typer.Exit(1)
+
     try:
         source_id = get_alias_manager().resolve(source_id)
         with get_client(profile) as client:
-            content = client.get_source_fulltext(source_id)
+            content = client.get_source_fulltext(source_id, offset=offset, limit=limit)
 
         if output:
             from pathlib import Path
@@ -275,6 +653,12 @@ def get_source_content(
             fmt = detect_output_format(json_output)
             formatter = get_formatter(fmt, console)
             formatter.format_item(content, title="Source Content")
+        end = offset + len(content["content"])
+        if limit is not None and end < content["char_count"] and not json_output:
+            console.print(
+                f"[dim]Showing characters {offset:,}-{end:,} of {content['char_count']:,}. "
+                f"Next page: --offset {end}[/dim]"
+            )
     except (ServiceError, NLMError) as e:
         handle_error(e, json_output=locals().get("json_output", False))
 
@@ -370,6 +754,70 @@ def list_stale_sources(
         handle_error(e, json_output=locals().get("json_output", False))
 
 
+@app.command("drive-sync")
+def drive_sync(
+    notebook_ids: list[str] = typer.Argument(..., help="Notebook ID(s)"),  # noqa: B008
+    concurrency: int = typer.Option(
+        8, "--concurrency", "-c", help="Checks and syncs in flight (1-16)"
+    ),
+    recheck_after: float | None = typer.Option(
+        None,
+        "--recheck-after",
+        help="Skip sources verified fresh or synced within this many hours",
+    ),
+    force: bool = typer.Option(False, "--force", help="Sync every Drive source without checking"),
+    confirm: bool = typer.Option(False, "--confirm", "-y", help="Skip confirmation"),
+    profile: str | None = typer.Option(None, "--profile", "-p", help="Profile to use"),
+) -> None:
+    """Check Drive sources in one or more notebooks and sync the stale ones.
+
+    Freshness checks and syncs share one worker pool: a source is synced as
+    soon as it is found stale, while the other checks continue.
+
+    Examples:
+        nlm source drive-sync <notebook-a> <notebook-b> --confirm
+        nlm source drive-sync <notebook-id> --recheck-after 12 -c 16 -y
+    """
+    try:
+        notebook_ids = [get_alias_manager().resolve(nb) for nb in notebook_ids]
+        if not confirm:
+            typer.confirm(
+                f"Sync stale Drive sources in {len(notebook_ids)} notebook(s)?",
+                abort=True,
+            )
+
+        counts: dict[str, int] = {}
+        started = time.monotonic()
+        with get_client(profile) as client:
+            items = sources_service.drive_sync(
+                client,
+                notebook_ids,
+                concurrency=concurrency,
+                recheck_after=recheck_after * 3600 if recheck_after is not None else None,
+                force=force,
+            )
+            for item in items:
+                counts[item["status"]] = counts.get(item["status"], 0) + 1
+                if item["status"] == "synced":
+                    console.print(f"[green]✓[/green] Synced {item['title']}", highlight=False)
+                elif item["status"] == "failed":
+                    console.print(
+                        f"[red]✗[/red] {item['title']} ({item['source_id']}): {item['error']}",
+                        highlight=False,
+                    )
+
+        elapsed = time.monotonic() - started
+        if not counts:
+            console.print("[green]✓[/green] No Drive sources to sync.")
+            return
+        summary = ", ".join(f"{n} {status}" for status, n in sorted(counts.items()))
+        console.print(f"{summary} [dim]({elapsed:.1f}s)[/dim]")
+        if counts.get("failed"):
+            raise typer.Exit(1)
+    except (ServiceError, NLMError) as e:
+        handle_error(e)
+
+
 @app.command("sync")
 def sync_sources(
     notebook_id: str = typer.Argument(..., help="Notebook ID"),
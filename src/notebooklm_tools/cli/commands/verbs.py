@@ -41,6 +41,7 @@ from notebooklm_tools.cli.commands.notebook import (
     describe_notebook,
     get_notebook,
     list_notebooks,
+    query_batch,
     query_notebook,
     rename_notebook,
 )
@@ -548,6 +549,9 @@ def add_url_verb(
     profile: str | None = typer.Option(None, "--profile", "-p", help="Profile to use"),
     wait: bool = typer.Option(False, "--wait", "-w", help="Wait for source processing to complete"),
     wait_timeout: float = typer.Option(600.0, "--wait-timeout", help="Wait timeout in seconds"),
+    dedupe: bool = typer.Option(
+        False, "--dedupe", help="Skip if this notebook already has the same content"
+    ),
 ) -> None:
     """Add a URL source to notebook."""
     # Explicitly wrap the single URL string in a list so it doesn't get unpacked as characters
@@ -558,6 +562,9 @@ def add_url_verb(
         drive=None,
         youtube=None,
         file=None,
+        concurrency=4,
+        resume=False,
+        dedupe=dedupe,
         wait=wait,
         wait_timeout=wait_timeout,
         profile=profile,
@@ -572,6 +579,9 @@ def add_text_verb(
     profile: str | None = typer.Option(None, "--profile", "-p", help="Profile to use"),
     wait: bool = typer.Option(False, "--wait", "-w", help="Wait for source processing to complete"),
     wait_timeout: float = typer.Option(600.0, "--wait-timeout", help="Wait timeout in seconds"),
+    dedupe: bool = typer.Option(
+        False, "--dedupe", help="Skip if this notebook already has the same content"
+    ),
 ) -> None:
     """Add text source to notebook."""
     # Explicitly pass None for unused source types to avoid typer.Option resolution issues
@@ -582,6 +592,9 @@ def add_text_verb(
         drive=None,
         youtube=None,
         file=None,
+        concurrency=4,
+        resume=False,
+        dedupe=dedupe,
         title=title or "Pasted Text",
         wait=wait,
         wait_timeout=wait_timeout,
@@ -608,6 +621,9 @@ def add_drive_verb(
         drive=document_id,
         youtube=None,
         file=None,
+        concurrency=4,
+        resume=False,
+        dedupe=False,
         title=title or f"Drive Document ({document_id[:8]}...)",
         doc_type=doc_type,
         wait=wait,
@@ -758,6 +774,38 @@ def query_notebook_verb(
     )
 
 
+@query_app.command("batch")
+def query_batch_verb(
+    notebook: str = typer.Argument(..., help="Notebook ID or alias"),
+    file: str = typer.Option(
+        ..., "--file", "-f", help="Questions file, one per line ('-' for stdin)"
+    ),
+    output: str | None = typer.Option(
+        None, "--output", "-o", help="Write JSONL results to file (default: stdout)"
+    ),
+    concurrency: int = typer.Option(
+        4, "--concurrency", "-n", help="Questions in flight at once (1-16)"
+    ),
+    source_ids: str | None = typer.Option(
+        None, "--source-ids", "-s", help="Comma-separated source IDs to query (default: all)"
+    ),
+    profile: str | None = typer.Option(None, "--profile", "-p", help="Profile to use"),
+    timeout: float | None = typer.Option(
+        None, "--timeout", "-t", help="Per-question timeout in seconds (default: 120)"
+    ),
+) -> None:
+    """Ask many questions of one notebook, streaming JSONL results."""
+    query_batch(
+        notebook_id=notebook,
+        file=file,
+        output=output,
+        concurrency=concurrency,
+        source_ids=source_ids,
+        profile=profile,
+        timeout=timeout,
+    )
+
+
 # =============================================================================
 # SYNC verb (for Drive sources)
 # =============================================================================
@@ -790,10 +838,21 @@ def content_source_verb(
     source: str = typer.Argument(..., help="Source ID"),
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
     output: str | None = typer.Option(None, "--output", "-o", help="Write content to file"),
+    offset: int = typer.Option(0, "--offset", help="First character to return"),
+    limit: int | None = typer.Option(
+        None, "--limit", "-l", help="Max characters to return (default: all)"
+    ),
     profile: str | None = typer.Option(None, "--profile", "-p", help="Profile to use"),
 ) -> None:
     """Get raw source content (no AI processing)."""
-    get_source_content(source_id=source, json_output=json_output, output=output, profile=profile)
+    get_source_content(
+        source_id=source,
+        json_output=json_output,
+        output=output,
+        offset=offset,
+        limit=limit,
+        profile=profile,
+    )
 
 
 # =============================================================================
@@ -929,10 +988,17 @@ def download_audio_verb(
     output: str | None = typer.Option(None, "--output", "-o", help="Output filename"),
     artifact_id: str | None = typer.Option(None, "--id", help="Specific artifact ID"),
     no_progress: bool = typer.Option(False, "--no-progress", help="Disable download progress bar"),
+    segments: int = typer.Option(
+        1, "--segments", help="Fetch N byte ranges in parallel (1-16) for faster large downloads"
+    ),
 ) -> None:
     """Download audio overview."""
     download_audio(
-        notebook_id=notebook, output=output, artifact_id=artifact_id, no_progress=no_progress
+        notebook_id=notebook,
+        output=output,
+        artifact_id=artifact_id,
+        no_progress=no_progress,
+        segments=segments,
     )
 
 
@@ -942,10 +1008,17 @@ def download_video_verb(
     output: str | None = typer.Option(None, "--output", "-o", help="Output filename"),
     artifact_id: str | None = typer.Option(None, "--id", help="Specific artifact ID"),
     no_progress: bool = typer.Option(False, "--no-progress", help="Disable download progress bar"),
+    segments: int = typer.Option(
+        1, "--segments", help="Fetch N byte ranges in parallel (1-16) for faster large downloads"
+    ),
 ) -> None:
     """Download video overview."""
     download_video(
-        notebook_id=notebook, output=output, artifact_id=artifact_id, no_progress=no_progress
+        notebook_id=notebook,
+        output=output,
+        artifact_id=artifact_id,
+        no_progress=no_progress,
+        segments=segments,
     )
 
 
@@ -1005,9 +1078,10 @@ def download_data_table_verb(
     notebook: str = typer.Argument(..., help="Notebook ID or alias"),
     output: str | None = typer.Option(None, "--output", "-o", help="Output filename"),
     artifact_id: str | None = typer.Option(None, "--id", help="Specific artifact ID"),
+    format: str = typer.Option("csv", "--format", "-f", help="Format: csv, jsonl"),
 ) -> None:
     """Download data table."""
-    download_data_table(notebook_id=notebook, output=output, artifact_id=artifact_id)
+    download_data_table(notebook_id=notebook, output=output, artifact_id=artifact_id, format=format)
 
 
 # =============================================================================
@@ -20,6 +20,7 @@ from notebooklm_tools.cli.commands.note import app as note_app
 from notebooklm_tools.cli.commands.notebook import app as notebook_app
 from notebooklm_tools.cli.commands.pipeline import app as pipeline_app
 from notebooklm_tools.cli.commands.research import app as research_app
+from notebooklm_tools.cli.commands.search import search
 from notebooklm_tools.cli.commands.setup import app as setup_app
 from notebooklm_tools.cli.commands.share import app as share_app
 from notebooklm_tools.cli.commands.skill import app as skill_app
@@ -755,6 +756,7 @@ app.add_typer(source_app, name="source", help="Manage sources")
 app.add_typer(chat_app, name="chat", help="Configure chat settings")
 app.add_typer(studio_app, name="studio", help="Manage studio artifacts")
 app.add_typer(research_app, name="research", help="Research and discover sources")
+app.command("search", help="Search source text in the local index")(search)
 app.add_typer(alias_app, name="alias", help="Manage ID aliases")
 app.add_typer(config_app, name="config", help="Manage configuration")
 app.add_typer(download_app, name="download", help="Download artifacts (audio, video, etc)")
@@ -0,0 +1,175 @@
+"""Local cache of downloaded artifact files.
+
+Agents often download the same report or infographic many times. Each
+downloaded file is kept here, keyed by (artifact_id, type, format, marker),
+where the marker is a fingerprint of the artifact's poll_studio entry (see
+`DownloadMixin.artifact_marker`). The next download of an unchanged artifact
+is served locally: media files are hard-linked into place (falling back to a
+copy), and small text files are copied so editing them can't touch the cache.
+
+Entries for an artifact are dropped when it is revised or deleted, and the
+least recently used files are evicted once the cache exceeds
+``NOTEBOOKLM_ARTIFACT_CACHE_MAX_BYTES`` (default 512 MiB; 0 = no cap).
+
+Files live in ``~/.notebooklm-mcp-cli/artifact_cache/`` with their SQLite
+index beside them (not in the shared database), so removing the directory
+removes both.
+"""
+
+import hashlib
+import os
+import shutil
+import time
+from pathlib import Path
+
+from notebooklm_tools.utils.config import get_storage_dir
+
+from .base import _safe_int_env, logger
+from .sqlite_store import SQLiteStore
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def _place(src: Path, dest: Path, link: bool) -> None:
+    """Put a copy of `src` at `dest` (via a temp name, so `dest` is never partial)."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    temp = dest.with_name(dest.name + ".cache-tmp")
+    temp.unlink(missing_ok=True)
+    if link:
+        try:
+            os.link(src, temp)
+        except OSError:
+            # Different filesystem, or links unsupported: copy instead
+            shutil.copyfile(src, temp)
+    else:
+        shutil.copyfile(src, temp)
+    os.replace(temp, dest)
+
+
+class ArtifactCache(SQLiteStore):
+    """Size-bounded LRU store of artifact files.
+
+    `directory` holds the files and their index (`path`).
+    """
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS artifacts (
+            key TEXT PRIMARY KEY,
+            artifact_id TEXT NOT NULL,
+            artifact_type TEXT NOT NULL,
+            format TEXT NOT NULL,
+            marker TEXT NOT NULL,
+            file TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            last_used REAL NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS artifacts_id ON artifacts (artifact_id)",
+    )
+
+    def __init__(self, directory: Path | None = None, max_bytes: int | None = None) -> None:
+        self.directory = directory or get_storage_dir() / "artifact_cache"
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = (
+            max_bytes
+            if max_bytes is not None
+            else _safe_int_env("NOTEBOOKLM_ARTIFACT_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)
+        )
+        super().__init__(self.directory / "index.sqlite3")
+
+    @staticmethod
+    def _key(artifact_id: str, artifact_type: str, fmt: str, marker: str) -> str:
+        return hashlib.sha256(
+            "\0".join((artifact_id, artifact_type, fmt, marker)).encode()
+        ).hexdigest()
+
+    def fetch(
+        self,
+        artifact_id: str,
+        artifact_type: str,
+        fmt: str,
+        marker: str,
+        dest: Path,
+        link: bool = False,
+    ) -> bool:
+        """Place the cached file at `dest`; return False on a cache miss."""
+        key = self._key(artifact_id, artifact_type, fmt, marker)
+        with self._lock:
+            row = self._conn.execute("SELECT file FROM artifacts WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return False
+        blob = self.directory / row[0]
+        try:
+            _place(blob, dest, link)
+        except FileNotFoundError:
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM artifacts WHERE key = ?", (key,))
+            return False
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE artifacts SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+        return True
+
+    def store(self, artifact_id: str, artifact_type: str, fmt: str, marker: str, src: Path) -> None:
+        """Keep a copy of a freshly downloaded file, replacing older versions."""
+        key = self._key(artifact_id, artifact_type, fmt, marker)
+        file = key + src.suffix
+        size = src.stat().st_size
+        if self.max_bytes and size > self.max_bytes:
+            return
+        _place(src, self.directory / file, link=False)
+        with self._lock, self._conn:
+            stale = self._conn.execute(
+                "SELECT key, file FROM artifacts"
+                " WHERE artifact_id = ? AND artifact_type = ? AND format = ? AND key != ?",
+                (artifact_id, artifact_type, fmt, key),
+            ).fetchall()
+            self._remove(stale)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO artifacts VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, artifact_id, artifact_type, fmt, marker, file, size, time.time()),
+            )
+            self._evict()
+
+    def invalidate(self, artifact_id: str) -> int:
+        """Drop every cached file of an artifact (after it was revised or deleted)."""
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                "SELECT key, file FROM artifacts WHERE artifact_id = ?", (artifact_id,)
+            ).fetchall()
+            self._remove(rows)
+        return len(rows)
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM artifacts").fetchone()[0]
+
+    def _evict(self) -> None:
+        """Drop least recently used files until under max_bytes (lock held)."""
+        if not self.max_bytes:
+            return
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM artifacts").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        victims = []
+        for key, file, size in self._conn.execute(
+            "SELECT key, file, size FROM artifacts ORDER BY last_used"
+        ):
+            victims.append((key, file))
+            total -= size
+            if total <= self.max_bytes:
+                break
+        logger.debug(f"Artifact cache over budget; evicting {len(victims)} file(s)")
+        self._remove(victims)
+
+    def _remove(self, rows: list[tuple[str, str]]) -> None:
+        for key, file in rows:
+            (self.directory / file).unlink(missing_ok=True)
+            self._conn.execute("DELETE FROM artifacts WHERE key = ?", (key,))
+
+
+def get_artifact_cache() -> ArtifactCache:
+    """Get the process-wide artifact cache."""
+    return ArtifactCache.shared()
@@ -361,6 +361,10 @@ class BaseClient:
         self.cookies = cookies
         self.csrf_token = csrf_token
         self._client: httpx.Client | None = None
+        # Pooled client for the streamed query endpoint (see _get_query_client).
+        self._query_client: httpx.Client | None = None
+        # Pooled client for resumable file uploads (see _get_upload_client).
+        self._upload_client: httpx.Client | None = None
         self._session_id = session_id
         self._bl = build_label
         self._created_at: float = _time.time()
@@ -379,7 +383,16 @@ class BaseClient:
         self._max_chars_per_turn = _safe_int_env(
             "NOTEBOOKLM_CONVERSATION_MAX_CHARS_PER_TURN", default=100_000
         )
+        # Total memory budget for cached turn text, in bytes. Sizes are tracked
+        # incrementally per conversation (`_conversation_cache_sizes`) so the
+        # byte cap can be enforced on every insert without rescanning the cache.
+        self._max_cache_bytes = _safe_int_env(
+            "NOTEBOOKLM_CONVERSATION_MAX_BYTES", default=256 * 1024 * 1024
+        )
         self._conversation_cache: OrderedDict[str, list[ConversationTurn]] = OrderedDict()
+        self._conversation_cache_sizes: dict[str, int] = {}
+        self._conversation_cache_bytes = 0
+        self._conversation_cache_evictions = 0
 
         # Request counter for _reqid parameter (required for query endpoint)
         self._reqid_counter = random.randint(100000, 999999)
@@ -393,8 +406,9 @@ class BaseClient:
         # Lock for thread-safe access to mutable instance state.
         # FastMCP dispatches sync tool functions into a thread pool, so
         # concurrent MCP tool calls share this singleton client instance.
-        # The lock protects: _client, _reqid_counter, _conversation_cache,
-        # _source_rpc_version, csrf_token, _session_id, cookies.
+        # The lock protects: _client, _query_client, _upload_client, _reqid_counter,
+        # _conversation_cache and its size accounting, _source_rpc_version, csrf_token,
+        # _session_id, cookies.
         # It is never held during network I/O.
         self._state_lock = threading.Lock()
 
@@ -413,10 +427,16 @@ class BaseClient:
         self.close()
 
     def close(self):
-        """Close the underlying HTTP client."""
+        """Close the underlying HTTP clients."""
         if self._client:
             self._client.close()
             self._client = None
+        if self._query_client:
+            self._query_client.close()
+            self._query_client = None
+        if self._upload_client:
+            self._upload_client.close()
+            self._upload_client = None
 
     def _apply_rpc_overrides(self) -> None:
         """Apply NOTEBOOKLM_RPC_OVERRIDES as instance attributes.
@@ -516,6 +536,48 @@ class BaseClient:
             self._client = client
         return self._client
 
+    def _get_query_client(self) -> httpx.Client:
+        """Get or create the pooled HTTP client for the streamed query endpoint (thread-safe).
+
+        The query endpoint is stricter than batchexecute about headers, so it
+        gets its own client carrying only cookies and Content-Type. Sharing one
+        instance lets sequential and concurrent queries reuse keep-alive
+        connections instead of paying a TLS handshake per question.
+        """
+        if self._query_client is not None:
+            return self._query_client
+        with self._state_lock:
+            if self._query_client is not None:
+                return self._query_client
+            self._query_client = httpx.Client(
+                cookies=self._get_httpx_cookies(),
+                # The streamed query endpoint rejects form-encoded payloads
+                # without an explicit Content-Type header.
+                headers={"Content-Type": "application/x-www-form-urlencoded;charset=UTF-8"},
+                timeout=120.0,
+            )
+        return self._query_client
+
+    def _get_upload_client(self) -> httpx.Client:
+        """Get or create the pooled HTTP client for resumable uploads (thread-safe).
+
+        Upload sessions (start + stream) for many files share this client, so
+        concurrent uploads reuse keep-alive connections to the upload host
+        instead of opening a fresh client per request. The pool is sized for
+        `add_files` running several uploads at once.
+        """
+        if self._upload_client is not None:
+            return self._upload_client
+        with self._state_lock:
+            if self._upload_client is not None:
+                return self._upload_client
+            self._upload_client = httpx.Client(
+                cookies=self._get_httpx_cookies(),
+                timeout=300.0,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            )
+        return self._upload_client
+
     def _get_async_client(self) -> httpx.AsyncClient:
         """Get an async client for streaming operations."""
         cookies = self._get_httpx_cookies()
@@ -904,6 +966,8 @@ class BaseClient:
                 self._refresh_auth_tokens()
                 with self._state_lock:
                     self._client = None
+                    self._query_client = None
+                    self._upload_client = None
                 return self._call_rpc(rpc_id, params, path, timeout, _retry=True)
             except ValueError:
                 # CSRF refresh failed (cookies expired) - continue to layer 2
@@ -913,6 +977,8 @@ class BaseClient:
         if not _deep_retry and self._try_reload_or_headless_auth():
             with self._state_lock:
                 self._client = None
+                self._query_client = None
+                self._upload_client = None
             return self._call_rpc(rpc_id, params, path, timeout, _retry=True, _deep_retry=True)
 
         # All recovery attempts failed
@@ -167,6 +167,7 @@ class NotebookLMClient(
         output_path: str,
         artifact_id: str | None = None,
         progress_callback: Callable[[int, int], None] | None = None,
+        segments: int = 1,
     ) -> str:
         """Download audio via synchronous compatibility wrapper."""
         return asyncio.run(
@@ -176,6 +177,7 @@ class NotebookLMClient(
                 output_path,
                 artifact_id,
                 progress_callback=progress_callback,
+                segments=segments,
             )
         )
 
@@ -185,6 +187,7 @@ class NotebookLMClient(
         output_path: str,
         artifact_id: str | None = None,
         progress_callback: Callable[[int, int], None] | None = None,
+        segments: int = 1,
     ) -> str:
         """Download audio asynchronously for service/CLI callers."""
         return await DownloadMixin.download_audio(
@@ -193,6 +196,7 @@ class NotebookLMClient(
             output_path,
             artifact_id,
             progress_callback=progress_callback,
+            segments=segments,
         )
 
     def download_video(  # type: ignore[override]
@@ -201,6 +205,7 @@ class NotebookLMClient(
         output_path: str,
         artifact_id: str | None = None,
         progress_callback: Callable[[int, int], None] | None = None,
+        segments: int = 1,
     ) -> str:
         """Download video via synchronous compatibility wrapper."""
         return asyncio.run(
@@ -210,6 +215,7 @@ class NotebookLMClient(
                 output_path,
                 artifact_id,
                 progress_callback=progress_callback,
+                segments=segments,
             )
         )
 
@@ -219,6 +225,7 @@ class NotebookLMClient(
         output_path: str,
         artifact_id: str | None = None,
         progress_callback: Callable[[int, int], None] | None = None,
+        segments: int = 1,
     ) -> str:
         """Download video asynchronously for service/CLI callers."""
         return await DownloadMixin.download_video(
@@ -227,6 +234,7 @@ class NotebookLMClient(
             output_path,
             artifact_id,
             progress_callback=progress_callback,
+            segments=segments,
         )
 
     def download_infographic(  # type: ignore[override]
@@ -370,7 +378,5 @@ class NotebookLMClient(
         )
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client:
-            self._client.close()
-            self._client = None
+        """Close the HTTP clients."""
+        super().close()
@@ -5,17 +5,20 @@ This module provides the ConversationMixin class which handles all query
 and conversation-related operations.
 """
 
+import io
 import json
 import logging
 import os
+import sys
 import urllib.parse
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Protocol, cast
 
-import httpx as _httpx
-
 from .base import BaseClient
 from .data_types import ConversationTurn
 from .errors import NotebookLMError
+from .retry import execute_with_retry
 
 logger = logging.getLogger("notebooklm_mcp.api")
 
@@ -101,6 +104,19 @@ class ConversationMixin(BaseClient):
 
         return history if history else None
 
+    @staticmethod
+    def _turn_size(turn: ConversationTurn) -> int:
+        """Bytes held by a cached turn's text (the query and answer str objects)."""
+        return sys.getsizeof(turn.query) + sys.getsizeof(turn.answer)
+
+    def _drop_conversation_locked(self, conversation_id: str) -> bool:
+        """Remove a conversation and its byte accounting. Caller holds `_state_lock`."""
+        if conversation_id not in self._conversation_cache:
+            return False
+        del self._conversation_cache[conversation_id]
+        self._conversation_cache_bytes -= self._conversation_cache_sizes.pop(conversation_id, 0)
+        return True
+
     def _cache_conversation_turn(self, conversation_id: str, query: str, answer: str) -> None:
         """Cache a conversation turn for future follow-up queries.
 
@@ -113,6 +129,10 @@ class ConversationMixin(BaseClient):
           overflow, the least-recently-used conversation is evicted.
         - Each turn's answer is truncated to `_max_chars_per_turn` characters as a
           safety net against pathological payloads.
+        - The total size of cached turn text is bounded to `_max_cache_bytes`.
+          Sizes are maintained incrementally here; on overflow whole LRU
+          conversations are evicted first, then the oldest turns of the current
+          conversation. The newest turn is always kept so follow-ups still work.
 
         Set any knob to 0 in the constructor's env vars to disable that specific
         cap (useful for tests).
@@ -129,40 +149,62 @@ class ConversationMixin(BaseClient):
                     self._max_conversations > 0
                     and len(self._conversation_cache) >= self._max_conversations
                 ):
-                    self._conversation_cache.popitem(last=False)
+                    self._drop_conversation_locked(next(iter(self._conversation_cache)))
+                    self._conversation_cache_evictions += 1
                 self._conversation_cache[conversation_id] = []
+                self._conversation_cache_sizes[conversation_id] = 0
             else:
                 # Existing conversation — mark as recently used.
                 self._conversation_cache.move_to_end(conversation_id)
 
-            turn_number = len(self._conversation_cache[conversation_id]) + 1
-            turn = ConversationTurn(query=query, answer=answer, turn_number=turn_number)
-            self._conversation_cache[conversation_id].append(turn)
+            turns = self._conversation_cache[conversation_id]
+            turn = ConversationTurn(query=query, answer=answer, turn_number=len(turns) + 1)
+            turns.append(turn)
+            added = self._turn_size(turn)
+            self._conversation_cache_sizes[conversation_id] = (
+                self._conversation_cache_sizes.get(conversation_id, 0) + added
+            )
+            self._conversation_cache_bytes += added
 
             # Per-conversation turn list trim (FIFO from the front). Renumber
             # survivors so `turn_number` always means "1-indexed position in the
             # current list" (matches the original unbounded-cache semantics from
             # the caller's perspective).
-            if (
-                self._max_turns_per_conversation > 0
-                and len(self._conversation_cache[conversation_id])
-                > self._max_turns_per_conversation
-            ):
-                kept = self._conversation_cache[conversation_id][
-                    -self._max_turns_per_conversation :
-                ]
+            keep = len(turns)
+            if self._max_turns_per_conversation > 0:
+                keep = min(keep, self._max_turns_per_conversation)
+
+            # Byte budget: evict whole LRU conversations first, then fall back
+            # to trimming this conversation's oldest turns. Turns the count cap
+            # is about to drop don't count against the budget.
+            if self._max_cache_bytes > 0:
+                capped = sum(self._turn_size(t) for t in turns[: len(turns) - keep])
+                while (
+                    self._conversation_cache_bytes - capped > self._max_cache_bytes
+                    and len(self._conversation_cache) > 1
+                ):
+                    self._drop_conversation_locked(next(iter(self._conversation_cache)))
+                    self._conversation_cache_evictions += 1
+                over = self._conversation_cache_bytes - capped - self._max_cache_bytes
+                for old in turns[len(turns) - keep : -1]:
+                    if over <= 0:
+                        break
+                    over -= self._turn_size(old)
+                    keep -= 1
+
+            if keep < len(turns):
+                dropped = sum(self._turn_size(t) for t in turns[: len(turns) - keep])
+                self._conversation_cache_sizes[conversation_id] -= dropped
+                self._conversation_cache_bytes -= dropped
                 self._conversation_cache[conversation_id] = [
                     ConversationTurn(query=t.query, answer=t.answer, turn_number=i)
-                    for i, t in enumerate(kept, start=1)
+                    for i, t in enumerate(turns[len(turns) - keep :], start=1)
                 ]
 
     def clear_conversation(self, conversation_id: str) -> bool:
         """Clear the conversation cache for a specific conversation."""
         with self._state_lock:
-            if conversation_id in self._conversation_cache:
-                del self._conversation_cache[conversation_id]
-                return True
-            return False
+            return self._drop_conversation_locked(conversation_id)
 
     def get_conversation_history(self, conversation_id: str) -> list[dict[str, str | int]] | None:
         """Get the conversation history for a specific conversation."""
@@ -181,20 +223,27 @@ class ConversationMixin(BaseClient):
         """Return introspection stats about the bounded conversation cache.
 
         Useful for debugging, tests, and exposing memory pressure via tooling.
+        `total_bytes` is the tracked size of all cached turn text and
+        `evictions` counts conversations evicted by the count or byte caps.
 
-        Note: `conversations` and `total_turns` are captured under the lock; the
-        cap fields are immutable post-init, so the small window between release
-        and dict construction is harmless.
+        Note: the live counters are captured under the lock; the cap fields are
+        immutable post-init, so the small window between release and dict
+        construction is harmless.
         """
         with self._state_lock:
             conv_count = len(self._conversation_cache)
             total_turns = sum(len(turns) for turns in self._conversation_cache.values())
+            total_bytes = self._conversation_cache_bytes
+            evictions = self._conversation_cache_evictions
         return {
             "conversations": conv_count,
             "total_turns": total_turns,
+            "total_bytes": total_bytes,
+            "evictions": evictions,
             "max_turns_per_conversation": self._max_turns_per_conversation,
             "max_conversations": self._max_conversations,
             "max_chars_per_turn": self._max_chars_per_turn,
+            "max_bytes": self._max_cache_bytes,
         }
 
     def get_conversation_id(self, notebook_id: str) -> str | None:
@@ -237,6 +286,18 @@ class ConversationMixin(BaseClient):
                 pass
         return None
 
+    def warm_query_client(self) -> None:
+        """Open the pooled query connection before the first question.
+
+        Creates the streamed-query client and completes the TCP/TLS handshake
+        with a lightweight HEAD request, so the first `query()` reuses a live
+        keep-alive connection. Best effort: failures are logged and ignored.
+        """
+        try:
+            self._get_query_client().head(f"{self._get_base_url()}/", timeout=10.0)
+        except Exception as e:
+            logger.debug("Query connection warm-up failed: %s", e)
+
     def delete_chat_history(self, notebook_id: str, conversation_id: str) -> bool:
         """Delete the chat history for a notebook.
 
@@ -254,7 +315,7 @@ class ConversationMixin(BaseClient):
         )
         # Also clear local cache if present
         with self._state_lock:
-            self._conversation_cache.pop(conversation_id, None)
+            self._drop_conversation_locked(conversation_id)
         return result is not None
 
     # =========================================================================
@@ -268,6 +329,7 @@ class ConversationMixin(BaseClient):
         source_ids: list[str] | None = None,
         conversation_id: str | None = None,
         timeout: float = 120.0,
+        on_answer: Callable[[str], None] | None = None,
     ) -> dict[str, Any] | None:
         """Query the notebook with a question.
 
@@ -282,6 +344,9 @@ class ConversationMixin(BaseClient):
                            If None, starts a new conversation.
                            If provided and exists in cache, includes conversation history.
             timeout: Request timeout in seconds (default: 120.0)
+            on_answer: Optional callback invoked with the answer text so far
+                       each time a longer answer frame streams in (thinking
+                       frames are not reported). Runs on the calling thread.
 
         Returns:
             Dict with:
@@ -294,6 +359,30 @@ class ConversationMixin(BaseClient):
             - turn_number: Which turn this is in the conversation (1 = first)
             - is_follow_up: Whether this was a follow-up query
         """
+        return self._query(
+            notebook_id,
+            query_text,
+            source_ids=source_ids,
+            conversation_id=conversation_id,
+            timeout=timeout,
+            on_answer=on_answer,
+        )
+
+    def _query(
+        self,
+        notebook_id: str,
+        query_text: str,
+        source_ids: list[str] | None = None,
+        conversation_id: str | None = None,
+        timeout: float = 120.0,
+        on_answer: Callable[[str], None] | None = None,
+        cache_turn: bool = True,
+    ) -> dict[str, Any] | None:
+        """`query()`, optionally without caching the turn for follow-ups.
+
+        One-off questions (`query_many`) pass ``cache_turn=False`` so they
+        don't push real conversations out of the LRU cache.
+        """
         import uuid
 
         # If no source_ids provided, get them from the notebook
@@ -364,18 +453,20 @@ class ConversationMixin(BaseClient):
         query_string = urllib.parse.urlencode(url_params)
         url = f"{self._get_base_url()}{self.QUERY_ENDPOINT}?{query_string}"
 
-        cookies = self._get_httpx_cookies()
-        # The streamed query endpoint is stricter than batchexecute and rejects
-        # form-encoded payloads without an explicit Content-Type header.
-        headers = {"Content-Type": "application/x-www-form-urlencoded;charset=UTF-8"}
-        with _httpx.Client(timeout=timeout, cookies=cookies, headers=headers) as client:
-            response = client.post(url, content=body)
+        # Frames are parsed as they arrive rather than after buffering the full
+        # body: every frame repeats the cumulative answer, so holding all of them
+        # (and decoding each one's citations) is quadratic in answer length.
+        parser = _QueryResponseParser(on_answer=on_answer)
+        client = self._get_query_client()
+        with client.stream("POST", url, content=body, timeout=timeout) as response:
             response.raise_for_status()
+            debug = logger.isEnabledFor(logging.DEBUG)
+            for line in response.iter_lines():
+                if debug:
+                    logger.debug("Query response line (first 500 chars): %s", line[:500])
+                parser.feed_line(line)
 
-        logger.debug("Raw query response (first 2000 chars): %s", response.text[:2000])
-
-        # Parse streaming response
-        answer_text, citation_data, server_conv_id = self._parse_query_response(response.text)
+        answer_text, citation_data, server_conv_id = parser.finish()
 
         # If the server assigned a conversation ID in the response, use it.
         # This is the key mechanism for chat history persistence — the server
@@ -387,20 +478,28 @@ class ConversationMixin(BaseClient):
                 # even if server_conv_id was already in the cache (in which
                 # case the assignment doesn't reorder it on its own).
                 if conversation_id in self._conversation_cache:
+                    self._drop_conversation_locked(server_conv_id)
                     self._conversation_cache[server_conv_id] = self._conversation_cache.pop(
                         conversation_id
                     )
-                self._conversation_cache.move_to_end(server_conv_id)
+                    self._conversation_cache_sizes[server_conv_id] = (
+                        self._conversation_cache_sizes.pop(conversation_id, 0)
+                    )
+                # A fresh local conversation has nothing cached under either ID.
+                if server_conv_id in self._conversation_cache:
+                    self._conversation_cache.move_to_end(server_conv_id)
             conversation_id = server_conv_id
 
         # Cache this turn for future follow-ups (only if we got an answer)
-        if answer_text:
+        if answer_text and cache_turn:
             self._cache_conversation_turn(conversation_id, query_text, answer_text)
 
         # Calculate turn number
         with self._state_lock:
             turns = self._conversation_cache.get(conversation_id, [])
             turn_number = len(turns)
+        if answer_text and not cache_turn:
+            turn_number += 1
 
         return {
             "answer": answer_text,
@@ -412,6 +511,84 @@ class ConversationMixin(BaseClient):
             "is_follow_up": not is_new_conversation,
         }
 
+    def query_many(
+        self,
+        notebook_id: str,
+        questions: Iterable[str],
+        source_ids: list[str] | None = None,
+        concurrency: int = 4,
+        timeout: float = 120.0,
+    ) -> Iterator[dict[str, Any]]:
+        """Ask many independent questions of one notebook concurrently.
+
+        Source IDs are resolved once for the whole batch. Each question runs in
+        its own fresh conversation (no server conversation lookup, no shared
+        history) so concurrent answers cannot bleed into each other. Those
+        conversations are not cached, so a large batch doesn't evict the
+        conversations kept for follow-ups. All
+        requests share the pooled query client, at most `concurrency` are in
+        flight, and transient 429/5xx responses are retried with backoff.
+
+        Args:
+            notebook_id: The notebook UUID
+            questions: Questions to ask
+            source_ids: Optional list of source IDs to query (default: all sources)
+            concurrency: Maximum number of questions in flight at once
+            timeout: Per-question request timeout in seconds
+
+        Yields:
+            One dict per question, in completion order, with `index` (position
+            in `questions`) and `question`, plus either the `query()` result
+            fields or `error` (str) if that question failed.
+        """
+        import uuid
+
+        question_list = list(questions)
+        if not question_list:
+            return
+
+        if source_ids is None:
+            notebook_client = cast(_NotebookLookupProtocol, self)
+            notebook_data = notebook_client.get_notebook(notebook_id)
+            source_ids = self._extract_source_ids_from_notebook(notebook_data)
+
+        def _ask(question: str) -> dict[str, Any] | None:
+            return cast(
+                dict[str, Any] | None,
+                execute_with_retry(
+                    self._query,
+                    notebook_id,
+                    question,
+                    source_ids=source_ids,
+                    conversation_id=str(uuid.uuid4()),
+                    timeout=timeout,
+                    cache_turn=False,
+                ),
+            )
+
+        executor = ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(question_list))))
+        try:
+            futures = {executor.submit(_ask, q): i for i, q in enumerate(question_list)}
+            for future in as_completed(futures):
+                index = futures[future]
+                item: dict[str, Any] = {"index": index, "question": question_list[index]}
+                try:
+                    result = future.result()
+                except Exception as e:
+                    item["error"] = str(e)
+                else:
+                    if result:
+                        item.update(result)
+                        # _query() sees an explicit conversation_id, but each
+                        # batch question starts a brand-new conversation.
+                        item["is_follow_up"] = False
+                    else:
+                        item["error"] = "Query returned empty result"
+                yield item
+        finally:
+            # If the caller stops iterating early, don't start queued questions.
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def _extract_source_ids_from_notebook(self, notebook_data: Any) -> list[str]:
         """Extract source IDs from notebook data."""
         source_ids: list[str] = []
@@ -453,85 +630,24 @@ class ConversationMixin(BaseClient):
         If no type 1 chunks found, fall back to longest overall.
         If no answer at all but Google returned an error, raise QueryRejectedError.
 
+        This is a convenience wrapper around `_QueryResponseParser` for callers
+        that already hold the full response body; `query()` feeds the parser
+        line by line as frames arrive instead.
+
         Returns:
             Tuple of (answer_text, citation_data, server_conversation_id)
             where server_conversation_id is the ID assigned by the NotebookLM
             backend (used for persistent chat history), or None if not found.
         """
-        # Remove anti-XSSI prefix
-        if response_text.startswith(")]}'"):
-            response_text = response_text[4:]
-
-        lines = response_text.strip().split("\n")
-        longest_answer = ""
-        longest_thinking = ""
-        answer_citation_data: dict[str, Any] = {}
-        detected_errors: list[dict[str, Any]] = []
-        server_conv_id: str | None = None
-
-        def _process_chunk(json_line: str) -> None:
-            nonlocal longest_answer, longest_thinking, answer_citation_data, server_conv_id
-            error = self._extract_error_from_chunk(json_line)
-            if error:
-                detected_errors.append(error)
-                return
-            text, is_answer, cdata, chunk_conv_id = self._extract_answer_from_chunk(json_line)
-            if text:
-                if is_answer and len(text) > len(longest_answer):
-                    longest_answer = text
-                    if cdata:
-                        answer_citation_data = cdata
-                    if chunk_conv_id:
-                        server_conv_id = chunk_conv_id
-                elif not is_answer and len(text) > len(longest_thinking):
-                    longest_thinking = text
-
-        # Parse chunks - prioritize type 1 (answers) over type 2 (thinking)
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            if not line:
-                i += 1
-                continue
-
-            # Try to parse as byte count (indicates next line is JSON)
-            try:
-                int(line)
-                i += 1
-                if i < len(lines):
-                    _process_chunk(lines[i])
-                i += 1
-            except ValueError:
-                _process_chunk(line)
-                i += 1
-
-        result = longest_answer if longest_answer else longest_thinking
-
-        if not result and detected_errors:
-            err = detected_errors[0]
-            raise QueryRejectedError(
-                error_code=err["code"],
-                error_type=err.get("type", ""),
-                raw_detail=err.get("raw", ""),
-            )
-
-        return result, answer_citation_data, server_conv_id
-
-    def _extract_error_from_chunk(self, json_str: str) -> dict[str, Any] | None:
-        """Check if a JSON chunk contains a Google API error.
-
-        Error responses have item[2] as null/None and error info in item[5]:
-          [["wrb.fr", null, null, null, null, [3]]]
-          [["wrb.fr", null, null, null, null, [8, null, [["type.googleapis.com/...Error", [...]]]]]]
-
-        Returns:
-            Dict with 'code', 'type', 'raw' keys if error found, else None
-        """
-        try:
-            data = json.loads(json_str)
-        except json.JSONDecodeError:
-            return None
+        parser = _QueryResponseParser()
+        # StringIO iterates lazily, so the body is never split into a list of lines.
+        for line in io.StringIO(response_text):
+            parser.feed_line(line)
+        return parser.finish()
 
+    @staticmethod
+    def _error_from_frame(data: Any, json_str: str) -> dict[str, Any] | None:
+        """Return error info from an already-decoded frame, or None (see `_extract_error_from_chunk`)."""
         if not isinstance(data, list) or len(data) == 0:
             return None
 
@@ -566,38 +682,32 @@ class ConversationMixin(BaseClient):
 
         return None
 
-    def _extract_answer_from_chunk(
-        self, json_str: str
-    ) -> tuple[str | None, bool, dict[str, Any], str | None]:
-        """Extract answer text, citation data, and server-assigned conversation ID from a single JSON chunk.
-
-        The chunk structure is:
-        [["wrb.fr", null, "<nested_json>", ...]]
-
-        The nested_json contains:
-        [["answer_text", null, [conv_id, hash, timestamp], null, [fmt_segments, null, null, source_passages, type_code]]]
-
-        type_code: 1 = actual answer, 2 = thinking step
-        source_passages (at first_elem[4][3]): list of passage entries, each containing
-        the parent source ID at passage[1][5][0][0][0].
+    def _extract_error_from_chunk(self, json_str: str) -> dict[str, Any] | None:
+        """Check if a JSON chunk contains a Google API error.
 
-        Args:
-            json_str: A single JSON chunk from the response
+        Error responses have item[2] as null/None and error info in item[5]:
+          [["wrb.fr", null, null, null, null, [3]]]
+          [["wrb.fr", null, null, null, null, [8, null, [["type.googleapis.com/...Error", [...]]]]]]
 
         Returns:
-            Tuple of (text, is_answer, citation_data, server_conv_id) where:
-            - is_answer is True for actual answers (type 1)
-            - citation_data is {"sources_used": [...], "citations": {num: source_id}}
-              or empty dict if no citation data found
-            - server_conv_id is the conversation ID assigned by the server, or None
+            Dict with 'code', 'type', 'raw' keys if error found, else None
         """
         try:
             data = json.loads(json_str)
         except json.JSONDecodeError:
-            return None, False, {}, None
+            return None
+        return self._error_from_frame(data, json_str)
 
+    @staticmethod
+    def _answer_from_frame(data: Any) -> tuple[str | None, bool, list[Any] | None, str | None]:
+        """Decode answer text, answer flag, raw type_info and conv ID from a decoded frame.
+
+        This is the cheap half of `_extract_answer_from_chunk`: it never walks
+        the citation passages, it only hands back the raw `type_info` list so the
+        caller can decide whether (and when) to run `_extract_citation_data`.
+        """
         if not isinstance(data, list) or len(data) == 0:
-            return None, False, {}, None
+            return None, False, None, None
 
         for item in data:
             if not isinstance(item, list) or len(item) < 3:
@@ -621,7 +731,7 @@ class ConversationMixin(BaseClient):
                     answer_text = first_elem[0]
                     if isinstance(answer_text, str):
                         is_answer = False
-                        citation_data: dict[str, Any] = {}
+                        type_info: list[Any] | None = None
                         server_conv_id: str | None = None
 
                         # Extract server-assigned conversation ID from conv_data
@@ -635,33 +745,71 @@ class ConversationMixin(BaseClient):
                             type_info = first_elem[4]
                             if len(type_info) > 0 and isinstance(type_info[-1], int):
                                 is_answer = type_info[-1] == 1
-                            if is_answer:
-                                citation_data = self._extract_citation_data(type_info)
-                        return answer_text, is_answer, citation_data, server_conv_id
+                        return answer_text, is_answer, type_info, server_conv_id
                 elif isinstance(first_elem, str):
-                    return first_elem, False, {}, None
+                    return first_elem, False, None, None
+
+        return None, False, None, None
+
+    def _extract_answer_from_chunk(
+        self, json_str: str
+    ) -> tuple[str | None, bool, dict[str, Any], str | None]:
+        """Extract answer text, citation data, and server-assigned conversation ID from a single JSON chunk.
+
+        The chunk structure is:
+        [["wrb.fr", null, "<nested_json>", ...]]
+
+        The nested_json contains:
+        [["answer_text", null, [conv_id, hash, timestamp], null, [fmt_segments, null, null, source_passages, type_code]]]
+
+        type_code: 1 = actual answer, 2 = thinking step
+        source_passages (at first_elem[4][3]): list of passage entries, each containing
+        the parent source ID at passage[1][5][0][0][0].
+
+        Args:
+            json_str: A single JSON chunk from the response
+
+        Returns:
+            Tuple of (text, is_answer, citation_data, server_conv_id) where:
+            - is_answer is True for actual answers (type 1)
+            - citation_data is {"sources_used": [...], "citations": {num: source_id}}
+              or empty dict if no citation data found
+            - server_conv_id is the conversation ID assigned by the server, or None
+        """
+        try:
+            data = json.loads(json_str)
+        except json.JSONDecodeError:
+            return None, False, {}, None
 
-        return None, False, {}, None
+        text, is_answer, type_info, server_conv_id = self._answer_from_frame(data)
+        citation_data: dict[str, Any] = {}
+        if is_answer and type_info is not None:
+            citation_data = self._extract_citation_data(type_info)
+        return text, is_answer, citation_data, server_conv_id
 
     @staticmethod
-    def _extract_cited_text(detail: list[Any]) -> str | None:
-        """Extract cited text from a passage detail structure.
+    def _decode_passage_detail(detail: list[Any]) -> tuple[str | None, dict[str, Any] | None]:
+        """Decode cited text and the first cited table from a passage detail in one walk.
 
         The text passages are at detail[4], which contains elements in two variants:
           - Wrapped segments: [[start, end, nested], metadata] — first element is a list
           - Direct segments: [start, end, nested] — first element is an integer
-        Each segment has nested_passages containing text as [start, end, text] triplets.
+        Text segments have nested_passages containing text as [start, end, text]
+        triplets. Table segments have segment[2] as null and their data in
+        segment[4] = [dim1, dim2, rows_array]; they contribute a "<cited_table>"
+        placeholder to the text.
 
         Args:
             detail: The inner detail array (passage[1]).
 
         Returns:
-            Concatenated cited text string, or None if no text found.
+            Tuple of (cited_text or None, cited_table dict or None).
         """
         if len(detail) <= 4 or not isinstance(detail[4], list):
-            return None
+            return None, None
 
         texts: list[str] = []
+        cited_table: dict[str, Any] | None = None
         for element in detail[4]:
             if not isinstance(element, list) or not element:
                 continue
@@ -689,6 +837,15 @@ class ConversationMixin(BaseClient):
                         and isinstance(segment[4][2], list)
                     ):
                         texts.append("<cited_table>")
+                        if cited_table is None:
+                            parsed_rows = ConversationMixin._extract_text_from_table_rows(
+                                segment[4][2]
+                            )
+                            if parsed_rows:
+                                cited_table = {
+                                    "num_columns": len(parsed_rows[0]),
+                                    "rows": parsed_rows,
+                                }
                     continue
                 for nested_group in nested:
                     if not isinstance(nested_group, list):
@@ -697,14 +854,32 @@ class ConversationMixin(BaseClient):
                         if not isinstance(inner, list) or len(inner) < 3:
                             continue
                         text_val = inner[2]
-                        if isinstance(text_val, str) and text_val.strip():
-                            texts.append(text_val.strip())
+                        if isinstance(text_val, str):
+                            stripped = text_val.strip()
+                            if stripped:
+                                texts.append(stripped)
                         elif isinstance(text_val, list):
                             for item in text_val:
-                                if isinstance(item, str) and item.strip():
-                                    texts.append(item.strip())
+                                if isinstance(item, str):
+                                    stripped = item.strip()
+                                    if stripped:
+                                        texts.append(stripped)
 
-        return " ".join(texts) if texts else None
+        return (" ".join(texts) if texts else None), cited_table
+
+    @staticmethod
+    def _extract_cited_text(detail: list[Any]) -> str | None:
+        """Extract cited text from a passage detail structure.
+
+        See `_decode_passage_detail` for the segment layout.
+
+        Args:
+            detail: The inner detail array (passage[1]).
+
+        Returns:
+            Concatenated cited text string, or None if no text found.
+        """
+        return ConversationMixin._decode_passage_detail(detail)[0]
 
     @staticmethod
     def _extract_text_from_table_rows(rows: list[Any]) -> list[list[str]]:
@@ -768,37 +943,7 @@ class ConversationMixin(BaseClient):
             Dict with 'num_columns' and 'rows' (list of lists of cell strings),
             or None if no table found.
         """
-        if len(detail) <= 4 or not isinstance(detail[4], list):
-            return None
-
-        for element in detail[4]:
-            if not isinstance(element, list) or not element:
-                continue
-
-            segments = [element] if isinstance(element[0], (int, float)) else element
-
-            for segment in segments:
-                if not isinstance(segment, list) or len(segment) < 3:
-                    continue
-                if not isinstance(segment[0], (int, float)):
-                    continue
-                # Table segments have segment[2] as null, data in segment[4]
-                if isinstance(segment[2], list):
-                    continue
-                if len(segment) <= 4 or not isinstance(segment[4], list):
-                    continue
-                table_info = segment[4]
-                if len(table_info) < 3 or not isinstance(table_info[2], list):
-                    continue
-
-                parsed_rows = ConversationMixin._extract_text_from_table_rows(table_info[2])
-                if parsed_rows:
-                    return {
-                        "num_columns": len(parsed_rows[0]),
-                        "rows": parsed_rows,
-                    }
-
-        return None
+        return ConversationMixin._decode_passage_detail(detail)[1]
 
     @staticmethod
     def _extract_citation_data(type_info: list[Any]) -> dict[str, Any]:
@@ -816,63 +961,211 @@ class ConversationMixin(BaseClient):
             and 'references' (list of {source_id, citation_number, cited_text}),
             or empty dict.
         """
+        return _CitationIndex().build(type_info)
+
+
+class _CitationIndex:
+    """Single-pass citation decoder with passage reuse across frames.
+
+    `build()` walks the passages once, indexing citation number -> source_id
+    and source_id -> citation numbers, and decodes each passage's cited text
+    and table in one traversal of its segments. Decoded passages are memoized
+    by (passage_id, source_id): the streamed query endpoint re-sends every
+    earlier passage in each cumulative frame, so reusing one index for a whole
+    response decodes each passage once no matter how many frames carry it.
+    """
+
+    __slots__ = ("_decoded", "citations", "by_source")
+
+    def __init__(self) -> None:
+        self._decoded: dict[tuple[str, str], dict[str, Any]] = {}
+        self.citations: dict[int, str] = {}
+        self.by_source: dict[str, list[int]] = {}
+
+    @staticmethod
+    def _source_id(detail: list[Any]) -> str | None:
+        """Return the parent source ID at detail[5][0][0][0], or None."""
+        if len(detail) < 6:
+            return None
+        source_ref = detail[5]
+        if not isinstance(source_ref, list) or not source_ref:
+            return None
+        first_ref = source_ref[0]
+        if not isinstance(first_ref, list) or not first_ref:
+            return None
+        wrapper = first_ref[0]
+        if not isinstance(wrapper, list) or not wrapper:
+            return None
+        source_id = wrapper[0]
+        return source_id if isinstance(source_id, str) else None
+
+    def build(self, type_info: list[Any]) -> dict[str, Any]:
+        """Index the passages at type_info[3]; see ConversationMixin._extract_citation_data."""
+        self.citations = {}
+        self.by_source = {}
         try:
             if len(type_info) < 4 or not isinstance(type_info[3], list):
                 return {}
-
             passages = type_info[3]
-            if not passages:
-                return {}
 
-            citations: dict[int, str] = {}
-            seen_sources: dict[str, None] = {}  # ordered set via dict
             references: list[dict[str, Any]] = []
-
             for i, passage in enumerate(passages):
                 if not isinstance(passage, list) or len(passage) < 2:
                     continue
                 detail = passage[1]
-                if not isinstance(detail, list) or len(detail) < 6:
+                if not isinstance(detail, list):
                     continue
-                source_ref = detail[5]
-                if not isinstance(source_ref, list) or len(source_ref) == 0:
+                source_id = self._source_id(detail)
+                if source_id is None:
                     continue
-                first_ref = source_ref[0]
-                if not isinstance(first_ref, list) or len(first_ref) == 0:
-                    continue
-                source_id_wrapper = first_ref[0]
-                if not isinstance(source_id_wrapper, list) or len(source_id_wrapper) == 0:
-                    continue
-                source_id = source_id_wrapper[0]
-                if isinstance(source_id, str):
-                    citation_number = i + 1
-                    citations[citation_number] = source_id
-                    seen_sources[source_id] = None
-
-                    # Extract cited text from passage detail
-                    cited_text = ConversationMixin._extract_cited_text(detail)
-
-                    ref_entry: dict[str, Any] = {
-                        "source_id": source_id,
-                        "citation_number": citation_number,
-                    }
-                    if cited_text:
-                        ref_entry["cited_text"] = cited_text
 
-                    # Extract structured table data if present
-                    cited_table = ConversationMixin._extract_table_from_detail(detail)
+                citation_number = i + 1
+                self.citations[citation_number] = source_id
+                self.by_source.setdefault(source_id, []).append(citation_number)
+
+                passage_key = passage[0][0] if isinstance(passage[0], list) and passage[0] else None
+                decoded = (
+                    self._decoded.get((passage_key, source_id))
+                    if isinstance(passage_key, str)
+                    else None
+                )
+                if decoded is None:
+                    cited_text, cited_table = ConversationMixin._decode_passage_detail(detail)
+                    decoded = {}
+                    if cited_text:
+                        decoded["cited_text"] = cited_text
                     if cited_table:
-                        ref_entry["cited_table"] = cited_table
+                        decoded["cited_table"] = cited_table
+                    if isinstance(passage_key, str):
+                        self._decoded[(passage_key, source_id)] = decoded
 
-                    references.append(ref_entry)
+                references.append(
+                    {"source_id": source_id, "citation_number": citation_number, **decoded}
+                )
 
-            if not citations:
+            if not self.citations:
                 return {}
 
             return {
-                "sources_used": list(seen_sources.keys()),
-                "citations": citations,
+                # by_source preserves first-seen order of source IDs
+                "sources_used": list(self.by_source),
+                "citations": dict(self.citations),
                 "references": references,
             }
         except (IndexError, TypeError):
             return {}
+
+
+class _QueryResponseParser:
+    """Incremental parser for the streamed query endpoint.
+
+    The endpoint emits `)]}'`, then alternating byte-count and JSON lines. Each
+    JSON frame re-sends the *cumulative* answer together with its full citation
+    payload, so decoding citations per frame makes parsing quadratic in answer
+    length. This parser keeps only the current winning frame's raw `type_info`
+    and runs the deep citation walk once, in `finish()`.
+
+    Feed lines as they arrive via `feed_line()`; call `finish()` at end of stream.
+    If `on_answer` is given it is called with the answer text each time a
+    longer answer frame arrives, for live display.
+    """
+
+    __slots__ = (
+        "_expect_payload",
+        "_first_line",
+        "_longest_answer",
+        "_longest_thinking",
+        "_answer_type_info",
+        "_server_conv_id",
+        "_first_error",
+        "_citations",
+        "_on_answer",
+    )
+
+    def __init__(self, on_answer: Callable[[str], None] | None = None) -> None:
+        self._expect_payload = False
+        self._first_line = True
+        self._longest_answer = ""
+        self._longest_thinking = ""
+        self._answer_type_info: list[Any] | None = None
+        self._server_conv_id: str | None = None
+        self._first_error: dict[str, Any] | None = None
+        self._citations = _CitationIndex()
+        self._on_answer = on_answer
+
+    @property
+    def answer(self) -> str:
+        """Best answer text seen so far (answer frames win over thinking frames)."""
+        return self._longest_answer or self._longest_thinking
+
+    def citation_data(self) -> dict[str, Any]:
+        """Decode citations for the best answer frame seen so far.
+
+        Safe to call mid-stream: passages already decoded for an earlier frame
+        are reused, so repeated calls only pay for newly cited passages.
+        """
+        if self._answer_type_info is None:
+            return {}
+        return self._citations.build(self._answer_type_info)
+
+    def feed_line(self, line: str) -> None:
+        """Consume one line of the response body."""
+        if self._first_line:
+            self._first_line = False
+            # Remove anti-XSSI prefix
+            if line.startswith(")]}'"):
+                line = line[4:]
+        line = line.strip()
+        if not line:
+            return
+
+        if not self._expect_payload and line.isdigit():
+            # Byte count: the next line is the JSON payload
+            self._expect_payload = True
+            return
+        self._expect_payload = False
+        self._feed_frame(line)
+
+    def _feed_frame(self, json_str: str) -> None:
+        try:
+            data = json.loads(json_str)
+        except json.JSONDecodeError:
+            return
+
+        error = ConversationMixin._error_from_frame(data, json_str)
+        if error:
+            if self._first_error is None:
+                self._first_error = error
+            return
+
+        text, is_answer, type_info, chunk_conv_id = ConversationMixin._answer_from_frame(data)
+        if not text:
+            return
+        if is_answer and len(text) > len(self._longest_answer):
+            self._longest_answer = text
+            if type_info is not None and len(type_info) > 3 and type_info[3]:
+                self._answer_type_info = type_info
+            if chunk_conv_id:
+                self._server_conv_id = chunk_conv_id
+            if self._on_answer is not None:
+                self._on_answer(text)
+        elif not is_answer and len(text) > len(self._longest_thinking):
+            self._longest_thinking = text
+
+    def finish(self) -> tuple[str, dict[str, Any], str | None]:
+        """Return (answer_text, citation_data, server_conversation_id).
+
+        Raises:
+            QueryRejectedError: If no text was received but Google returned an error.
+        """
+        result = self.answer
+
+        if not result and self._first_error:
+            err = self._first_error
+            raise QueryRejectedError(
+                error_code=err["code"],
+                error_type=err.get("type", ""),
+                raw_detail=err.get("raw", ""),
+            )
+
+        return result, self.citation_data(), self._server_conv_id
@@ -3,10 +3,15 @@
 
 import asyncio
 import csv
+import hashlib
 import html as html_module
 import json
+import os
 import re
-from collections.abc import Callable
+import threading
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
@@ -24,6 +29,48 @@ from .errors import (
     ClientAuthenticationError as AuthenticationError,
 )
 
+# Artifact lists captured once per notebook for a bulk download (notebook ID →
+# {"artifacts": raw poll_studio list, "mind_maps": raw mind map list}). While
+# set, `_list_raw` and mind map lookups are answered from it instead of
+# re-running the list RPC for every file.
+_artifact_snapshots: ContextVar[dict[str, dict[str, list[Any]]] | None] = ContextVar(
+    "artifact_snapshots", default=None
+)
+
+# Per-host download limit for the current bulk download: (limit, host → semaphore).
+_host_limits: ContextVar[tuple[int, dict[str, asyncio.Semaphore]] | None] = ContextVar(
+    "download_host_limits", default=None
+)
+
+# AsyncClient shared by every file of the current bulk download, so connections
+# to the media hosts are reused instead of opened per file.
+_shared_download_client: ContextVar[httpx.AsyncClient | None] = ContextVar(
+    "shared_download_client", default=None
+)
+
+# Serializes lseek+write where os.pwrite is unavailable (Windows).
+_seek_write_lock = threading.Lock()
+
+
+@contextmanager
+def use_artifact_snapshots(snapshots: dict[str, dict[str, list[Any]]]) -> Iterator[None]:
+    """Serve artifact lookups from `snapshots` (see `DownloadMixin.snapshot_artifacts`)."""
+    token = _artifact_snapshots.set(snapshots)
+    try:
+        yield
+    finally:
+        _artifact_snapshots.reset(token)
+
+
+@contextmanager
+def limit_download_hosts(per_host: int) -> Iterator[None]:
+    """Allow at most `per_host` concurrent file downloads from any one host."""
+    token = _host_limits.set((per_host, {}))
+    try:
+        yield
+    finally:
+        _host_limits.reset(token)
+
 
 class DownloadMixin(BaseClient):
     """Mixin for artifact download operations.
@@ -42,6 +89,9 @@ class DownloadMixin(BaseClient):
 
     _AUDIO_DOWNLOAD_RETRY_DELAYS = (5, 10, 20, 30, 45, 60, 60)
     _GOOGLE_MEDIA_DOWNLOAD_HOSTS = {"lh3.googleusercontent.com", "lh3.google.com"}
+    _DOWNLOAD_RESUME_ATTEMPTS = 3
+    _DOWNLOAD_RESUME_DELAY = 2.0
+    _MIN_SEGMENT_BYTES = 1 << 20
 
     # =========================================================================
     # Core Download Infrastructure
@@ -101,42 +151,301 @@ class DownloadMixin(BaseClient):
             and final_url.path.startswith("/rd-notebooklm/")
         )
 
-    async def _download_url(
+    @staticmethod
+    def _partial_meta_path(temp_file: Path) -> Path:
+        """Sidecar recording what a partial `.tmp` download was fetched from."""
+        return temp_file.with_suffix(temp_file.suffix + ".json")
+
+    @staticmethod
+    def _discard_partial(temp_file: Path, meta_file: Path) -> None:
+        temp_file.unlink(missing_ok=True)
+        meta_file.unlink(missing_ok=True)
+
+    def _load_partial(self, url: str, temp_file: Path, meta_file: Path) -> tuple[int, dict]:
+        """Return (bytes on disk, sidecar) for a resumable partial download.
+
+        A partial is only resumable if it came from the same URL and the
+        server gave a validator (ETag or Last-Modified) to send as `If-Range`;
+        anything else is discarded and the download starts from zero.
+        """
+        offset = temp_file.stat().st_size if temp_file.exists() else 0
+        try:
+            meta = json.loads(meta_file.read_text())
+        except (OSError, ValueError):
+            meta = {}
+        length = meta.get("length")
+        if (
+            offset == 0
+            or meta.get("url") != url
+            or not (meta.get("etag") or meta.get("last_modified"))
+            or (length is not None and offset > length)
+        ):
+            self._discard_partial(temp_file, meta_file)
+            return 0, {}
+        return offset, meta
+
+    @staticmethod
+    def _parse_content_range(value: str | None) -> tuple[int | None, int | None]:
+        """Parse ``bytes START-END/TOTAL`` into (START, TOTAL); TOTAL may be ``*``."""
+        match = re.fullmatch(r"bytes (\d+)-\d+/(\d+|\*)", (value or "").strip())
+        if not match:
+            return None, None
+        total = match.group(2)
+        return int(match.group(1)), None if total == "*" else int(total)
+
+    @staticmethod
+    def _is_encoded(response: httpx.Response) -> bool:
+        """Whether the body has a Content-Encoding (e.g. gzip) that httpx decodes.
+
+        Content-Length, Content-Range and Range offsets count encoded bytes,
+        so they don't line up with the decoded bytes written to disk.
+        """
+        return response.headers.get("content-encoding", "identity").lower() not in ("", "identity")
+
+    async def _fetch_to_temp(
         self,
+        client: httpx.AsyncClient,
         url: str,
-        output_path: str,
-        progress_callback: Callable[[int, int], None] | None = None,
-        chunk_size: int = 65536,
-    ) -> str:
-        """Download content from a URL to a local file with streaming support.
+        temp_file: Path,
+        progress_callback: Callable[[int, int], None] | None,
+        chunk_size: int,
+    ) -> tuple[int, int]:
+        """Fetch `url` into `temp_file`, resuming a partial download if possible.
 
-        Features:
-        - Streams file in chunks to minimize memory usage
-        - Optional progress callback for UI integration
-        - Per-chunk timeouts to detect stalled connections
-        - Temp file usage to prevent corrupted partial downloads
-        - Authentication error detection
+        Returns:
+            (bytes now in temp_file, expected total or 0 if unknown)
+        """
+        meta_file = self._partial_meta_path(temp_file)
+        offset, meta = self._load_partial(url, temp_file, meta_file)
+        request_headers = {}
+        if offset:
+            request_headers["Range"] = f"bytes={offset}-"
+            request_headers["If-Range"] = meta.get("etag") or meta["last_modified"]
+            logger.info(f"Resuming download of {temp_file.name} at byte {offset}")
+
+        async with client.stream("GET", url, headers=request_headers) as response:
+            restart = False
+            if offset and response.status_code == 416:
+                # The partial no longer lines up with the server's copy.
+                restart = True
+            elif offset and response.status_code == 206:
+                start, total_bytes = self._parse_content_range(
+                    response.headers.get("content-range")
+                )
+                # Encoded ranges can't be appended to a decoded partial.
+                restart = start != offset or self._is_encoded(response)
+                total_bytes = total_bytes or meta.get("length") or 0
+                mode = "ab"
+            else:
+                response.raise_for_status()
+                # A 200 to a ranged request means If-Range failed (the file
+                # changed) or ranges aren't supported: start over.
+                offset = 0
+                content_length = response.headers.get("content-length")
+                # An encoded body's length isn't the size of the file on disk.
+                encoded = self._is_encoded(response)
+                total_bytes = int(content_length) if content_length and not encoded else 0
+                mode = "wb"
 
-        Args:
-            url: The URL to download
-            output_path: The local path to save the file
-            progress_callback: Optional callback(bytes_downloaded, total_bytes)
-            chunk_size: Size of chunks to read (default 64KB)
+            if not restart:
+                bytes_downloaded = offset
+                chunks = response.aiter_bytes(chunk_size=chunk_size)
 
-        Returns:
-            The output path
+                # Check for auth redirect before starting download
+                first_chunk = b""
+                content_type = response.headers.get("content-type", "").lower()
+                if "text/html" in content_type:
+                    # Read first chunk to check for login page
+                    first_chunk = await anext(chunks, b"")
 
-        Raises:
-            ArtifactDownloadError: If download fails
-            AuthenticationError: If auth redirect detected
+                    if self._looks_like_login_page(first_chunk):
+                        self._discard_partial(temp_file, meta_file)
+                        raise AuthenticationError(
+                            "Download failed: Redirected to login page. "
+                            "Run 'nlm login' to refresh credentials."
+                        )
+
+                # Record where this partial comes from, so an interrupted
+                # download can continue with a validated Range request.
+                # Without a validator a resume can't be checked, and decoded
+                # bytes can't be resumed at an encoded offset, so then none is kept.
+                if mode == "wb":
+                    meta = {
+                        "url": url,
+                        "etag": response.headers.get("etag"),
+                        "last_modified": response.headers.get("last-modified"),
+                        "length": total_bytes or None,
+                    }
+                    if (meta["etag"] or meta["last_modified"]) and not encoded:
+                        meta_file.write_text(json.dumps(meta))
+                    else:
+                        meta_file.unlink(missing_ok=True)
+
+                # Disk writes run in a worker thread so a slow disk doesn't
+                # stall the event loop between chunks.
+                f = await asyncio.to_thread(open, temp_file, mode)
+                try:
+                    if first_chunk:
+                        await asyncio.to_thread(f.write, first_chunk)
+                        bytes_downloaded += len(first_chunk)
+                        if progress_callback:
+                            progress_callback(bytes_downloaded, total_bytes)
+                    async for chunk in chunks:
+                        await asyncio.to_thread(f.write, chunk)
+                        bytes_downloaded += len(chunk)
+
+                        if progress_callback:
+                            progress_callback(bytes_downloaded, total_bytes)
+                finally:
+                    await asyncio.to_thread(f.close)
+
+        if restart:
+            self._discard_partial(temp_file, meta_file)
+            return await self._fetch_to_temp(client, url, temp_file, progress_callback, chunk_size)
+        return bytes_downloaded, total_bytes
+
+    async def _fetch_with_resume(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        temp_file: Path,
+        progress_callback: Callable[[int, int], None] | None,
+        chunk_size: int,
+    ) -> None:
+        """Single-stream fetch into `temp_file`, resuming after dropped connections."""
+        meta_file = self._partial_meta_path(temp_file)
+        attempts = self._DOWNLOAD_RESUME_ATTEMPTS
+        for attempt in range(attempts + 1):
+            try:
+                received, total_bytes = await self._fetch_to_temp(
+                    client, url, temp_file, progress_callback, chunk_size
+                )
+            except httpx.TransportError as e:
+                # Dropped connection: retry from where it stopped, if
+                # what we have can be resumed.
+                if attempt == attempts or not meta_file.exists():
+                    raise
+                logger.warning(f"Download interrupted ({e}); resuming...")
+                await asyncio.sleep(self._DOWNLOAD_RESUME_DELAY)
+                continue
+
+            if not total_bytes or received == total_bytes:
+                return
+            if received > total_bytes or attempt == attempts:
+                raise ArtifactDownloadError(
+                    "file",
+                    details=f"Incomplete download: got {received} of {total_bytes} bytes",
+                )
+            logger.warning(f"Download ended early ({received} of {total_bytes} bytes); resuming...")
+            await asyncio.sleep(self._DOWNLOAD_RESUME_DELAY)
+
+    @staticmethod
+    def _write_at(fd: int, data: bytes, position: int) -> None:
+        """Write all of `data` at `position` without relying on a shared file offset."""
+        view = memoryview(data)
+        while view:
+            if hasattr(os, "pwrite"):
+                written = os.pwrite(fd, view, position)
+            else:
+                # Windows has no pwrite; segments write from worker threads,
+                # so seek and write must not interleave.
+                with _seek_write_lock:
+                    os.lseek(fd, position, os.SEEK_SET)
+                    written = os.write(fd, view)
+            view = view[written:]
+            position += written
+
+    async def _fetch_segmented(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        temp_file: Path,
+        segments: int,
+        progress_callback: Callable[[int, int], None] | None,
+        chunk_size: int,
+    ) -> bool:
+        """Fetch `url` as concurrent byte ranges written into a preallocated file.
+
+        Google's media CDNs cap per-connection throughput, so several ranged
+        GETs on the same client finish a large file sooner than one stream.
+        A one-byte probe checks for range support and the total length first.
+
+        Returns:
+            False (without writing anything) if the server doesn't support
+            ranges or the file is too small to split; True once every segment
+            has been written.
         """
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+        async with client.stream("GET", url, headers={"Range": "bytes=0-0"}) as probe:
+            if probe.status_code != 206:
+                return False
+            _, total_bytes = self._parse_content_range(probe.headers.get("content-range"))
+            if "text/html" in probe.headers.get("content-type", "").lower():
+                return False  # Let the single-stream path detect login redirects
+            if self._is_encoded(probe):
+                return False  # Ranges would count encoded bytes
+            validator = probe.headers.get("etag") or probe.headers.get("last-modified")
+
+        segments = min(segments, (total_bytes or 0) // self._MIN_SEGMENT_BYTES)
+        if segments < 2:
+            return False
 
-        # Use temp file to prevent corrupted partial downloads
-        temp_file = output_file.with_suffix(output_file.suffix + ".tmp")
+        size = -(-total_bytes // segments)
+        ranges = [
+            (start, min(start + size, total_bytes) - 1) for start in range(0, total_bytes, size)
+        ]
+        received = 0
+
+        async def fetch_segment(start: int, end: int) -> None:
+            nonlocal received
+            position = start
+            attempts = self._DOWNLOAD_RESUME_ATTEMPTS
+            for attempt in range(attempts + 1):
+                request_headers = {"Range": f"bytes={position}-{end}"}
+                if validator:
+                    request_headers["If-Range"] = validator
+                try:
+                    async with client.stream("GET", url, headers=request_headers) as response:
+                        if response.status_code != 206:
+                            response.raise_for_status()
+                            raise ArtifactDownloadError(
+                                "file", details="Server stopped honoring byte ranges mid-download"
+                            )
+                        async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                            chunk = chunk[: end + 1 - position]
+                            await asyncio.to_thread(self._write_at, fd, chunk, position)
+                            position += len(chunk)
+                            received += len(chunk)
+                            if progress_callback:
+                                progress_callback(received, total_bytes)
+                            if position > end:
+                                return
+                except httpx.TransportError as e:
+                    if attempt == attempts:
+                        raise
+                    logger.warning(f"Segment {start}-{end} interrupted ({e}); resuming...")
+                if attempt < attempts:
+                    await asyncio.sleep(self._DOWNLOAD_RESUME_DELAY)
+            raise ArtifactDownloadError(
+                "file", details=f"Incomplete segment: bytes {start}-{end} stopped at {position}"
+            )
 
-        # Build headers with auth cookies
+        fd = os.open(temp_file, os.O_RDWR | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0))
+        try:
+            os.ftruncate(fd, total_bytes)
+            tasks = [asyncio.create_task(fetch_segment(start, end)) for start, end in ranges]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+        finally:
+            os.close(fd)
+        return True
+
+    def _download_client(self) -> httpx.AsyncClient:
+        """AsyncClient for artifact hosts, with auth cookies and browser-like headers."""
         base_headers = getattr(
             self,
             "_PAGE_FETCH_HEADERS",
@@ -171,84 +480,161 @@ class DownloadMixin(BaseClient):
         # This allows large files to download without timeout while detecting stalls
         timeout = httpx.Timeout(connect=10.0, read=30.0, write=30.0, pool=30.0)
 
+        return httpx.AsyncClient(
+            cookies=cookies, headers=headers, follow_redirects=True, timeout=timeout
+        )
+
+    @asynccontextmanager
+    async def share_download_client(self) -> AsyncIterator[None]:
+        """Serve every download started inside from one AsyncClient.
+
+        Bulk downloads fetch many files from the same few media hosts; sharing
+        the client reuses their connections (and TLS sessions) across files.
+        """
+        async with self._download_client() as client:
+            token = _shared_download_client.set(client)
+            try:
+                yield
+            finally:
+                _shared_download_client.reset(token)
+
+    @asynccontextmanager
+    async def _open_download_client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """The bulk download's shared client if there is one, else a new one."""
+        shared = _shared_download_client.get()
+        if shared is not None:
+            yield shared
+            return
+        async with self._download_client() as client:
+            yield client
+
+    @staticmethod
+    def _looks_like_login_page(first_chunk: bytes) -> bool:
+        """Whether an HTML response body is Google's sign-in page (expired auth)."""
+        head = first_chunk.lower()
+        return b"<!doctype html>" in head or b"sign in" in head
+
+    async def stream_url(self, url: str, chunk_size: int = 65536) -> AsyncIterator[bytes]:
+        """Yield the body of `url` as it arrives, without writing to disk.
+
+        Uses the same headers and cookies as `_download_url` (OSID stripped),
+        for piping media into another process or an upload.
+
+        Raises:
+            ArtifactDownloadError: If the request fails
+            AuthenticationError: If auth redirect detected
+        """
         try:
             async with (
-                httpx.AsyncClient(
-                    cookies=cookies, headers=headers, follow_redirects=True, timeout=timeout
-                ) as client,
+                self._host_slot(url),
+                self._open_download_client() as client,
                 client.stream("GET", url) as response,
             ):
                 response.raise_for_status()
-
-                # Get total size if available
-                content_length = response.headers.get("content-length")
-                total_bytes = int(content_length) if content_length else 0
-
-                # Check for auth redirect before starting download
-                content_type = response.headers.get("content-type", "").lower()
-                if "text/html" in content_type:
-                    # Read first chunk to check for login page
-                    first_chunk = b""
-                    async for chunk in response.aiter_bytes(chunk_size=8192):
-                        first_chunk = chunk
-                        break
-
-                    if (
-                        b"<!doctype html>" in first_chunk.lower()
-                        or b"sign in" in first_chunk.lower()
-                    ):
+                chunks = response.aiter_bytes(chunk_size=chunk_size)
+                if "text/html" in response.headers.get("content-type", "").lower():
+                    first_chunk = await anext(chunks, b"")
+                    if self._looks_like_login_page(first_chunk):
                         raise AuthenticationError(
                             "Download failed: Redirected to login page. "
                             "Run 'nlm login' to refresh credentials."
                         )
+                    if first_chunk:
+                        yield first_chunk
+                async for chunk in chunks:
+                    yield chunk
+        except httpx.HTTPError as e:
+            raise ArtifactDownloadError(
+                "file", details=f"HTTP error streaming from {url[:50]}...: {e}"
+            ) from e
+
+    async def _download_url(
+        self,
+        url: str,
+        output_path: str,
+        progress_callback: Callable[[int, int], None] | None = None,
+        chunk_size: int = 65536,
+        segments: int = 1,
+    ) -> str:
+        """Download content from a URL to a local file with streaming support.
 
-                    # Not an auth error - write first chunk and continue
-                    with open(temp_file, "wb") as f:
-                        f.write(first_chunk)
-                        bytes_downloaded = len(first_chunk)
+        Features:
+        - Streams file in chunks to minimize memory usage
+        - Optional progress callback for UI integration
+        - Per-chunk timeouts to detect stalled connections
+        - Temp file usage to prevent corrupted partial downloads
+        - Resumes interrupted downloads with `Range`/`If-Range` requests,
+          both within this call and on the next call for the same path
+        - Verifies the final size against the server's length
+        - Optional segmented mode: `segments` byte ranges fetched concurrently
+          (falls back to one stream if the server doesn't support ranges)
+        - Authentication error detection
 
-                        if progress_callback:
-                            progress_callback(bytes_downloaded, total_bytes)
+        A partial download is kept as ``<file>.tmp`` next to a
+        ``<file>.tmp.json`` sidecar recording the URL, ETag/Last-Modified and
+        length, so a retry only fetches the missing bytes.
 
-                        # Continue streaming rest of file
-                        async for chunk in response.aiter_bytes(chunk_size=chunk_size):
-                            f.write(chunk)
-                            bytes_downloaded += len(chunk)
+        Args:
+            url: The URL to download
+            output_path: The local path to save the file
+            progress_callback: Optional callback(bytes_downloaded, total_bytes)
+            chunk_size: Size of chunks to read (default 64KB)
+            segments: Number of concurrent byte-range requests (default 1)
 
-                            if progress_callback:
-                                progress_callback(bytes_downloaded, total_bytes)
-                else:
-                    # Binary content - stream directly
-                    bytes_downloaded = 0
-                    with open(temp_file, "wb") as f:
-                        async for chunk in response.aiter_bytes(chunk_size=chunk_size):
-                            f.write(chunk)
-                            bytes_downloaded += len(chunk)
+        Returns:
+            The output path
 
-                            if progress_callback:
-                                progress_callback(bytes_downloaded, total_bytes)
+        Raises:
+            ArtifactDownloadError: If download fails
+            AuthenticationError: If auth redirect detected
+        """
+        output_file = Path(output_path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # Use temp file to prevent corrupted partial downloads
+        temp_file = output_file.with_suffix(output_file.suffix + ".tmp")
+        meta_file = self._partial_meta_path(temp_file)
+
+        try:
+            async with self._host_slot(url), self._open_download_client() as client:
+                # Segmented mode needs a fresh file; a resumable partial
+                # is continued with a single stream instead.
+                if not (
+                    segments > 1
+                    and not meta_file.exists()
+                    and await self._fetch_segmented(
+                        client, url, temp_file, segments, progress_callback, chunk_size
+                    )
+                ):
+                    await self._fetch_with_resume(
+                        client, url, temp_file, progress_callback, chunk_size
+                    )
 
             # Move temp file to final location only on success
+            meta_file.unlink(missing_ok=True)
             temp_file.rename(output_file)
             return str(output_file)
 
-        except httpx.HTTPError as e:
-            # Clean up temp file on failure
-            if temp_file.exists():
-                temp_file.unlink()
-            raise ArtifactDownloadError(
-                "file", details=f"HTTP error downloading from {url[:50]}...: {e}"
-            ) from e
         except Exception as e:
-            # Clean up temp file on failure
-            if temp_file.exists():
-                temp_file.unlink()
+            # Keep a resumable partial for the next attempt; drop anything else
+            if not meta_file.exists():
+                temp_file.unlink(missing_ok=True)
+            if isinstance(e, ArtifactDownloadError):
+                raise
+            if isinstance(e, httpx.HTTPError):
+                raise ArtifactDownloadError(
+                    "file", details=f"HTTP error downloading from {url[:50]}...: {e}"
+                ) from e
             raise ArtifactDownloadError(
                 "file", details=f"Failed to download from {url[:50]}...: {str(e)}"
             ) from e
 
     def _list_raw(self, notebook_id: str) -> list[Any]:
         """Get raw artifact list for parsing download URLs."""
+        snapshot = (_artifact_snapshots.get() or {}).get(notebook_id)
+        if snapshot is not None:
+            return snapshot["artifacts"]
+
         # Poll params: [[2], notebook_id, 'NOT artifact.status = "ARTIFACT_STATUS_SUGGESTED"']
         params = [[2], notebook_id, 'NOT artifact.status = "ARTIFACT_STATUS_SUGGESTED"']
 
@@ -259,6 +645,151 @@ class DownloadMixin(BaseClient):
             return result[0] if isinstance(result[0], list) else result
         return []
 
+    async def _list_raw_async(self, notebook_id: str) -> list[Any]:
+        """`_list_raw` for coroutines: the list RPC runs in a worker thread.
+
+        The RPC layer uses a blocking `httpx.Client`; calling it inline would
+        stall every other coroutine on the event loop (e.g. concurrent
+        downloads in the MCP server) for the length of the request.
+        """
+        snapshot = (_artifact_snapshots.get() or {}).get(notebook_id)
+        if snapshot is not None:
+            return snapshot["artifacts"]
+        return await asyncio.to_thread(self._list_raw, notebook_id)
+
+    def _list_raw_mind_maps(self, notebook_id: str) -> list[Any]:
+        """Get the raw mind map list (mind maps live in the notes system)."""
+        snapshot = (_artifact_snapshots.get() or {}).get(notebook_id)
+        if snapshot is not None:
+            return snapshot["mind_maps"]
+
+        params = [notebook_id]
+        result = self._call_rpc(self.RPC_LIST_MIND_MAPS, params, f"/notebook/{notebook_id}")
+        if result and isinstance(result, list) and len(result) > 0:  # noqa: SIM102
+            if isinstance(result[0], list):
+                return result[0]
+        return []
+
+    def snapshot_artifacts(self, notebook_id: str, mind_maps: bool = True) -> dict[str, list[Any]]:
+        """List a notebook's artifacts (and optionally mind maps) once for bulk downloads."""
+        return {
+            "artifacts": self._list_raw(notebook_id),
+            "mind_maps": self._list_raw_mind_maps(notebook_id) if mind_maps else [],
+        }
+
+    def downloadable_artifacts(self, snapshot: dict[str, list[Any]]) -> list[dict[str, str]]:
+        """Completed artifacts in a snapshot, as dicts with artifact_id, title and type.
+
+        Types use the download names: audio, video, report, infographic,
+        slide_deck, data_table, quiz, flashcards and mind_map.
+        """
+        type_names = {
+            self.STUDIO_TYPE_AUDIO: "audio",
+            self.STUDIO_TYPE_VIDEO: "video",
+            self.STUDIO_TYPE_REPORT: "report",
+            self.STUDIO_TYPE_INFOGRAPHIC: "infographic",
+            self.STUDIO_TYPE_SLIDE_DECK: "slide_deck",
+            self.STUDIO_TYPE_DATA_TABLE: "data_table",
+            self.STUDIO_TYPE_FLASHCARDS: "flashcards",
+        }
+        items = []
+        for a in snapshot["artifacts"]:
+            if not isinstance(a, list) or len(a) <= 4 or a[2] not in type_names:
+                continue
+            ready = (
+                self._is_audio_artifact_ready(a) if a[2] == self.STUDIO_TYPE_AUDIO else a[4] == 3
+            )
+            if not ready:
+                continue
+            artifact_type = type_names[a[2]]
+            if artifact_type == "flashcards":
+                # Quiz shares type 4; options[1][0] is 2 for quizzes
+                try:
+                    if a[9][1][0] == 2:
+                        artifact_type = "quiz"
+                except (IndexError, TypeError):
+                    pass
+            items.append({"artifact_id": a[0], "title": a[1] or "", "type": artifact_type})
+
+        for mm in snapshot["mind_maps"]:
+            # Deleted mind maps are tombstones: [id, None, 2]
+            if isinstance(mm, list) and len(mm) > 1 and isinstance(mm[1], list):
+                title = mm[1][4] if len(mm[1]) > 4 and mm[1][4] else "Mind Map"
+                items.append({"artifact_id": mm[0], "title": title, "type": "mind_map"})
+        return items
+
+    @staticmethod
+    def artifact_marker(entry: list[Any]) -> str:
+        """Fingerprint of an artifact's list entry, for telling versions apart.
+
+        Signed media URLs rotate on every listing, so URL strings are blanked
+        before hashing; everything else (status, content, metadata) counts.
+        """
+
+        def strip_urls(value: Any) -> Any:
+            if isinstance(value, list):
+                return [strip_urls(v) for v in value]
+            if isinstance(value, str) and value.startswith(("http://", "https://")):
+                return ""
+            return value
+
+        payload = json.dumps(strip_urls(entry), ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def select_artifact(
+        self, notebook_id: str, artifact_type: str, artifact_id: str | None = None
+    ) -> tuple[str, str] | None:
+        """Resolve the artifact a download would fetch, as (artifact_id, marker).
+
+        Uses the same selection rules as the download methods (the given ID,
+        else the first completed artifact of the type). Returns None if none
+        matches, leaving the download itself to report why.
+        """
+        if artifact_type == "mind_map":
+            entries = [mm for mm in self._list_raw_mind_maps(notebook_id) if isinstance(mm, list)]
+        else:
+            type_codes = {
+                "audio": self.STUDIO_TYPE_AUDIO,
+                "video": self.STUDIO_TYPE_VIDEO,
+                "report": self.STUDIO_TYPE_REPORT,
+                "infographic": self.STUDIO_TYPE_INFOGRAPHIC,
+                "slide_deck": self.STUDIO_TYPE_SLIDE_DECK,
+                "data_table": self.STUDIO_TYPE_DATA_TABLE,
+                "quiz": self.STUDIO_TYPE_FLASHCARDS,
+                "flashcards": self.STUDIO_TYPE_FLASHCARDS,
+            }
+            if artifact_type not in type_codes:
+                return None
+            entries = [
+                a
+                for a in self._list_raw(notebook_id)
+                if isinstance(a, list)
+                and len(a) > 4
+                and a[2] == type_codes[artifact_type]
+                and (self._is_audio_artifact_ready(a) if artifact_type == "audio" else a[4] == 3)
+            ]
+
+        if artifact_id:
+            target = next((e for e in entries if e and e[0] == artifact_id), None)
+        else:
+            target = entries[0] if entries else None
+        if not target or not isinstance(target[0], str):
+            return None
+        return target[0], self.artifact_marker(target)
+
+    @asynccontextmanager
+    async def _host_slot(self, url: str) -> AsyncIterator[None]:
+        """Hold one of the host's download slots, if a bulk download set a limit."""
+        limits = _host_limits.get()
+        if limits is None:
+            yield
+            return
+        per_host, semaphores = limits
+        host = urlparse(url).hostname or ""
+        semaphore = semaphores.setdefault(host, asyncio.Semaphore(per_host))
+        async with semaphore:
+            yield
+
     # =========================================================================
     # Binary Artifact Downloads (Audio, Video, Infographic, Slide Deck)
     # =========================================================================
@@ -269,6 +800,7 @@ class DownloadMixin(BaseClient):
         output_path: str,
         artifact_id: str | None = None,
         progress_callback: Callable[[int, int], None] | None = None,
+        segments: int = 1,
     ) -> str:
         """Download an Audio Overview to a file.
 
@@ -277,92 +809,129 @@ class DownloadMixin(BaseClient):
             output_path: Path to save the audio file (MP4/MP3).
             artifact_id: Specific artifact ID, or uses first completed audio.
             progress_callback: Optional callback(bytes_downloaded, total_bytes).
+            segments: Fetch this many byte ranges concurrently (default 1).
 
         Returns:
             The output path.
         """
+        url = await self._audio_url(notebook_id, artifact_id)
+
+        for attempt in range(len(self._AUDIO_DOWNLOAD_RETRY_DELAYS) + 1):
+            try:
+                return await self._download_url(
+                    url, output_path, progress_callback, segments=segments
+                )
+            except ArtifactDownloadError as e:
+                await self._wait_out_audio_404(url, e, attempt)
+                url = await self._fresh_audio_url(notebook_id, artifact_id)
+
+        raise ArtifactDownloadError("audio", details="No download URL found")
+
+    async def _wait_out_audio_404(
+        self, url: str, error: ArtifactDownloadError, attempt: int
+    ) -> None:
+        """Sleep before retry `attempt` of a fresh audio URL that 404s; re-raise anything else."""
+        if not self._is_transient_audio_media_404(url, error):
+            raise error
+        if attempt == len(self._AUDIO_DOWNLOAD_RETRY_DELAYS):
+            raise ArtifactDownloadError(
+                "audio",
+                details="media download URL is still propagating; retry in a few minutes",
+            ) from error
+
+        delay = self._AUDIO_DOWNLOAD_RETRY_DELAYS[attempt]
+        logger.warning(
+            f"Audio media URL returned 404 while propagating; retrying in {delay:.0f}s..."
+        )
+        await asyncio.sleep(delay)
+
+    async def _stream_audio(
+        self, notebook_id: str, artifact_id: str | None, chunk_size: int
+    ) -> AsyncIterator[bytes]:
+        """Stream an Audio Overview, retrying like `download_audio` until the first chunk arrives."""
+        url = await self._audio_url(notebook_id, artifact_id)
+        attempt = 0
+        while True:
+            chunks = self.stream_url(url, chunk_size)
+            try:
+                first_chunk = await anext(chunks, None)
+                break
+            except ArtifactDownloadError as e:
+                await self._wait_out_audio_404(url, e, attempt)
+                attempt += 1
+                url = await self._fresh_audio_url(notebook_id, artifact_id)
+        if first_chunk is None:
+            return
+        yield first_chunk
+        async for chunk in chunks:
+            yield chunk
+
+    async def _fresh_audio_url(self, notebook_id: str, artifact_id: str | None) -> str:
+        """`_audio_url` from a new listing, bypassing any artifact snapshot.
+
+        Retries after a propagation 404 need the URL the backend hands out now.
+        """
+        token = _artifact_snapshots.set(None)
+        try:
+            return await self._audio_url(notebook_id, artifact_id)
+        finally:
+            _artifact_snapshots.reset(token)
+
+    async def _audio_url(self, notebook_id: str, artifact_id: str | None) -> str:
+        """Resolve the media URL of a ready Audio Overview."""
+        artifacts = await self._list_raw_async(notebook_id)
+
+        # Filter for ready audio artifacts. Some completed audio payloads use
+        # status code 2 while already exposing media URLs.
+        candidates = [a for a in artifacts if self._is_audio_artifact_ready(a)]
+
+        if not candidates:
+            raise ArtifactNotReadyError("audio")
+
+        if artifact_id:
+            target = next((a for a in candidates if a[0] == artifact_id), None)
+            if not target:
+                raise ArtifactNotReadyError("audio", artifact_id)
+        else:
+            target = candidates[0]
+
         try:
+            # Extract URL from metadata[6][5]
+            metadata = target[6]
+            if not isinstance(metadata, list) or len(metadata) <= 5:
+                raise ArtifactParseError("audio", details="Invalid audio metadata structure")
+
+            media_list = metadata[5]
+            if not isinstance(media_list, list) or len(media_list) == 0:
+                raise ArtifactParseError("audio", details="No media URLs found in metadata")
+
+            # Look for a downloadable audio/mp4 URL.
+            # Google's media list contains multiple entries:
+            #   =m140-dv  (priority 4, "download variant" — fast CDN via drum.usercontent.google.com)
+            #   =m140     (priority 1, streaming transcode — slow CDN via googlevideo.com)
+            # Prefer the "-dv" variant which is the intended download endpoint.
+            url = None
+            for item in media_list:
+                if isinstance(item, list) and len(item) > 2 and item[2] == "audio/mp4":
+                    candidate = item[0]
+                    if isinstance(candidate, str) and candidate.endswith("-dv"):
+                        url = candidate
+                        break
 
-            def select_target() -> list[Any]:
-                artifacts = self._list_raw(notebook_id)
-
-                # Filter for ready audio artifacts. Some completed audio payloads use
-                # status code 2 while already exposing media URLs.
-                candidates = [a for a in artifacts if self._is_audio_artifact_ready(a)]
-
-                if not candidates:
-                    raise ArtifactNotReadyError("audio")
-
-                if artifact_id:
-                    target = next((a for a in candidates if a[0] == artifact_id), None)
-                    if not target:
-                        raise ArtifactNotReadyError("audio", artifact_id)
-                    return target
-                return candidates[0]
-
-            def select_url(target: list[Any]) -> str:
-                # Extract URL from metadata[6][5]
-                metadata = target[6]
-                if not isinstance(metadata, list) or len(metadata) <= 5:
-                    raise ArtifactParseError("audio", details="Invalid audio metadata structure")
-
-                media_list = metadata[5]
-                if not isinstance(media_list, list) or len(media_list) == 0:
-                    raise ArtifactParseError("audio", details="No media URLs found in metadata")
-
-                # Look for a downloadable audio/mp4 URL.
-                # Google's media list contains multiple entries:
-                #   =m140-dv  (priority 4, "download variant" — fast CDN via drum.usercontent.google.com)
-                #   =m140     (priority 1, streaming transcode — slow CDN via googlevideo.com)
-                # Prefer the "-dv" variant which is the intended download endpoint.
-                url = None
+            # Fallback: any audio/mp4 URL
+            if not url:
                 for item in media_list:
                     if isinstance(item, list) and len(item) > 2 and item[2] == "audio/mp4":
-                        candidate = item[0]
-                        if isinstance(candidate, str) and candidate.endswith("-dv"):
-                            url = candidate
-                            break
-
-                # Fallback: any audio/mp4 URL
-                if not url:
-                    for item in media_list:
-                        if isinstance(item, list) and len(item) > 2 and item[2] == "audio/mp4":
-                            url = item[0]
-                            break
-
-                # Last resort: first URL regardless of type
-                if not url and len(media_list) > 0 and isinstance(media_list[0], list):
-                    url = media_list[0][0]
-
-                if not url:
-                    raise ArtifactDownloadError("audio", details="No download URL found")
-                return url
-
-            target = select_target()
-            url = select_url(target)
-
-            for attempt in range(len(self._AUDIO_DOWNLOAD_RETRY_DELAYS) + 1):
-                try:
-                    return await self._download_url(url, output_path, progress_callback)
-                except ArtifactDownloadError as e:
-                    if not self._is_transient_audio_media_404(url, e):
-                        raise
-                    if attempt == len(self._AUDIO_DOWNLOAD_RETRY_DELAYS):
-                        raise ArtifactDownloadError(
-                            "audio",
-                            details="media download URL is still propagating; retry in a few minutes",
-                        ) from e
-
-                    delay = self._AUDIO_DOWNLOAD_RETRY_DELAYS[attempt]
-                    logger.warning(
-                        f"Audio media URL returned 404 while propagating; "
-                        f"retrying in {delay:.0f}s..."
-                    )
-                    await asyncio.sleep(delay)
-                    target = select_target()
-                    url = select_url(target)
+                        url = item[0]
+                        break
 
-            raise ArtifactDownloadError("audio", details="No download URL found")
+            # Last resort: first URL regardless of type
+            if not url and len(media_list) > 0 and isinstance(media_list[0], list):
+                url = media_list[0][0]
+
+            if not url:
+                raise ArtifactDownloadError("audio", details="No download URL found")
+            return url
 
         except (IndexError, TypeError, AttributeError) as e:
             raise ArtifactParseError("audio", details=str(e)) from e
@@ -373,6 +942,7 @@ class DownloadMixin(BaseClient):
         output_path: str,
         artifact_id: str | None = None,
         progress_callback: Callable[[int, int], None] | None = None,
+        segments: int = 1,
     ) -> str:
         """Download a Video Overview to a file.
 
@@ -381,11 +951,17 @@ class DownloadMixin(BaseClient):
             output_path: Path to save the video file (MP4).
             artifact_id: Specific artifact ID, or uses first completed video.
             progress_callback: Optional callback(bytes_downloaded, total_bytes).
+            segments: Fetch this many byte ranges concurrently (default 1).
 
         Returns:
             The output path.
         """
-        artifacts = self._list_raw(notebook_id)
+        url = await self._video_url(notebook_id, artifact_id)
+        return await self._download_url(url, output_path, progress_callback, segments=segments)
+
+    async def _video_url(self, notebook_id: str, artifact_id: str | None) -> str:
+        """Resolve the download URL of a Video Overview."""
+        artifacts = await self._list_raw_async(notebook_id)
 
         # Filter for completed video (Type 3, Status 3)
         candidates = []
@@ -444,7 +1020,7 @@ class DownloadMixin(BaseClient):
             if not url:
                 raise ArtifactDownloadError("video", details="No download URL found")
 
-            return await self._download_url(url, output_path, progress_callback)
+            return url
 
         except (IndexError, TypeError, AttributeError) as e:
             raise ArtifactParseError("video", details=str(e)) from e
@@ -467,7 +1043,12 @@ class DownloadMixin(BaseClient):
         Returns:
             The output path.
         """
-        artifacts = self._list_raw(notebook_id)
+        url = await self._infographic_url(notebook_id, artifact_id)
+        return await self._download_url(url, output_path, progress_callback)
+
+    async def _infographic_url(self, notebook_id: str, artifact_id: str | None) -> str:
+        """Resolve the download URL of an Infographic."""
+        artifacts = await self._list_raw_async(notebook_id)
 
         # Filter for completed infographics (Type 7, Status 3)
         candidates = []
@@ -513,7 +1094,7 @@ class DownloadMixin(BaseClient):
             if not url or not isinstance(url, str):
                 raise ArtifactDownloadError("infographic", details="No download URL found")
 
-            return await self._download_url(url, output_path, progress_callback)
+            return url
 
         except (IndexError, TypeError, AttributeError) as e:
             raise ArtifactParseError("infographic", details=str(e)) from e
@@ -538,7 +1119,14 @@ class DownloadMixin(BaseClient):
         Returns:
             The output path.
         """
-        artifacts = self._list_raw(notebook_id)
+        url = await self._slide_deck_url(notebook_id, artifact_id, file_format)
+        return await self._download_url(url, output_path, progress_callback)
+
+    async def _slide_deck_url(
+        self, notebook_id: str, artifact_id: str | None, file_format: str = "pdf"
+    ) -> str:
+        """Resolve the download URL of a Slide Deck (PDF or PPTX)."""
+        artifacts = await self._list_raw_async(notebook_id)
 
         # Filter for completed slide decks (Type 8, Status 3)
         candidates = []
@@ -577,11 +1165,45 @@ class DownloadMixin(BaseClient):
                 if not url or not isinstance(url, str):
                     raise ArtifactDownloadError("slide_deck", details="No PDF download URL found")
 
-            return await self._download_url(url, output_path, progress_callback)
+            return url
 
         except (IndexError, TypeError, AttributeError) as e:
             raise ArtifactParseError("slide_deck", details=str(e)) from e
 
+    async def stream_artifact(
+        self,
+        notebook_id: str,
+        artifact_type: str,
+        artifact_id: str | None = None,
+        file_format: str = "pdf",
+        chunk_size: int = 65536,
+    ) -> AsyncIterator[bytes]:
+        """Yield a binary artifact's bytes as they arrive, without a temp file.
+
+        Args:
+            notebook_id: The notebook ID.
+            artifact_type: "audio", "video", "infographic" or "slide_deck".
+            artifact_id: Specific artifact ID, or uses first completed one.
+            file_format: For slide_deck only: "pdf" (default) or "pptx".
+            chunk_size: Size of chunks to read (default 64KB).
+        """
+        if artifact_type == "audio":
+            # A just-finished audio's media URL can 404 for a while; retried
+            # before the first chunk, as download_audio does.
+            async for chunk in self._stream_audio(notebook_id, artifact_id, chunk_size):
+                yield chunk
+            return
+        if artifact_type == "video":
+            url = await self._video_url(notebook_id, artifact_id)
+        elif artifact_type == "infographic":
+            url = await self._infographic_url(notebook_id, artifact_id)
+        elif artifact_type == "slide_deck":
+            url = await self._slide_deck_url(notebook_id, artifact_id, file_format)
+        else:
+            raise ValueError(f"Cannot stream artifact type: {artifact_type!r}")
+        async for chunk in self.stream_url(url, chunk_size):
+            yield chunk
+
     # =========================================================================
     # Text Artifact Downloads (Report, Mind Map, Data Table)
     # =========================================================================
@@ -662,13 +1284,7 @@ class DownloadMixin(BaseClient):
             The output path where the file was saved.
         """
         # Mind maps are retrieved via list_mind_maps RPC
-        params = [notebook_id]
-        result = self._call_rpc(self.RPC_LIST_MIND_MAPS, params, f"/notebook/{notebook_id}")
-
-        mind_maps = []
-        if result and isinstance(result, list) and len(result) > 0:  # noqa: SIM102
-            if isinstance(result[0], list):
-                mind_maps = result[0]
+        mind_maps = self._list_raw_mind_maps(notebook_id)
 
         if not mind_maps:
             raise ArtifactNotReadyError("mind_map")
@@ -704,80 +1320,74 @@ class DownloadMixin(BaseClient):
 
     @staticmethod
     def _extract_cell_text(cell: Any, _depth: int = 0) -> str:
-        """Recursively extract text from a nested data table cell structure.
+        """Extract text from a nested data table cell structure.
 
         Data table cells have deeply nested arrays with position markers (integers)
-        and text content (strings). This function traverses the structure and
-        concatenates all text fragments found.
+        and text content (strings). This function walks the structure with an
+        explicit stack (no recursion, so no per-level call overhead) and joins
+        all text fragments found, in order.
 
         Features:
-        - Depth tracking to prevent infinite recursion (max 100 levels)
+        - Ignores anything nested more than 100 levels deep
         - Handles None values gracefully
         - Strips whitespace from extracted text
         - Type validation at each level
 
         Args:
             cell: The cell data structure (can be str, int, list, or other)
-            _depth: Internal recursion depth counter for safety
+            _depth: Nesting depth of `cell` itself (for callers inside a structure)
 
         Returns:
             Extracted text string, stripped of leading/trailing whitespace
         """
-        # Safety: prevent infinite recursion
-        if _depth > 100:
-            return ""
-
-        # Handle different types
-        if cell is None:
+        if _depth > 100 or cell is None:
             return ""
         if isinstance(cell, str):
             return cell.strip()
         if isinstance(cell, (int, float)):
             return ""  # Position markers are numeric
-        if isinstance(cell, list):
-            # Recursively extract from all list items
-            parts = []
-            for item in cell:
-                text = DownloadMixin._extract_cell_text(item, _depth + 1)
-                if text:
-                    parts.append(text)
-            return " ".join(parts) if parts else ""
-
-        # Unknown type - convert to string as fallback
-        return str(cell).strip()
-
-    def _parse_data_table(
-        self, raw_data: list, validate_columns: bool = True
-    ) -> tuple[list[str], list[list[str]]]:
-        """Parse rich-text data table into headers and rows.
+        if not isinstance(cell, list):
+            # Unknown type - convert to string as fallback
+            return str(cell).strip()
+        if _depth == 100:
+            return ""  # Its items would be 101 levels deep
+
+        parts: list[str] = []
+        # (iterator over a list, depth of that list); lists whose items would
+        # be more than 100 levels deep are never pushed
+        stack: list[tuple[Iterator[Any], int]] = [(iter(cell), _depth)]
+        while stack:
+            items, depth = stack[-1]
+            for item in items:
+                # Exact type checks: decoded JSON only holds these types, and
+                # this loop runs for every node of every cell
+                cls = type(item)
+                if cls is str:
+                    text = item.strip()
+                    if text:
+                        parts.append(text)
+                elif cls is list:
+                    if depth < 99:
+                        stack.append((iter(item), depth + 1))
+                        break
+                elif item is not None and cls is not int and cls is not float:
+                    # Subclasses (e.g. bool) and unknown types
+                    text = DownloadMixin._extract_cell_text(item, depth + 1)
+                    if text:
+                        parts.append(text)
+            else:
+                stack.pop()
+        return " ".join(parts)
 
-        Features:
-        - Validates structure at each navigation step with clear error messages
-        - Optional column count validation across all rows
-        - Handles missing/empty cells gracefully
-        - Provides detailed error context for debugging
+    @staticmethod
+    def _data_table_rows_array(raw_data: list) -> list:
+        """Navigate to a data table's rows array, raising ArtifactParseError on bad structure.
 
         Structure: raw_data[0][0][0][0][4][2] contains the rows array where:
         - [0][0][0][0] navigates through wrapper layers
         - [4] contains the table content section [type, flags, rows_array]
         - [2] is the actual rows array
-
-        Each row: [start_pos, end_pos, [cell1, cell2, ...]]
-        Each cell: deeply nested with position markers mixed with text
-
-        Args:
-            raw_data: The raw data table metadata from artifact[18]
-            validate_columns: If True, ensures all rows have same column count as headers
-
-        Returns:
-            Tuple of (headers, rows) where:
-            - headers: List of column names
-            - rows: List of data rows (each row is a list matching header length)
-
-        Raises:
-            ArtifactParseError: With detailed context if parsing fails
         """
-        # Validate and navigate structure with clear error messages
         try:
             if not isinstance(raw_data, list) or len(raw_data) == 0:
                 raise ArtifactParseError(
@@ -844,18 +1454,37 @@ class DownloadMixin(BaseClient):
                 details=f"Structure navigation failed - table may be corrupted or in unexpected format: {e}",
             ) from e
 
-        # Extract headers and rows
+        return rows_array
+
+    def _iter_data_table(
+        self, raw_data: list, validate_columns: bool = True
+    ) -> Iterator[list[str]]:
+        """Decode a rich-text data table row by row: the headers first, then each data row.
+
+        Rows are decoded only as they are consumed, so a writer can stream them
+        out without the whole table being held as strings. Structure errors are
+        raised before the first row; missing headers on the first row; a table
+        with no data rows once the rows run out.
+
+        Each row: [start_pos, end_pos, [cell1, cell2, ...]]
+        Each cell: deeply nested with position markers mixed with text
+
+        Args:
+            raw_data: The raw data table metadata from artifact[18]
+            validate_columns: If True, pads or truncates rows to the header count
+
+        Raises:
+            ArtifactParseError: With detailed context if parsing fails
+        """
+        rows_array = self._data_table_rows_array(raw_data)
+        extract = self._extract_cell_text
         headers: list[str] = []
-        rows: list[list[str]] = []
+        data_rows = 0
         skipped_rows = 0
 
         for i, row_section in enumerate(rows_array):
             # Validate row format: [start_pos, end_pos, [cell_array]]
-            if not isinstance(row_section, list):
-                skipped_rows += 1
-                continue
-
-            if len(row_section) < 3:
+            if not isinstance(row_section, list) or len(row_section) < 3:
                 skipped_rows += 1
                 continue
 
@@ -865,7 +1494,7 @@ class DownloadMixin(BaseClient):
                 continue
 
             # Extract text from each cell
-            row_values = [self._extract_cell_text(cell) for cell in cell_array]
+            row_values = [extract(cell) for cell in cell_array]
 
             # First row is headers
             if i == 0:
@@ -875,47 +1504,103 @@ class DownloadMixin(BaseClient):
                         "data_table",
                         details="First row (headers) is empty - table must have column headers",
                     )
-            else:
-                # Validate column count if requested
-                if validate_columns and len(row_values) != len(headers):
-                    # Pad or truncate to match header length
-                    if len(row_values) < len(headers):
-                        row_values.extend([""] * (len(headers) - len(row_values)))
-                    else:
-                        row_values = row_values[: len(headers)]
+                yield headers
+                continue
 
-                rows.append(row_values)
+            if not headers:
+                raise ArtifactParseError(
+                    "data_table", details="Failed to extract headers - first row may be malformed"
+                )
+            # Pad or truncate to match header length
+            if validate_columns and len(row_values) != len(headers):
+                if len(row_values) < len(headers):
+                    row_values.extend([""] * (len(headers) - len(row_values)))
+                else:
+                    row_values = row_values[: len(headers)]
+            data_rows += 1
+            yield row_values
 
         # Final validation
         if not headers:
             raise ArtifactParseError(
                 "data_table", details="Failed to extract headers - first row may be malformed"
             )
-
-        if not rows:
+        if not data_rows:
             raise ArtifactParseError(
                 "data_table",
                 details=f"No data rows extracted (skipped {skipped_rows} malformed rows)",
             )
 
-        return headers, rows
+    def _parse_data_table(
+        self, raw_data: list, validate_columns: bool = True
+    ) -> tuple[list[str], list[list[str]]]:
+        """Parse rich-text data table into headers and rows.
+
+        Collects `_iter_data_table` into memory; downloads stream it instead.
+
+        Args:
+            raw_data: The raw data table metadata from artifact[18]
+            validate_columns: If True, ensures all rows have same column count as headers
+
+        Returns:
+            Tuple of (headers, rows) where:
+            - headers: List of column names
+            - rows: List of data rows (each row is a list matching header length)
+
+        Raises:
+            ArtifactParseError: With detailed context if parsing fails
+        """
+        rows = self._iter_data_table(raw_data, validate_columns)
+        headers = next(rows)
+        return headers, list(rows)
+
+    @staticmethod
+    def _write_data_table(rows: Iterator[list[str]], output: Path, output_format: str) -> None:
+        """Write decoded rows (headers first) as CSV or JSONL, one row at a time.
+
+        Written through ``<file>.tmp`` so a table that fails mid-way never
+        leaves a partial file behind.
+        """
+        temp = output.with_name(output.name + ".tmp")
+        try:
+            if output_format == "jsonl":
+                with open(temp, "w", encoding="utf-8") as f:
+                    headers = next(rows)
+                    for row in rows:
+                        f.write(
+                            json.dumps(dict(zip(headers, row, strict=True)), ensure_ascii=False)
+                        )
+                        f.write("\n")
+            else:
+                with open(temp, "w", newline="", encoding="utf-8-sig") as f:
+                    csv.writer(f).writerows(rows)
+            os.replace(temp, output)
+        finally:
+            temp.unlink(missing_ok=True)
 
     def download_data_table(
         self,
         notebook_id: str,
         output_path: str,
         artifact_id: str | None = None,
+        output_format: str = "csv",
     ) -> str:
-        """Download a data table as CSV.
+        """Download a data table as CSV, or as JSONL (one object per row).
+
+        Rows are decoded and written one at a time, so large tables are never
+        held in memory as a second, decoded copy.
 
         Args:
             notebook_id: The notebook ID.
-            output_path: Path to save the CSV file.
+            output_path: Path to save the file.
             artifact_id: Specific artifact ID, or uses first completed data table.
+            output_format: "csv" (default) or "jsonl".
 
         Returns:
             The output path where the file was saved.
         """
+        if output_format not in ("csv", "jsonl"):
+            raise ValueError(f"Invalid data table format '{output_format}'. Use csv or jsonl.")
         artifacts = self._list_raw(notebook_id)
 
         # Filter for completed data tables (Type 9, Status 3)
@@ -939,17 +1624,11 @@ class DownloadMixin(BaseClient):
         try:
             # Data is at index 18
             raw_data = target[18]
-            headers, rows = self._parse_data_table(raw_data)
+            rows = self._iter_data_table(raw_data)
 
-            # Write to CSV
             output = Path(output_path)
             output.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(output, "w", newline="", encoding="utf-8-sig") as f:
-                writer = csv.writer(f)
-                writer.writerow(headers)
-                writer.writerows(rows)
-
+            self._write_data_table(rows, output, output_format)
             return str(output)
 
         except (IndexError, TypeError, AttributeError) as e:
@@ -1225,7 +1904,7 @@ class DownloadMixin(BaseClient):
             )
 
         # Get all artifacts and filter for completed interactive artifacts
-        artifacts = self._list_raw(notebook_id)
+        artifacts = await self._list_raw_async(notebook_id)
 
         # Type 4 (STUDIO_TYPE_FLASHCARDS) covers both quizzes and flashcards
         # Status 3 = completed
@@ -1250,7 +1929,7 @@ class DownloadMixin(BaseClient):
             target = candidates[0]  # Most recent
 
         # Fetch HTML content
-        html_content = self._get_artifact_content(notebook_id, target[0])
+        html_content = await asyncio.to_thread(self._get_artifact_content, notebook_id, target[0])
         if not html_content:
             raise ArtifactDownloadError(
                 artifact_type, details="Failed to fetch HTML content from API"
@@ -1276,7 +1955,7 @@ class DownloadMixin(BaseClient):
         # Write to file
         output = Path(output_path)
         output.parent.mkdir(parents=True, exist_ok=True)
-        output.write_text(content, encoding="utf-8")
+        await asyncio.to_thread(output.write_text, content, encoding="utf-8")
 
         logger.info(f"Downloaded {artifact_type} to {output} ({output_format} format)")
         return str(output)
@@ -0,0 +1,61 @@
+"""Local record of when each Drive source was last verified up to date.
+
+NotebookLM exposes no Drive revision ID, so the nearest change signal we
+have is our own history: when a source was last found fresh or last synced,
+and which Drive document it points at. `drive_sync` consults this record to
+skip sources verified within a caller-chosen window without spending a
+freshness RPC on them. A source whose Drive document ID changed is always
+checked again.
+
+The record is kept in the local SQLite database (see `sqlite_store`).
+"""
+
+import time
+
+from .sqlite_store import SQLiteStore
+
+
+class DriveSyncState(SQLiteStore):
+    """SQLite map of source_id → (drive_doc_id, last verified, last synced)."""
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS drive_sources (
+            source_id TEXT PRIMARY KEY,
+            drive_doc_id TEXT,
+            verified_at REAL NOT NULL,
+            synced_at REAL
+        ) WITHOUT ROWID
+        """,
+    )
+
+    def verified_within(self, source_id: str, drive_doc_id: str | None, seconds: float) -> bool:
+        """Whether the source was found fresh or synced in the last `seconds`."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT drive_doc_id, verified_at FROM drive_sources WHERE source_id = ?",
+                (source_id,),
+            ).fetchone()
+        if row is None or row[0] != drive_doc_id:
+            return False
+        return time.time() - row[1] <= seconds
+
+    def record(self, source_id: str, drive_doc_id: str | None, synced: bool = False) -> None:
+        """Remember that the source is now up to date (checked fresh, or synced)."""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO drive_sources VALUES (?, ?, ?, ?)
+                ON CONFLICT (source_id) DO UPDATE SET
+                    drive_doc_id = excluded.drive_doc_id,
+                    verified_at = excluded.verified_at,
+                    synced_at = COALESCE(excluded.synced_at, drive_sources.synced_at)
+                """,
+                (source_id, drive_doc_id, now, now if synced else None),
+            )
+
+
+def get_drive_sync_state() -> DriveSyncState:
+    """Get the process-wide Drive sync record."""
+    return DriveSyncState.shared()
@@ -0,0 +1,76 @@
+"""Local cache of source full text, keyed by source ID.
+
+A source's indexed text does not change once NotebookLM has processed it
+(Drive sources are the exception: after `sync_drive_source` they get fresh
+content, so re-fetch with ``refresh=True``). Bulk exports store each fetched
+`get_source_fulltext` result here so re-runs only fetch sources added since.
+
+The cache is kept in the local SQLite database (see `sqlite_store`).
+"""
+
+import time
+from typing import Any
+
+from .sqlite_store import SQLiteStore
+
+
+class FulltextCache(SQLiteStore):
+    """SQLite store of `get_source_fulltext` results."""
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS fulltext (
+            source_id TEXT PRIMARY KEY,
+            notebook_id TEXT,
+            title TEXT NOT NULL,
+            source_type TEXT NOT NULL,
+            url TEXT,
+            content TEXT NOT NULL,
+            fetched_at REAL NOT NULL
+        )
+        """,
+    )
+
+    def get(self, source_id: str) -> dict[str, Any] | None:
+        """Return the cached fulltext record, shaped like `get_source_fulltext`."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT title, source_type, url, content FROM fulltext WHERE source_id = ?",
+                (source_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        title, source_type, url, content = row
+        return {
+            "content": content,
+            "title": title,
+            "source_type": source_type,
+            "url": url,
+            "char_count": len(content),
+        }
+
+    def put(self, source_id: str, record: dict[str, Any], notebook_id: str | None = None) -> None:
+        """Store a `get_source_fulltext` result."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO fulltext VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    source_id,
+                    notebook_id,
+                    record.get("title") or "",
+                    record.get("source_type") or "",
+                    record.get("url"),
+                    record.get("content") or "",
+                    time.time(),
+                ),
+            )
+
+    def delete(self, source_id: str) -> None:
+        """Forget a source (e.g. after it was deleted or re-synced)."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM fulltext WHERE source_id = ?", (source_id,))
+
+
+def get_fulltext_cache() -> FulltextCache:
+    """Get the process-wide fulltext cache."""
+    return FulltextCache.shared()
@@ -30,6 +30,17 @@ def is_retryable_error(exc: Exception) -> bool:
     return False
 
 
+def is_transient_error(exc: BaseException) -> bool:
+    """Check if a failed read (e.g. a status poll) is worth simply trying again later.
+
+    Network failures and retryable status codes are; authentication,
+    permission and other errors are not, so pollers should surface them.
+    """
+    if isinstance(exc, httpx.TransportError):
+        return True
+    return isinstance(exc, httpx.HTTPStatusError) and is_retryable_error(exc)
+
+
 # Transport errors that are always safe to retry: the connection was never
 # established, so the server never received the request. This is deliberately
 # narrower than ``httpx.TimeoutException`` — a read or write timeout means the
@@ -0,0 +1,162 @@
+"""Local full-text search index over source content (SQLite FTS5).
+
+Finding which source mentions a term otherwise means pulling every source's
+full text over the network and scanning it. This index keeps the text from
+`get_source_fulltext` in an FTS5 table keyed by notebook and source, so
+searches are answered locally with bm25-ranked snippets.
+
+The index is opt-in: nothing is written until a notebook is synced (see
+``services.sources.sync_search_index``). Syncs are incremental: sources
+removed from the notebook are dropped, renamed ones are re-indexed and only
+new ones are fetched. It is kept in the local SQLite database (see
+`sqlite_store`).
+"""
+
+import time
+from typing import Any
+
+from .sqlite_store import SQLiteStore
+
+SNIPPET_TOKENS = 16
+TITLE_WEIGHT = 10.0
+
+
+def build_match_query(terms: str) -> str:
+    """Turn free-form search terms into an FTS5 MATCH expression.
+
+    Each whitespace-separated term is quoted, so punctuation (``C++``,
+    ``e-mail``, ``"``) can't break the query syntax; all terms must match.
+    A trailing ``*`` on a term keeps its prefix-search meaning.
+    """
+    parts = []
+    for term in terms.split():
+        prefix = term.endswith("*") and len(term) > 1
+        term = term.rstrip("*") if prefix else term
+        quoted = '"' + term.replace('"', '""') + '"'
+        parts.append(quoted + "*" if prefix else quoted)
+    return " ".join(parts)
+
+
+class SearchIndex(SQLiteStore):
+    """SQLite FTS5 index of source text.
+
+    `search_sources` tracks which sources are indexed (and their FTS row), so
+    syncs can diff against a notebook's live source list without touching the
+    FTS table.
+    """
+
+    SCHEMA = (
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS source_text USING fts5(
+            title, content, tokenize = 'porter unicode61'
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS search_sources (
+            source_id TEXT PRIMARY KEY,
+            notebook_id TEXT NOT NULL,
+            title TEXT NOT NULL,
+            source_type TEXT NOT NULL,
+            text_rowid INTEGER NOT NULL,
+            indexed_at REAL NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS search_sources_notebook ON search_sources (notebook_id)",
+    )
+
+    def source_ids(self, notebook_id: str) -> set[str]:
+        """IDs of the sources indexed for a notebook."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT source_id FROM search_sources WHERE notebook_id = ?", (notebook_id,)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def titles(self, notebook_id: str) -> dict[str, str]:
+        """Titles of the sources indexed for a notebook, by source ID."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT source_id, title FROM search_sources WHERE notebook_id = ?", (notebook_id,)
+            ).fetchall()
+        return dict(rows)
+
+    def upsert(self, notebook_id: str, source_id: str, record: dict[str, Any]) -> None:
+        """Index (or re-index) a `get_source_fulltext` result."""
+        title = record.get("title") or ""
+        with self._lock, self._conn:
+            self._delete(source_id)
+            cursor = self._conn.execute(
+                "INSERT INTO source_text (title, content) VALUES (?, ?)",
+                (title, record.get("content") or ""),
+            )
+            self._conn.execute(
+                "INSERT INTO search_sources VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    source_id,
+                    notebook_id,
+                    title,
+                    record.get("source_type") or "unknown",
+                    cursor.lastrowid,
+                    time.time(),
+                ),
+            )
+
+    def remove(self, source_id: str) -> None:
+        """Drop a source from the index."""
+        with self._lock, self._conn:
+            self._delete(source_id)
+
+    def _delete(self, source_id: str) -> None:
+        row = self._conn.execute(
+            "SELECT text_rowid FROM search_sources WHERE source_id = ?", (source_id,)
+        ).fetchone()
+        if row is not None:
+            self._conn.execute("DELETE FROM source_text WHERE rowid = ?", (row[0],))
+            self._conn.execute("DELETE FROM search_sources WHERE source_id = ?", (source_id,))
+
+    def search(
+        self, terms: str, notebook_id: str | None = None, limit: int = 10
+    ) -> list[dict[str, Any]]:
+        """Return the best-matching sources, best first.
+
+        Each hit has notebook_id, source_id, title, source_type, a content
+        snippet with matches wrapped in ``[...]``, and a bm25 score (higher is
+        better). Title matches weigh more than body matches.
+
+        Raises:
+            sqlite3.OperationalError: If the terms can't be parsed as a query
+        """
+        query = build_match_query(terms)
+        if not query:
+            return []
+        sql = f"""
+            SELECT s.notebook_id, s.source_id, s.title, s.source_type,
+                   snippet(source_text, 1, '[', ']', '…', {SNIPPET_TOKENS}),
+                   bm25(source_text, {TITLE_WEIGHT}, 1.0) AS rank
+            FROM source_text JOIN search_sources s ON s.text_rowid = source_text.rowid
+            WHERE source_text MATCH ?
+        """
+        params: list[Any] = [query]
+        if notebook_id:
+            sql += " AND s.notebook_id = ?"
+            params.append(notebook_id)
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [
+            {
+                "notebook_id": nb_id,
+                "source_id": source_id,
+                "title": title,
+                "source_type": source_type,
+                "snippet": snippet,
+                "score": round(-rank, 4),
+            }
+            for nb_id, source_id, title, source_type, snippet, rank in rows
+        ]
+
+
+def get_search_index() -> SearchIndex:
+    """Get the process-wide search index."""
+    return SearchIndex.shared()
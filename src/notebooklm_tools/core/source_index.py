@@ -0,0 +1,117 @@
+"""Local content-hash index of sources already added to notebooks.
+
+Re-running an ingestion job re-sends the same files, URLs and text to the same
+notebooks. With ``dedupe=True``, the add methods (``add_file``, ``add_files``,
+``add_url_source(s)``, ``add_text_source``) look up a content key here before
+sending anything:
+
+- files: SHA-256 of the file bytes
+- URLs: SHA-256 of the normalized URL (lowercase scheme/host, no fragment,
+  default port or trailing slash)
+- text: SHA-256 of the dedented, stripped text
+
+A hit is verified against the notebook's live source list (one fetch serves
+every key in a call), so sources deleted in the web UI are re-added and their
+stale entries dropped. The index is kept in the local SQLite database (see
+`sqlite_store`).
+"""
+
+import hashlib
+import textwrap
+import time
+import urllib.parse
+from pathlib import Path
+
+from .sqlite_store import SQLiteStore
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def file_sha256(file_path: str | Path) -> str:
+    """Hex SHA-256 of a file's bytes, read in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_key(file_path: str | Path) -> str:
+    """Content key for a local file: SHA-256 of its bytes."""
+    return "file:" + file_sha256(file_path)
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a URL so trivially different spellings share one key."""
+    parts = urllib.parse.urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    path = parts.path.rstrip("/")
+    return urllib.parse.urlunsplit((scheme, host, path, parts.query, ""))
+
+
+def url_key(url: str) -> str:
+    """Content key for a URL source."""
+    return "url:" + hashlib.sha256(normalize_url(url).encode("utf-8")).hexdigest()
+
+
+def text_key(text: str) -> str:
+    """Content key for a pasted-text source."""
+    normalized = textwrap.dedent(text).strip()
+    return "text:" + hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class SourceIndex(SQLiteStore):
+    """SQLite map of (notebook_id, content key) → source_id.
+
+    Every write is committed immediately.
+    """
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS source_keys (
+            notebook_id TEXT NOT NULL,
+            content_key TEXT NOT NULL,
+            source_id TEXT NOT NULL,
+            label TEXT,
+            added_at REAL NOT NULL,
+            PRIMARY KEY (notebook_id, content_key)
+        ) WITHOUT ROWID
+        """,
+    )
+
+    def lookup(self, notebook_id: str, content_key: str) -> str | None:
+        """Return the indexed source ID for this content in this notebook."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT source_id FROM source_keys WHERE notebook_id = ? AND content_key = ?",
+                (notebook_id, content_key),
+            ).fetchone()
+        return row[0] if row else None
+
+    def record(
+        self, notebook_id: str, content_key: str, source_id: str, label: str | None = None
+    ) -> None:
+        """Remember that this content was added to the notebook as `source_id`."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO source_keys VALUES (?, ?, ?, ?, ?)",
+                (notebook_id, content_key, source_id, label, time.time()),
+            )
+
+    def forget(self, notebook_id: str, content_key: str) -> None:
+        """Drop an entry whose source no longer exists."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM source_keys WHERE notebook_id = ? AND content_key = ?",
+                (notebook_id, content_key),
+            )
+
+
+def get_source_index() -> SourceIndex:
+    """Get the process-wide source index."""
+    return SourceIndex.shared()
@@ -0,0 +1,291 @@
+"""SourceReadinessWatcher - Wait for many sources to finish processing.
+
+One `get_notebook_sources_with_types` call per tick serves every pending source
+in a notebook, so waiting on 50 new URLs costs one poll per tick rather than 50
+independent polling loops. Polling starts fast (new sources often settle in a
+couple of seconds) and backs off geometrically while sources stay pending.
+
+Results are delivered three ways; use whichever fits the caller:
+- futures: `watch()` returns a Future resolved with the source dict, or failed
+  with RuntimeError (processing failed) / TimeoutError / the source-list
+  fetch's own error when it is not transient (e.g. authentication)
+- callbacks: `on_ready(event)` / `on_failed(event)` passed to the constructor
+- iterator: `events()` drives polling on the calling thread and yields a
+  SourceEvent per settled source; `start()` drives it on a background thread
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from . import constants
+from .retry import is_transient_error
+
+logger = logging.getLogger("notebooklm_mcp.api")
+
+# Source processing status codes (see SourceMixin.get_notebook_sources_with_types)
+SOURCE_STATUS_READY = 2
+SOURCE_STATUS_ERROR = 3
+
+# Source types that NotebookLM consistently surfaces as "ready" via
+# status 2. For these, status 3 is a hard processing failure.
+# Audio (10) and unknown/transient (None, 0) types may pass through
+# status 3 on their way to status 2, so we do not raise on 3 for them.
+NON_AUDIO_TERMINAL_TYPES = frozenset(
+    {
+        constants.SOURCE_TYPE_PDF,
+        constants.SOURCE_TYPE_PASTED_TEXT,
+        constants.SOURCE_TYPE_WEB_PAGE,
+        constants.SOURCE_TYPE_GENERATED_TEXT,
+        constants.SOURCE_TYPE_YOUTUBE,
+        constants.SOURCE_TYPE_UPLOADED_FILE,
+        constants.SOURCE_TYPE_IMAGE,
+        constants.SOURCE_TYPE_WORD_DOC,
+    }
+)
+
+
+class _SourceListProtocol(Protocol):
+    def get_notebook_sources_with_types(self, notebook_id: str) -> list[dict[str, Any]]: ...
+
+
+def classify_source(src: dict[str, Any]) -> str | None:
+    """Return "ready", "failed", or None (still processing) for a source dict."""
+    status = src.get("status")
+    if status == SOURCE_STATUS_READY:
+        return "ready"
+    # Only treat status 3 as a hard failure when the source has already
+    # settled into a known terminal non-audio type. Audio (10) and
+    # not-yet-classified sources (None / 0) may pass through 3 transiently.
+    if status == SOURCE_STATUS_ERROR and src.get("source_type") in NON_AUDIO_TERMINAL_TYPES:
+        return "failed"
+    return None
+
+
+@dataclass
+class SourceEvent:
+    """A source that finished waiting: ready, failed, or timed out."""
+
+    source_id: str
+    state: str  # "ready" | "failed" | "timeout"
+    source: dict[str, Any] | None = None  # Latest source dict, if seen
+    error: str | None = None
+
+
+class SourceReadinessWatcher:
+    """Track readiness of any number of sources in one notebook.
+
+    Thread-safe: `watch()` may be called from any thread, including while a
+    background driver (`start()`) or an `events()` loop is polling.
+    """
+
+    def __init__(
+        self,
+        client: _SourceListProtocol,
+        notebook_id: str,
+        *,
+        timeout: float = 120.0,
+        min_interval: float = 1.0,
+        max_interval: float = 10.0,
+        backoff: float = 1.5,
+        on_ready: Callable[[SourceEvent], None] | None = None,
+        on_failed: Callable[[SourceEvent], None] | None = None,
+    ) -> None:
+        """
+        Args:
+            client: Client providing `get_notebook_sources_with_types`
+            notebook_id: Notebook containing the sources
+            timeout: Max seconds to wait per source, from when it is watched
+            min_interval: First poll interval in seconds
+            max_interval: Poll interval ceiling in seconds
+            backoff: Interval multiplier applied after each tick
+            on_ready: Called with the event when a source becomes ready
+            on_failed: Called with the event when a source fails or times out
+        """
+        self._client = client
+        self.notebook_id = notebook_id
+        self.timeout = timeout
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.backoff = backoff
+        self._on_ready = on_ready
+        self._on_failed = on_failed
+        self._interval = min_interval
+        # source_id -> (future, deadline)
+        self._pending: dict[str, tuple[Future[dict[str, Any]], float]] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+
+    def watch(self, source_id: str) -> Future[dict[str, Any]]:
+        """Start tracking a source. Watching an already-pending ID returns its future."""
+        with self._lock:
+            if source_id in self._pending:
+                return self._pending[source_id][0]
+            future: Future[dict[str, Any]] = Future()
+            self._pending[source_id] = (future, time.monotonic() + self.timeout)
+            # Newly added sources often settle quickly; poll fast again.
+            self._interval = self.min_interval
+        self._wake.set()
+        return future
+
+    def watch_many(self, source_ids: Iterable[str]) -> dict[str, Future[dict[str, Any]]]:
+        """Track several sources, returning their futures by ID."""
+        return {source_id: self.watch(source_id) for source_id in source_ids}
+
+    @property
+    def pending(self) -> set[str]:
+        """IDs still waiting to settle."""
+        with self._lock:
+            return set(self._pending)
+
+    # ------------------------------------------------------------------
+    # Polling
+    # ------------------------------------------------------------------
+
+    def poll(self) -> list[SourceEvent]:
+        """Run one tick: a single source-list fetch serves every pending source."""
+        with self._lock:
+            if not self._pending:
+                return []
+        try:
+            sources = self._client.get_notebook_sources_with_types(self.notebook_id)
+        except Exception as e:
+            if not is_transient_error(e):
+                return self._fail_all(e)
+            # Transient fetch errors should not fail every pending source;
+            # per-source deadlines still bound the wait.
+            logger.debug("Source readiness poll failed for %s: %s", self.notebook_id, e)
+            sources = []
+        by_id = {src.get("id"): src for src in sources}
+
+        now = time.monotonic()
+        events: list[SourceEvent] = []
+        with self._lock:
+            for source_id, (_, deadline) in list(self._pending.items()):
+                src = by_id.get(source_id)
+                state = classify_source(src) if src is not None else None
+                if state == "ready":
+                    events.append(SourceEvent(source_id, "ready", source=src))
+                elif state == "failed":
+                    events.append(
+                        SourceEvent(
+                            source_id,
+                            "failed",
+                            source=src,
+                            error=f"Source {source_id} failed to process",
+                        )
+                    )
+                elif now >= deadline:
+                    events.append(
+                        SourceEvent(
+                            source_id,
+                            "timeout",
+                            source=src,
+                            error=f"Source {source_id} not ready after {self.timeout}s",
+                        )
+                    )
+            settled = [(event, self._pending.pop(event.source_id)[0]) for event in events]
+            self._interval = min(self._interval * self.backoff, self.max_interval)
+
+        for event, future in settled:
+            self._deliver(event, future)
+        return events
+
+    def _fail_all(self, error: Exception) -> list[SourceEvent]:
+        """Fail every pending source with a fetch error that retrying won't fix."""
+        with self._lock:
+            settled = [
+                (SourceEvent(source_id, "failed", error=str(error)), future)
+                for source_id, (future, _) in self._pending.items()
+            ]
+            self._pending.clear()
+        for event, future in settled:
+            self._deliver(event, future, error)
+        return [event for event, _ in settled]
+
+    def _deliver(
+        self,
+        event: SourceEvent,
+        future: Future[dict[str, Any]],
+        error: Exception | None = None,
+    ) -> None:
+        if event.state == "ready":
+            future.set_result(event.source or {"id": event.source_id})
+            callback = self._on_ready
+        else:
+            if error is None:
+                error_cls = TimeoutError if event.state == "timeout" else RuntimeError
+                error = error_cls(event.error)
+            future.set_exception(error)
+            callback = self._on_failed
+        if callback is not None:
+            try:
+                callback(event)
+            except Exception:
+                logger.exception("Source readiness callback failed for %s", event.source_id)
+
+    def _sleep_interval(self) -> float:
+        """Seconds until the next tick, never past the earliest pending deadline."""
+        with self._lock:
+            if not self._pending:
+                return self._interval
+            earliest = min(deadline for _, deadline in self._pending.values())
+            return max(0.0, min(self._interval, earliest - time.monotonic()))
+
+    def events(self) -> Iterator[SourceEvent]:
+        """Poll on the calling thread, yielding events until nothing is pending."""
+        while self.pending:
+            yield from self.poll()
+            if self.pending:
+                time.sleep(self._sleep_interval())
+
+    def wait(self) -> dict[str, SourceEvent]:
+        """Block until every watched source settles. Returns events by source ID."""
+        return {event.source_id: event for event in self.events()}
+
+    # ------------------------------------------------------------------
+    # Background driver
+    # ------------------------------------------------------------------
+
+    def start(self) -> "SourceReadinessWatcher":
+        """Drive polling on a daemon thread so futures resolve on their own."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="nlm-source-watcher", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            if not self.pending:
+                self._wake.wait(timeout=1.0)
+                self._wake.clear()
+                continue
+            self.poll()
+            if self.pending:
+                self._stop.wait(self._sleep_interval())
+
+    def close(self) -> None:
+        """Stop the background driver. Pending futures are left unresolved."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+
+    def __enter__(self) -> "SourceReadinessWatcher":
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
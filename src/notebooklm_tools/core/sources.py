@@ -8,26 +8,94 @@ This mixin provides source-related operations:
 - add_url_source: Add URL/YouTube as source
 - add_text_source: Add pasted text as source
 - add_drive_source: Add Google Drive document as source
-- upload_file: Upload local file via Chrome automation
+- add_file: Upload a local file via the resumable upload protocol
+- add_files: Upload many local files concurrently
+- add_url_sources_chunked: Add many URLs in concurrent, reconciled chunks
 - get_source_guide: Get AI-generated summary and keywords
 - get_source_fulltext: Get raw text content of a source
 
-HTTP resumable upload implementation adapted from notebooklm-py.
+HTTP resumable upload implementation adapted from notebooklm-py. Multi-chunk
+uploads recover from failures at the last committed offset and persist their
+session (see uploads.py) so an interrupted upload can be resumed.
 """
 
 import textwrap
+import threading
 import time
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
 from typing import Any, Protocol, cast
 
 import httpx
 
 from . import constants
-from .base import SOURCE_ADD_TIMEOUT, BaseClient
+from .base import SOURCE_ADD_TIMEOUT, BaseClient, logger
 from .errors import RPCError
 from .exceptions import FileUploadError, FileValidationError
-from .retry import execute_with_retry
+from .retry import RETRYABLE_STATUS_CODES, execute_with_retry
+from .source_index import file_key, get_source_index, normalize_url, text_key, url_key
+from .source_watcher import NON_AUDIO_TERMINAL_TYPES, SourceReadinessWatcher, classify_source
+from .uploads import UploadSession, get_upload_state_store
+
+TEXT_SEPARATOR = "\n\n"
+
+_END = object()
+
+
+def iter_text_segments(blocks: Iterable[Any]) -> Iterator[tuple[int | None, int | None, str]]:
+    """Stream the text out of `get_source_fulltext` content blocks.
+
+    Content blocks are nested arrays shaped ``[start_pos, end_pos, data, ...]``
+    with the text strings somewhere inside ``data``. The walk uses an explicit
+    stack of iterators rather than recursion, so deep nesting in large EPUB or
+    PDF sources costs neither stack depth nor intermediate lists.
+
+    Yields:
+        ``(start, end, text)`` for every non-empty string, in document order.
+        ``start``/``end`` are the offsets of the innermost enclosing block
+        that has them, or None.
+    """
+    stack: list[tuple[Iterator[Any], int | None, int | None]] = [(iter(blocks), None, None)]
+    while stack:
+        items, start, end = stack[-1]
+        item = next(items, _END)
+        if item is _END:
+            stack.pop()
+        elif isinstance(item, str):
+            if item:
+                yield start, end, item
+        elif isinstance(item, list):
+            if len(item) > 1 and type(item[0]) is int and type(item[1]) is int:
+                start, end = item[0], item[1]
+            stack.append((iter(item), start, end))
+
+
+def join_text_window(
+    segments: Iterable[tuple[int | None, int | None, str]],
+    offset: int = 0,
+    limit: int | None = None,
+) -> tuple[str, int]:
+    """Join segment text with blank lines, keeping only one window of it.
+
+    Only the characters in ``[offset, offset + limit)`` of the joined text are
+    materialized, so paging through a large source doesn't build the whole
+    string.
+
+    Returns:
+        ``(window_text, total_chars)`` where total_chars is the length of the
+        full joined text.
+    """
+    stop = None if limit is None else offset + limit
+    parts: list[str] = []
+    pos = 0
+    for i, (_, _, text) in enumerate(segments):
+        piece = TEXT_SEPARATOR + text if i else text
+        piece_end = pos + len(piece)
+        if piece_end > offset and (stop is None or pos < stop):
+            parts.append(piece[max(0, offset - pos) : None if stop is None else stop - pos])
+        pos = piece_end
+    return "".join(parts), pos
 
 
 class _NotebookLookupProtocol(Protocol):
@@ -48,22 +116,9 @@ class SourceMixin(BaseClient):
     SOURCE_STATUS_ERROR = 3
     SOURCE_STATUS_PREPARING = 5
 
-    # Source types that NotebookLM consistently surfaces as "ready" via
-    # status 2. For these, status 3 is a hard processing failure.
-    # Audio (10) and unknown/transient (None, 0) types may pass through
-    # status 3 on their way to status 2, so we do not raise on 3 for them.
-    _NON_AUDIO_TERMINAL_TYPES = frozenset(
-        {
-            constants.SOURCE_TYPE_PDF,
-            constants.SOURCE_TYPE_PASTED_TEXT,
-            constants.SOURCE_TYPE_WEB_PAGE,
-            constants.SOURCE_TYPE_GENERATED_TEXT,
-            constants.SOURCE_TYPE_YOUTUBE,
-            constants.SOURCE_TYPE_UPLOADED_FILE,
-            constants.SOURCE_TYPE_IMAGE,
-            constants.SOURCE_TYPE_WORD_DOC,
-        }
-    )
+    # Source types for which status 3 is a hard processing failure
+    # (see source_watcher.NON_AUDIO_TERMINAL_TYPES).
+    _NON_AUDIO_TERMINAL_TYPES = NON_AUDIO_TERMINAL_TYPES
 
     def _reconcile_source(
         self,
@@ -93,18 +148,57 @@ class SourceMixin(BaseClient):
             The matched source dict if found within the polling window,
             otherwise None (caller should re-raise the original RPCError).
         """
+        found = self._reconcile_sources(
+            notebook_id,
+            {True},
+            key_fn=lambda src: True if match_fn(src) else None,
+            poll_attempts=poll_attempts,
+            poll_delay=poll_delay,
+        )
+        return found.get(True)
+
+    def _reconcile_sources(
+        self,
+        notebook_id: str,
+        keys: set[Any],
+        key_fn: Callable[[dict[str, Any]], Any],
+        poll_attempts: int = 3,
+        poll_delay: float = 1.0,
+    ) -> dict[Any, dict[str, Any]]:
+        """Poll the notebook source list until every wanted source is found.
+
+        The many-source form of `_reconcile_source`: each poll indexes the
+        live sources by `key_fn` once and looks up all outstanding keys, so
+        reconciling a chunk of N URLs costs one fetch per poll, not N.
+
+        Args:
+            notebook_id:   Notebook to inspect.
+            keys:          Keys of the sources we submitted.
+            key_fn:        Callable(source: dict) -> key, or None to ignore
+                           the source.
+            poll_attempts: Maximum number of polls (default 3).
+            poll_delay:    Base seconds between polls, doubling (max 4s).
+
+        Returns:
+            Map of key → matched source dict for every key found; keys not
+            found within the polling window are absent.
+        """
+        found: dict[Any, dict[str, Any]] = {}
         for attempt in range(poll_attempts):
             if attempt > 0:
                 time.sleep(min(poll_delay * (2 ** (attempt - 1)), 4.0))
             try:
                 sources = self.get_notebook_sources_with_types(notebook_id)
-                for src in sources:
-                    if match_fn(src):
-                        return src
             except Exception:
                 # If listing itself fails, don't mask the original error.
-                pass
-        return None
+                continue
+            for src in sources:
+                key = key_fn(src)
+                if key in keys and key not in found:
+                    found[key] = src
+            if len(found) == len(keys):
+                break
+        return found
 
     def wait_for_source_ready(
         self,
@@ -115,7 +209,10 @@ class SourceMixin(BaseClient):
     ) -> dict[str, Any]:
         """Wait for a source to finish processing.
 
-        Polls the source status until it becomes READY or times out.
+        Polls the source status until it becomes READY or times out. Polling
+        starts at one second and backs off to `poll_interval`. To wait on many
+        sources at once, use `SourceReadinessWatcher` directly so one source
+        list fetch per tick serves all of them.
 
         Note on AUDIO sources (source_type 10): NotebookLM transcribes
         audio in the cloud, and the source moves through several
@@ -135,7 +232,7 @@ class SourceMixin(BaseClient):
             timeout: Max seconds to wait (default 120; for audio
                 sources callers typically need to pass a larger value
                 — the CLI's `--wait-timeout` flag defaults to 600s)
-            poll_interval: Seconds between status checks (default 3)
+            poll_interval: Max seconds between status checks (default 3)
 
         Returns:
             The source dict with status='ready'
@@ -144,29 +241,79 @@ class SourceMixin(BaseClient):
             TimeoutError: If source doesn't become ready within timeout
             RuntimeError: If source processing fails
         """
-        start = time.time()
+        watcher = SourceReadinessWatcher(
+            self, notebook_id, timeout=timeout, max_interval=poll_interval
+        )
+        future = watcher.watch(source_id)
+        watcher.wait()
+        return future.result()
+
+    def _find_indexed_sources(
+        self,
+        notebook_id: str,
+        content_keys: Iterable[str],
+        list_sources: Callable[[], list[dict[str, Any]]] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Return live source dicts for content already added to this notebook.
+
+        Keys found in the local source index are verified with one fetch of
+        the notebook's source list (`list_sources`, if given, supplies a
+        shared fetch); entries whose source is gone are dropped.
+        """
+        index = get_source_index()
+        indexed = {key: sid for key in content_keys if (sid := index.lookup(notebook_id, key))}
+        if not indexed:
+            return {}
+        try:
+            sources = (
+                list_sources()
+                if list_sources is not None
+                else self.get_notebook_sources_with_types(notebook_id)
+            )
+            live = {src.get("id"): src for src in sources}
+        except Exception as e:
+            # Without the live list we cannot tell whether the sources still
+            # exist; fall back to adding them again.
+            logger.debug("Could not verify indexed sources in %s: %s", notebook_id, e)
+            return {}
+        found = {}
+        for key, source_id in indexed.items():
+            if source_id in live:
+                found[key] = live[source_id]
+            else:
+                index.forget(notebook_id, key)
+        return found
 
-        while time.time() - start < timeout:
-            sources = self.get_notebook_sources_with_types(notebook_id)
-            for src in sources:
-                if src.get("id") == source_id:
-                    status = src.get("status")
-                    source_type = src.get("source_type")
-                    if status == self.SOURCE_STATUS_READY:
-                        return src
-                    # Only treat status 3 as a hard failure when the
-                    # source has already settled into a known terminal
-                    # non-audio type. Audio (10) and not-yet-classified
-                    # sources (None / 0) may pass through 3 transiently.
-                    if (
-                        status == self.SOURCE_STATUS_ERROR
-                        and source_type in self._NON_AUDIO_TERMINAL_TYPES
-                    ):
-                        raise RuntimeError(f"Source {source_id} failed to process")
-                    break
-            time.sleep(poll_interval)
-
-        raise TimeoutError(f"Source {source_id} not ready after {timeout}s")
+    def _reuse_source(
+        self, notebook_id: str, src: dict[str, Any], wait: bool, wait_timeout: float
+    ) -> dict[str, Any]:
+        """Result for content skipped because the notebook already has it."""
+        result: dict[str, Any] = {"id": src["id"], "title": src.get("title") or ""}
+        if wait:
+            result = (
+                src
+                if classify_source(src) == "ready"
+                else self.wait_for_source_ready(notebook_id, src["id"], wait_timeout)
+            )
+        return {**result, "deduplicated": True}
+
+    def _add_deduplicated(
+        self,
+        notebook_id: str,
+        content_key: str,
+        label: str,
+        add: Callable[[], dict[str, Any] | None],
+        wait: bool,
+        wait_timeout: float,
+    ) -> dict[str, Any] | None:
+        """Skip `add()` if the index says the notebook has this content, else index its result."""
+        existing = self._find_indexed_sources(notebook_id, [content_key]).get(content_key)
+        if existing is not None:
+            return self._reuse_source(notebook_id, existing, wait, wait_timeout)
+        result = add()
+        if result and result.get("id"):
+            get_source_index().record(notebook_id, content_key, result["id"], label)
+        return result
 
     def check_source_freshness(self, source_id: str) -> bool | None:
         """Check if a Drive source is fresh (up-to-date with Google Drive)."""
@@ -351,6 +498,7 @@ class SourceMixin(BaseClient):
         url: str,
         wait: bool = False,
         wait_timeout: float = 120.0,
+        dedupe: bool = False,
     ) -> dict[str, Any] | None:
         """Add a URL (website or YouTube) as a source to a notebook.
 
@@ -363,10 +511,22 @@ class SourceMixin(BaseClient):
             url: URL to add
             wait: If True, block until source is ready
             wait_timeout: Seconds to wait if wait=True (default 120)
+            dedupe: If True, skip URLs already added to this notebook (see
+                `source_index`) and return the existing source with
+                `deduplicated: True`
 
         Returns:
             Source dict with id and title, or None on failure
         """
+        if dedupe:
+            return self._add_deduplicated(
+                notebook_id,
+                url_key(url),
+                url,
+                lambda: self.add_url_source(notebook_id, url, wait=wait, wait_timeout=wait_timeout),
+                wait,
+                wait_timeout,
+            )
         source_path = f"/notebook/{notebook_id}"
 
         try:
@@ -493,6 +653,7 @@ class SourceMixin(BaseClient):
         urls: list[str],
         wait: bool = False,
         wait_timeout: float = 120.0,
+        dedupe: bool = False,
     ) -> list[dict[str, Any]]:
         """Add multiple URLs as sources to a notebook in a single request.
 
@@ -504,10 +665,14 @@ class SourceMixin(BaseClient):
             urls: List of URLs to add
             wait: If True, block until all sources are ready
             wait_timeout: Seconds to wait per source if wait=True (default 120)
+            dedupe: If True, only send URLs not already added to this
+                notebook; existing ones are returned with `deduplicated: True`
 
         Returns:
             List of source dicts with id and title, or empty list on failure
         """
+        if dedupe:
+            return self._add_url_sources_deduplicated(notebook_id, urls, wait, wait_timeout)
         source_path = f"/notebook/{notebook_id}"
 
         try:
@@ -543,17 +708,177 @@ class SourceMixin(BaseClient):
         source_results = self._parse_source_results(result)
 
         if source_results and wait:
-            waited_results = []
-            for sr in source_results:
-                if sr.get("id"):
-                    waited = self.wait_for_source_ready(notebook_id, sr["id"], wait_timeout)
-                    waited_results.append(waited or sr)
-                else:
-                    waited_results.append(sr)
-            return waited_results
+            # One watcher serves every new source: a single source-list fetch
+            # per tick instead of one polling loop per URL.
+            watcher = SourceReadinessWatcher(self, notebook_id, timeout=wait_timeout)
+            futures = watcher.watch_many(sr["id"] for sr in source_results if sr.get("id"))
+            watcher.wait()
+            return [
+                futures[sr["id"]].result() or sr if sr.get("id") else sr for sr in source_results
+            ]
 
         return source_results
 
+    def _add_url_sources_deduplicated(
+        self, notebook_id: str, urls: list[str], wait: bool, wait_timeout: float
+    ) -> list[dict[str, Any]]:
+        """add_url_sources(dedupe=True): one index check, one live fetch, one add RPC."""
+        keys = [url_key(url) for url in urls]
+        existing = self._find_indexed_sources(notebook_id, keys)
+        new_urls = [url for url, key in zip(urls, keys, strict=True) if key not in existing]
+        added = (
+            self.add_url_sources(notebook_id, new_urls, wait=wait, wait_timeout=wait_timeout)
+            if new_urls
+            else []
+        )
+        if added and added[0].get("status") == "timeout":
+            return added
+
+        index = get_source_index()
+        added_results = iter(added)
+        results = []
+        for url, key in zip(urls, keys, strict=True):
+            if key in existing:
+                results.append(self._reuse_source(notebook_id, existing[key], wait, wait_timeout))
+                continue
+            source_result = next(added_results, None)
+            if source_result is None:
+                break
+            if source_result.get("id"):
+                index.record(notebook_id, key, source_result["id"], url)
+            results.append(source_result)
+        return results
+
+    def add_url_sources_chunked(
+        self,
+        notebook_id: str,
+        urls: Iterable[str],
+        chunk_size: int = 50,
+        concurrency: int = 4,
+        max_attempts: int = 3,
+    ) -> Iterator[dict[str, Any]]:
+        """Add many URLs in concurrent chunks, reconciling partial failures.
+
+        URLs are split into chunks of `chunk_size`, each sent with one
+        `add_url_sources` call, with up to `concurrency` chunks in flight.
+        When a chunk errors, times out or returns fewer sources than it sent,
+        the notebook's source list is checked for the chunk's URLs
+        (`_reconcile_sources`), and only the URLs that did not land are sent
+        again, up to `max_attempts` times. Sources that existed before the
+        call are never mistaken for newly added ones.
+
+        Args:
+            notebook_id: Target notebook ID
+            urls: URLs to add
+            chunk_size: URLs per add RPC (default 50)
+            concurrency: Maximum chunks in flight at once (default 4)
+            max_attempts: Sends per URL before it is reported failed
+
+        Yields:
+            One report per URL, grouped by chunk in completion order: `index`
+            (position in `urls`), `url`, `status` ("added", "reconciled" when
+            found in the source list after an error, or "failed"), `attempts`,
+            plus `id`/`title` or `error`.
+        """
+        urls = list(urls)
+        if not urls:
+            return
+        try:
+            baseline = {src["id"] for src in self.get_notebook_sources_with_types(notebook_id)}
+        except Exception:
+            baseline = set()
+        indexed = list(enumerate(urls))
+        chunks = [indexed[i : i + chunk_size] for i in range(0, len(indexed), chunk_size)]
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(concurrency, len(chunks))), thread_name_prefix="nlm-url-ingest"
+        )
+        try:
+            futures = [
+                executor.submit(self._add_url_chunk, notebook_id, chunk, max_attempts, baseline)
+                for chunk in chunks
+            ]
+            for future in as_completed(futures):
+                yield from future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _add_url_chunk(
+        self,
+        notebook_id: str,
+        chunk: list[tuple[int, str]],
+        max_attempts: int,
+        baseline: set[str],
+    ) -> list[dict[str, Any]]:
+        """Send one chunk of (index, url) pairs, retrying only what didn't land."""
+        reports: dict[int, dict[str, Any]] = {}
+        pending = chunk
+        error = ""
+
+        def report(index: int, url: str, status: str, src: dict[str, Any], attempt: int) -> None:
+            reports[index] = {
+                "index": index,
+                "url": url,
+                "status": status,
+                "id": src["id"],
+                "title": src.get("title", ""),
+                "attempts": attempt,
+            }
+
+        def source_url_key(src: dict[str, Any]) -> str | None:
+            if src.get("id") in baseline or not src.get("url"):
+                return None
+            return normalize_url(src["url"])
+
+        for attempt in range(1, max_attempts + 1):
+            try:
+                results = self.add_url_sources(notebook_id, [url for _, url in pending])
+                error = results[0].get("message", "") if results and "status" in results[0] else ""
+            except Exception as e:
+                results, error = [], str(e)
+
+            missing = []
+            if len(results) == len(pending):
+                for (index, url), result in zip(pending, results, strict=True):
+                    if result.get("id"):
+                        report(index, url, "added", result, attempt)
+                    else:
+                        missing.append((index, url))
+            else:
+                missing = pending
+            pending = []
+            if not missing:
+                break
+
+            error = error or "Source was not returned by the add request"
+            found = self._reconcile_sources(
+                notebook_id, {normalize_url(url) for _, url in missing}, key_fn=source_url_key
+            )
+            for index, url in missing:
+                src = found.get(normalize_url(url))
+                if src:
+                    report(index, url, "reconciled", src, attempt)
+                else:
+                    pending.append((index, url))
+            if not pending:
+                break
+            logger.debug(
+                "URL chunk attempt %d: %d of %d URL(s) missing (%s)",
+                attempt,
+                len(pending),
+                len(chunk),
+                error,
+            )
+
+        for index, url in pending:
+            reports[index] = {
+                "index": index,
+                "url": url,
+                "status": "failed",
+                "attempts": max_attempts,
+                "error": error,
+            }
+        return [reports[index] for index, _ in chunk]
+
     def _add_url_sources_v1(self, notebook_id: str, urls: list[str], source_path: str) -> Any:
         """Legacy izAoDd RPC for adding multiple URL sources."""
         source_data_list = []
@@ -614,6 +939,7 @@ class SourceMixin(BaseClient):
         title: str = "Pasted Text",
         wait: bool = False,
         wait_timeout: float = 120.0,
+        dedupe: bool = False,
     ) -> dict[str, Any] | None:
         """Add pasted text as a source to a notebook.
 
@@ -623,7 +949,19 @@ class SourceMixin(BaseClient):
             title: Title for the source
             wait: If True, block until source is ready
             wait_timeout: Seconds to wait if wait=True (default 120)
+            dedupe: If True, skip text already added to this notebook
         """
+        if dedupe:
+            return self._add_deduplicated(
+                notebook_id,
+                text_key(text),
+                title,
+                lambda: self.add_text_source(
+                    notebook_id, text, title, wait=wait, wait_timeout=wait_timeout
+                ),
+                wait,
+                wait_timeout,
+            )
         source_path = f"/notebook/{notebook_id}"
         normalized_text = textwrap.dedent(text).strip()
         text_variants = [text]
@@ -834,7 +1172,6 @@ class SourceMixin(BaseClient):
         import json
 
         url = f"{self._get_upload_url()}?authuser=0"
-        cookies = self._get_httpx_cookies()
 
         headers = {
             "Accept": "*/*",
@@ -856,108 +1193,223 @@ class SourceMixin(BaseClient):
             ensure_ascii=False,
         )
 
-        with httpx.Client(timeout=60.0, cookies=cookies) as client:
+        client = self._get_upload_client()
 
-            def _do_request() -> httpx.Response:
-                resp = client.post(url, headers=headers, content=body)
-                resp.raise_for_status()
-                return resp
+        def _do_request() -> httpx.Response:
+            resp = client.post(url, headers=headers, content=body, timeout=60.0)
+            resp.raise_for_status()
+            return resp
 
-            response = execute_with_retry(_do_request)
+        response = execute_with_retry(_do_request)
 
-            upload_url = response.headers.get("x-goog-upload-url")
-            if not upload_url:
-                raise FileUploadError(filename, "Failed to get upload URL from response headers")
-
-            return cast(str, upload_url)
-
-    def _upload_file_streaming(self, upload_url: str, file_path: Path) -> None:
-        """Stream upload file content to the resumable upload URL.
+        upload_url = response.headers.get("x-goog-upload-url")
+        if not upload_url:
+            raise FileUploadError(filename, "Failed to get upload URL from response headers")
 
-        Step 3 of the resumable upload protocol. Uses streaming to
-        avoid loading the entire file into memory.
+        return cast(str, upload_url)
 
-        Args:
-            upload_url: The upload URL from step 2
-            file_path: Path to the file to upload
+    # Resumable uploads send the file in chunks of this size (a multiple of the
+    # upload endpoint's 256 KiB chunk granularity). Files up to one chunk go
+    # out in a single "upload, finalize" request.
+    UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
 
-        Raises:
-            FileUploadError: If the upload fails
-        """
-        cookies = self._get_httpx_cookies()
+    # Consecutive failed attempts (chunks or offset queries) tolerated before
+    # giving up. Each recovery re-queries the committed offset, so no data is
+    # re-sent twice.
+    UPLOAD_MAX_RECOVERIES = 5
 
-        headers = {
+    def _upload_headers(self, command: str) -> dict[str, str]:
+        """Headers shared by the resumable upload commands."""
+        return {
             "Accept": "*/*",
             "Content-Type": "application/x-www-form-urlencoded;charset=utf-8",
             "Origin": self._get_base_url(),
             "Referer": f"{self._get_base_url()}/",
             "x-goog-authuser": "0",
-            "x-goog-upload-command": "upload, finalize",
-            "x-goog-upload-offset": "0",
+            "x-goog-upload-command": command,
         }
 
-        # Generator for streaming file content
-        def file_stream() -> Iterator[bytes]:
-            with open(file_path, "rb") as f:
-                while chunk := f.read(65536):  # 64KB chunks
-                    yield chunk
+    def _query_upload_offset(self, upload_url: str) -> tuple[str, int]:
+        """Ask the upload server how much of a resumable upload it has committed.
 
-        with httpx.Client(timeout=300.0, cookies=cookies) as client:
+        Returns:
+            Tuple of (upload status, committed byte offset). Status is
+            "active" while the session accepts more bytes and "final" once
+            the upload has been finalized.
 
-            def _do_upload() -> httpx.Response:
-                resp = client.post(upload_url, headers=headers, content=file_stream())
-                resp.raise_for_status()
-                return resp
+        Raises:
+            httpx.HTTPStatusError: If the session is unknown or expired
+        """
+        client = self._get_upload_client()
 
-            execute_with_retry(_do_upload)
+        def _do_query() -> httpx.Response:
+            resp = client.post(upload_url, headers=self._upload_headers("query"), timeout=60.0)
+            resp.raise_for_status()
+            return resp
 
-    def add_file(
-        self,
-        notebook_id: str,
-        file_path: str | Path,
-        wait: bool = False,
-        wait_timeout: float = 120.0,
-    ) -> dict[str, Any]:
-        """Add a local file as a source using resumable upload.
+        response = execute_with_retry(_do_query)
+        status = response.headers.get("x-goog-upload-status", "active")
+        try:
+            received = int(response.headers.get("x-goog-upload-size-received", "0"))
+        except ValueError:
+            received = 0
+        return status, received
 
-        Uses Google's resumable upload protocol:
-        1. Register source intent with RPC → get SOURCE_ID
-        2. Start upload session with SOURCE_ID → get upload URL
-        3. Stream upload file content (memory-efficient for large files)
+    def _upload_file_streaming(
+        self,
+        upload_url: str,
+        file_path: Path,
+        on_progress: Callable[[int], None] | None = None,
+        offset: int = 0,
+        on_commit: Callable[[int], None] | None = None,
+    ) -> None:
+        """Stream upload file content to the resumable upload URL.
 
-        Supported file types: PDF, TXT, MD, DOCX, CSV, EPUB, MP3, M4A, WAV, AAC, OGG, OPUS, MP4, JPG, PNG, GIF, WEBP
+        Step 3 of the resumable upload protocol. The file is sent in
+        `UPLOAD_CHUNK_SIZE` chunks with the "upload" command and the last
+        chunk with "upload, finalize", streaming each chunk from disk. When
+        a chunk fails (connection error or transient 429/5xx), the committed
+        offset is fetched with the "query" command and the upload continues
+        from there rather than restarting at byte zero. A query that fails the
+        same way is retried and counts against `UPLOAD_MAX_RECOVERIES`.
 
         Args:
-            notebook_id: The notebook ID to add the source to
-            file_path: Path to the local file to upload
-            wait: If True, poll until source is processed (default: False)
-            wait_timeout: Max seconds to wait if wait=True (default 120;
-                audio file uploads typically need a larger value — the
-                CLI's `--wait-timeout` flag defaults to 600s)
-
-        Returns:
-            dict with 'id' and 'title' of the created source
+            upload_url: The upload URL from step 2
+            file_path: Path to the file to upload
+            on_progress: Optional callback receiving the total number of bytes
+                sent so far (drops back to the committed offset on recovery)
+            offset: Byte offset to start from (when resuming a session)
+            on_commit: Optional callback receiving the new committed offset
+                after each chunk the server accepts
 
         Raises:
-            FileValidationError: If file doesn't exist or is invalid
-            FileUploadError: If upload fails
+            FileUploadError: If the upload fails
         """
-        file_path = Path(file_path).expanduser().resolve()
+        file_size = file_path.stat().st_size
+        client = self._get_upload_client()
+        recoveries = 0
 
-        # Validate file
-        if not file_path.exists():
-            raise FileValidationError(f"File not found: {file_path}")
-        if not file_path.is_file():
-            raise FileValidationError(f"Not a regular file: {file_path}")
+        def chunk_stream(start: int, end: int) -> Iterator[bytes]:
+            sent = start
+            with open(file_path, "rb") as f:
+                f.seek(start)
+                while sent < end and (chunk := f.read(min(65536, end - sent))):  # 64KB reads
+                    yield chunk
+                    sent += len(chunk)
+                    if on_progress is not None:
+                        on_progress(sent)
+
+        def recover(error: httpx.HTTPError) -> tuple[str, int]:
+            """Back off and fetch the committed offset, retrying failed queries."""
+            nonlocal recoveries
+            while True:
+                if (
+                    isinstance(error, httpx.HTTPStatusError)
+                    and error.response.status_code not in RETRYABLE_STATUS_CODES
+                ):
+                    raise FileUploadError(file_path.name, f"Upload rejected: {error}") from error
+                recoveries += 1
+                if recoveries > self.UPLOAD_MAX_RECOVERIES:
+                    raise FileUploadError(
+                        file_path.name, f"Upload failed at byte {offset}: {error}"
+                    ) from error
+                time.sleep(min(2**recoveries, 16))
+                try:
+                    return self._query_upload_offset(upload_url)
+                except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                    error = e
+
+        while offset < file_size:
+            end = min(offset + self.UPLOAD_CHUNK_SIZE, file_size)
+            command = "upload, finalize" if end == file_size else "upload"
+            headers = {**self._upload_headers(command), "x-goog-upload-offset": str(offset)}
+            try:
+                resp = client.post(upload_url, headers=headers, content=chunk_stream(offset, end))
+                resp.raise_for_status()
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                status, committed = recover(e)
+                if status == "final":
+                    return
+                offset = committed
+                if on_commit is not None:
+                    on_commit(offset)
+                continue
+
+            recoveries = 0
+            offset = end
+            if on_commit is not None:
+                on_commit(offset)
+
+    def _upload_local_file(
+        self,
+        notebook_id: str,
+        file_path: Path,
+        file_size: int,
+        resume: bool = False,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> str:
+        """Run the three upload steps for one validated file, returning its SOURCE_ID.
 
-        filename = file_path.name
-        file_size = file_path.stat().st_size
+        Uploads larger than one chunk persist their session after each
+        committed chunk. With `resume=True`, a saved session for the same
+        notebook and unchanged file is continued from the server's committed
+        offset instead of registering a new source.
+        """
+        store = get_upload_state_store()
+        mtime_ns = file_path.stat().st_mtime_ns
+        session = store.load(notebook_id, str(file_path), file_size, mtime_ns) if resume else None
 
-        if file_size == 0:
-            raise FileValidationError(f"File is empty: {file_path}")
+        if session is not None:
+            try:
+                status, offset = self._query_upload_offset(session.upload_url)
+            except httpx.HTTPError:
+                # Expired or unknown session: start over with a fresh upload.
+                store.delete(session)
+                session = None
+            else:
+                if status == "final":
+                    store.delete(session)
+                    return session.source_id
+                session.offset = offset
+
+        if session is None:
+            # Step 1: Register source intent → get SOURCE_ID
+            source_id = self._register_file_source(notebook_id, file_path.name)
+            # Step 2: Start resumable upload → get upload URL
+            upload_url = self._start_resumable_upload(
+                notebook_id, file_path.name, file_size, source_id
+            )
+            session = UploadSession(
+                notebook_id=notebook_id,
+                file_path=str(file_path),
+                file_size=file_size,
+                mtime_ns=mtime_ns,
+                source_id=source_id,
+                upload_url=upload_url,
+            )
+
+        on_commit = None
+        if file_size > self.UPLOAD_CHUNK_SIZE:
+            store.save(session)
+
+            def on_commit(offset: int) -> None:
+                session.offset = offset
+                store.save(session)
 
-        # Validate file type
-        supported_extensions = {
+        # Step 3: Stream upload file content
+        self._upload_file_streaming(
+            session.upload_url,
+            file_path,
+            on_progress=on_progress,
+            offset=session.offset,
+            on_commit=on_commit,
+        )
+        store.delete(session)
+        return session.source_id
+
+    # File extensions accepted by the resumable upload endpoint.
+    SUPPORTED_FILE_EXTENSIONS = frozenset(
+        {
             ".pdf",
             ".txt",
             ".md",
@@ -977,29 +1429,220 @@ class SourceMixin(BaseClient):
             ".gif",
             ".webp",  # Images
         }
+    )
+
+    def _validate_upload_file(self, file_path: str | Path) -> tuple[Path, int]:
+        """Resolve and validate a local file for upload.
+
+        Returns:
+            Tuple of (resolved path, size in bytes)
+
+        Raises:
+            FileValidationError: If the file is missing, empty, not a regular
+                file, or of an unsupported type
+        """
+        file_path = Path(file_path).expanduser().resolve()
+
+        if not file_path.exists():
+            raise FileValidationError(f"File not found: {file_path}")
+        if not file_path.is_file():
+            raise FileValidationError(f"Not a regular file: {file_path}")
+
+        file_size = file_path.stat().st_size
+        if file_size == 0:
+            raise FileValidationError(f"File is empty: {file_path}")
+
         file_extension = file_path.suffix.lower()
-        if file_extension not in supported_extensions:
+        if file_extension not in self.SUPPORTED_FILE_EXTENSIONS:
             raise FileValidationError(
                 f"Unsupported file type: {file_extension}\n"
-                f"Supported types: {', '.join(sorted(supported_extensions))}"
+                f"Supported types: {', '.join(sorted(self.SUPPORTED_FILE_EXTENSIONS))}"
             )
+        return file_path, file_size
 
-        # Step 1: Register source intent → get SOURCE_ID
-        source_id = self._register_file_source(notebook_id, filename)
+    def add_file(
+        self,
+        notebook_id: str,
+        file_path: str | Path,
+        wait: bool = False,
+        wait_timeout: float = 120.0,
+        resume: bool = False,
+        dedupe: bool = False,
+    ) -> dict[str, Any]:
+        """Add a local file as a source using resumable upload.
 
-        # Step 2: Start resumable upload → get upload URL
-        upload_url = self._start_resumable_upload(notebook_id, filename, file_size, source_id)
+        Uses Google's resumable upload protocol:
+        1. Register source intent with RPC → get SOURCE_ID
+        2. Start upload session with SOURCE_ID → get upload URL
+        3. Stream upload file content in chunks (memory-efficient for large
+           files; failed chunks resume from the server's committed offset)
 
-        # Step 3: Stream upload file content
-        self._upload_file_streaming(upload_url, file_path)
+        Supported file types: PDF, TXT, MD, DOCX, CSV, EPUB, MP3, M4A, WAV, AAC, OGG, OPUS, MP4, JPG, PNG, GIF, WEBP
+
+        Args:
+            notebook_id: The notebook ID to add the source to
+            file_path: Path to the local file to upload
+            wait: If True, poll until source is processed (default: False)
+            wait_timeout: Max seconds to wait if wait=True (default 120;
+                audio file uploads typically need a larger value — the
+                CLI's `--wait-timeout` flag defaults to 600s)
+            resume: If True, continue an interrupted upload of the same file to
+                the same notebook from its saved session, if one exists
+            dedupe: If True, skip the upload when a file with the same bytes
+                was already added to this notebook
+
+        Returns:
+            dict with 'id' and 'title' of the created source
+
+        Raises:
+            FileValidationError: If file doesn't exist or is invalid
+            FileUploadError: If upload fails
+        """
+        file_path, file_size = self._validate_upload_file(file_path)
+        if dedupe:
+            result = self._add_deduplicated(
+                notebook_id,
+                file_key(file_path),
+                str(file_path),
+                lambda: self.add_file(
+                    notebook_id, file_path, wait=wait, wait_timeout=wait_timeout, resume=resume
+                ),
+                wait,
+                wait_timeout,
+            )
+            return cast(dict[str, Any], result)
+        source_id = self._upload_local_file(notebook_id, file_path, file_size, resume=resume)
 
-        result = {"id": source_id, "title": filename}
+        result = {"id": source_id, "title": file_path.name}
 
         if wait:
             return self.wait_for_source_ready(notebook_id, source_id, wait_timeout)
 
         return result
 
+    def add_files(
+        self,
+        notebook_id: str,
+        file_paths: Iterable[str | Path],
+        concurrency: int = 4,
+        wait: bool = False,
+        wait_timeout: float = 120.0,
+        on_progress: Callable[[int, int, int], None] | None = None,
+        resume: bool = False,
+        dedupe: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Upload many local files to one notebook concurrently.
+
+        Each file runs the same three-step protocol as `add_file()`, but up to
+        `concurrency` files are in flight at once, so registration RPCs,
+        upload-session starts and content streams for different files overlap
+        instead of paying each round trip serially. Upload requests share the
+        pooled upload client (`_get_upload_client`).
+
+        Args:
+            notebook_id: The notebook ID to add the sources to
+            file_paths: Local files to upload
+            concurrency: Maximum files uploading at once (default: 4)
+            wait: If True, each worker waits until its source is processed
+            wait_timeout: Max seconds to wait per source if wait=True
+            on_progress: Optional callback `(index, bytes_sent, total_bytes)`
+                invoked from worker threads as file content streams out
+            resume: If True, continue interrupted uploads from saved sessions
+            dedupe: If True, skip files whose bytes were already added to this
+                notebook (their results carry `deduplicated: True`)
+
+        Yields:
+            One dict per file, in completion order, with `index` (position in
+            `file_paths`), `file_path` and `bytes`, plus either `id`, `title`
+            and `seconds` (wall time for that file) on success, or `error`
+            (message) on failure. A failed file does not stop the others.
+        """
+        paths = [Path(p) for p in file_paths]
+        # Workers share one background watcher, so waiting on N uploads costs
+        # one source-list fetch per tick rather than N polling loops.
+        watcher = (
+            SourceReadinessWatcher(self, notebook_id, timeout=wait_timeout).start()
+            if wait
+            else None
+        )
+
+        # Index hits are verified against one source-list fetch shared by all
+        # workers, made only if some file is already indexed.
+        live_lock = threading.Lock()
+        live: list[list[dict[str, Any]]] = []
+
+        def live_sources() -> list[dict[str, Any]]:
+            with live_lock:
+                if not live:
+                    live.append(self.get_notebook_sources_with_types(notebook_id))
+                return live[0]
+
+        def _upload(index: int, raw_path: Path) -> dict[str, Any]:
+            started = time.monotonic()
+            file_path, file_size = self._validate_upload_file(raw_path)
+            progress = None
+            if on_progress is not None:
+
+                def progress(sent: int) -> None:
+                    on_progress(index, sent, file_size)
+
+            content_key = file_key(file_path) if dedupe else None
+            if content_key is not None:
+                existing = self._find_indexed_sources(
+                    notebook_id, [content_key], list_sources=live_sources
+                )
+                if content_key in existing:
+                    result = self._reuse_source(
+                        notebook_id, existing[content_key], wait, wait_timeout
+                    )
+                    return {
+                        **result,
+                        "index": index,
+                        "file_path": str(file_path),
+                        "bytes": file_size,
+                        "seconds": time.monotonic() - started,
+                    }
+
+            source_id = self._upload_local_file(
+                notebook_id, file_path, file_size, resume=resume, on_progress=progress
+            )
+            if content_key is not None:
+                get_source_index().record(notebook_id, content_key, source_id, str(file_path))
+            result: dict[str, Any] = {"id": source_id, "title": file_path.name}
+            if watcher is not None:
+                result = watcher.watch(source_id).result()
+            return {
+                **result,
+                "index": index,
+                "file_path": str(file_path),
+                "bytes": file_size,
+                "seconds": time.monotonic() - started,
+            }
+
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, concurrency), thread_name_prefix="nlm-upload"
+        )
+        try:
+            futures = {
+                executor.submit(_upload, index, path): (index, path)
+                for index, path in enumerate(paths)
+            }
+            for future in as_completed(futures):
+                index, path = futures[future]
+                try:
+                    yield future.result()
+                except Exception as e:
+                    yield {
+                        "index": index,
+                        "file_path": str(path),
+                        "bytes": 0,
+                        "error": str(e),
+                    }
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            if watcher is not None:
+                watcher.close()
+
     def get_source_guide(self, source_id: str) -> dict[str, Any]:
         """Get AI-generated summary and keywords for a source."""
         result = self._call_rpc(self.RPC_GET_SOURCE_GUIDE, [[[[source_id]]]], "/")
@@ -1022,7 +1665,9 @@ class SourceMixin(BaseClient):
             "keywords": keywords,
         }
 
-    def get_source_fulltext(self, source_id: str) -> dict[str, Any]:
+    def get_source_fulltext(
+        self, source_id: str, offset: int = 0, limit: int | None = None
+    ) -> dict[str, Any]:
         """Get the full text content of a source.
 
         Returns the raw text content that was indexed from the source,
@@ -1030,15 +1675,19 @@ class SourceMixin(BaseClient):
 
         Args:
             source_id: The source UUID
+            offset: First character of the content to return
+            limit: Max characters of content to return (default: all)
 
         Returns:
-            Dict with content, title, source_type, and char_count
+            Dict with content, title, source_type, url, and char_count (the
+            length of the full text, not just the returned window)
         """
         # The hizoJc RPC returns source details including full text
         params = [[source_id], [2], [2]]
         result = self._call_rpc(self.RPC_GET_SOURCE, params, "/")
 
         content = ""
+        char_count = 0
         title = ""
         source_type = ""
         url = None
@@ -1078,31 +1727,66 @@ class SourceMixin(BaseClient):
             if len(result) > 3 and isinstance(result[3], list):
                 content_wrapper = result[3]
                 if len(content_wrapper) > 0 and isinstance(content_wrapper[0], list):
-                    content_blocks = content_wrapper[0]
-                    # Collect all text from content blocks
-                    text_parts = []
-                    for block in content_blocks:
-                        if isinstance(block, list):
-                            # Each block is [start, end, content_data, ...]
-                            # Extract all text strings recursively
-                            texts = self._extract_all_text(block)
-                            text_parts.extend(texts)
-                    content = "\n\n".join(text_parts)
+                    # Each block is [start, end, content_data, ...]
+                    blocks = [b for b in content_wrapper[0] if isinstance(b, list)]
+                    content, char_count = join_text_window(
+                        iter_text_segments(blocks), offset, limit
+                    )
 
         return {
             "content": content,
             "title": title,
             "source_type": source_type,
             "url": url,
-            "char_count": len(content),
+            "char_count": char_count,
         }
 
-    def _extract_all_text(self, data: list[Any]) -> list[str]:
-        """Recursively extract all text strings from nested arrays."""
-        texts = []
-        for item in data:
-            if isinstance(item, str) and len(item) > 0:
-                texts.append(item)
-            elif isinstance(item, list):
-                texts.extend(self._extract_all_text(item))
-        return texts
+    def get_source_fulltexts(
+        self, source_ids: Iterable[str], concurrency: int = 8
+    ) -> Iterator[dict[str, Any]]:
+        """Fetch the full text of many sources concurrently.
+
+        At most `concurrency` fetches are in flight, and a new one is started
+        only as a finished one is yielded, so memory stays bounded by the
+        window rather than growing with the number of sources. Transient
+        429/5xx responses are retried with backoff.
+
+        Args:
+            source_ids: Sources to fetch
+            concurrency: Maximum fetches in flight at once (default: 8)
+
+        Yields:
+            One dict per source, in completion order, with `index` (position in
+            `source_ids`) and `source_id`, plus either the `get_source_fulltext`
+            fields or `error` (message) if that fetch failed.
+        """
+        ids = list(source_ids)
+        if not ids:
+            return
+        window = max(1, min(concurrency, len(ids)))
+        queue = iter(enumerate(ids))
+        executor = ThreadPoolExecutor(max_workers=window, thread_name_prefix="nlm-fulltext")
+        in_flight: dict[Future[Any], int] = {}
+
+        def submit_next() -> None:
+            for index, source_id in queue:
+                future = executor.submit(execute_with_retry, self.get_source_fulltext, source_id)
+                in_flight[future] = index
+                return
+
+        try:
+            for _ in range(window):
+                submit_next()
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = in_flight.pop(future)
+                    item: dict[str, Any] = {"index": index, "source_id": ids[index]}
+                    try:
+                        item.update(future.result())
+                    except Exception as e:
+                        item["error"] = str(e)
+                    submit_next()
+                    yield item
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,60 @@
+"""Shared plumbing for the local SQLite stores.
+
+Stores keep their own tables in one database,
+``~/.notebooklm-mcp-cli/local.sqlite3``, unless given a path of their own.
+Each store opens its own connection; WAL mode lets them read concurrently
+while writes take turns.
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import ClassVar, Self
+
+from notebooklm_tools.utils.config import get_storage_dir
+
+DB_FILENAME = "local.sqlite3"
+
+
+def default_db_path() -> Path:
+    """The database the stores share unless given a path of their own."""
+    return get_storage_dir() / DB_FILENAME
+
+
+class SQLiteStore:
+    """Base for a store kept in a SQLite database.
+
+    Subclasses list their ``CREATE ... IF NOT EXISTS`` statements in
+    `SCHEMA`. Safe to share between threads: one connection guarded by
+    `_lock`, which writes hold together with the connection's transaction
+    (``with self._lock, self._conn:``).
+    """
+
+    SCHEMA: ClassVar[tuple[str, ...]] = ()
+
+    _shared: ClassVar[dict[type, "SQLiteStore"]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path or default_db_path()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            for statement in self.SCHEMA:
+                self._conn.execute(statement)
+
+    @classmethod
+    def shared(cls) -> Self:
+        """The process-wide instance, opened on first use."""
+        store = cls._shared.get(cls)
+        if store is None:
+            with cls._shared_lock:
+                store = cls._shared.get(cls)
+                if store is None:
+                    store = cls._shared[cls] = cls()
+        return store  # type: ignore[return-value]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
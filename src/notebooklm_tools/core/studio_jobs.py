@@ -0,0 +1,290 @@
+"""Durable queue of studio generation jobs.
+
+A job is one artifact to generate: (account, notebook, artifact type, create
+options), plus an optional directory to download the result into. Jobs move
+through these states:
+
+    queued -> starting -> generating -> completed
+                                     -> failed (after max_attempts)
+
+``starting`` covers the create RPC itself; a job left there by a crash is
+queued again on the next run. ``generating`` jobs keep their artifact ID, so
+a restarted runner resumes tracking them instead of generating again.
+
+The store also remembers, per account, every generation start and what the
+backend's RESOURCE_EXHAUSTED errors taught us: how many starts a day the
+account gets, and until when it is cooling down.
+
+The queue is kept in the local SQLite database (see `sqlite_store`).
+"""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+from .sqlite_store import SQLiteStore
+
+DAY_SECONDS = 24 * 60 * 60
+
+
+class StudioJobStore(SQLiteStore):
+    """SQLite-backed studio job queue and per-account quota record."""
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS jobs (
+            job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            account TEXT NOT NULL,
+            notebook_id TEXT NOT NULL,
+            artifact_type TEXT NOT NULL,
+            options TEXT NOT NULL,
+            download_dir TEXT,
+            state TEXT NOT NULL,
+            artifact_id TEXT,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            max_attempts INTEGER NOT NULL,
+            not_before REAL NOT NULL DEFAULT 0,
+            path TEXT,
+            error TEXT,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS jobs_state ON jobs (account, state)",
+        "CREATE TABLE IF NOT EXISTS starts (account TEXT NOT NULL, started_at REAL NOT NULL)",
+        """
+        CREATE TABLE IF NOT EXISTS quotas (
+            account TEXT PRIMARY KEY,
+            daily_limit INTEGER,
+            blocked_until REAL NOT NULL DEFAULT 0,
+            strikes INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID
+        """,
+    )
+
+    def __init__(self, path: Path | None = None) -> None:
+        super().__init__(path)
+        self._conn.row_factory = sqlite3.Row
+
+    # ------------------------------------------------------------------
+    # Jobs
+    # ------------------------------------------------------------------
+
+    def enqueue(
+        self,
+        account: str,
+        notebook_id: str,
+        artifact_type: str,
+        options: dict[str, Any] | None = None,
+        download_dir: str | None = None,
+        max_attempts: int = 3,
+    ) -> int:
+        """Add a queued job and return its ID."""
+        now = time.time()
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO jobs (account, notebook_id, artifact_type, options, download_dir,"
+                " state, max_attempts, created_at, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, 'queued', ?, ?, ?)",
+                (
+                    account,
+                    notebook_id,
+                    artifact_type,
+                    json.dumps(options or {}),
+                    download_dir,
+                    max_attempts,
+                    now,
+                    now,
+                ),
+            )
+        return int(cursor.lastrowid or 0)
+
+    def claim_next(self, account: str) -> dict[str, Any] | None:
+        """Move the oldest runnable queued job to ``starting`` and return it."""
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT * FROM jobs WHERE account = ? AND state = 'queued' AND not_before <= ?"
+                " ORDER BY job_id LIMIT 1",
+                (account, now),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE jobs SET state = 'starting', attempts = attempts + 1, updated_at = ?"
+                " WHERE job_id = ?",
+                (now, row["job_id"]),
+            )
+        return self._job(row) | {"state": "starting", "attempts": row["attempts"] + 1}
+
+    def mark_generating(self, job_id: int, artifact_id: str) -> None:
+        self._update(job_id, state="generating", artifact_id=artifact_id, error=None)
+
+    def mark_completed(
+        self, job_id: int, path: str | None = None, error: str | None = None
+    ) -> None:
+        """Finish a job; `error` records a failed auto-download of a generated artifact."""
+        self._update(job_id, state="completed", path=path, error=error)
+
+    def mark_failed(self, job_id: int, error: str) -> None:
+        self._update(job_id, state="failed", artifact_id=None, error=error)
+
+    def retry_or_fail(self, job_id: int, error: str, delay: float = 0.0) -> str:
+        """Queue a failed attempt again after `delay` seconds, or fail the job if out of attempts.
+
+        Returns the job's new state.
+        """
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT attempts, max_attempts FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        state = "failed" if row is None or row[0] >= row[1] else "queued"
+        self._update(
+            job_id, state=state, artifact_id=None, error=error, not_before=time.time() + delay
+        )
+        return state
+
+    def release(self, job_id: int, not_before: float) -> None:
+        """Put a claimed job back without spending an attempt (it never got to run)."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET state = 'queued', attempts = attempts - 1, not_before = ?,"
+                " updated_at = ? WHERE job_id = ?",
+                (not_before, time.time(), job_id),
+            )
+
+    def recover(self, account: str) -> int:
+        """Queue again jobs a crashed runner left mid-create. Returns how many."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET state = 'queued', attempts = attempts - 1, updated_at = ?"
+                " WHERE account = ? AND state = 'starting'",
+                (time.time(), account),
+            )
+        return cursor.rowcount
+
+    def jobs(self, account: str | None = None, state: str | None = None) -> list[dict[str, Any]]:
+        """Jobs in queue order, optionally filtered by account and state."""
+        query, params = "SELECT * FROM jobs WHERE 1 = 1", []
+        if account is not None:
+            query, params = query + " AND account = ?", [*params, account]
+        if state is not None:
+            query, params = query + " AND state = ?", [*params, state]
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY job_id", params).fetchall()
+        return [self._job(row) for row in rows]
+
+    def counts(self, account: str | None = None) -> dict[str, int]:
+        """Number of jobs per state."""
+        query, params = "SELECT state, COUNT(*) FROM jobs", []
+        if account is not None:
+            query, params = query + " WHERE account = ?", [account]
+        with self._lock:
+            rows = self._conn.execute(query + " GROUP BY state", params).fetchall()
+        return {state: count for state, count in rows}
+
+    def next_runnable_at(self, account: str) -> float | None:
+        """Earliest `not_before` of the account's queued jobs, if any are queued."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MIN(not_before) FROM jobs WHERE account = ? AND state = 'queued'",
+                (account,),
+            ).fetchone()
+        return row[0]
+
+    def _update(self, job_id: int, **fields: Any) -> None:
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"UPDATE jobs SET {assignments}, updated_at = ? WHERE job_id = ?",
+                (*fields.values(), time.time(), job_id),
+            )
+
+    @staticmethod
+    def _job(row: sqlite3.Row) -> dict[str, Any]:
+        job = dict(row)
+        job["options"] = json.loads(job["options"])
+        return job
+
+    # ------------------------------------------------------------------
+    # Quota
+    # ------------------------------------------------------------------
+
+    def record_start(self, account: str) -> None:
+        """Count a generation start against the account's rolling day."""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute("INSERT INTO starts VALUES (?, ?)", (account, now))
+            self._conn.execute("DELETE FROM starts WHERE started_at < ?", (now - DAY_SECONDS,))
+            self._conn.execute("UPDATE quotas SET strikes = 0 WHERE account = ?", (account,))
+
+    def starts_today(self, account: str) -> int:
+        """Generations started by the account in the last 24 hours."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM starts WHERE account = ? AND started_at >= ?",
+                (account, time.time() - DAY_SECONDS),
+            ).fetchone()[0]
+
+    def start_slot_at(self, account: str, daily_limit: int) -> float:
+        """When the account may start another generation under `daily_limit` starts a day."""
+        now = time.time()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT started_at FROM starts WHERE account = ? AND started_at >= ?"
+                " ORDER BY started_at",
+                (account, now - DAY_SECONDS),
+            ).fetchall()
+        if len(rows) < daily_limit:
+            return now
+        return rows[len(rows) - daily_limit][0] + DAY_SECONDS
+
+    def record_exhausted(self, account: str, cooldown: float) -> tuple[int | None, float]:
+        """Learn from a RESOURCE_EXHAUSTED error and block the account for a while.
+
+        A first error is taken as short-term throttling: the account cools
+        down for `cooldown` seconds, doubling while errors repeat. If the
+        error is still there after a cooldown (no start got through), the
+        account is out of daily quota: the number of starts in the last 24
+        hours becomes its learned daily limit, and it stays blocked until the
+        oldest of those starts ages out.
+
+        Returns:
+            (learned daily limit or None, blocked-until timestamp)
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT daily_limit, strikes FROM quotas WHERE account = ?", (account,)
+            ).fetchone()
+            limit, strikes = (row[0], row[1] + 1) if row else (None, 1)
+            until = now + cooldown * 2 ** (strikes - 1)
+            if strikes >= 2:
+                count, oldest = self._conn.execute(
+                    "SELECT COUNT(*), MIN(started_at) FROM starts"
+                    " WHERE account = ? AND started_at >= ?",
+                    (account, now - DAY_SECONDS),
+                ).fetchone()
+                if count:
+                    limit = count
+                    until = max(until, oldest + DAY_SECONDS)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO quotas VALUES (?, ?, ?, ?)",
+                (account, limit, until, strikes),
+            )
+        return limit, until
+
+    def quota(self, account: str) -> tuple[int | None, float]:
+        """(learned daily limit or None, blocked-until timestamp) for an account."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT daily_limit, blocked_until FROM quotas WHERE account = ?", (account,)
+            ).fetchone()
+        return (row[0], row[1]) if row else (None, 0.0)
+
+
+def get_studio_job_store() -> StudioJobStore:
+    """Get the process-wide studio job queue."""
+    return StudioJobStore.shared()
@@ -0,0 +1,372 @@
+"""StudioWatcher - Track studio generations across notebooks with one poller.
+
+Agents waiting on generated artifacts used to poll `studio_status` on their
+own, each poll costing a studio list RPC (plus a mind map list), and several
+agents often polled the same notebook. The watcher instead polls each notebook
+that has in-flight artifacts at most once per tick, with one
+`poll_studio_status` call serving every artifact watched in it.
+
+Poll intervals adapt to what is being generated: reports and quizzes finish in
+seconds, so they are checked often; audio and video take minutes, so they
+start slow and back off further. A notebook is polled at the pace of its
+fastest pending artifact.
+
+Results are delivered as futures (`watch()`), resolved with the artifact dict
+or failed with StudioGenerationError (generation failed) / ArtifactNotFoundError
+(not in the notebook's studio list) / TimeoutError / the poll's own error when
+it is not transient (e.g. authentication), and as
+`StudioEvent`s to every `subscribe()`d callback. `start()` drives polling on a
+background thread; `poll_due()` runs one round on the calling thread.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from .errors import ArtifactNotFoundError
+from .retry import is_transient_error
+
+logger = logging.getLogger("notebooklm_mcp.api")
+
+# (first interval, max interval) in seconds per artifact type
+TYPE_INTERVALS: dict[str, tuple[float, float]] = {
+    "report": (2.0, 10.0),
+    "data_table": (2.0, 10.0),
+    "quiz": (2.0, 10.0),
+    "flashcards": (2.0, 10.0),
+    "mind_map": (2.0, 10.0),
+    "infographic": (5.0, 20.0),
+    "slide_deck": (5.0, 20.0),
+    "audio": (15.0, 60.0),
+    "video": (30.0, 90.0),
+}
+DEFAULT_INTERVALS = (5.0, 30.0)
+
+# Seconds a just-started generation may be missing from the studio list
+# before it is given up on as not found.
+MISSING_GRACE = 60.0
+
+
+class StudioGenerationError(RuntimeError):
+    """The backend reported that an artifact failed to generate."""
+
+
+class _StudioPollProtocol(Protocol):
+    def poll_studio_status(self, notebook_id: str) -> list[dict[str, Any]]: ...
+
+
+@dataclass
+class StudioEvent:
+    """An artifact that finished waiting: completed, failed, or timed out."""
+
+    notebook_id: str
+    artifact_id: str
+    state: str  # "completed" | "failed" | "timeout" | "error" (the poll itself failed)
+    artifact: dict[str, Any] | None = None  # Latest poll_studio_status entry, if seen
+    error: str | None = None
+
+
+@dataclass
+class _Watch:
+    future: Future[dict[str, Any]]
+    deadline: float
+    artifact_type: str | None
+    interval: float
+    missing_after: float  # When absence from a successful poll settles it as not found
+    holders: int = 1  # watch() calls not yet matched by unwatch()
+
+
+class StudioWatcher:
+    """Track in-flight studio artifacts in any number of notebooks.
+
+    Thread-safe: `watch()` and `subscribe()` may be called from any thread,
+    including while the background driver is polling.
+    """
+
+    def __init__(
+        self,
+        client: _StudioPollProtocol,
+        *,
+        timeout: float = 3600.0,
+        backoff: float = 1.5,
+        missing_grace: float = MISSING_GRACE,
+    ) -> None:
+        """
+        Args:
+            client: Client providing `poll_studio_status`
+            timeout: Max seconds to track an artifact, from when it is watched
+            backoff: Interval multiplier applied after each poll, per artifact
+            missing_grace: Seconds a just-started generation (watched with its
+                type) may be missing from the studio list. Other artifacts
+                are settled as not found on the first poll that lacks them.
+        """
+        self._client = client
+        self.timeout = timeout
+        self.backoff = backoff
+        self.missing_grace = missing_grace
+        # notebook_id -> artifact_id -> watch
+        self._notebooks: dict[str, dict[str, _Watch]] = {}
+        # notebook_id -> monotonic time of its next poll
+        self._due: dict[str, float] = {}
+        self._subscribers: list[Callable[[StudioEvent], None]] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+
+    def watch(
+        self, notebook_id: str, artifact_id: str, artifact_type: str | None = None
+    ) -> Future[dict[str, Any]]:
+        """Start tracking an artifact. Watching an already-pending ID returns its future.
+
+        Each call holds the watch until the artifact settles or it is handed
+        back with `unwatch()`.
+
+        With a known `artifact_type` (a generation just started), the first
+        check waits that type's first interval and the artifact may be missing
+        from the studio list for `missing_grace` seconds; otherwise the
+        notebook is checked on the next tick.
+        """
+        first, _ = TYPE_INTERVALS.get(artifact_type or "", DEFAULT_INTERVALS)
+        now = time.monotonic()
+        with self._lock:
+            pending = self._notebooks.setdefault(notebook_id, {})
+            if artifact_id in pending:
+                pending[artifact_id].holders += 1
+                return pending[artifact_id].future
+            future: Future[dict[str, Any]] = Future()
+            grace = self.missing_grace if artifact_type else 0.0
+            pending[artifact_id] = _Watch(
+                future, now + self.timeout, artifact_type, first, now + grace
+            )
+            due = now + first if artifact_type else now
+            self._due[notebook_id] = min(self._due.get(notebook_id, due), due)
+        self._wake.set()
+        return future
+
+    def watch_many(
+        self, notebook_id: str, artifact_ids: Iterable[str]
+    ) -> dict[str, Future[dict[str, Any]]]:
+        """Track several artifacts of one notebook, returning their futures by ID."""
+        return {artifact_id: self.watch(notebook_id, artifact_id) for artifact_id in artifact_ids}
+
+    def unwatch(self, notebook_id: str, artifact_id: str) -> None:
+        """Hand back one `watch()` of a pending artifact.
+
+        Once no caller holds it, the artifact is no longer polled and its
+        future is cancelled. Settled or unknown artifacts are ignored.
+        """
+        with self._lock:
+            pending = self._notebooks.get(notebook_id, {})
+            watch = pending.get(artifact_id)
+            if watch is None:
+                return
+            watch.holders -= 1
+            if watch.holders > 0:
+                return
+            del pending[artifact_id]
+            if not pending:
+                self._notebooks.pop(notebook_id, None)
+                self._due.pop(notebook_id, None)
+        watch.future.cancel()
+
+    def subscribe(self, callback: Callable[[StudioEvent], None]) -> Callable[[], None]:
+        """Call `callback` with every event from now on. Returns an unsubscribe function."""
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def notebook_of(self, artifact_id: str) -> str | None:
+        """The notebook a pending artifact is watched in, if any."""
+        with self._lock:
+            for notebook_id, pending in self._notebooks.items():
+                if artifact_id in pending:
+                    return notebook_id
+        return None
+
+    @property
+    def pending(self) -> dict[str, set[str]]:
+        """Artifact IDs still in flight, by notebook."""
+        with self._lock:
+            return {nb: set(pending) for nb, pending in self._notebooks.items()}
+
+    # ------------------------------------------------------------------
+    # Polling
+    # ------------------------------------------------------------------
+
+    def poll(self, notebook_id: str) -> list[StudioEvent]:
+        """Run one tick for a notebook: a single studio list serves every watched artifact."""
+        with self._lock:
+            if not self._notebooks.get(notebook_id):
+                return []
+        listed = True
+        try:
+            artifacts = self._client.poll_studio_status(notebook_id)
+        except Exception as e:
+            if not is_transient_error(e):
+                return self._fail_notebook(notebook_id, e)
+            # Transient errors should not fail every pending artifact;
+            # per-artifact deadlines still bound the wait.
+            logger.debug("Studio poll failed for %s: %s", notebook_id, e)
+            artifacts = []
+            listed = False
+        by_id = {a.get("artifact_id"): a for a in artifacts}
+
+        now = time.monotonic()
+        events: list[StudioEvent] = []
+        errors: dict[str, Exception] = {}
+        with self._lock:
+            pending = self._notebooks.get(notebook_id, {})
+            for artifact_id, watch in pending.items():
+                artifact = by_id.get(artifact_id)
+                status = artifact.get("status") if artifact else None
+                if artifact and watch.artifact_type is None:
+                    watch.artifact_type = artifact.get("type")
+                    watch.interval = TYPE_INTERVALS.get(
+                        watch.artifact_type or "", DEFAULT_INTERVALS
+                    )[0]
+                if status == "completed":
+                    events.append(StudioEvent(notebook_id, artifact_id, "completed", artifact))
+                elif status == "failed":
+                    reason = artifact.get("error_reason") if artifact else None
+                    events.append(
+                        StudioEvent(
+                            notebook_id,
+                            artifact_id,
+                            "failed",
+                            artifact,
+                            error=reason or f"Artifact {artifact_id} failed to generate",
+                        )
+                    )
+                elif artifact is None and listed and now >= watch.missing_after:
+                    # Mistyped, deleted, or in another notebook: it won't show up.
+                    error = ArtifactNotFoundError(artifact_id)
+                    errors[artifact_id] = error
+                    events.append(StudioEvent(notebook_id, artifact_id, "failed", error=str(error)))
+                elif now >= watch.deadline:
+                    events.append(
+                        StudioEvent(
+                            notebook_id,
+                            artifact_id,
+                            "timeout",
+                            artifact,
+                            error=f"Artifact {artifact_id} not finished after {self.timeout}s",
+                        )
+                    )
+                else:
+                    _, ceiling = TYPE_INTERVALS.get(watch.artifact_type or "", DEFAULT_INTERVALS)
+                    watch.interval = min(watch.interval * self.backoff, ceiling)
+
+            settled = [(event, pending.pop(event.artifact_id).future) for event in events]
+            if pending:
+                next_poll = now + min(w.interval for w in pending.values())
+                earliest_deadline = min(w.deadline for w in pending.values())
+                self._due[notebook_id] = min(next_poll, earliest_deadline)
+            else:
+                self._notebooks.pop(notebook_id, None)
+                self._due.pop(notebook_id, None)
+            subscribers = list(self._subscribers)
+
+        for event, future in settled:
+            self._deliver(event, future, subscribers, errors.get(event.artifact_id))
+        return events
+
+    def _fail_notebook(self, notebook_id: str, error: Exception) -> list[StudioEvent]:
+        """Fail a notebook's pending artifacts with a poll error that retrying won't fix."""
+        with self._lock:
+            pending = self._notebooks.pop(notebook_id, {})
+            self._due.pop(notebook_id, None)
+            subscribers = list(self._subscribers)
+        settled = [
+            (StudioEvent(notebook_id, artifact_id, "error", error=str(error)), watch.future)
+            for artifact_id, watch in pending.items()
+        ]
+        for event, future in settled:
+            self._deliver(event, future, subscribers, error)
+        return [event for event, _ in settled]
+
+    def poll_due(self) -> list[StudioEvent]:
+        """Poll every notebook whose next check is due."""
+        now = time.monotonic()
+        with self._lock:
+            due = [nb for nb, at in self._due.items() if at <= now]
+        events: list[StudioEvent] = []
+        for notebook_id in due:
+            events.extend(self.poll(notebook_id))
+        return events
+
+    def _deliver(
+        self,
+        event: StudioEvent,
+        future: Future[dict[str, Any]],
+        subscribers: list[Callable[[StudioEvent], None]],
+        error: Exception | None = None,
+    ) -> None:
+        if event.state == "completed":
+            future.set_result(event.artifact or {"artifact_id": event.artifact_id})
+        else:
+            if error is None:
+                error_cls = TimeoutError if event.state == "timeout" else StudioGenerationError
+                error = error_cls(event.error)
+            future.set_exception(error)
+        for callback in subscribers:
+            try:
+                callback(event)
+            except Exception:
+                logger.exception("Studio watcher callback failed for %s", event.artifact_id)
+
+    def next_due_in(self) -> float:
+        """Seconds until the next notebook is due (1s when idle)."""
+        with self._lock:
+            if not self._due:
+                return 1.0
+            return max(0.0, min(self._due.values()) - time.monotonic())
+
+    # ------------------------------------------------------------------
+    # Background driver
+    # ------------------------------------------------------------------
+
+    def start(self) -> "StudioWatcher":
+        """Drive polling on a daemon thread so futures resolve on their own."""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="nlm-studio-watcher", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.poll_due()
+            # A new watch() may make a notebook due sooner; it sets _wake.
+            self._wake.wait(self.next_due_in())
+            self._wake.clear()
+
+    def close(self) -> None:
+        """Stop the background driver. Pending futures are left unresolved."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+
+    def __enter__(self) -> "StudioWatcher":
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
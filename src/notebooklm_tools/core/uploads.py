@@ -0,0 +1,170 @@
+"""Persistent state for resumable file uploads.
+
+A multi-chunk upload records its session (SOURCE_ID, upload URL and the last
+byte offset the server committed) in a small JSON file under
+``~/.notebooklm-mcp-cli/uploads/``. If the process dies mid-upload,
+``add_file(..., resume=True)`` (``nlm source add --resume``) finds the session
+for the same notebook and unchanged file, asks the server for the committed
+offset, and continues from there instead of re-sending the whole file.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from notebooklm_tools.utils.config import get_storage_dir, safe_mkdir
+
+logger = logging.getLogger("notebooklm_mcp.api")
+
+# Google resumable upload URLs stay valid for about a week; older sessions
+# cannot be resumed and are discarded on lookup.
+SESSION_MAX_AGE_SECONDS = 6 * 24 * 3600
+
+
+@dataclass
+class UploadSession:
+    """A resumable upload in progress for one local file."""
+
+    notebook_id: str
+    file_path: str  # Resolved absolute path
+    file_size: int
+    mtime_ns: int  # File modification time, so edited files are not resumed
+    source_id: str
+    upload_url: str
+    offset: int = 0  # Bytes the server has committed
+    created_at: float = field(default_factory=time.time)
+
+
+class UploadStateStore:
+    """JSON-file store of in-progress upload sessions, one file per session."""
+
+    def __init__(self, directory: Path | None = None) -> None:
+        self.directory = directory or get_storage_dir() / "uploads"
+
+    @staticmethod
+    def session_key(notebook_id: str, file_path: str, file_size: int, mtime_ns: int) -> str:
+        """Stable key for a (notebook, file version) pair."""
+        raw = f"{notebook_id}\0{file_path}\0{file_size}\0{mtime_ns}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+    def _path_for(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def load(
+        self, notebook_id: str, file_path: str, file_size: int, mtime_ns: int
+    ) -> UploadSession | None:
+        """Return the saved session for this notebook and file version, if resumable."""
+        path = self._path_for(self.session_key(notebook_id, file_path, file_size, mtime_ns))
+        try:
+            session = UploadSession(**json.loads(path.read_text(encoding="utf-8")))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as e:
+            logger.debug("Discarding unreadable upload state %s: %s", path, e)
+            path.unlink(missing_ok=True)
+            return None
+        if time.time() - session.created_at > SESSION_MAX_AGE_SECONDS:
+            path.unlink(missing_ok=True)
+            return None
+        return session
+
+    def save(self, session: UploadSession) -> None:
+        """Write the session atomically (temp file + rename)."""
+        safe_mkdir(self.directory, parents=True, mode=0o700)
+        key = self.session_key(
+            session.notebook_id, session.file_path, session.file_size, session.mtime_ns
+        )
+        path = self._path_for(key)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(asdict(session)), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def delete(self, session: UploadSession) -> None:
+        """Forget a finished or abandoned session."""
+        key = self.session_key(
+            session.notebook_id, session.file_path, session.file_size, session.mtime_ns
+        )
+        self._path_for(key).unlink(missing_ok=True)
+
+
+_store: UploadStateStore | None = None
+
+
+def get_upload_state_store() -> UploadStateStore:
+    """Get the process-wide upload state store."""
+    global _store
+    if _store is None:
+        _store = UploadStateStore()
+    return _store
+
+
+@dataclass
+class ManifestEntry:
+    """One file in a directory ingest and how far it got."""
+
+    path: str  # Relative to the ingested directory, POSIX separators
+    size: int
+    mtime_ns: int
+    sha256: str
+    status: str = "pending"  # pending | uploaded | ready | failed
+    source_id: str | None = None
+    error: str | None = None
+
+
+class DirectoryManifest:
+    """Append-only JSONL record of a directory ingest, one line per state change.
+
+    Every status change is appended and flushed as it happens, so a crash or
+    Ctrl-C loses at most the in-flight line. On load, the last line for each
+    path wins; `rewrite()` compacts the file to one line per path.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.entries: dict[str, ManifestEntry] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def default_path(notebook_id: str, directory: Path) -> Path:
+        """Manifest location for a (notebook, directory) pair under the storage dir."""
+        raw = f"{notebook_id}\0{directory}"
+        key = hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+        return get_storage_dir() / "manifests" / f"{key}.jsonl"
+
+    def load(self) -> None:
+        """Read existing entries, ignoring a torn last line from a crash."""
+        self.entries = {}
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return
+        for line in lines:
+            try:
+                entry = ManifestEntry(**json.loads(line))
+            except (ValueError, TypeError) as e:
+                logger.debug("Skipping unreadable manifest line in %s: %s", self.path, e)
+                continue
+            self.entries[entry.path] = entry
+
+    def rewrite(self) -> None:
+        """Write all entries atomically, one line each (temp file + rename)."""
+        safe_mkdir(self.path.parent, parents=True, mode=0o700)
+        tmp = self.path.with_suffix(".tmp")
+        with self._lock:
+            tmp.write_text(
+                "".join(json.dumps(asdict(e)) + "\n" for e in self.entries.values()),
+                encoding="utf-8",
+            )
+            os.replace(tmp, self.path)
+
+    def update(self, entry: ManifestEntry) -> None:
+        """Record a state change for one file and append it to disk immediately."""
+        with self._lock:
+            self.entries[entry.path] = entry
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(asdict(entry)) + "\n")
@@ -46,7 +46,7 @@ mcp = FastMCP(
 **Auth:** If you get authentication errors, run `nlm login` via your Bash/terminal tool. This is the automated authentication method that handles everything. Only use save_auth_tokens as a fallback if the CLI fails.
 **Account Switching:** To switch Google Accounts for the MCP server, run `nlm login switch <profile>` in Bash. The MCP server instantly uses the active default profile.
 **Confirmation:** Tools with confirm param require user approval before setting confirm=True.
-**Studio:** After creating audio/video/infographic/slides, poll studio_status for completion.
+**Studio:** After creating audio/video/infographic/slides, call studio_wait(artifact_ids) to block until they finish instead of polling studio_status.
 
 Consolidated tools:
 - source_add(source_type=url|text|drive|file, url=..., document_id=..., text=..., file_path=...): Add any source type
@@ -37,11 +37,13 @@ from .sharing import (
 from .smart_select import tag
 from .sources import (
     source_add,
+    source_add_directory,
     source_delete,
     source_describe,
     source_get_content,
     source_list_drive,
     source_rename,
+    source_search,
     source_sync_drive,
 )
 from .studio import (
@@ -64,14 +66,16 @@ __all__ = [
     "notebook_create",
     "notebook_rename",
     "notebook_delete",
-    # Sources (7)
+    # Sources (9)
     "source_add",
+    "source_add_directory",
     "source_list_drive",
     "source_sync_drive",
     "source_delete",
     "source_describe",
     "source_get_content",
     "source_rename",
+    "source_search",
     # Sharing (4)
     "notebook_share_status",
     "notebook_share_public",
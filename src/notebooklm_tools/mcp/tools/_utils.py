@@ -135,6 +135,12 @@ def get_client() -> NotebookLMClient:
     return _client
 
 
+def get_existing_client() -> NotebookLMClient | None:
+    """Return the current API client without creating one or touching auth."""
+    with _client_lock:
+        return _client
+
+
 def reset_client() -> None:
     """Reset the client to force re-initialization."""
     global _client
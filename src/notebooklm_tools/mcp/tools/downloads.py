@@ -31,14 +31,17 @@ def download_artifact(
             - mind_map: Mind Map (JSON)
             - slide_deck: Slide Deck (PDF or PPTX)
             - infographic: Infographic (PNG)
-            - data_table: Data Table (CSV)
+            - data_table: Data Table (csv|jsonl)
             - quiz: Quiz (json|markdown|html)
             - flashcards: Flashcards (json|markdown|html)
         output_path: Path to save the file
         artifact_id: Optional specific artifact ID (uses latest if not provided)
-        output_format: For quiz/flashcards only: json|markdown|html (default: json)
+        output_format: For quiz/flashcards: json|markdown|html (default: json);
+            for data_table: csv (default) or jsonl (one JSON object per row)
         slide_deck_format: For slide_deck only: pdf (default) or pptx
 
+    Repeat downloads of an unchanged artifact are served from a local cache.
+
     Returns:
         dict with status and saved file path
 
@@ -58,6 +61,7 @@ def download_artifact(
                 artifact_id=artifact_id,
                 output_format=output_format,
                 slide_deck_format=slide_deck_format,
+                use_cache=True,
             )
         )
         return {"status": "success", **download_result}
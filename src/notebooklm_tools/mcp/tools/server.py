@@ -6,7 +6,7 @@ from typing import Any, cast
 
 from notebooklm_tools import __version__
 
-from ._utils import logged_tool
+from ._utils import get_existing_client, logged_tool
 
 
 def _get_latest_pypi_version() -> str | None:
@@ -62,6 +62,17 @@ def _check_auth_status() -> str:
         return "error"
 
 
+def _conversation_cache_stats() -> dict[str, int] | None:
+    """Stats for the running client's conversation cache, or None before first use."""
+    client = get_existing_client()
+    if client is None:
+        return None
+    try:
+        return client.get_conversation_cache_stats()
+    except Exception:
+        return None
+
+
 @logged_tool()
 def server_info() -> dict[str, Any]:
     """Get server version, check for updates, and report auth status.
@@ -97,6 +108,9 @@ def server_info() -> dict[str, Any]:
         - update_available: True if a newer version is available
         - auth_status: configured | stale | unverified | not_configured | error
         - update_command: Command to run to update
+        - conversation_cache: Conversation cache memory stats (conversations,
+          total_turns, total_bytes, evictions and the configured caps), or None
+          if no client has been created yet
     """
     latest = _get_latest_pypi_version()
     update_available = False
@@ -112,4 +126,5 @@ def server_info() -> dict[str, Any]:
         "auth_status": _check_auth_status(),
         "update_command": "uv tool upgrade notebooklm-mcp-cli",
         "pip_update_command": "pip install --upgrade notebooklm-mcp-cli",
+        "conversation_cache": _conversation_cache_stats(),
     }
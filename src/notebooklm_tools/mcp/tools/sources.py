@@ -21,10 +21,12 @@ def source_add(
     text: str | None = None,
     title: str | None = None,
     file_path: str | None = None,
+    file_paths: list[str] | None = None,
     document_id: str | None = None,
     doc_type: str = "doc",
     wait: bool = False,
     wait_timeout: float = 120.0,
+    dedupe: bool = False,
 ) -> ResultDict:
     """Add a source to a notebook. Unified tool for all source types.
 
@@ -50,10 +52,17 @@ def source_add(
         file_path: Local file path on the machine running the MCP server
             (for source_type=file). A path on a different client/agent host
             is not accessible to the server.
+        file_paths: List of local file paths to upload concurrently (for
+            source_type=file, alternative to file_path). If some fail, status
+            is "partial" and they are listed under "failed" with their error.
         document_id: Google Drive document ID (for source_type=drive)
         doc_type: Drive doc type: doc|slides|sheets|pdf (for source_type=drive)
         wait: If True, wait for source processing to complete before returning
         wait_timeout: Max seconds to wait if wait=True (default 120)
+        dedupe: If True, skip url, text and file sources this notebook already
+            has (same normalized URL, text or file bytes, tracked in a local
+            index and verified against the live source list). Skipped results
+            carry deduplicated=True. Use for re-runnable ingestion jobs.
 
     Example:
         source_add(notebook_id="abc", source_type="url", url="https://example.com")
@@ -61,12 +70,15 @@ def source_add(
         source_add(notebook_id="abc", source_type="url", url="https://example.com", wait=True)
         source_add(notebook_id="abc", source_type="file", file_path="/path/to/doc.pdf", wait=True)
         source_add(notebook_id="abc", source_type="file", file_path="/path/to/screenshot.png", wait=True)
+        source_add(notebook_id="abc", source_type="file", file_paths=["/docs/a.pdf", "/docs/b.pdf"])
+        source_add(notebook_id="abc", source_type="url", urls=["https://a.com"], dedupe=True)
     """
     try:
         client = get_client()
 
         # Coerce list params from MCP clients (may arrive as strings)
         coerced_urls: list[str] | None = coerce_list(urls)
+        coerced_files: list[str] | None = coerce_list(file_paths)
 
         # Bulk URL add: when urls list is provided
         if coerced_urls and source_type == "url":
@@ -76,9 +88,25 @@ def source_add(
                 [{"source_type": "url", "url": url_value} for url_value in coerced_urls],
                 wait=wait,
                 wait_timeout=wait_timeout,
+                dedupe=dedupe,
             )
             return {"status": "success", "ready": wait, **bulk_result}
 
+        # Bulk file upload: files are uploaded concurrently
+        if coerced_files and source_type == "file":
+            bulk_result = sources_service.add_sources(
+                client,
+                notebook_id,
+                [{"source_type": "file", "file_path": path} for path in coerced_files],
+                wait=wait,
+                wait_timeout=wait_timeout,
+                dedupe=dedupe,
+            )
+            # Files that uploaded are listed in results even when others failed,
+            # so a retry only needs the paths under "failed".
+            status = "partial" if bulk_result["failed"] else "success"
+            return {"status": status, "ready": wait, **bulk_result}
+
         # Single source add (existing behavior)
         single_result = sources_service.add_source(
             client,
@@ -92,6 +120,7 @@ def source_add(
             doc_type=doc_type,
             wait=wait,
             wait_timeout=wait_timeout,
+            dedupe=dedupe,
         )
         return {"status": "success", "ready": wait, **single_result}
     except ValidationError as e:
@@ -102,6 +131,114 @@ def source_add(
         return error_result(str(e))
 
 
+@logged_tool()
+def source_add_directory(
+    notebook_id: str,
+    directory: str,
+    pattern: str = "**/*",
+    concurrency: int = 4,
+    wait: bool = False,
+    wait_timeout: float = 600.0,
+    dedupe: bool = False,
+) -> ResultDict:
+    """Upload every supported file in a server-side directory. Resumable.
+
+    Progress is kept in a manifest, so calling again with the same notebook and
+    directory skips files already uploaded and retries the rest.
+
+    Args:
+        notebook_id: Notebook UUID
+        directory: Directory path on the machine running the MCP server
+        pattern: Glob relative to the directory, e.g. "**/*.pdf" (default: all files)
+        concurrency: Max files uploading at once (1-16)
+        wait: If True, wait for all new sources to finish processing
+        wait_timeout: Max seconds to wait per source if wait=True (default 600)
+        dedupe: If True, skip files whose bytes this notebook already has
+
+    Returns per-file results (status uploaded|ready|skipped|deduplicated|failed)
+    and counts by status. Files that failed can be retried by calling again.
+    """
+    try:
+        client = get_client()
+        plan, manifest = sources_service.plan_directory_ingest(
+            notebook_id, directory, pattern=pattern
+        )
+        results = list(
+            sources_service.add_directory(
+                client,
+                notebook_id,
+                plan,
+                manifest,
+                concurrency=concurrency,
+                wait=wait,
+                wait_timeout=wait_timeout,
+                dedupe=dedupe,
+            )
+        )
+        counts: dict[str, int] = {}
+        for item in results:
+            counts[item["status"]] = counts.get(item["status"], 0) + 1
+        return {
+            "status": "success",
+            "directory": plan["directory"],
+            "manifest_path": plan["manifest_path"],
+            "total": plan["total"],
+            "counts": counts,
+            "results": results,
+        }
+    except ServiceError as e:
+        return error_result(e.user_message, hint=e.hint)
+    except Exception as e:
+        return error_result(str(e))
+
+
+@logged_tool()
+def source_search(
+    query: str,
+    notebook_id: str | None = None,
+    limit: int = 10,
+    sync: bool = True,
+    refresh: bool = False,
+) -> ResultDict:
+    """Find which sources mention a term. Ranked snippets from a local index.
+
+    Much faster than calling source_get_content on every source: text is kept
+    in a local full-text index and searched in milliseconds.
+
+    Args:
+        query: Search terms; all must match. Append * for prefix search ("retriev*").
+        notebook_id: Notebook UUID. With sync=True its index is updated first
+            (removed sources dropped, renamed ones re-indexed, new ones
+            fetched). If omitted, every notebook indexed so far is searched
+            offline.
+        limit: Max results (1-100)
+        sync: If False, search the index as-is without contacting NotebookLM
+        refresh: Re-fetch and re-index every source of notebook_id first
+            (e.g. after sources were edited)
+
+    Returns: results (notebook_id, source_id, title, source_type, snippet with
+    matches in [...], score; best first), sync counts when synced
+    """
+    try:
+        sync_result = None
+        if notebook_id and sync:
+            sync_result = sources_service.sync_search_index(
+                get_client(), notebook_id, refresh=refresh
+            )
+        hits = sources_service.search_sources(query, notebook_id=notebook_id, limit=limit)
+        return {
+            "status": "success",
+            "query": query,
+            "count": len(hits),
+            "results": hits,
+            "sync": sync_result,
+        }
+    except ServiceError as e:
+        return error_result(e.user_message, hint=e.hint)
+    except Exception as e:
+        return error_result(str(e))
+
+
 @logged_tool()
 def source_list_drive(notebook_id: str, skip_freshness: bool = False) -> ResultDict:
     """List sources with types and Drive freshness status.
@@ -250,21 +387,32 @@ def source_describe(source_id: str) -> ResultDict:
 
 
 @logged_tool()
-def source_get_content(source_id: str) -> ResultDict:
+def source_get_content(
+    source_id: str,
+    offset: int = 0,
+    limit: int | None = None,
+) -> ResultDict:
     """Get raw text content of a source (no AI processing).
 
     Returns the original indexed text from PDFs, web pages, pasted text,
     or YouTube transcripts. Much faster than notebook_query for content export.
+    For large sources, page through with limit and offset instead of pulling
+    the whole text at once.
 
     Args:
         source_id: Source UUID
+        offset: First character to return (default 0)
+        limit: Max characters to return (default: all)
 
-    Returns: content (str), title (str), source_type (str), char_count (int)
+    Returns: content (str), title (str), source_type (str), char_count (int,
+    full length), offset (int), next_offset (int, or null when done)
     """
     try:
         client = get_client()
-        result = sources_service.get_source_content(client, source_id)
+        result = sources_service.get_source_content(client, source_id, offset=offset, limit=limit)
         return {"status": "success", **result}
+    except ValidationError as e:
+        return error_result(str(e))
     except ServiceError as e:
         return error_result(e.user_message, hint=e.hint)
     except Exception as e:
@@ -1,8 +1,14 @@
 """Studio tools - Artifact creation with consolidated studio_create."""
 
+import asyncio
+import threading
 import time as _time
+from collections import OrderedDict
 from typing import Any
 
+from fastmcp import Context
+
+from ...core.studio_watcher import StudioWatcher
 from ...services import ServiceError, ValidationError
 from ...services import studio as studio_service
 from ...utils.config import get_base_url, get_default_language
@@ -25,6 +31,39 @@ _auth_guard_expires: float = 0.0
 _auth_guard_mtime: float = 0.0
 _AUTH_GUARD_TTL: float = 60.0
 
+# One watcher polls every notebook with artifacts being waited on, shared by
+# all studio_wait calls. studio_create remembers which notebook (and type)
+# each new artifact belongs to, so studio_wait only needs the artifact IDs.
+_watcher: StudioWatcher | None = None
+_watcher_lock = threading.Lock()
+_created: OrderedDict[str, tuple[str, str]] = OrderedDict()
+_CREATED_MAX = 256
+
+
+class _CurrentClient:
+    """Poll through whichever client get_client() returns now (auth may be reloaded)."""
+
+    def poll_studio_status(self, notebook_id: str) -> list[dict[str, Any]]:
+        return get_client().poll_studio_status(notebook_id)
+
+
+def _get_watcher() -> StudioWatcher:
+    """Get the process-wide studio watcher, starting its poller on first use."""
+    global _watcher
+    if _watcher is None:
+        with _watcher_lock:
+            if _watcher is None:
+                _watcher = StudioWatcher(_CurrentClient()).start()
+    return _watcher
+
+
+def _remember_created(artifact_id: str, notebook_id: str, artifact_type: str) -> None:
+    with _watcher_lock:
+        _created[artifact_id] = (notebook_id, artifact_type)
+        _created.move_to_end(artifact_id)
+        while len(_created) > _CREATED_MAX:
+            _created.popitem(last=False)
+
 
 def _get_auth_file_mtime() -> float:
     """Thin wrapper around `services.auth.get_active_auth_mtime`.
@@ -251,6 +290,8 @@ def studio_create(
         if artifact_status is not None:
             result_payload["artifact_status"] = artifact_status
             result_payload.pop("status", None)
+        if artifact_status not in (None, "completed"):
+            _remember_created(result["artifact_id"], notebook_id, artifact_type)
         return {
             **result_payload,
             "status": "success",
@@ -270,6 +311,8 @@ def studio_status(
     action: str = "status",
     artifact_id: str | None = None,
     new_title: str | None = None,
+    since: str | None = None,
+    include_content: bool = False,
 ) -> ResultDict:
     """Check studio content generation status and get URLs, or rename an artifact.
 
@@ -281,6 +324,10 @@ def studio_status(
             - list_types: List all supported artifact types with their options
         artifact_id: Required for action="rename" - the artifact UUID to rename
         new_title: Required for action="rename" - the new title for the artifact
+        since: Cursor from a previous status call. Returns only artifacts whose
+            status or content changed since then (plus removed IDs)
+        include_content: Include report_content, custom_instructions and
+            visual_style_prompt (omitted by default to keep responses small)
 
     Returns:
         Dictionary with status and results.
@@ -292,9 +339,12 @@ def studio_status(
                 - type: audio, video, report, etc.
                 - status: completed, in_progress, failed
                 - url: URL to view/download (if applicable)
-                - custom_instructions: The custom prompt/focus instructions used to generate the artifact (if any)
+                - custom_instructions: The custom prompt/focus instructions used to generate the artifact (only with include_content=True)
                 - source_ids: List of source UUIDs the artifact was generated from
-            - summary: Counts of total, completed, in_progress
+            - summary: Counts of total, completed, in_progress (always all artifacts)
+            - cursor: Pass as since= on the next call to get only changes
+            - incremental: True when artifacts holds only changes since the cursor
+            - removed: Artifact IDs gone since the cursor
     """
     try:
         if action == "list_types":
@@ -317,7 +367,9 @@ def studio_status(
                 **rename_result,
             }
 
-        status_result = studio_service.get_studio_status(client, notebook_id)
+        status_result = studio_service.get_studio_status(
+            client, notebook_id, since=since, include_content=include_content
+        )
         return {
             "status": "success",
             "notebook_id": notebook_id,
@@ -327,6 +379,9 @@ def studio_status(
                 "in_progress": status_result["in_progress"],
             },
             "artifacts": status_result["artifacts"],
+            "cursor": status_result["cursor"],
+            "incremental": status_result["incremental"],
+            "removed": status_result["removed"],
             "notebook_url": f"{get_base_url()}/notebook/{notebook_id}",
         }
     except (ValidationError, ServiceError) as e:
@@ -336,6 +391,124 @@ def studio_status(
         return error_result(str(e))
 
 
+def _settled_payload(artifact_id: str, future: "asyncio.Future[dict[str, Any]]") -> dict[str, Any]:
+    """Describe a settled watch: completed (with URL), failed, or given up on by the watcher."""
+    error = future.exception()
+    if error is None:
+        artifact = future.result()
+        payload: dict[str, Any] = {"artifact_id": artifact_id, "status": "completed"}
+        for key in (
+            "type",
+            "title",
+            "audio_url",
+            "video_url",
+            "infographic_url",
+            "slide_deck_url",
+        ):
+            if artifact.get(key):
+                payload[key] = artifact[key]
+        return payload
+    state = "in_progress" if isinstance(error, TimeoutError) else "failed"
+    return {"artifact_id": artifact_id, "status": state, "error": str(error)}
+
+
+@logged_tool()
+async def studio_wait(
+    artifact_ids: list[str],
+    notebook_id: str | None = None,
+    timeout: float = 300.0,
+    ctx: Context | None = None,
+) -> ResultDict:
+    """Block until studio artifacts finish generating, instead of polling studio_status.
+
+    Each artifact's completion or failure is also pushed as a log notification
+    (with progress) as soon as it happens. One shared poller checks each
+    notebook, slowing down for long-running types like audio and video.
+
+    Args:
+        artifact_ids: Artifact UUIDs to wait for (from studio_create / studio_revise)
+        notebook_id: Notebook UUID. Optional for artifacts created by this server.
+        timeout: Max seconds to wait. Artifacts still generating are reported
+            as in_progress; call studio_wait again to keep waiting.
+            IDs missing from the notebook's studio list are reported as failed.
+
+    Returns:
+        - status: "success" when all artifacts completed, otherwise "partial"
+        - artifacts: One entry per artifact with status completed | failed | in_progress
+    """
+    ids = coerce_list(artifact_ids) or []
+    if not ids:
+        return error_result("artifact_ids must not be empty.")
+
+    watcher = _get_watcher()
+    owners: dict[str, str] = {}
+    try:
+        return await _wait_for_artifacts(watcher, ids, notebook_id, timeout, ctx, owners)
+    finally:
+        # Stop polling for artifacts nobody else is still waiting on.
+        for artifact_id, owner in owners.items():
+            watcher.unwatch(owner, artifact_id)
+
+
+async def _wait_for_artifacts(
+    watcher: StudioWatcher,
+    ids: list[str],
+    notebook_id: str | None,
+    timeout: float,
+    ctx: Context | None,
+    owners: dict[str, str],
+) -> ResultDict:
+    """Watch `ids` (recording each one's notebook in `owners`) and wait for them to settle."""
+    waiters: dict[asyncio.Future[dict[str, Any]], str] = {}
+    for artifact_id in ids:
+        if artifact_id in owners:
+            continue  # Listed twice: one watch serves both entries
+        with _watcher_lock:
+            created = _created.get(artifact_id)
+        owner = watcher.notebook_of(artifact_id) or (created[0] if created else notebook_id)
+        if not owner:
+            return error_result(
+                f"notebook_id is required to wait for artifact {artifact_id}.",
+                hint="Pass the notebook_id the artifact belongs to.",
+            )
+        future = watcher.watch(owner, artifact_id, created[1] if created else None)
+        owners[artifact_id] = owner
+        waiters[asyncio.wrap_future(future)] = artifact_id
+
+    results: dict[str, dict[str, Any]] = {
+        artifact_id: {"artifact_id": artifact_id, "status": "in_progress"} for artifact_id in ids
+    }
+    pending: set[asyncio.Future[dict[str, Any]]] = set(waiters)
+    deadline = _time.monotonic() + timeout
+    while pending:
+        remaining = deadline - _time.monotonic()
+        if remaining <= 0:
+            break
+        done, pending = await asyncio.wait(
+            pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+        )
+        for future in done:
+            artifact_id = waiters[future]
+            results[artifact_id] = _settled_payload(artifact_id, future)
+            if ctx is not None:
+                await ctx.info(
+                    f"Studio artifact {artifact_id} {results[artifact_id]['status']}",
+                    extra=results[artifact_id],
+                )
+                await ctx.report_progress(len(waiters) - len(pending), len(waiters))
+
+    artifacts = [results[artifact_id] for artifact_id in ids]
+    all_done = all(a["status"] == "completed" for a in artifacts)
+    return {
+        "status": "success" if all_done else "partial",
+        "artifacts": artifacts,
+        "summary": {
+            state: sum(a["status"] == state for a in artifacts)
+            for state in ("completed", "failed", "in_progress")
+        },
+    }
+
+
 @logged_tool()
 def studio_delete(
     notebook_id: str,
@@ -382,7 +555,7 @@ def studio_revise(
     """Revise individual slides in an existing slide deck. Creates a NEW artifact.
 
     Only slide decks support revision. The original artifact is not modified.
-    Poll studio_status after calling to check when the new deck is ready.
+    Call studio_wait with the new artifact_id to block until the new deck is ready.
 
     Args:
         notebook_id: Notebook UUID
@@ -432,6 +605,7 @@ def studio_revise(
             artifact_id,
             slide_instructions,
         )
+        _remember_created(result["artifact_id"], notebook_id, "slide_deck")
         return {
             "status": "success",
             "notebook_url": f"{get_base_url()}/notebook/{notebook_id}",
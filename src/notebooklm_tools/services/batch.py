@@ -8,6 +8,7 @@ from . import chat as chat_service
 from . import notebooks as notebooks_service
 from . import sources as sources_service
 from . import studio as studio_service
+from . import studio_queue as studio_queue_service
 from ._compat import TypedDict
 from .errors import ValidationError
 
@@ -247,3 +248,47 @@ def batch_studio(
         return studio_service.create_artifact(client, nb_id, artifact_type)
 
     return _run_batch("batch_studio", targets, studio_fn, max_concurrent)
+
+
+def queue_batch_studio(
+    client: NotebookLMClient,
+    artifact_type: str = "audio",
+    notebook_names: list[str] | None = None,
+    tags: list[str] | None = None,
+    all_notebooks: bool = False,
+    *,
+    account: str = "default",
+    options: dict[str, Any] | None = None,
+    download_dir: str | None = None,
+    max_attempts: int = 3,
+) -> list[int]:
+    """Queue studio generation across multiple notebooks in the durable studio queue.
+
+    Unlike `batch_studio`, nothing is generated here: run the jobs with
+    `studio_queue.run_studio_queue`, which tracks them to completion.
+
+    Args:
+        client: Authenticated client
+        artifact_type: Type of artifact (audio, video, report, etc.)
+        notebook_names: Target notebooks
+        tags: Select by tags
+        all_notebooks: All notebooks
+        account: Account (profile) whose quota the jobs count against
+        options: Keyword options for `studio.create_artifact`
+        download_dir: Download each finished artifact under this directory
+        max_attempts: Generations to try per notebook before giving up
+
+    Returns:
+        The new job IDs
+    """
+    targets = _resolve_targets(client, notebook_names, tags, all_notebooks)
+    if not targets:
+        return []
+    return studio_queue_service.enqueue_studio_jobs(
+        [nb_id for nb_id, _ in targets],
+        artifact_type,
+        account=account,
+        options=options,
+        download_dir=download_dir,
+        max_attempts=max_attempts,
+    )
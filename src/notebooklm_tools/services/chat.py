@@ -4,6 +4,7 @@ import logging
 import threading
 import time
 import uuid
+from collections.abc import Iterator
 from typing import Any, cast
 
 from ..core.client import NotebookLMClient
@@ -17,6 +18,7 @@ logger = logging.getLogger(__name__)
 VALID_GOALS = ("default", "learning_guide", "custom")
 VALID_RESPONSE_LENGTHS = ("default", "longer", "shorter")
 MAX_PROMPT_LENGTH = 10_000
+MAX_BATCH_CONCURRENCY = 16
 
 
 class QueryResult(TypedDict):
@@ -134,6 +136,97 @@ def query(
     )
 
 
+class BatchQueryItem(TypedDict):
+    """Result of one question in a batch query."""
+
+    index: int
+    question: str
+    answer: str
+    conversation_id: str | None
+    sources_used: list[Any]
+    citations: dict[str, Any]
+    references: list[dict[str, Any]]
+    error: str | None
+
+
+def query_many(
+    client: NotebookLMClient,
+    notebook_id: str,
+    questions: list[str],
+    source_ids: list[str] | None = None,
+    concurrency: int = 4,
+    timeout: float | None = None,
+) -> Iterator[BatchQueryItem]:
+    """Ask many independent questions of one notebook concurrently.
+
+    Validation happens eagerly; results are then yielded in completion order
+    so callers can stream them (e.g. to JSONL) as each answer arrives. Each
+    question runs in its own fresh conversation.
+
+    Args:
+        client: Authenticated NotebookLM client
+        notebook_id: Notebook UUID
+        questions: Questions to ask (blank entries are skipped; each result's
+            `index` is its question's 0-based position in this list)
+        source_ids: Source IDs to query (default: all, resolved once)
+        concurrency: Max questions in flight (1-16)
+        timeout: Per-question timeout in seconds
+
+    Returns:
+        Iterator of BatchQueryItem; failed questions carry `error` and do not
+        stop the batch.
+
+    Raises:
+        ValidationError: If no questions are given, concurrency is out of range,
+            or the notebook has no sources
+        ServiceError: If the notebook's sources cannot be resolved
+    """
+    # Blank entries are skipped without renumbering: `index` is the position in `questions`
+    lines = [i for i, q in enumerate(questions) if q and q.strip()]
+    asked = [questions[i].strip() for i in lines]
+    if not asked:
+        raise ValidationError(
+            "At least one question is required.",
+            user_message="The questions file has no questions (one question per line).",
+        )
+    if not 1 <= concurrency <= MAX_BATCH_CONCURRENCY:
+        raise ValidationError(
+            f"Invalid concurrency {concurrency}. Must be between 1 and {MAX_BATCH_CONCURRENCY}.",
+        )
+
+    if not source_ids:
+        # One notebook fetch serves both the empty-notebook check and the
+        # source list every question reuses.
+        nb = notebook_service.get_notebook(client, notebook_id)
+        source_ids = [src["id"] for src in nb.get("sources", []) if src.get("id")]
+        if not source_ids:
+            raise ValidationError(
+                "Cannot query an empty notebook.",
+                user_message="This notebook has no sources to query. Add a source first using 'nlm source add' or 'nlm research start'.",
+            )
+
+    def _results() -> Iterator[BatchQueryItem]:
+        for item in client.query_many(
+            notebook_id,
+            asked,
+            source_ids=source_ids,
+            concurrency=concurrency,
+            **({"timeout": cast(float, timeout)} if timeout is not None else {}),
+        ):
+            yield {
+                "index": lines[item["index"]],
+                "question": item["question"],
+                "answer": item.get("answer", ""),
+                "conversation_id": item.get("conversation_id"),
+                "sources_used": item.get("sources_used", []),
+                "citations": item.get("citations", {}),
+                "references": item.get("references", []),
+                "error": item.get("error"),
+            }
+
+    return _results()
+
+
 def configure_chat(
     client: NotebookLMClient,
     notebook_id: str,
@@ -1,15 +1,22 @@
 """Downloads service — shared validation and routing for artifact downloads."""
 
+import asyncio
 import inspect
-from collections.abc import Awaitable, Callable
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import AbstractContextManager, nullcontext
 from pathlib import Path
 from typing import Any, cast
 
+from ..core.artifact_cache import get_artifact_cache
 from ..core.client import NotebookLMClient
-from ..core.errors import ArtifactDownloadError
+from ..core.download import limit_download_hosts, use_artifact_snapshots
+from ..core.errors import ArtifactDownloadError, ArtifactNotReadyError
 from ._compat import TypedDict
 from .errors import ServiceError, ValidationError
 
+logger = logging.getLogger(__name__)
+
 VALID_ARTIFACT_TYPES = (
     "audio",
     "video",
@@ -27,9 +34,16 @@ VALID_OUTPUT_FORMATS = ("json", "markdown", "html")
 # Types that support async streaming downloads with progress callbacks
 STREAMING_TYPES = ("audio", "video", "slide_deck", "infographic")
 
+# Types that can be fetched as concurrent byte ranges (large media files)
+SEGMENTED_TYPES = ("audio", "video")
+MAX_DOWNLOAD_SEGMENTS = 16
+
 # Types that support output_format (json/markdown/html)
 INTERACTIVE_TYPES = ("quiz", "flashcards")
 
+# Data table output formats (any other output_format, e.g. the "json" default, means csv)
+DATA_TABLE_FORMATS = ("csv", "jsonl")
+
 # Extension map per artifact type (used for default filenames)
 DEFAULT_EXTENSIONS = {
     "audio": "m4a",
@@ -51,6 +65,9 @@ FORMAT_EXTENSIONS = {
 }
 
 
+MAX_BULK_CONCURRENCY = 16
+
+
 class DownloadResult(TypedDict):
     """Result of a download operation."""
 
@@ -58,6 +75,25 @@ class DownloadResult(TypedDict):
     path: str
 
 
+class BulkDownloadItem(TypedDict):
+    """One planned file of a bulk download."""
+
+    notebook_id: str
+    artifact_id: str
+    artifact_type: str
+    title: str
+    path: str
+    status: str  # "pending" (planned) | "downloaded" | "skipped" (already on disk) | "failed"
+    error: str | None
+
+
+class BulkDownloadPlan(TypedDict):
+    """Files to download, plus the artifact lists they were planned from."""
+
+    items: list[BulkDownloadItem]
+    snapshots: dict[str, dict[str, list[Any]]]
+
+
 # Directories that are always blocked as download targets, regardless of platform.
 _BLOCKED_DIRS = {
     ".ssh",
@@ -144,13 +180,29 @@ def validate_output_format(output_format: str) -> None:
         )
 
 
+def validate_data_table_format(output_format: str) -> None:
+    """Validate output format for data tables. Raises ValidationError if invalid."""
+    if output_format not in ("json", *DATA_TABLE_FORMATS):
+        raise ValidationError(
+            f"Invalid data table format '{output_format}'. "
+            f"Valid formats: {', '.join(DATA_TABLE_FORMATS)}",
+        )
+
+
+def data_table_format(output_format: str) -> str:
+    """The file format a data table is written in for `output_format`."""
+    return output_format if output_format in DATA_TABLE_FORMATS else "csv"
+
+
 def get_default_extension(artifact_type: str, output_format: str = "json") -> str:
     """Get default file extension for an artifact type.
 
-    For interactive types (quiz/flashcards), depends on output_format.
+    For interactive types (quiz/flashcards) and data tables, depends on output_format.
     """
     if artifact_type in INTERACTIVE_TYPES:
         return FORMAT_EXTENSIONS.get(output_format, "json")
+    if artifact_type == "data_table":
+        return data_table_format(output_format)
     return DEFAULT_EXTENSIONS.get(artifact_type, "bin")
 
 
@@ -161,6 +213,7 @@ def download_sync(
     output_path: str,
     artifact_id: str | None = None,
     output_format: str = "json",
+    use_cache: bool = False,
 ) -> DownloadResult:
     """Download a non-streaming artifact synchronously.
 
@@ -172,7 +225,9 @@ def download_sync(
         artifact_type: Type of artifact
         output_path: Path to save file
         artifact_id: Specific artifact ID (optional)
-        output_format: For quiz/flashcards: json|markdown|html
+        output_format: For quiz/flashcards: json|markdown|html; for data_table: csv|jsonl
+        use_cache: Serve an unchanged artifact from the local artifact cache,
+            and cache what gets downloaded
 
     Returns:
         DownloadResult with artifact_type and path
@@ -189,16 +244,31 @@ def download_sync(
 
     if artifact_type in INTERACTIVE_TYPES:
         validate_output_format(output_format)
+    elif artifact_type == "data_table":
+        validate_data_table_format(output_format)
+
+    cache_format = _cache_format(artifact_type, output_format)
+    version = None
+    listing: AbstractContextManager[None] = nullcontext()
+    if use_cache:
+        served, version, listing = _fetch_cached(
+            client, notebook_id, artifact_type, artifact_id, cache_format, output_path
+        )
+        if served:
+            return {"artifact_type": artifact_type, "path": output_path}
+        if version:
+            artifact_id = version[0]
 
     try:
-        saved_path = _dispatch_sync(
-            client,
-            notebook_id,
-            artifact_type,
-            output_path,
-            artifact_id,
-            output_format,
-        )
+        with listing:
+            saved_path = _dispatch_sync(
+                client,
+                notebook_id,
+                artifact_type,
+                output_path,
+                artifact_id,
+                output_format,
+            )
     except (ValidationError, ServiceError):
         raise
     except Exception as e:
@@ -213,6 +283,8 @@ def download_sync(
             user_message=f"{artifact_type} is not ready or does not exist.",
         )
 
+    if version:
+        _store_cached(artifact_type, cache_format, version, saved_path)
     return {"artifact_type": artifact_type, "path": saved_path}
 
 
@@ -225,6 +297,8 @@ async def download_async(
     output_format: str = "json",
     progress_callback: Callable[[int, int], None] | None = None,
     slide_deck_format: str = "pdf",
+    segments: int = 1,
+    use_cache: bool = False,
 ) -> DownloadResult:
     """Download a streaming artifact asynchronously.
 
@@ -236,15 +310,20 @@ async def download_async(
         artifact_type: Type of artifact
         output_path: Path to save file
         artifact_id: Specific artifact ID (optional)
-        output_format: For quiz/flashcards: json|markdown|html
+        output_format: For quiz/flashcards: json|markdown|html; for data_table: csv|jsonl
         progress_callback: Called with (current, total) for progress tracking
         slide_deck_format: For slide_deck only: "pdf" (default) or "pptx"
+        segments: For audio/video only: byte ranges fetched concurrently
+            (1-16, default 1). Falls back to one stream if the server
+            doesn't support ranges.
+        use_cache: Serve an unchanged artifact from the local artifact cache,
+            and cache what gets downloaded
 
     Returns:
         DownloadResult with artifact_type and path
 
     Raises:
-        ValidationError: If artifact_type or output_format is invalid
+        ValidationError: If artifact_type, output_format or segments is invalid
         ServiceError: If the download fails
     """
     validate_artifact_type(artifact_type)
@@ -255,18 +334,47 @@ async def download_async(
 
     if artifact_type in INTERACTIVE_TYPES:
         validate_output_format(output_format)
+    elif artifact_type == "data_table":
+        validate_data_table_format(output_format)
 
-    try:
-        saved_path = await _dispatch_async(
+    if not 1 <= segments <= MAX_DOWNLOAD_SEGMENTS:
+        raise ValidationError(f"segments must be between 1 and {MAX_DOWNLOAD_SEGMENTS}.")
+    if segments > 1 and artifact_type not in SEGMENTED_TYPES:
+        raise ValidationError(
+            f"Segmented downloads are only supported for: {', '.join(SEGMENTED_TYPES)}."
+        )
+
+    cache_format = _cache_format(artifact_type, output_format, slide_deck_format)
+    version = None
+    listing: AbstractContextManager[None] = nullcontext()
+    if use_cache:
+        served, version, listing = await asyncio.to_thread(
+            _fetch_cached,
             client,
             notebook_id,
             artifact_type,
-            output_path,
             artifact_id,
-            output_format,
-            progress_callback,
-            slide_deck_format=slide_deck_format,
+            cache_format,
+            output_path,
         )
+        if served:
+            return {"artifact_type": artifact_type, "path": output_path}
+        if version:
+            artifact_id = version[0]
+
+    try:
+        with listing:
+            saved_path = await _dispatch_async(
+                client,
+                notebook_id,
+                artifact_type,
+                output_path,
+                artifact_id,
+                output_format,
+                progress_callback,
+                slide_deck_format=slide_deck_format,
+                segments=segments,
+            )
     except (ValidationError, ServiceError):
         raise
     except ArtifactDownloadError as e:
@@ -294,9 +402,132 @@ async def download_async(
             user_message=f"{artifact_type} is not ready or does not exist.",
         )
 
+    if version:
+        await asyncio.to_thread(_store_cached, artifact_type, cache_format, version, saved_path)
     return {"artifact_type": artifact_type, "path": saved_path}
 
 
+def stream_artifact(
+    client: NotebookLMClient,
+    notebook_id: str,
+    artifact_type: str,
+    artifact_id: str | None = None,
+    slide_deck_format: str = "pdf",
+) -> AsyncIterator[bytes]:
+    """Stream a binary artifact's bytes as they arrive, without writing a file.
+
+    For: audio, video, slide_deck, infographic. Lets a caller pipe media into
+    another process (e.g. ffmpeg) or an upload while it's still downloading.
+
+    Args:
+        client: Authenticated NotebookLM client
+        notebook_id: Notebook UUID
+        artifact_type: Type of artifact
+        artifact_id: Specific artifact ID (optional)
+        slide_deck_format: For slide_deck only: "pdf" (default) or "pptx"
+
+    Returns:
+        Async iterator of byte chunks
+
+    Raises:
+        ValidationError: If artifact_type or slide_deck_format is invalid
+        ServiceError: If the download fails (raised while iterating)
+    """
+    validate_artifact_type(artifact_type)
+    if artifact_type not in STREAMING_TYPES:
+        raise ValidationError(
+            f"Streaming is only supported for: {', '.join(STREAMING_TYPES)}.",
+        )
+    if slide_deck_format not in ("pdf", "pptx"):
+        raise ValidationError("slide_deck_format must be 'pdf' or 'pptx'.")
+
+    async def _results() -> AsyncIterator[bytes]:
+        try:
+            async for chunk in client.stream_artifact(
+                notebook_id, artifact_type, artifact_id, file_format=slide_deck_format
+            ):
+                yield chunk
+        except ArtifactNotReadyError as e:
+            raise ServiceError(
+                f"Failed to stream {artifact_type}: {e}",
+                user_message=f"{artifact_type} is not ready or does not exist.",
+            ) from e
+        except Exception as e:
+            raise ServiceError(
+                f"Failed to stream {artifact_type}: {e}",
+                user_message=f"Download failed for {artifact_type}.",
+            ) from e
+
+    return _results()
+
+
+def _cache_format(artifact_type: str, output_format: str, slide_deck_format: str = "pdf") -> str:
+    """The part of the cache key that depends on how the artifact is rendered."""
+    if artifact_type in INTERACTIVE_TYPES:
+        return output_format
+    if artifact_type == "slide_deck":
+        return slide_deck_format
+    if artifact_type == "data_table" and data_table_format(output_format) != "csv":
+        return data_table_format(output_format)  # CSV keeps the key it had before formats
+    return ""
+
+
+def _fetch_cached(
+    client: NotebookLMClient,
+    notebook_id: str,
+    artifact_type: str,
+    artifact_id: str | None,
+    cache_format: str,
+    output_path: str,
+) -> tuple[bool, tuple[str, str] | None, AbstractContextManager[None]]:
+    """Try to serve a download from the artifact cache.
+
+    Returns (served, version, listing), where version is the (artifact_id,
+    marker) the download resolved to, or None if it couldn't be resolved,
+    and listing is a context manager that serves the artifact list the
+    lookup fetched, so a cache miss downloads without listing the notebook
+    again. Cache problems never fail a download; they just mean
+    downloading uncached.
+    """
+    listing: AbstractContextManager[None] = nullcontext()
+    try:
+        snapshots = {
+            notebook_id: client.snapshot_artifacts(
+                notebook_id, mind_maps=artifact_type == "mind_map"
+            )
+        }
+        listing = use_artifact_snapshots(snapshots)
+        with use_artifact_snapshots(snapshots):
+            version = client.select_artifact(notebook_id, artifact_type, artifact_id)
+        if version is None:
+            return False, None, listing
+        served = get_artifact_cache().fetch(
+            version[0],
+            artifact_type,
+            cache_format,
+            version[1],
+            Path(output_path),
+            link=artifact_type in STREAMING_TYPES,
+        )
+    except Exception as e:
+        logger.debug("Artifact cache lookup failed for %s: %s", artifact_type, e)
+        return False, None, listing
+    if served:
+        logger.debug("Served %s %s from the artifact cache", artifact_type, version[0])
+    return served, version, listing
+
+
+def _store_cached(
+    artifact_type: str, cache_format: str, version: tuple[str, str], saved_path: str
+) -> None:
+    try:
+        get_artifact_cache().store(
+            version[0], artifact_type, cache_format, version[1], Path(saved_path)
+        )
+    except Exception as e:
+        logger.debug("Could not cache downloaded %s: %s", artifact_type, e)
+
+
 def _dispatch_sync(
     client: NotebookLMClient,
     notebook_id: str,
@@ -311,7 +542,9 @@ def _dispatch_sync(
     elif artifact_type == "mind_map":
         return client.download_mind_map(notebook_id, output_path, artifact_id)
     elif artifact_type == "data_table":
-        return client.download_data_table(notebook_id, output_path, artifact_id)
+        return client.download_data_table(
+            notebook_id, output_path, artifact_id, data_table_format(output_format)
+        )
     else:
         raise ValidationError(
             f"Artifact type '{artifact_type}' requires async download. "
@@ -346,20 +579,28 @@ async def _dispatch_async(
     output_format: str,
     progress_callback: Callable[[int, int], None] | None,
     slide_deck_format: str = "pdf",
+    segments: int = 1,
 ) -> str:
     """Route to the correct async client method."""
-    # Non-streaming types (sync client methods callable from async context)
+    # Non-streaming types: sync client methods (blocking RPC + file write),
+    # run in a worker thread so they don't stall the event loop
     if artifact_type == "report":
         return await _resolve_download_result(
-            client.download_report(notebook_id, output_path, artifact_id)
+            await asyncio.to_thread(client.download_report, notebook_id, output_path, artifact_id)
         )
     elif artifact_type == "mind_map":
         return await _resolve_download_result(
-            client.download_mind_map(notebook_id, output_path, artifact_id)
+            await asyncio.to_thread(client.download_mind_map, notebook_id, output_path, artifact_id)
         )
     elif artifact_type == "data_table":
         return await _resolve_download_result(
-            client.download_data_table(notebook_id, output_path, artifact_id)
+            await asyncio.to_thread(
+                client.download_data_table,
+                notebook_id,
+                output_path,
+                artifact_id,
+                data_table_format(output_format),
+            )
         )
     # Streaming types (async client methods)
     elif artifact_type == "audio":
@@ -370,6 +611,7 @@ async def _dispatch_async(
                 output_path,
                 artifact_id,
                 progress_callback=progress_callback,
+                segments=segments,
             )
         )
     elif artifact_type == "video":
@@ -380,6 +622,7 @@ async def _dispatch_async(
                 output_path,
                 artifact_id,
                 progress_callback=progress_callback,
+                segments=segments,
             )
         )
     elif artifact_type == "slide_deck":
@@ -433,3 +676,165 @@ async def _dispatch_async(
         raise ValidationError(
             f"Artifact type '{artifact_type}' is not supported for async download.",
         )
+
+
+def plan_bulk_download(
+    client: NotebookLMClient,
+    notebook_ids: list[str],
+    out_dir: str,
+    *,
+    types: list[str] | None = None,
+    output_format: str = "json",
+) -> BulkDownloadPlan:
+    """List each notebook's artifacts once and plan a file for every completed one.
+
+    Files go to ``<out_dir>/<notebook_id>/<type>_<artifact_id>.<ext>``, so the
+    same artifact always maps to the same path. Files already on disk are
+    planned as "skipped"; the rest as "pending".
+
+    Args:
+        client: Authenticated NotebookLM client
+        notebook_ids: Notebooks to download from
+        out_dir: Directory to download into
+        types: Artifact types to include (default: all)
+        output_format: For quiz/flashcards: json|markdown|html
+
+    Returns:
+        BulkDownloadPlan to pass to `run_bulk_download`
+
+    Raises:
+        ValidationError: If no notebooks are given or a parameter is invalid
+        ServiceError: If a notebook's artifacts cannot be listed
+    """
+    if not notebook_ids:
+        raise ValidationError("No notebook IDs provided for bulk download.")
+    types = list(types or VALID_ARTIFACT_TYPES)
+    for artifact_type in types:
+        validate_artifact_type(artifact_type)
+    validate_output_format(output_format)
+    validate_output_path(out_dir)
+
+    items: list[BulkDownloadItem] = []
+    snapshots: dict[str, dict[str, list[Any]]] = {}
+    for notebook_id in dict.fromkeys(notebook_ids):
+        try:
+            snapshot = client.snapshot_artifacts(notebook_id, mind_maps="mind_map" in types)
+        except Exception as e:
+            raise ServiceError(
+                f"Failed to list artifacts for {notebook_id}: {e}",
+                user_message=f"Could not list artifacts of notebook {notebook_id}.",
+            ) from e
+        snapshots[notebook_id] = snapshot
+
+        for artifact in client.downloadable_artifacts(snapshot):
+            artifact_type = artifact["type"]
+            if artifact_type not in types:
+                continue
+            ext = get_default_extension(artifact_type, output_format)
+            path = Path(out_dir) / notebook_id / f"{artifact_type}_{artifact['artifact_id']}.{ext}"
+            items.append(
+                {
+                    "notebook_id": notebook_id,
+                    "artifact_id": artifact["artifact_id"],
+                    "artifact_type": artifact_type,
+                    "title": artifact["title"],
+                    "path": str(path),
+                    "status": "skipped" if path.exists() else "pending",
+                    "error": None,
+                }
+            )
+    return {"items": items, "snapshots": snapshots}
+
+
+def run_bulk_download(
+    client: NotebookLMClient,
+    plan: BulkDownloadPlan,
+    *,
+    concurrency: int = 6,
+    per_host: int = 4,
+    output_format: str = "json",
+    progress_callback: Callable[[int, int], None] | None = None,
+) -> AsyncIterator[BulkDownloadItem]:
+    """Download every pending file of a plan concurrently.
+
+    At most `concurrency` files are in flight, and at most `per_host` of them
+    fetch from the same media host. Lookups reuse the plan's artifact lists,
+    so no file re-runs the list RPC. Media files are written through
+    ``<file>.tmp`` and moved into place when complete, so a file that exists
+    is finished and is skipped on the next run.
+
+    Args:
+        client: Authenticated NotebookLM client
+        plan: Result of `plan_bulk_download`
+        concurrency: Max files downloading at once (1-16)
+        per_host: Max files downloading from one host at once (1-16)
+        output_format: For quiz/flashcards: json|markdown|html (as planned)
+        progress_callback: Called with (bytes downloaded, bytes expected) summed
+            over all media files; the expected total grows as downloads start
+
+    Returns:
+        Async iterator of BulkDownloadItem: skipped files first, then the
+        rest as they finish
+
+    Raises:
+        ValidationError: If a limit is out of range
+    """
+    for name, value in (("concurrency", concurrency), ("per_host", per_host)):
+        if not 1 <= value <= MAX_BULK_CONCURRENCY:
+            raise ValidationError(
+                f"Invalid {name} {value}. Must be between 1 and {MAX_BULK_CONCURRENCY}.",
+            )
+
+    progress: dict[str, tuple[int, int]] = {}
+
+    def _progress_for(path: str) -> Callable[[int, int], None] | None:
+        if progress_callback is None:
+            return None
+
+        def update(done: int, total: int) -> None:
+            progress[path] = (done, total)
+            progress_callback(
+                sum(d for d, _ in progress.values()), sum(t for _, t in progress.values())
+            )
+
+        return update
+
+    async def _download(item: BulkDownloadItem, slots: asyncio.Semaphore) -> BulkDownloadItem:
+        async with slots:
+            try:
+                await _dispatch_async(
+                    client,
+                    item["notebook_id"],
+                    item["artifact_type"],
+                    item["path"],
+                    item["artifact_id"],
+                    output_format,
+                    _progress_for(item["path"]),
+                )
+            except Exception as e:
+                return {**item, "status": "failed", "error": str(e)}
+        return {**item, "status": "downloaded"}
+
+    async def _results() -> AsyncIterator[BulkDownloadItem]:
+        for item in plan["items"]:
+            if item["status"] == "skipped":
+                yield item
+
+        pending = [item for item in plan["items"] if item["status"] == "pending"]
+        if not pending:
+            return
+        slots = asyncio.Semaphore(concurrency)
+        # One client for the whole run, so files from the same media host
+        # reuse its connections.
+        async with client.share_download_client():
+            with use_artifact_snapshots(plan["snapshots"]), limit_download_hosts(per_host):
+                tasks = [asyncio.create_task(_download(item, slots)) for item in pending]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    yield await next_done
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    return _results()
@@ -1,14 +1,29 @@
 """Sources service — shared validation and logic for source management."""
 
+import dataclasses
 import urllib.parse
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, cast
 
 from ..core.client import NotebookLMClient
+from ..core.drive_sync_state import get_drive_sync_state
+from ..core.fulltext_cache import get_fulltext_cache
+from ..core.search_index import get_search_index
+from ..core.source_index import file_sha256
+from ..core.source_watcher import SourceReadinessWatcher
+from ..core.uploads import DirectoryManifest, ManifestEntry
 from ._compat import TypedDict
 from .errors import ServiceError, ValidationError
 
 _FRESHNESS_MAX_WORKERS = 8
+MAX_UPLOAD_CONCURRENCY = 16
+MAX_FULLTEXT_CONCURRENCY = 16
+MAX_SEARCH_LIMIT = 100
+MAX_URL_CHUNK_SIZE = 100
+MAX_URL_CHUNK_CONCURRENCY = 8
+MAX_DRIVE_SYNC_CONCURRENCY = 16
 
 VALID_SOURCE_TYPES = ("url", "text", "drive", "file")
 VALID_DRIVE_DOC_TYPES = ("doc", "slides", "sheets", "pdf")
@@ -25,14 +40,18 @@ DRIVE_MIME_TYPES = {
 }
 
 
-class AddSourceResult(TypedDict):
-    """Result of adding a source."""
-
+class _AddSourceResultBase(TypedDict):
     source_type: str
     source_id: str
     title: str
 
 
+class AddSourceResult(_AddSourceResultBase, total=False):
+    """Result of adding a source."""
+
+    deduplicated: bool  # Present (True) when dedupe skipped an unchanged source
+
+
 class DriveSourceInfo(TypedDict, total=False):
     """Info about a Drive source including freshness."""
 
@@ -51,13 +70,61 @@ class SyncResult(TypedDict):
     error: str | None
 
 
+class DriveSyncItem(TypedDict):
+    """Outcome for one Drive source in a drive-sync run."""
+
+    notebook_id: str
+    source_id: str
+    title: str
+    status: str  # synced | fresh | skipped | unknown | failed
+    synced_at: int | None  # NotebookLM's sync timestamp, when synced
+    error: str | None
+
+
 class SourceContentResult(TypedDict):
     """Result of getting source content."""
 
     content: str
     title: str
     source_type: str
+    char_count: int  # Length of the full text, not just this page
+    offset: int
+    next_offset: int | None  # Offset of the next page, or None at the end
+
+
+class SourceFulltextRecord(TypedDict):
+    """Full text of one source in a bulk export."""
+
+    source_id: str
+    title: str
+    source_type: str
+    url: str | None
+    content: str
     char_count: int
+    cached: bool  # Served from the local fulltext cache
+    error: str | None
+
+
+class SearchIndexSyncResult(TypedDict):
+    """Result of bringing a notebook's local search index up to date."""
+
+    notebook_id: str
+    added: int  # Newly indexed sources
+    updated: int  # Re-indexed sources (renamed, or re-fetched with refresh)
+    removed: int  # Sources no longer in the notebook
+    unchanged: int
+    pending: int  # Sources whose text could not be fetched (still processing or failed)
+
+
+class SourceSearchHit(TypedDict):
+    """One ranked match from the local search index."""
+
+    notebook_id: str
+    source_id: str
+    title: str
+    source_type: str
+    snippet: str  # Matching content excerpt, matches wrapped in [...]
+    score: float  # bm25 relevance, higher is better
 
 
 class RenameResult(TypedDict):
@@ -83,11 +150,66 @@ class DriveListResult(TypedDict):
     stale_count: int
 
 
+class FileUploadItem(TypedDict):
+    """Result of one file in a concurrent upload."""
+
+    index: int
+    file_path: str
+    source_id: str | None
+    title: str | None
+    bytes: int
+    seconds: float | None
+    error: str | None
+    deduplicated: bool
+
+
+class UrlIngestItem(TypedDict):
+    """Outcome for one URL of a chunked bulk URL add."""
+
+    index: int  # Position in the input list
+    url: str
+    status: str  # added | reconciled | failed
+    source_id: str | None
+    title: str | None
+    attempts: int
+    error: str | None
+
+
+class DirectoryIngestItem(TypedDict):
+    """Outcome for one file of a directory ingest."""
+
+    path: str  # Relative to the ingested directory
+    status: str  # uploaded | ready | skipped | deduplicated | failed
+    source_id: str | None
+    bytes: int
+    error: str | None
+
+
+class DirectoryIngestPlan(TypedDict):
+    """Files matched by a directory ingest, before any network I/O."""
+
+    directory: str
+    manifest_path: str
+    total: int  # Supported files matching the pattern
+    done: int  # Already uploaded by a previous run (per the manifest)
+    to_upload: int
+    total_bytes: int  # Bytes still to upload
+
+
+class BulkAddFailure(TypedDict):
+    """A source that a bulk add could not add."""
+
+    source_type: str
+    source: str  # File path, document ID or text title
+    error: str
+
+
 class BulkAddResult(TypedDict):
     """Result of bulk adding sources."""
 
     results: list[AddSourceResult]
     added_count: int
+    failed: list[BulkAddFailure]
 
 
 def validate_source_type(source_type: str) -> None:
@@ -119,6 +241,8 @@ def add_source(
     doc_type: str = "doc",
     wait: bool = False,
     wait_timeout: float = 120.0,
+    resume: bool = False,
+    dedupe: bool = False,
 ) -> AddSourceResult:
     """Add a source to a notebook.
 
@@ -136,6 +260,10 @@ def add_source(
         doc_type: Drive doc type: doc|slides|sheets|pdf
         wait: Wait for source processing
         wait_timeout: Max seconds to wait
+        resume: Continue an interrupted file upload from its saved session
+        dedupe: Skip url, text and file sources this notebook already has
+            (tracked in the local source index); the result then carries
+            `deduplicated: True`
 
     Returns:
         AddSourceResult with source_type, source_id, title
@@ -156,7 +284,9 @@ def add_source(
                     f"URL scheme '{parsed.scheme}' is not allowed. "
                     f"Only http:// and https:// URLs are supported."
                 )
-            result = client.add_url_source(notebook_id, url, wait=wait, wait_timeout=wait_timeout)
+            result = client.add_url_source(
+                notebook_id, url, wait=wait, wait_timeout=wait_timeout, dedupe=dedupe
+            )
             return _extract_result(result, "url", url)
 
         elif source_type == "text":
@@ -169,6 +299,7 @@ def add_source(
                 effective_title,
                 wait=wait,
                 wait_timeout=wait_timeout,
+                dedupe=dedupe,
             )
             return _extract_result(result, "text", effective_title)
 
@@ -198,7 +329,12 @@ def add_source(
             # when rename fires.
             effective_wait = wait or bool(title)
             result = client.add_file(
-                notebook_id, file_path, wait=effective_wait, wait_timeout=wait_timeout
+                notebook_id,
+                file_path,
+                wait=effective_wait,
+                wait_timeout=wait_timeout,
+                resume=resume,
+                dedupe=dedupe,
             )
             fallback_title = str(file_path).split("/")[-1]
             # `client.add_file` doesn't accept a title parameter (the NotebookLM
@@ -256,11 +392,14 @@ def _extract_result(
             f"Failed to add {source_type} source — no ID returned",
             user_message=f"Failed to add {source_type} source.",
         )
-    return {
+    extracted: AddSourceResult = {
         "source_type": source_type,
         "source_id": result["id"],
         "title": result.get("title", fallback_title),
     }
+    if result.get("deduplicated"):
+        extracted["deduplicated"] = True
+    return extracted
 
 
 def add_sources(
@@ -270,11 +409,14 @@ def add_sources(
     *,
     wait: bool = False,
     wait_timeout: float = 120.0,
+    upload_concurrency: int = 4,
+    dedupe: bool = False,
 ) -> BulkAddResult:
     """Add multiple sources to a notebook.
 
-    URL sources are batched into a single API call for efficiency.
-    Non-URL sources (text, drive, file) fall back to individual calls.
+    URL sources are batched into a single API call for efficiency. File
+    sources are uploaded concurrently (see `upload_files`). Text and drive
+    sources fall back to individual calls.
 
     Args:
         client: Authenticated NotebookLM client
@@ -289,13 +431,17 @@ def add_sources(
             - file_path: str (for file type)
         wait: Wait for source processing
         wait_timeout: Max seconds to wait per source
+        upload_concurrency: Max file sources uploading at once (1-16)
+        dedupe: Skip url, text and file sources this notebook already has
 
     Returns:
-        BulkAddResult with results list and added_count
+        BulkAddResult with the added sources (`results`, `added_count`) and
+        the file, text and drive sources that could not be added (`failed`).
+        One failed source doesn't stop the others.
 
     Raises:
         ValidationError: If sources list is empty or has invalid entries
-        ServiceError: If the add operation fails
+        ServiceError: If the URL sources cannot be added
     """
     if not sources:
         raise ValidationError("No sources provided for bulk add.")
@@ -304,12 +450,17 @@ def add_sources(
     for src in sources:
         st = src.get("source_type", "")
         validate_source_type(st)
+        if st == "file" and not src.get("file_path"):
+            raise ValidationError("file_path is required for source_type='file'")
 
-    # Separate URL sources for batching vs others for individual adds
+    # Separate URL sources for batching and files for the upload pipeline
+    # from the remaining sources, which are added individually.
     url_sources = [s for s in sources if s.get("source_type") == "url"]
-    other_sources = [s for s in sources if s.get("source_type") != "url"]
+    file_sources = [s for s in sources if s.get("source_type") == "file"]
+    other_sources = [s for s in sources if s.get("source_type") not in ("url", "file")]
 
     results: list[AddSourceResult] = []
+    failed: list[BulkAddFailure] = []
 
     # Batch URL sources in a single API call
     if url_sources:
@@ -326,16 +477,11 @@ def add_sources(
                 urls,
                 wait=wait,
                 wait_timeout=wait_timeout,
+                dedupe=dedupe,
             )
             for i, raw in enumerate(raw_results):
                 if raw and raw.get("id"):
-                    results.append(
-                        {
-                            "source_type": "url",
-                            "source_id": raw["id"],
-                            "title": raw.get("title", urls[i]),
-                        }
-                    )
+                    results.append(_extract_result(raw, "url", urls[i]))
                 else:
                     raise ServiceError(
                         f"Failed to add URL source '{urls[i]}' — no ID returned",
@@ -350,28 +496,464 @@ def add_sources(
                 hint="Check the URLs are accessible. For YouTube, ensure the videos are public.",
             ) from e
 
-    # Add non-URL sources individually
-    for src in other_sources:
-        result = add_source(
+    if file_sources:
+        uploaded, upload_failures = _upload_file_sources(
             client,
             notebook_id,
-            src["source_type"],
-            text=src.get("text"),
-            title=src.get("title"),
-            file_path=src.get("file_path"),
-            document_id=src.get("document_id"),
-            doc_type=src.get("doc_type", "doc"),
+            file_sources,
+            concurrency=upload_concurrency,
             wait=wait,
             wait_timeout=wait_timeout,
+            dedupe=dedupe,
         )
+        results.extend(uploaded)
+        failed.extend(upload_failures)
+
+    # Add text and drive sources individually
+    for src in other_sources:
+        try:
+            result = add_source(
+                client,
+                notebook_id,
+                src["source_type"],
+                text=src.get("text"),
+                title=src.get("title"),
+                file_path=src.get("file_path"),
+                document_id=src.get("document_id"),
+                doc_type=src.get("doc_type", "doc"),
+                wait=wait,
+                wait_timeout=wait_timeout,
+                dedupe=dedupe,
+            )
+        except ServiceError as e:
+            label = src.get("document_id") or src.get("title") or (src.get("text") or "")[:50]
+            failed.append(
+                {"source_type": src["source_type"], "source": label, "error": e.user_message}
+            )
+            continue
         results.append(result)
 
     return {
         "results": results,
         "added_count": len(results),
+        "failed": failed,
     }
 
 
+def ingest_urls(
+    client: NotebookLMClient,
+    notebook_id: str,
+    urls: list[str],
+    *,
+    chunk_size: int = 50,
+    concurrency: int = 4,
+    max_attempts: int = 3,
+) -> Iterator[UrlIngestItem]:
+    """Add a large list of URLs in concurrent chunks with a per-URL report.
+
+    Each chunk is one add request. If a request errors or times out, the
+    chunk's URLs are checked against the notebook's source list, and only the
+    ones that did not land are sent again (`client.add_url_sources_chunked`).
+    One failed chunk never hides what the others added.
+
+    Args:
+        client: Authenticated NotebookLM client
+        notebook_id: Notebook UUID
+        urls: http(s) URLs to add
+        chunk_size: URLs per add request (1-100)
+        concurrency: Max chunks in flight (1-8)
+        max_attempts: Sends per URL before it is reported failed (1-10)
+
+    Returns:
+        Iterator of UrlIngestItem, one per URL, as each chunk finishes
+
+    Raises:
+        ValidationError: If the list is empty, a URL is not http(s), or a
+            tuning parameter is out of range
+    """
+    if not urls:
+        raise ValidationError("No URLs provided.")
+    for url in urls:
+        scheme = urllib.parse.urlparse(url).scheme
+        if not scheme or scheme.lower() not in ALLOWED_URL_SCHEMES:
+            raise ValidationError(
+                f"URL scheme '{scheme}' is not allowed ({url}). "
+                f"Only http:// and https:// URLs are supported."
+            )
+    if not 1 <= chunk_size <= MAX_URL_CHUNK_SIZE:
+        raise ValidationError(
+            f"Invalid chunk size {chunk_size}. Must be between 1 and {MAX_URL_CHUNK_SIZE}.",
+        )
+    if not 1 <= concurrency <= MAX_URL_CHUNK_CONCURRENCY:
+        raise ValidationError(
+            f"Invalid concurrency {concurrency}. Must be between 1 and {MAX_URL_CHUNK_CONCURRENCY}.",
+        )
+    if not 1 <= max_attempts <= 10:
+        raise ValidationError(f"Invalid max_attempts {max_attempts}. Must be between 1 and 10.")
+
+    def _results() -> Iterator[UrlIngestItem]:
+        for item in client.add_url_sources_chunked(
+            notebook_id,
+            urls,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+            max_attempts=max_attempts,
+        ):
+            yield {
+                "index": item["index"],
+                "url": item["url"],
+                "status": item["status"],
+                "source_id": item.get("id"),
+                "title": item.get("title"),
+                "attempts": item["attempts"],
+                "error": item.get("error"),
+            }
+
+    return _results()
+
+
+def upload_files(
+    client: NotebookLMClient,
+    notebook_id: str,
+    file_paths: list[str],
+    *,
+    concurrency: int = 4,
+    wait: bool = False,
+    wait_timeout: float = 120.0,
+    on_progress: Callable[[int, int, int], None] | None = None,
+    resume: bool = False,
+    dedupe: bool = False,
+) -> Iterator[FileUploadItem]:
+    """Upload many local files to a notebook with bounded concurrency.
+
+    Validation happens eagerly; results are then yielded in completion order so
+    callers can report each file as it lands.
+
+    Args:
+        client: Authenticated NotebookLM client
+        notebook_id: Notebook UUID
+        file_paths: Local file paths on the machine running nlm / the MCP server
+        concurrency: Max files uploading at once (1-16)
+        wait: Wait for each source to finish processing
+        wait_timeout: Max seconds to wait per source
+        on_progress: Optional `(index, bytes_sent, total_bytes)` callback,
+            called from upload worker threads
+        resume: Continue interrupted uploads from their saved sessions
+        dedupe: Skip files whose bytes this notebook already has
+
+    Returns:
+        Iterator of FileUploadItem; failed files carry `error` and do not stop
+        the other uploads.
+
+    Raises:
+        ValidationError: If no files are given or concurrency is out of range
+    """
+    if not file_paths:
+        raise ValidationError("No files provided for upload.")
+    if not 1 <= concurrency <= MAX_UPLOAD_CONCURRENCY:
+        raise ValidationError(
+            f"Invalid concurrency {concurrency}. Must be between 1 and {MAX_UPLOAD_CONCURRENCY}.",
+        )
+
+    def _results() -> Iterator[FileUploadItem]:
+        for item in client.add_files(
+            notebook_id,
+            file_paths,
+            concurrency=concurrency,
+            wait=wait,
+            wait_timeout=wait_timeout,
+            on_progress=on_progress,
+            resume=resume,
+            dedupe=dedupe,
+        ):
+            yield {
+                "index": item["index"],
+                "file_path": item["file_path"],
+                "source_id": item.get("id"),
+                "title": item.get("title"),
+                "bytes": item.get("bytes", 0),
+                "seconds": item.get("seconds"),
+                "error": item.get("error"),
+                "deduplicated": bool(item.get("deduplicated")),
+            }
+
+    return _results()
+
+
+def scan_directory(directory: Path, pattern: str = "**/*") -> list[Path]:
+    """Regular, non-empty files under `directory` matching `pattern` with a supported extension."""
+    supported = NotebookLMClient.SUPPORTED_FILE_EXTENSIONS
+    return sorted(
+        path
+        for path in directory.glob(pattern)
+        if path.suffix.lower() in supported and path.is_file() and path.stat().st_size > 0
+    )
+
+
+def plan_directory_ingest(
+    notebook_id: str,
+    directory: str,
+    *,
+    pattern: str = "**/*",
+    manifest_path: str | None = None,
+) -> tuple[DirectoryIngestPlan, DirectoryManifest]:
+    """Scan a directory and reconcile it with its manifest, without network I/O.
+
+    Files unchanged (same size and mtime) since the manifest recorded them keep
+    their hash and status; new or modified files are hashed and marked pending.
+    The compacted manifest is written before returning.
+
+    Raises:
+        ValidationError: If the directory does not exist or nothing matches
+    """
+    root = Path(directory).expanduser().resolve()
+    if not root.is_dir():
+        raise ValidationError(f"Not a directory: {directory}")
+    if not pattern:
+        raise ValidationError("pattern must not be empty.")
+    files = scan_directory(root, pattern)
+    if not files:
+        raise ValidationError(
+            f"No supported files match '{pattern}' in {root}.",
+        )
+
+    manifest = DirectoryManifest(
+        Path(manifest_path).expanduser()
+        if manifest_path
+        else DirectoryManifest.default_path(notebook_id, root)
+    )
+    manifest.load()
+    entries: dict[str, ManifestEntry] = {}
+    for path in files:
+        rel = path.relative_to(root).as_posix()
+        stat = path.stat()
+        previous = manifest.entries.get(rel)
+        if previous and previous.size == stat.st_size and previous.mtime_ns == stat.st_mtime_ns:
+            entries[rel] = previous
+        else:
+            entries[rel] = ManifestEntry(
+                path=rel, size=stat.st_size, mtime_ns=stat.st_mtime_ns, sha256=file_sha256(path)
+            )
+    manifest.entries = entries
+    manifest.rewrite()
+
+    pending = [e for e in entries.values() if e.status in ("pending", "failed")]
+    plan: DirectoryIngestPlan = {
+        "directory": str(root),
+        "manifest_path": str(manifest.path),
+        "total": len(entries),
+        "done": len(entries) - len(pending),
+        "to_upload": len(pending),
+        "total_bytes": sum(e.size for e in pending),
+    }
+    return plan, manifest
+
+
+def add_directory(
+    client: NotebookLMClient,
+    notebook_id: str,
+    plan: DirectoryIngestPlan,
+    manifest: DirectoryManifest,
+    *,
+    concurrency: int = 4,
+    wait: bool = False,
+    wait_timeout: float = 600.0,
+    dedupe: bool = False,
+    on_progress: Callable[[str, int, int], None] | None = None,
+) -> Iterator[DirectoryIngestItem]:
+    """Upload the pending files of a planned directory ingest.
+
+    Files go through the concurrent, resumable upload pipeline (`add_files`
+    with `resume=True`), and each result is appended to the manifest as it
+    lands, so an interrupted run picks up where it stopped. With `wait`, all
+    new sources (and sources a previous run uploaded but never saw ready) are
+    tracked by one SourceReadinessWatcher after the uploads finish; each
+    source's `wait_timeout` starts then, not when its upload landed.
+
+    A source that failed processing in a previous run is still in the
+    notebook, so it is deleted before its file is uploaded again. If it
+    can't be deleted, the file is reported as failed and not re-uploaded,
+    so the notebook never gets a duplicate.
+
+    Args:
+        client: Authenticated NotebookLM client
+        notebook_id: Notebook UUID
+        plan, manifest: From `plan_directory_ingest`
+        concurrency: Max files uploading at once (1-16)
+        wait: Wait for sources to finish processing
+        wait_timeout: Max seconds to wait per source
+        dedupe: Skip files whose bytes this notebook already has
+        on_progress: Optional `(relative_path, bytes_sent, total_bytes)` callback
+
+    Returns:
+        Iterator of DirectoryIngestItem, one per matched file. Files a previous
+        run already uploaded are reported as `skipped` (or `ready` once waited).
+
+    Raises:
+        ValidationError: If concurrency is out of range
+    """
+    if not 1 <= concurrency <= MAX_UPLOAD_CONCURRENCY:
+        raise ValidationError(
+            f"Invalid concurrency {concurrency}. Must be between 1 and {MAX_UPLOAD_CONCURRENCY}.",
+        )
+    root = Path(plan["directory"])
+
+    def _item(entry: ManifestEntry, status: str) -> DirectoryIngestItem:
+        return {
+            "path": entry.path,
+            "status": status,
+            "source_id": entry.source_id,
+            "bytes": entry.size,
+            "error": entry.error,
+        }
+
+    def _results() -> Iterator[DirectoryIngestItem]:
+        entries = list(manifest.entries.values())
+        pending = [e for e in entries if e.status in ("pending", "failed")]
+        watcher = SourceReadinessWatcher(client, notebook_id, timeout=wait_timeout)
+        watched: dict[str, ManifestEntry] = {}
+
+        deduplicated: set[str] = set()
+
+        for entry in entries:
+            if entry.status == "uploaded" and wait and entry.source_id:
+                watched[entry.source_id] = entry
+            elif entry.status in ("uploaded", "ready"):
+                yield _item(entry, "skipped")
+
+        stale = {e.source_id: e for e in pending if e.source_id}
+        if stale:
+            try:
+                live = {s.get("id") for s in client.get_notebook_sources_with_types(notebook_id)}
+                present = [source_id for source_id in stale if source_id in live]
+                if present:
+                    delete_sources(client, present)
+            except Exception as e:
+                message = e.user_message if isinstance(e, ServiceError) else str(e)
+                for source_id, entry in stale.items():
+                    pending.remove(entry)
+                    error = f"Could not remove failed source {source_id}: {message}"
+                    yield {**_item(entry, "failed"), "error": error}
+            else:
+                for entry in stale.values():
+                    cleared = dataclasses.replace(entry, source_id=None)
+                    manifest.update(cleared)
+                    pending[pending.index(entry)] = cleared
+
+        progress = None
+        if on_progress is not None:
+
+            def progress(index: int, sent: int, total: int) -> None:
+                on_progress(pending[index].path, sent, total)
+
+        if pending:
+            for result in client.add_files(
+                notebook_id,
+                [str(root / entry.path) for entry in pending],
+                concurrency=concurrency,
+                wait=False,
+                on_progress=progress,
+                resume=True,
+                dedupe=dedupe,
+            ):
+                entry = pending[result["index"]]
+                if result.get("error"):
+                    entry = dataclasses.replace(entry, status="failed", error=result["error"])
+                    manifest.update(entry)
+                    yield _item(entry, "failed")
+                    continue
+                entry = dataclasses.replace(
+                    entry, status="uploaded", source_id=result["id"], error=None
+                )
+                manifest.update(entry)
+                if wait:
+                    watched[result["id"]] = entry
+                    if result.get("deduplicated"):
+                        deduplicated.add(result["id"])
+                else:
+                    yield _item(entry, "deduplicated" if result.get("deduplicated") else "uploaded")
+
+        # Watch only once polling starts, so slow uploads don't eat into
+        # the readiness deadlines of sources that landed early.
+        watcher.watch_many(watched)
+        for event in watcher.events():
+            entry = watched[event.source_id]
+            if event.state == "ready":
+                entry = dataclasses.replace(entry, status="ready")
+            elif event.state == "failed":
+                entry = dataclasses.replace(entry, status="failed", error=event.error)
+            else:
+                # Still processing server-side: keep it "uploaded" so a re-run
+                # waits for it again instead of re-uploading.
+                yield {**_item(entry, "failed"), "error": event.error}
+                continue
+            manifest.update(entry)
+            if entry.status == "ready" and event.source_id in deduplicated:
+                yield _item(entry, "deduplicated")
+            else:
+                yield _item(entry, entry.status)
+
+    return _results()
+
+
+def _upload_file_sources(
+    client: NotebookLMClient,
+    notebook_id: str,
+    file_sources: list[dict[str, Any]],
+    *,
+    concurrency: int,
+    wait: bool,
+    wait_timeout: float,
+    dedupe: bool = False,
+) -> tuple[list[AddSourceResult], list[BulkAddFailure]]:
+    """Upload the file entries of a bulk add.
+
+    Returns:
+        (uploaded sources, files that failed), each in input order
+    """
+    file_paths = [src["file_path"] for src in file_sources]
+
+    # Custom titles are applied with a rename, which only sticks once the
+    # source is registered server-side (see add_source), so wait if any are set.
+    effective_wait = wait or any(src.get("title") for src in file_sources)
+    items = sorted(
+        upload_files(
+            client,
+            notebook_id,
+            file_paths,
+            concurrency=concurrency,
+            wait=effective_wait,
+            wait_timeout=wait_timeout,
+            dedupe=dedupe,
+        ),
+        key=lambda item: item["index"],
+    )
+
+    results: list[AddSourceResult] = []
+    failed: list[BulkAddFailure] = []
+    for src, item in zip(file_sources, items, strict=True):
+        if item["error"]:
+            failed.append(
+                {"source_type": "file", "source": str(item["file_path"]), "error": item["error"]}
+            )
+            continue
+        source_id = cast(str, item["source_id"])
+        title = item["title"] or str(item["file_path"]).split("/")[-1]
+        custom_title = src.get("title")
+        if custom_title:
+            try:
+                renamed = client.rename_source(notebook_id, source_id, custom_title)
+                title = renamed.get("title", custom_title) if renamed else title
+            except Exception:
+                # Best-effort, as in add_source: the upload itself succeeded.
+                pass
+        result: AddSourceResult = {"source_type": "file", "source_id": source_id, "title": title}
+        if item["deduplicated"]:
+            result["deduplicated"] = True
+        results.append(result)
+    return results, failed
+
+
 def list_drive_sources(
     client: NotebookLMClient,
     notebook_id: str,
@@ -456,6 +1038,12 @@ def _safe_check_freshness(client: NotebookLMClient, source_id: str) -> bool | No
         return None
 
 
+def _forget_source_text(source_id: str) -> None:
+    """Drop a source's cached full text and search entry after its content changed."""
+    get_fulltext_cache().delete(source_id)
+    get_search_index().remove(source_id)
+
+
 def sync_drive_sources(
     client: NotebookLMClient,
     source_ids: list[str],
@@ -479,6 +1067,8 @@ def sync_drive_sources(
     for source_id in source_ids:
         try:
             result = client.sync_drive_source(source_id)
+            if result:
+                _forget_source_text(source_id)
             results.append({"source_id": source_id, "synced": bool(result), "error": None})
         except Exception as e:
             results.append({"source_id": source_id, "synced": False, "error": str(e)})
@@ -486,6 +1076,120 @@ def sync_drive_sources(
     return results
 
 
+def drive_sync(
+    client: NotebookLMClient,
+    notebook_ids: list[str],
+    *,
+    concurrency: int = 8,
+    recheck_after: float | None = None,
+    force: bool = False,
+) -> Iterator[DriveSyncItem]:
+    """Check Drive sources for staleness and sync the stale ones, pipelined.
+
+    Each Drive source is handled by one task in a single bounded pool: the
+    freshness check runs, and if the source is stale its sync RPC is issued
+    right away by the same task, so syncs overlap with the remaining checks
+    instead of waiting for all of them. Results stream as tasks finish.
+
+    Sources found fresh or synced are recorded locally. With
+    `recheck_after`, sources verified within that many seconds are reported
+    as skipped without a freshness RPC (NotebookLM exposes no Drive revision
+    ID, so this local record is the change signal). Synced sources' cached
+    full text and search entries are dropped, so they are fetched again.
+
+    Args:
+        client: Authenticated NotebookLM client
+        notebook_ids: Notebooks whose Drive sources to sync
+        concurrency: Max checks/syncs in flight (1-16)
+        recheck_after: Skip sources verified within this many seconds
+        force: Sync every Drive source without checking freshness
+
+    Returns:
+        Iterator of DriveSyncItem: skipped sources first, then the rest as
+        they finish
+
+    Raises:
+        ValidationError: If no notebooks are given or a parameter is out of range
+        ServiceError: If a notebook's sources cannot be listed
+    """
+    if not notebook_ids:
+        raise ValidationError("No notebook IDs provided for Drive sync.")
+    if not 1 <= concurrency <= MAX_DRIVE_SYNC_CONCURRENCY:
+        raise ValidationError(
+            f"Invalid concurrency {concurrency}. Must be between 1 and {MAX_DRIVE_SYNC_CONCURRENCY}.",
+        )
+    if recheck_after is not None and recheck_after < 0:
+        raise ValidationError("recheck_after cannot be negative.")
+
+    drive_sources: list[tuple[str, dict[str, Any]]] = []
+    for notebook_id in notebook_ids:
+        try:
+            sources = client.get_notebook_sources_with_types(notebook_id)
+        except Exception as e:
+            raise ServiceError(
+                f"Failed to list sources for {notebook_id}: {e}",
+                user_message=f"Could not list sources of notebook {notebook_id}.",
+            ) from e
+        drive_sources.extend(
+            (notebook_id, src) for src in sources if src.get("can_sync") and src.get("id")
+        )
+
+    def _item(notebook_id: str, src: dict[str, Any], status: str, **extra: Any) -> DriveSyncItem:
+        return {
+            "notebook_id": notebook_id,
+            "source_id": src["id"],
+            "title": src.get("title") or "",
+            "status": status,
+            "synced_at": extra.get("synced_at"),
+            "error": extra.get("error"),
+        }
+
+    def _check_and_sync(notebook_id: str, src: dict[str, Any]) -> DriveSyncItem:
+        state = get_drive_sync_state()
+        try:
+            if not force:
+                fresh = client.check_source_freshness(src["id"])
+                if fresh is None:
+                    return _item(notebook_id, src, "unknown")
+                if fresh:
+                    state.record(src["id"], src.get("drive_doc_id"))
+                    return _item(notebook_id, src, "fresh")
+            result = client.sync_drive_source(src["id"])
+        except Exception as e:
+            return _item(notebook_id, src, "failed", error=str(e))
+        if not result:
+            return _item(notebook_id, src, "failed", error="Sync returned no data")
+        state.record(src["id"], src.get("drive_doc_id"), synced=True)
+        _forget_source_text(src["id"])
+        return _item(notebook_id, src, "synced", synced_at=result.get("synced_at"))
+
+    def _results() -> Iterator[DriveSyncItem]:
+        state = get_drive_sync_state()
+        pending = []
+        for notebook_id, src in drive_sources:
+            if (
+                recheck_after is not None
+                and not force
+                and state.verified_within(src["id"], src.get("drive_doc_id"), recheck_after)
+            ):
+                yield _item(notebook_id, src, "skipped")
+            else:
+                pending.append((notebook_id, src))
+        if not pending:
+            return
+        executor = ThreadPoolExecutor(
+            max_workers=min(concurrency, len(pending)), thread_name_prefix="nlm-drive-sync"
+        )
+        try:
+            futures = [executor.submit(_check_and_sync, nb, src) for nb, src in pending]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    return _results()
+
+
 def rename_source(
     client: NotebookLMClient,
     notebook_id: str,
@@ -628,35 +1332,256 @@ def describe_source(
         ) from e
 
 
+def export_source_fulltexts(
+    client: NotebookLMClient,
+    notebook_id: str,
+    *,
+    concurrency: int = 8,
+    refresh: bool = False,
+) -> Iterator[SourceFulltextRecord]:
+    """Stream the full text of every source in a notebook.
+
+    Sources already in the local fulltext cache are served from it; the rest
+    are fetched concurrently (`client.get_source_fulltexts`) and cached as they
+    arrive, so a re-run only fetches sources added since. Records are yielded
+    one at a time, so callers can write them out with constant memory.
+
+    Args:
+        client: Authenticated NotebookLM client
+        notebook_id: Notebook UUID
+        concurrency: Max fetches in flight (1-16)
+        refresh: Ignore cached text and re-fetch every source (e.g. after a
+            Drive sync)
+
+    Returns:
+        Iterator of SourceFulltextRecord; failed fetches carry `error` and do
+        not stop the export.
+
+    Raises:
+        ValidationError: If concurrency is out of range
+        ServiceError: If the notebook's sources cannot be listed
+    """
+    if not 1 <= concurrency <= MAX_FULLTEXT_CONCURRENCY:
+        raise ValidationError(
+            f"Invalid concurrency {concurrency}. Must be between 1 and {MAX_FULLTEXT_CONCURRENCY}.",
+        )
+    try:
+        sources = client.get_notebook_sources_with_types(notebook_id)
+    except Exception as e:
+        raise ServiceError(
+            f"Failed to list sources: {e}",
+            user_message="Could not list notebook sources.",
+        ) from e
+    titles = {src["id"]: src.get("title") or "" for src in sources if src.get("id")}
+
+    def _record(source_id: str, data: dict[str, Any], cached: bool) -> SourceFulltextRecord:
+        content = data.get("content") or ""
+        return {
+            "source_id": source_id,
+            "title": data.get("title") or titles.get(source_id, ""),
+            "source_type": data.get("source_type") or "unknown",
+            "url": data.get("url"),
+            "content": content,
+            "char_count": len(content),
+            "cached": cached,
+            "error": data.get("error"),
+        }
+
+    def _results() -> Iterator[SourceFulltextRecord]:
+        cache = get_fulltext_cache()
+        to_fetch = []
+        for source_id in titles:
+            hit = None if refresh else cache.get(source_id)
+            if hit is None:
+                to_fetch.append(source_id)
+            else:
+                yield _record(source_id, hit, cached=True)
+        for item in client.get_source_fulltexts(to_fetch, concurrency=concurrency):
+            source_id = item["source_id"]
+            # Empty text usually means the source is still processing; don't
+            # cache it, so the next export fetches it again.
+            if not item.get("error") and item.get("content"):
+                cache.put(source_id, item, notebook_id=notebook_id)
+            yield _record(source_id, item, cached=False)
+
+    return _results()
+
+
+def sync_search_index(
+    client: NotebookLMClient,
+    notebook_id: str,
+    *,
+    concurrency: int = 8,
+    refresh: bool = False,
+) -> SearchIndexSyncResult:
+    """Bring a notebook's entries in the local search index up to date.
+
+    One source-list fetch is diffed against the index: sources removed from
+    the notebook are dropped, renamed ones are re-indexed, and only sources
+    not yet indexed have their text fetched (served from the fulltext cache
+    when possible). Sources without text yet are left out and picked up by
+    the next sync; a re-index that can't fetch text keeps the old entry.
+
+    Args:
+        client: Authenticated NotebookLM client
+        notebook_id: Notebook UUID
+        concurrency: Max fetches in flight (1-16)
+        refresh: Ignore cached text and re-fetch and re-index every source
+            (e.g. after sources were edited in NotebookLM)
+
+    Returns:
+        SearchIndexSyncResult with counts of added, updated, removed,
+        unchanged and pending sources
+
+    Raises:
+        ValidationError: If concurrency is out of range
+        ServiceError: If the notebook's sources cannot be listed
+    """
+    if not 1 <= concurrency <= MAX_FULLTEXT_CONCURRENCY:
+        raise ValidationError(
+            f"Invalid concurrency {concurrency}. Must be between 1 and {MAX_FULLTEXT_CONCURRENCY}.",
+        )
+    try:
+        sources = client.get_notebook_sources_with_types(notebook_id)
+    except Exception as e:
+        raise ServiceError(
+            f"Failed to list sources: {e}",
+            user_message="Could not list notebook sources.",
+        ) from e
+    titles = {src["id"]: src.get("title") or "" for src in sources if src.get("id")}
+
+    index = get_search_index()
+    cache = get_fulltext_cache()
+    indexed = index.titles(notebook_id)
+    removed = indexed.keys() - titles.keys()
+    for source_id in removed:
+        index.remove(source_id)
+
+    added = updated = pending = 0
+    stale = []  # Indexed sources to index again
+    to_fetch = []
+
+    def _index(source_id: str, record: dict[str, Any]) -> None:
+        nonlocal added, updated
+        # The live title is what the index is diffed against on the next sync.
+        index.upsert(
+            notebook_id, source_id, {**record, "title": titles[source_id] or record.get("title")}
+        )
+        if source_id in indexed:
+            updated += 1
+        else:
+            added += 1
+
+    for source_id, title in titles.items():
+        if source_id in indexed:
+            if not refresh and indexed[source_id] == title:
+                continue
+            stale.append(source_id)
+        hit = None if refresh else cache.get(source_id)
+        if hit is None:
+            to_fetch.append(source_id)
+        else:
+            _index(source_id, hit)
+    for item in client.get_source_fulltexts(to_fetch, concurrency=concurrency):
+        source_id = item["source_id"]
+        if item.get("error") or not item.get("content"):
+            pending += 1
+            continue
+        cache.put(source_id, item, notebook_id=notebook_id)
+        _index(source_id, item)
+
+    return {
+        "notebook_id": notebook_id,
+        "added": added,
+        "updated": updated,
+        "removed": len(removed),
+        "unchanged": len(indexed.keys() & titles.keys()) - len(stale),
+        "pending": pending,
+    }
+
+
+def search_sources(
+    query: str,
+    *,
+    notebook_id: str | None = None,
+    limit: int = 10,
+) -> list[SourceSearchHit]:
+    """Search source text in the local index. No network I/O.
+
+    Only notebooks synced with `sync_search_index` are searchable.
+
+    Args:
+        query: Search terms; all must match. A trailing * searches by prefix.
+        notebook_id: Limit results to one notebook (default: all indexed)
+        limit: Max results (1-100)
+
+    Returns:
+        Hits ranked best first
+
+    Raises:
+        ValidationError: If the query is empty or limit is out of range
+        ServiceError: If the search fails
+    """
+    if not query.strip():
+        raise ValidationError("Search query cannot be empty.")
+    if not 1 <= limit <= MAX_SEARCH_LIMIT:
+        raise ValidationError(
+            f"Invalid limit {limit}. Must be between 1 and {MAX_SEARCH_LIMIT}.",
+        )
+    try:
+        hits = get_search_index().search(query, notebook_id=notebook_id, limit=limit)
+    except Exception as e:
+        raise ServiceError(f"Search failed: {e}") from e
+    return cast(list[SourceSearchHit], hits)
+
+
 def get_source_content(
     client: NotebookLMClient,
     source_id: str,
+    *,
+    offset: int = 0,
+    limit: int | None = None,
 ) -> SourceContentResult:
     """Get raw text content of a source (no AI processing).
 
+    Large sources can be read a page at a time: pass `limit`, then call again
+    with `offset=next_offset` until `next_offset` is None.
+
     Args:
         client: Authenticated NotebookLM client
         source_id: Source UUID
+        offset: First character to return
+        limit: Max characters to return (default: all)
 
     Returns:
-        SourceContentResult with content, title, type, and char_count
+        SourceContentResult with content, title, type, char_count and paging
+        offsets
 
     Raises:
+        ValidationError: If offset or limit is out of range
         ServiceError: If content retrieval fails
     """
+    if offset < 0:
+        raise ValidationError(f"Invalid offset {offset}. Must be 0 or greater.")
+    if limit is not None and limit < 1:
+        raise ValidationError(f"Invalid limit {limit}. Must be at least 1.")
     try:
-        result = client.get_source_fulltext(source_id)
+        result = client.get_source_fulltext(source_id, offset=offset, limit=limit)
         if not result:
             raise ServiceError(
                 f"No content returned for source {source_id}",
                 user_message="Failed to get source content.",
             )
         content = result.get("content", "")
+        char_count = result.get("char_count", offset + len(content))
+        end = offset + len(content)
         return {
             "content": content,
             "title": result.get("title", ""),
             "source_type": result.get("type", "unknown"),
-            "char_count": len(content),
+            "char_count": char_count,
+            "offset": offset,
+            "next_offset": end if end < char_count else None,
         }
     except ServiceError:
         raise
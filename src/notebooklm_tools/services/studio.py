@@ -6,16 +6,21 @@ Centralizes:
 - Source ID resolution (fetch all when none provided)
 - Mind map two-step pattern (generate → save)
 - Result validation (artifact_id exists)
+- Incremental status (change cursors over per-notebook snapshots)
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import threading
+from collections import OrderedDict
 from collections.abc import Mapping, Sequence
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from notebooklm_tools.core import constants
+from notebooklm_tools.core.artifact_cache import get_artifact_cache
 from notebooklm_tools.core.errors import ResourceExhaustedError, RPCDriftError, RPCError
 
 from ._compat import TypedDict
@@ -49,6 +54,14 @@ _CINEMATIC_FOCUS_HINT = (
 # Video formats with no visual style picker — full creative direction goes through --focus
 _STYLELESS_VIDEO_FORMATS = frozenset({"cinematic", "short"})
 
+# Multi-KB fields left out of status results unless include_content=True
+HEAVY_ARTIFACT_FIELDS = ("report_content", "custom_instructions", "visual_style_prompt")
+
+# (notebook_id, cursor) -> {artifact key: fingerprint}, most recent last
+_STATUS_SNAPSHOTS_MAX = 128
+_status_snapshots: OrderedDict[tuple[str, str], dict[str, str]] = OrderedDict()
+_status_snapshots_lock = threading.Lock()
+
 
 # ---------- TypedDicts ----------
 
@@ -97,12 +110,19 @@ class ArtifactInfo(TypedDict, total=False):
 
 
 class StatusResult(TypedDict):
-    """Result of polling studio status."""
+    """Result of polling studio status.
+
+    With `since`, `artifacts` holds only artifacts changed since that cursor
+    and `removed` the IDs gone since; the counts always cover all artifacts.
+    """
 
     artifacts: list[ArtifactInfo]
     total: int
     completed: int
     in_progress: int
+    cursor: str  # Pass as `since` to get only later changes
+    incremental: bool  # False when `since` was not given or has expired
+    removed: list[str]
 
 
 class RenameResult(TypedDict):
@@ -599,14 +619,49 @@ def _derive_error_reason(raw_artifact: dict[str, Any]) -> str | None:
     return None
 
 
+def _artifact_key(artifact: ArtifactInfo) -> str:
+    return artifact.get("artifact_id") or f"{artifact.get('type')}:{artifact.get('title')}"
+
+
+def _artifact_fingerprint(artifact: ArtifactInfo) -> str:
+    """Hash of an artifact's status and content. Signed URLs rotate per listing, so they don't count."""
+    stable = {k: v for k, v in artifact.items() if k != "url" and not k.endswith("_url")}
+    payload = json.dumps(stable, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def _remember_snapshot(notebook_id: str, snapshot: dict[str, str]) -> str:
+    """Keep a notebook's status snapshot and return its cursor (same state, same cursor)."""
+    cursor = hashlib.sha256(
+        "\n".join(f"{key}={fp}" for key, fp in sorted(snapshot.items())).encode()
+    ).hexdigest()[:16]
+    with _status_snapshots_lock:
+        _status_snapshots[(notebook_id, cursor)] = snapshot
+        _status_snapshots.move_to_end((notebook_id, cursor))
+        while len(_status_snapshots) > _STATUS_SNAPSHOTS_MAX:
+            _status_snapshots.popitem(last=False)
+    return cursor
+
+
 def get_studio_status(
     client: NotebookLMClient,
     notebook_id: str,
+    since: str | None = None,
+    include_content: bool = True,
 ) -> StatusResult:
     """Get status of all studio artifacts including mind maps.
 
+    Args:
+        client: NotebookLM client
+        notebook_id: Notebook UUID
+        since: Cursor from an earlier result; only artifacts whose status or
+            content changed since then are returned. An unknown or expired
+            cursor returns every artifact with ``incremental=False``.
+        include_content: Include heavy fields (report_content, custom and
+            visual style instructions). Changes to them are detected either way.
+
     Returns:
-        StatusResult with artifact list and summary counts
+        StatusResult with artifact list, summary counts and a new cursor
 
     Raises:
         ServiceError: If polling fails
@@ -711,11 +766,32 @@ def get_studio_status(
     completed = [a for a in artifacts if a.get("status") == "completed"]
     in_progress = [a for a in artifacts if a.get("status") == "in_progress"]
 
+    snapshot = {_artifact_key(a): _artifact_fingerprint(a) for a in artifacts}
+    with _status_snapshots_lock:
+        previous = _status_snapshots.get((notebook_id, since)) if since else None
+    cursor = _remember_snapshot(notebook_id, snapshot)
+
+    returned = artifacts
+    removed: list[str] = []
+    if previous is not None:
+        returned = [
+            a for a in artifacts if previous.get(_artifact_key(a)) != snapshot[_artifact_key(a)]
+        ]
+        removed = [key for key in previous if key not in snapshot]
+    if not include_content:
+        returned = [
+            cast("ArtifactInfo", {k: v for k, v in a.items() if k not in HEAVY_ARTIFACT_FIELDS})
+            for a in returned
+        ]
+
     return StatusResult(
-        artifacts=artifacts,
+        artifacts=returned,
         total=len(artifacts),
         completed=len(completed),
         in_progress=len(in_progress),
+        cursor=cursor,
+        incremental=previous is not None,
+        removed=removed,
     )
 
 
@@ -761,6 +837,14 @@ def rename_artifact(
 # ---------- Delete ----------
 
 
+def _invalidate_cached(artifact_id: str) -> None:
+    """Drop an artifact's locally cached downloads (best effort)."""
+    try:
+        get_artifact_cache().invalidate(artifact_id)
+    except Exception as e:
+        logger.debug("Could not invalidate cached downloads of %s: %s", artifact_id, e)
+
+
 def delete_artifact(
     client: NotebookLMClient,
     artifact_id: str,
@@ -785,6 +869,7 @@ def delete_artifact(
             f"Failed to delete artifact: {e}",
             user_message="Could not delete artifact.",
         ) from e
+    _invalidate_cached(artifact_id)
 
 
 # ---------- Revise ----------
@@ -879,6 +964,7 @@ def revise_artifact(
             ),
         )
 
+    _invalidate_cached(artifact_id)
     return ReviseResult(
         artifact_type="slide_deck",
         artifact_id=result["artifact_id"],
@@ -0,0 +1,366 @@
+"""Studio queue service — durable, quota-aware generation across many notebooks.
+
+Jobs are persisted in `StudioJobStore`, so a queue of hundreds of podcasts
+survives crashes and restarts. `run_studio_queue` works through an account's
+jobs with at most `concurrency` generations in flight, tracks them with one
+`StudioWatcher` (one studio list per notebook per tick), retries generations
+the backend reports as failed, and optionally downloads each finished
+artifact. A generation that outlives the watcher's deadline is checked again
+and kept on if it is still running, never regenerated blindly.
+
+When the backend answers RESOURCE_EXHAUSTED, the account is paused: briefly
+for throttling, or until its rolling 24-hour window frees a slot once the
+store has learned the account's daily limit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from notebooklm_tools.core.errors import ArtifactNotFoundError, ResourceExhaustedError
+from notebooklm_tools.core.retry import is_transient_error
+from notebooklm_tools.core.studio_jobs import StudioJobStore, get_studio_job_store
+from notebooklm_tools.core.studio_watcher import StudioGenerationError, StudioWatcher
+
+from . import downloads as downloads_service
+from . import studio as studio_service
+from ._compat import TypedDict
+from .errors import ServiceError, ValidationError
+
+if TYPE_CHECKING:
+    from notebooklm_tools.core.client import NotebookLMClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COOLDOWN = 15 * 60  # First pause after RESOURCE_EXHAUSTED, doubled while it repeats
+DEFAULT_RETRY_DELAY = 60.0  # Pause before regenerating a failed artifact
+MAX_QUEUE_CONCURRENCY = 8
+_MAX_IDLE_SLEEP = 30.0
+
+# Keyword options accepted by studio.create_artifact
+CREATE_OPTIONS = frozenset(
+    name
+    for name, param in inspect.signature(studio_service.create_artifact).parameters.items()
+    if param.kind is inspect.Parameter.KEYWORD_ONLY
+)
+
+
+class QueueEvent(TypedDict):
+    """A job changing state during a queue run."""
+
+    job_id: int
+    notebook_id: str
+    artifact_type: str
+    state: str  # started | completed | retrying | failed | paused
+    artifact_id: str | None
+    path: str | None
+    error: str | None
+
+
+class QueueRunResult(TypedDict):
+    """Outcome of one `run_studio_queue` call."""
+
+    account: str
+    completed: int  # Jobs completed during this run
+    failed: int  # Jobs failed for good during this run
+    queued: int  # Jobs still waiting (including retries)
+    generating: int  # Jobs still generating (tracked again by the next run)
+    paused_until: float | None  # Unix time the account's quota frees up, if the run stopped on it
+
+
+def enqueue_studio_jobs(
+    notebook_ids: list[str],
+    artifact_type: str,
+    *,
+    account: str = "default",
+    options: dict[str, Any] | None = None,
+    download_dir: str | None = None,
+    max_attempts: int = 3,
+    store: StudioJobStore | None = None,
+) -> list[int]:
+    """Queue one generation job per notebook.
+
+    Args:
+        notebook_ids: Notebooks to generate in
+        artifact_type: Studio artifact type (audio, video, report, ...)
+        account: Account (profile) whose quota the jobs count against
+        options: Keyword options for `studio.create_artifact` (e.g. audio_format)
+        download_dir: Download each finished artifact to
+            ``<download_dir>/<notebook_id>/<type>_<artifact_id>.<ext>``
+        max_attempts: Generations to try per job before failing it
+        store: Job store (default: the process-wide queue)
+
+    Returns:
+        The new job IDs, in notebook order
+
+    Raises:
+        ValidationError: If a parameter is invalid
+    """
+    if not notebook_ids:
+        raise ValidationError("At least one notebook is required.")
+    studio_service.validate_artifact_type(artifact_type)
+    options = dict(options or {})
+    unknown = sorted(set(options) - CREATE_OPTIONS)
+    if unknown:
+        raise ValidationError(f"Unknown {artifact_type} option(s): {', '.join(unknown)}.")
+    if max_attempts < 1:
+        raise ValidationError(f"Invalid max_attempts {max_attempts}. Must be at least 1.")
+    if download_dir:
+        downloads_service.validate_output_path(download_dir)
+
+    store = store or get_studio_job_store()
+    return [
+        store.enqueue(account, notebook_id, artifact_type, options, download_dir, max_attempts)
+        for notebook_id in dict.fromkeys(notebook_ids)
+    ]
+
+
+def run_studio_queue(
+    client: NotebookLMClient,
+    *,
+    account: str = "default",
+    concurrency: int = 2,
+    daily_limit: int | None = None,
+    cooldown: float = DEFAULT_COOLDOWN,
+    retry_delay: float = DEFAULT_RETRY_DELAY,
+    wait_for_quota: bool = False,
+    on_event: Callable[[QueueEvent], None] | None = None,
+    store: StudioJobStore | None = None,
+    watcher: StudioWatcher | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> QueueRunResult:
+    """Work through an account's queued jobs until none are left to run.
+
+    Jobs a previous run left generating are tracked again rather than
+    regenerated. The run returns once nothing is queued or generating, or,
+    unless `wait_for_quota`, when the account's quota is paused and nothing
+    is left generating.
+
+    Args:
+        client: Authenticated client for the account
+        account: Account (profile) whose jobs to run
+        concurrency: Max generations in flight at once (1-8)
+        daily_limit: Max starts per rolling 24 hours (default: learned from
+            RESOURCE_EXHAUSTED errors; unlimited until then)
+        cooldown: First pause after a RESOURCE_EXHAUSTED error, in seconds
+        retry_delay: Pause before regenerating a failed artifact, in seconds
+        wait_for_quota: Sleep through quota pauses instead of returning
+        on_event: Called with a QueueEvent whenever a job changes state
+        store: Job store (default: the process-wide queue)
+        watcher: Studio watcher to track generations with (default: a new one
+            driven by this call)
+        sleep: Sleep function (injectable for tests)
+
+    Returns:
+        QueueRunResult with this run's outcome and what is left
+
+    Raises:
+        ValidationError: If a limit is out of range
+        ServiceError: If the studio status cannot be checked for a reason
+            retrying won't fix (e.g. expired authentication). Jobs still
+            generating stay so and are tracked again by the next run.
+    """
+    if not 1 <= concurrency <= MAX_QUEUE_CONCURRENCY:
+        raise ValidationError(
+            f"Invalid concurrency {concurrency}. Must be between 1 and {MAX_QUEUE_CONCURRENCY}."
+        )
+    if daily_limit is not None and daily_limit < 1:
+        raise ValidationError(f"Invalid daily_limit {daily_limit}. Must be at least 1.")
+
+    store = store or get_studio_job_store()
+    watcher = watcher or StudioWatcher(client)
+    store.recover(account)
+
+    completed = failed = 0
+    paused_until: float | None = None
+    tracking: dict[Future[dict[str, Any]], dict[str, Any]] = {}
+
+    def emit(job: dict[str, Any], state: str, **fields: Any) -> None:
+        if on_event is not None:
+            on_event(
+                QueueEvent(
+                    job_id=job["job_id"],
+                    notebook_id=job["notebook_id"],
+                    artifact_type=job["artifact_type"],
+                    state=state,
+                    artifact_id=fields.get("artifact_id", job.get("artifact_id")),
+                    path=fields.get("path"),
+                    error=fields.get("error"),
+                )
+            )
+
+    def track(job: dict[str, Any]) -> None:
+        future = watcher.watch(job["notebook_id"], job["artifact_id"], job["artifact_type"])
+        tracking[future] = job
+
+    def finish(job: dict[str, Any]) -> None:
+        nonlocal completed
+        path, error = _download_result(client, job)
+        store.mark_completed(job["job_id"], path, error)
+        completed += 1
+        emit(job, "completed", path=path, error=error)
+
+    def retry(job: dict[str, Any], error: str) -> None:
+        nonlocal failed
+        state = store.retry_or_fail(job["job_id"], error, retry_delay)
+        failed += state == "failed"
+        emit(job, "retrying" if state == "queued" else "failed", artifact_id=None, error=error)
+
+    def drop(job: dict[str, Any]) -> None:
+        """Fail a job whose artifact was deleted while generating."""
+        # Nothing to wait for, and regenerating would undo whoever removed it.
+        nonlocal failed
+        error = f"Artifact {job['artifact_id']} no longer exists"
+        store.mark_failed(job["job_id"], error)
+        failed += 1
+        emit(job, "failed", error=error)
+
+    def recheck(job: dict[str, Any]) -> None:
+        """Settle a job the watcher gave up on by looking at its artifact once more."""
+        try:
+            artifacts = client.poll_studio_status(job["notebook_id"])
+        except Exception as e:
+            if not is_transient_error(e):
+                raise _status_error(e) from e
+            track(job)
+            return
+        artifact = next((a for a in artifacts if a.get("artifact_id") == job["artifact_id"]), None)
+        status = artifact.get("status") if artifact else None
+        if status == "completed":
+            finish(job)
+        elif status == "failed":
+            retry(job, artifact.get("error_reason") or f"Artifact {job['artifact_id']} failed")
+        elif artifact is None:
+            drop(job)
+        else:
+            track(job)  # Still generating: keep waiting rather than start over
+
+    def quota_reopens_at() -> float:
+        """When the account may start its next generation (now or earlier if it may now)."""
+        learned, blocked_until = store.quota(account)
+        limit = daily_limit or learned
+        return max(blocked_until, store.start_slot_at(account, limit) if limit else 0.0)
+
+    for job in store.jobs(account, "generating"):
+        track(job)
+
+    while True:
+        # Start generations while there is capacity and quota.
+        while len(tracking) < concurrency and quota_reopens_at() <= time.time():
+            job = store.claim_next(account)
+            if job is None:
+                break
+            try:
+                result = studio_service.create_artifact(
+                    client, job["notebook_id"], job["artifact_type"], **job["options"]
+                )
+            except ValidationError as e:
+                store.mark_failed(job["job_id"], e.user_message)
+                failed += 1
+                emit(job, "failed", error=e.user_message)
+                continue
+            except ServiceError as e:
+                if isinstance(e.__cause__, ResourceExhaustedError):
+                    learned, until = store.record_exhausted(account, cooldown)
+                    store.release(job["job_id"], until)
+                    logger.info(
+                        "Studio quota exhausted for %s; paused until %s (daily limit: %s)",
+                        account,
+                        time.ctime(until),
+                        learned or "unknown",
+                    )
+                    emit(job, "paused", error=e.user_message)
+                    break
+                retry(job, e.user_message)
+                continue
+
+            store.record_start(account)
+            job["artifact_id"] = result["artifact_id"]
+            if result.get("status", "completed") == "completed":
+                finish(job)  # Mind maps are ready as soon as they are saved
+                continue
+            store.mark_generating(job["job_id"], job["artifact_id"])
+            emit(job, "started")
+            track(job)
+
+        # Track generations: one studio list per due notebook.
+        watcher.poll_due()
+        for future in [f for f in tracking if f.done()]:
+            job = tracking.pop(future)
+            error = future.exception()
+            if error is None:
+                finish(job)
+            elif isinstance(error, StudioGenerationError):
+                retry(job, str(error))
+            elif isinstance(error, ArtifactNotFoundError):
+                drop(job)
+            elif isinstance(error, TimeoutError):
+                recheck(job)
+            else:
+                raise _status_error(error) from error
+
+        next_runnable = store.next_runnable_at(account)
+        if not tracking:
+            if next_runnable is None:
+                break  # Queue drained
+            reopens = quota_reopens_at()
+            if reopens > time.time() and not wait_for_quota:
+                paused_until = reopens
+                break
+            sleep(max(0.0, max(next_runnable, reopens) - time.time()))
+            continue
+
+        nap = watcher.next_due_in()
+        if next_runnable is not None and len(tracking) < concurrency:
+            nap = min(nap, max(0.0, max(next_runnable, quota_reopens_at()) - time.time()))
+        sleep(min(nap, _MAX_IDLE_SLEEP))
+
+    counts = store.counts(account)
+    return QueueRunResult(
+        account=account,
+        completed=completed,
+        failed=failed,
+        queued=counts.get("queued", 0),
+        generating=counts.get("generating", 0),
+        paused_until=paused_until,
+    )
+
+
+def _status_error(error: BaseException) -> ServiceError:
+    """Wrap a studio status check failure that retrying won't fix."""
+    return ServiceError(
+        f"Studio status check failed: {error}",
+        user_message=f"Could not check studio status: {error}",
+    )
+
+
+def _download_result(
+    client: NotebookLMClient, job: dict[str, Any]
+) -> tuple[str | None, str | None]:
+    """Download a finished job's artifact if it asked for it, as (path, error)."""
+    if not job["download_dir"]:
+        return None, None
+    artifact_type = job["artifact_type"]
+    ext = downloads_service.get_default_extension(artifact_type)
+    path = (
+        Path(job["download_dir"])
+        / job["notebook_id"]
+        / f"{artifact_type}_{job['artifact_id']}.{ext}"
+    )
+    try:
+        result = asyncio.run(
+            downloads_service.download_async(
+                client, job["notebook_id"], artifact_type, str(path), job["artifact_id"]
+            )
+        )
+    except ServiceError as e:
+        # The artifact exists; regenerating it would not fix a download.
+        return None, f"Download failed: {e.user_message}"
+    return result["path"], None
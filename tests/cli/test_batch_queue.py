@@ -0,0 +1,50 @@
+"""Tests for `nlm batch studio --queue` and the studio queue commands."""
+
+from unittest.mock import MagicMock, patch
+
+from typer.testing import CliRunner
+
+from notebooklm_tools.cli.commands.batch import app
+from notebooklm_tools.core.studio_jobs import StudioJobStore
+
+
+def test_batch_studio_queue_enqueues_and_runs(tmp_path):
+    run_result = {
+        "account": "work",
+        "completed": 2,
+        "failed": 0,
+        "queued": 0,
+        "generating": 0,
+        "paused_until": None,
+    }
+    with (
+        patch("notebooklm_tools.cli.utils.get_client", return_value=MagicMock()),
+        patch("notebooklm_tools.services.batch.queue_batch_studio", return_value=[1, 2]) as enqueue,
+        patch(
+            "notebooklm_tools.services.studio_queue.run_studio_queue", return_value=run_result
+        ) as run,
+    ):
+        result = CliRunner().invoke(
+            app,
+            ["studio", "audio", "--all", "--queue", "--download", str(tmp_path), "-p", "work"],
+        )
+
+    assert result.exit_code == 0, result.output
+    assert "Queued 2 audio job(s) for work" in result.output
+    assert "Completed 2, failed 0" in result.output
+    assert enqueue.call_args.kwargs["account"] == "work"
+    assert enqueue.call_args.kwargs["download_dir"] == str(tmp_path)
+    assert run.call_args.kwargs["account"] == "work"
+    assert run.call_args.kwargs["wait_for_quota"] is False
+
+
+def test_queue_status_lists_jobs(tmp_path):
+    store = StudioJobStore(tmp_path / "jobs.sqlite3")
+    store.enqueue("work", "nb-123456789", "video")
+    with patch("notebooklm_tools.core.studio_jobs.get_studio_job_store", return_value=store):
+        result = CliRunner().invoke(app, ["queue-status", "-p", "work"])
+    store.close()
+
+    assert result.exit_code == 0, result.output
+    assert "nb-123456789" in result.output
+    assert "queued: 1" in result.output
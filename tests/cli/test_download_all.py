@@ -0,0 +1,91 @@
+"""Tests for `nlm download all`."""
+
+from unittest.mock import MagicMock, patch
+
+from typer.testing import CliRunner
+
+from notebooklm_tools.cli.commands.download import app
+
+
+def _item(artifact_id, status, error=None):
+    return {
+        "notebook_id": "nb-1",
+        "artifact_id": artifact_id,
+        "artifact_type": "audio",
+        "title": f"Audio {artifact_id}",
+        "path": f"out/nb-1/audio_{artifact_id}.m4a",
+        "status": status,
+        "error": error,
+    }
+
+
+def _invoke(items, args, notebooks=()):
+    client = MagicMock()
+    client.list_notebooks.return_value = [MagicMock(id=nb) for nb in notebooks]
+    alias_mgr = MagicMock()
+    alias_mgr.resolve.side_effect = lambda value: value
+    plan = {"items": items, "snapshots": {}}
+    plan_mock = MagicMock(return_value=plan)
+
+    async def results():
+        for item in items:
+            yield item
+
+    run_mock = MagicMock(side_effect=lambda *a, **kw: results())
+    with (
+        patch("notebooklm_tools.cli.commands.download.get_alias_manager", return_value=alias_mgr),
+        patch("notebooklm_tools.cli.commands.download.get_client", return_value=client),
+        patch(
+            "notebooklm_tools.cli.commands.download.downloads_service.plan_bulk_download",
+            plan_mock,
+        ),
+        patch(
+            "notebooklm_tools.cli.commands.download.downloads_service.run_bulk_download",
+            run_mock,
+        ),
+    ):
+        return CliRunner().invoke(app, args), plan_mock, run_mock
+
+
+def test_download_all_plans_and_reports_counts():
+    items = [_item("a1", "skipped"), _item("a2", "downloaded"), _item("a3", "downloaded")]
+    result, plan_mock, run_mock = _invoke(
+        items,
+        ["all", "--notebooks", "nb-1,nb-2", "--types", "audio,data-table", "--out", "out"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert plan_mock.call_args.args[1:] == (["nb-1", "nb-2"], "out")
+    assert plan_mock.call_args.kwargs == {
+        "types": ["audio", "data_table"],
+        "output_format": "json",
+    }
+    assert run_mock.call_args.kwargs["concurrency"] == 6
+    assert run_mock.call_args.kwargs["per_host"] == 4
+    assert "2 downloaded, 1 skipped" in " ".join(result.output.split())
+
+
+def test_download_all_every_notebook():
+    result, plan_mock, _ = _invoke(
+        [_item("a1", "downloaded")], ["all", "--all", "--no-progress"], notebooks=["x", "y"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert plan_mock.call_args.args[1] == ["x", "y"]
+
+
+def test_download_all_requires_one_notebook_selector():
+    result, plan_mock, _ = _invoke([], ["all"])
+
+    assert result.exit_code == 1
+    assert "--notebooks or --all" in result.output
+    plan_mock.assert_not_called()
+
+
+def test_download_all_exits_nonzero_on_failure():
+    result, _, _ = _invoke(
+        [_item("a1", "failed", "HTTP 403")], ["all", "-n", "nb-1", "--no-progress"]
+    )
+
+    assert result.exit_code == 1
+    assert "HTTP 403" in result.output
@@ -0,0 +1,55 @@
+"""Tests for `nlm download <type> --output -` (stream to stdout)."""
+
+from unittest.mock import MagicMock, patch
+
+from typer.testing import CliRunner
+
+from notebooklm_tools.cli.commands.download import app
+from notebooklm_tools.services import ServiceError
+
+
+def _invoke(args, stream):
+    alias_mgr = MagicMock()
+    alias_mgr.resolve.side_effect = lambda value: value
+    stream_mock = MagicMock(side_effect=stream)
+    with (
+        patch("notebooklm_tools.cli.commands.download.get_alias_manager", return_value=alias_mgr),
+        patch("notebooklm_tools.cli.commands.download.get_client", return_value=MagicMock()),
+        patch(
+            "notebooklm_tools.cli.commands.download.downloads_service.stream_artifact",
+            stream_mock,
+        ),
+    ):
+        return CliRunner().invoke(app, args), stream_mock
+
+
+def test_output_dash_writes_bytes_to_stdout():
+    async def chunks(*args, **kwargs):
+        yield b"\x00ID3"
+        yield b"\xffdata"
+
+    result, stream_mock = _invoke(["audio", "nb-1", "--output", "-", "--id", "a1"], chunks)
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout_bytes == b"\x00ID3\xffdata"
+    assert stream_mock.call_args.args[1:] == ("nb-1", "audio")
+    assert stream_mock.call_args.kwargs == {"artifact_id": "a1", "slide_deck_format": "pdf"}
+
+
+def test_output_dash_reports_errors_on_stderr():
+    async def failing(*args, **kwargs):
+        raise ServiceError("boom", user_message="Download failed for video.")
+        yield b""
+
+    result, _ = _invoke(["video", "nb-1", "-o", "-"], failing)
+
+    assert result.exit_code == 1
+    assert result.stdout_bytes == b""
+    assert "Download failed for video." in result.stderr
+
+
+def test_output_dash_rejects_segments():
+    result, stream_mock = _invoke(["video", "nb-1", "-o", "-", "--segments", "4"], None)
+
+    assert result.exit_code == 1
+    stream_mock.assert_not_called()
@@ -0,0 +1,70 @@
+"""Tests for the `nlm notebook query-batch` CLI command."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from typer.testing import CliRunner
+
+from notebooklm_tools.cli.commands.notebook import app
+
+
+def _make_client(items):
+    client = MagicMock()
+    client.__enter__ = lambda s: s
+    client.__exit__ = MagicMock(return_value=False)
+    client.query_many.return_value = iter(items)
+    return client
+
+
+def _invoke(client, args):
+    alias_mgr = MagicMock()
+    alias_mgr.resolve.side_effect = lambda value: value
+    with (
+        patch("notebooklm_tools.cli.commands.notebook.get_alias_manager", return_value=alias_mgr),
+        patch("notebooklm_tools.cli.commands.notebook.get_client", return_value=client),
+    ):
+        return CliRunner().invoke(app, args)
+
+
+def test_query_batch_writes_one_json_line_per_answer(tmp_path):
+    questions = tmp_path / "questions.txt"
+    questions.write_text("What is A?\n\nWhat is B?\n", encoding="utf-8")
+    out = tmp_path / "answers.jsonl"
+    client = _make_client(
+        [
+            {"index": 1, "question": "What is B?", "answer": "B."},
+            {"index": 0, "question": "What is A?", "answer": "A."},
+        ]
+    )
+
+    result = _invoke(
+        client,
+        ["query-batch", "nb-1", "--file", str(questions), "-o", str(out), "-s", "s1,s2"],
+    )
+
+    assert result.exit_code == 0, result.output
+    client.query_many.assert_called_once_with(
+        "nb-1", ["What is A?", "What is B?"], source_ids=["s1", "s2"], concurrency=4
+    )
+    records = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+    assert [r["index"] for r in records] == [2, 0]  # Input lines, blank line counted
+    assert records[1]["answer"] == "A."
+    assert "2/2 questions answered" in result.output
+
+
+def test_query_batch_exits_nonzero_when_a_question_fails(tmp_path):
+    questions = tmp_path / "questions.txt"
+    questions.write_text("q1\n", encoding="utf-8")
+    client = _make_client([{"index": 0, "question": "q1", "error": "rejected"}])
+
+    result = _invoke(client, ["query-batch", "nb-1", "--file", str(questions), "-s", "s1"])
+
+    assert result.exit_code == 1
+    assert json.loads(result.output.splitlines()[0])["error"] == "rejected"
+
+
+def test_query_batch_missing_file_errors(tmp_path):
+    result = _invoke(MagicMock(), ["query-batch", "nb-1", "--file", str(tmp_path / "nope.txt")])
+
+    assert result.exit_code == 1
+    assert "Cannot read questions file" in result.output
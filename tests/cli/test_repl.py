@@ -1,5 +1,7 @@
 """Tests for the interactive chat REPL."""
 
+import threading
+import time
 from contextlib import nullcontext
 from types import SimpleNamespace
 from unittest.mock import MagicMock
@@ -7,6 +9,13 @@ from unittest.mock import MagicMock
 from notebooklm_tools.cli.commands import repl
 
 
+def _wait_for_call(mock, timeout=2.0):
+    """Background prefetches run on worker threads; wait for them to land."""
+    deadline = time.monotonic() + timeout
+    while not mock.called and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
 def test_run_chat_repl_banner_uses_normalized_source_count(monkeypatch):
     client = MagicMock()
     client.get_notebook_sources_with_types.return_value = [
@@ -47,7 +56,15 @@ def test_run_chat_repl_banner_uses_normalized_source_count(monkeypatch):
 
     assert panel_text
     assert "2 source(s) loaded" in panel_text[0]
+    for mock in (
+        client.get_notebook_sources_with_types,
+        client.get_conversation_id,
+        client.warm_query_client,
+    ):
+        _wait_for_call(mock)
     client.get_notebook_sources_with_types.assert_called_once_with("nb-123")
+    client.get_conversation_id.assert_called_once_with("nb-123")
+    client.warm_query_client.assert_called_once_with()
 
 
 def test_run_chat_repl_empty_notebook_skips_source_fetch(monkeypatch):
@@ -87,3 +104,93 @@ def test_run_chat_repl_empty_notebook_skips_source_fetch(monkeypatch):
     assert panel_text
     assert "0 source(s) loaded" in panel_text[0]
     client.get_notebook_sources_with_types.assert_not_called()
+
+
+def test_run_chat_repl_first_question_uses_prefetched_state(monkeypatch):
+    client = MagicMock()
+    client.get_conversation_id.return_value = "server-conv"
+    client.get_notebook_sources_with_types.return_value = [
+        {"id": "src-1", "title": "Typed Source", "source_type_name": "text"},
+    ]
+    streamed = []
+
+    def fake_query(notebook_id, **kwargs):
+        kwargs["on_answer"]("Partial")
+        kwargs["on_answer"]("Partial answer [1]")
+        streamed.append(kwargs)
+        return {
+            "answer": "Partial answer [1]",
+            "conversation_id": "server-conv",
+            "citations": {1: "src-1"},
+        }
+
+    client.query.side_effect = fake_query
+    inputs = iter(["What is it?", "/exit"])
+    printed = []
+
+    monkeypatch.setattr(repl, "get_client", lambda profile=None: nullcontext(client))
+    monkeypatch.setattr(
+        repl,
+        "get_alias_manager",
+        lambda: SimpleNamespace(resolve=lambda value: value),
+    )
+    monkeypatch.setattr(
+        repl.notebook_service,
+        "get_notebook",
+        lambda _client, _notebook_id: {
+            "title": "Notebook Title",
+            "source_count": 1,
+            "sources": [{"id": "src-1", "title": "Source 1"}],
+        },
+    )
+    monkeypatch.setattr(repl, "Panel", lambda renderable, **kwargs: renderable)
+    monkeypatch.setattr(repl.console, "input", lambda prompt: next(inputs))
+    monkeypatch.setattr(repl.console, "print", lambda *args, **kwargs: printed.extend(args))
+
+    repl.run_chat_repl("nb-123")
+
+    assert len(streamed) == 1
+    assert streamed[0]["conversation_id"] == "server-conv"
+    assert streamed[0]["source_ids"] == ["src-1"]
+    assert any("[1] Typed Source" in str(line) for line in printed)
+
+
+def test_run_chat_repl_drains_prefetch_before_closing_client(monkeypatch):
+    client = MagicMock()
+    client.get_conversation_id.return_value = None
+    events = []
+    started = threading.Event()
+
+    def slow_warm_up():
+        started.set()
+        time.sleep(0.1)
+        events.append("warmed")
+
+    client.warm_query_client.side_effect = slow_warm_up
+
+    class ClientContext:
+        def __enter__(self):
+            return client
+
+        def __exit__(self, *exc):
+            events.append("closed")
+
+    monkeypatch.setattr(repl, "get_client", lambda profile=None: ClientContext())
+    monkeypatch.setattr(
+        repl,
+        "get_alias_manager",
+        lambda: SimpleNamespace(resolve=lambda value: value),
+    )
+    monkeypatch.setattr(
+        repl.notebook_service,
+        "get_notebook",
+        lambda _client, _notebook_id: {"title": "T", "source_count": 0, "sources": []},
+    )
+    monkeypatch.setattr(repl, "Panel", lambda renderable, **kwargs: renderable)
+    # Quit while the warm-up is still running.
+    monkeypatch.setattr(repl.console, "input", lambda prompt: started.wait(2) and "/exit")
+    monkeypatch.setattr(repl.console, "print", lambda *args, **kwargs: None)
+
+    repl.run_chat_repl("nb-123")
+
+    assert events == ["warmed", "closed"]
@@ -0,0 +1,81 @@
+"""Tests for the `nlm search` CLI command."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from typer.testing import CliRunner
+
+from notebooklm_tools.cli.main import app
+
+HITS = [
+    {
+        "notebook_id": "nb-1",
+        "source_id": "s1",
+        "title": "Paper [draft]",
+        "source_type": "pdf",
+        "snippet": "…uses [attention] heads…",
+        "score": 3.2,
+    }
+]
+
+
+def _invoke(args, hits=HITS):
+    client = MagicMock()
+    client.__enter__ = lambda s: s
+    client.__exit__ = MagicMock(return_value=False)
+    alias_mgr = MagicMock()
+    alias_mgr.resolve.side_effect = lambda value: value
+    sync = MagicMock(
+        return_value={
+            "notebook_id": "nb-1",
+            "added": 2,
+            "updated": 0,
+            "removed": 1,
+            "unchanged": 0,
+            "pending": 0,
+        }
+    )
+    search = MagicMock(return_value=hits)
+    with (
+        patch("notebooklm_tools.cli.commands.search.get_alias_manager", return_value=alias_mgr),
+        patch("notebooklm_tools.cli.commands.search.get_client", return_value=client),
+        patch("notebooklm_tools.cli.commands.search.sources_service.sync_search_index", sync),
+        patch("notebooklm_tools.cli.commands.search.sources_service.search_sources", search),
+    ):
+        return CliRunner().invoke(app, args), sync, search
+
+
+def test_search_notebook_syncs_then_prints_snippets():
+    result, sync, search = _invoke(["search", "attention", "--notebook", "nb-1", "-l", "5"])
+
+    assert result.exit_code == 0, result.output
+    assert sync.call_args.kwargs == {"refresh": False}
+    search.assert_called_once_with("attention", notebook_id="nb-1", limit=5)
+    output = " ".join(result.output.split())
+    assert "Index synced: 2 added, 1 removed" in output
+    assert "1. Paper [draft]" in output
+    assert "[attention]" in output
+
+
+def test_search_refresh_reindexes_the_notebook():
+    result, sync, _ = _invoke(["search", "attention", "--notebook", "nb-1", "--refresh"])
+
+    assert result.exit_code == 0, result.output
+    assert sync.call_args.kwargs == {"refresh": True}
+
+
+def test_search_all_notebooks_json_is_offline():
+    result, sync, _ = _invoke(["search", "attention", "--json"])
+
+    assert result.exit_code == 0, result.output
+    sync.assert_not_called()
+    payload = json.loads(result.output)
+    assert payload["count"] == 1
+    assert payload["sync"] is None
+
+
+def test_search_no_matches_hints_at_syncing():
+    result, _, _ = _invoke(["search", "nothing"], hits=[])
+
+    assert result.exit_code == 0
+    assert "Use --notebook" in " ".join(result.output.split())
@@ -0,0 +1,119 @@
+"""Tests for file uploads via `nlm source add --file`."""
+
+from unittest.mock import MagicMock, patch
+
+from typer.testing import CliRunner
+
+from notebooklm_tools.cli.commands.source import app
+
+
+def _invoke(client, args):
+    alias_mgr = MagicMock()
+    alias_mgr.resolve.side_effect = lambda value: value
+    with (
+        patch("notebooklm_tools.cli.commands.source.get_alias_manager", return_value=alias_mgr),
+        patch("notebooklm_tools.cli.commands.source.get_client", return_value=client),
+    ):
+        return CliRunner().invoke(app, args)
+
+
+def _make_client(items):
+    client = MagicMock()
+    client.__enter__ = lambda s: s
+    client.__exit__ = MagicMock(return_value=False)
+    client.add_files.return_value = iter(items)
+    return client
+
+
+def test_repeated_file_flags_upload_concurrently():
+    client = _make_client(
+        [
+            {"index": 1, "file_path": "/d/b.pdf", "id": "s2", "title": "b.pdf", "bytes": 2_000_000},
+            {"index": 0, "file_path": "/d/a.pdf", "id": "s1", "title": "a.pdf", "bytes": 1_000_000},
+        ]
+    )
+
+    result = _invoke(client, ["add", "nb-1", "--file", "/d/a.pdf", "--file", "/d/b.pdf", "-c", "2"])
+
+    assert result.exit_code == 0, result.output
+    args, kwargs = client.add_files.call_args
+    assert args == ("nb-1", ["/d/a.pdf", "/d/b.pdf"])
+    assert kwargs["concurrency"] == 2
+    assert "2/2 file(s) added" in result.output
+    assert "3.0 MB" in result.output
+
+
+def test_failed_file_exits_nonzero():
+    client = _make_client(
+        [
+            {"index": 0, "file_path": "/d/a.pdf", "id": "s1", "title": "a.pdf", "bytes": 1},
+            {"index": 1, "file_path": "/d/b.pdf", "bytes": 0, "error": "File not found"},
+        ]
+    )
+
+    result = _invoke(client, ["add", "nb-1", "--file", "/d/a.pdf", "--file", "/d/b.pdf"])
+
+    assert result.exit_code == 1
+    assert "File not found" in result.output
+    assert "1/2 file(s) added" in result.output
+
+
+def test_resume_flag_is_forwarded_for_single_file(tmp_path):
+    path = tmp_path / "lecture.mp3"
+    path.write_bytes(b"audio")
+    client = _make_client([])
+    client.add_file.return_value = {"id": "s1", "title": "lecture.mp3"}
+
+    result = _invoke(client, ["add", "nb-1", "--file", str(path), "--resume"])
+
+    assert result.exit_code == 0, result.output
+    assert client.add_file.call_args.kwargs["resume"] is True
+
+
+def test_dedupe_reports_files_already_in_notebook():
+    client = _make_client(
+        [
+            {"index": 0, "file_path": "/d/a.pdf", "id": "s1", "title": "a.pdf", "bytes": 1},
+            {
+                "index": 1,
+                "file_path": "/d/b.pdf",
+                "id": "s2",
+                "title": "b.pdf",
+                "bytes": 5,
+                "deduplicated": True,
+            },
+        ]
+    )
+
+    result = _invoke(
+        client, ["add", "nb-1", "--file", "/d/a.pdf", "--file", "/d/b.pdf", "--dedupe"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert client.add_files.call_args.kwargs["dedupe"] is True
+    assert "Already in notebook: b.pdf" in result.output
+    assert "1/2 file(s) added, 1 already in notebook" in result.output
+
+
+def test_add_dir_uploads_and_resumes(tmp_path, monkeypatch):
+    monkeypatch.setenv("NOTEBOOKLM_MCP_CLI_PATH", str(tmp_path / "store"))
+    corpus = tmp_path / "corpus"
+    corpus.mkdir()
+    (corpus / "a.pdf").write_bytes(b"a")
+    (corpus / "b.pdf").write_bytes(b"b")
+    client = _make_client([])
+    client.add_files.side_effect = lambda nb, paths, **kw: iter(
+        [{"index": i, "file_path": p, "id": f"s{i}"} for i, p in enumerate(paths)]
+    )
+
+    first = _invoke(client, ["add-dir", "nb-1", str(corpus), "--glob", "*.pdf"])
+    second = _invoke(client, ["add-dir", "nb-1", str(corpus), "--glob", "*.pdf"])
+
+    assert first.exit_code == 0, first.output
+    assert second.exit_code == 0, second.output
+    first_out, second_out = (" ".join(r.output.split()) for r in (first, second))
+    assert "2 to upload" in first_out
+    assert "2 uploaded" in first_out
+    assert "0 to upload" in second_out
+    assert "2 skipped" in second_out
+    assert client.add_files.call_count == 1
@@ -0,0 +1,76 @@
+"""Tests for chunked bulk URL ingest via `nlm source add-urls`."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from typer.testing import CliRunner
+
+from notebooklm_tools.cli.commands.source import app
+
+
+def _invoke(reports, args, stdin=None):
+    client = MagicMock()
+    client.__enter__ = lambda s: s
+    client.__exit__ = MagicMock(return_value=False)
+    client.add_url_sources_chunked.return_value = iter(reports)
+    alias_mgr = MagicMock()
+    alias_mgr.resolve.side_effect = lambda value: value
+    with (
+        patch("notebooklm_tools.cli.commands.source.get_alias_manager", return_value=alias_mgr),
+        patch("notebooklm_tools.cli.commands.source.get_client", return_value=client),
+    ):
+        return CliRunner().invoke(app, args, input=stdin), client
+
+
+def test_add_urls_reads_file_and_writes_report(tmp_path):
+    urls = tmp_path / "urls.txt"
+    urls.write_text("# reading list\nhttps://a.com\n\nhttps://b.com\n", encoding="utf-8")
+    report = tmp_path / "report.jsonl"
+    reports = [
+        {"index": 0, "url": "https://a.com", "status": "added", "id": "s1", "attempts": 1},
+        {"index": 1, "url": "https://b.com", "status": "reconciled", "id": "s2", "attempts": 1},
+    ]
+
+    result, client = _invoke(
+        reports, ["add-urls", "nb-1", str(urls), "-s", "25", "-c", "2", "--report", str(report)]
+    )
+
+    assert result.exit_code == 0, result.output
+    client.add_url_sources_chunked.assert_called_once_with(
+        "nb-1", ["https://a.com", "https://b.com"], chunk_size=25, concurrency=2, max_attempts=3
+    )
+    lines = [json.loads(line) for line in report.read_text(encoding="utf-8").splitlines()]
+    assert [line["status"] for line in lines] == ["added", "reconciled"]
+    assert "1 added, 1 reconciled" in " ".join(result.output.split())
+
+
+def test_add_urls_from_stdin_exits_nonzero_on_failure():
+    reports = [
+        {"index": 0, "url": "https://a.com", "status": "failed", "attempts": 3, "error": "boom"}
+    ]
+
+    result, _ = _invoke(reports, ["add-urls", "nb-1", "-"], stdin="https://a.com\n")
+
+    assert result.exit_code == 1
+    assert "https://a.com: boom" in result.output
+
+
+def test_add_urls_unreadable_file_exits_with_message(tmp_path):
+    result, client = _invoke([], ["add-urls", "nb-1", str(tmp_path / "missing.txt")])
+
+    assert result.exit_code == 1
+    assert "Cannot read URLs file" in result.output
+    client.add_url_sources_chunked.assert_not_called()
+
+
+def test_add_urls_unwritable_report_exits_with_message(tmp_path):
+    urls = tmp_path / "urls.txt"
+    urls.write_text("https://a.com\n", encoding="utf-8")
+
+    result, client = _invoke(
+        [], ["add-urls", "nb-1", str(urls), "--report", str(tmp_path / "no" / "report.jsonl")]
+    )
+
+    assert result.exit_code == 1
+    assert "Cannot write report file" in result.output
+    client.add_url_sources_chunked.assert_not_called()
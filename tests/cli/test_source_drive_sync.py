@@ -0,0 +1,54 @@
+"""Tests for `nlm source drive-sync`."""
+
+from unittest.mock import MagicMock, patch
+
+from typer.testing import CliRunner
+
+from notebooklm_tools.cli.commands.source import app
+
+
+def _invoke(items, args):
+    client = MagicMock()
+    client.__enter__ = lambda s: s
+    client.__exit__ = MagicMock(return_value=False)
+    alias_mgr = MagicMock()
+    alias_mgr.resolve.side_effect = lambda value: value
+    sync = MagicMock(return_value=iter(items))
+    with (
+        patch("notebooklm_tools.cli.commands.source.get_alias_manager", return_value=alias_mgr),
+        patch("notebooklm_tools.cli.commands.source.get_client", return_value=client),
+        patch("notebooklm_tools.cli.commands.source.sources_service.drive_sync", sync),
+    ):
+        return CliRunner().invoke(app, args), sync
+
+
+def _item(source_id, status, error=None):
+    return {
+        "notebook_id": "nb-1",
+        "source_id": source_id,
+        "title": f"Doc {source_id}",
+        "status": status,
+        "synced_at": None,
+        "error": error,
+    }
+
+
+def test_drive_sync_reports_counts():
+    result, sync = _invoke(
+        [_item("a", "skipped"), _item("b", "synced"), _item("c", "fresh")],
+        ["drive-sync", "nb-1", "nb-2", "--recheck-after", "12", "-c", "16", "-y"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert sync.call_args.args[1] == ["nb-1", "nb-2"]
+    assert sync.call_args.kwargs == {"concurrency": 16, "recheck_after": 43200.0, "force": False}
+    output = " ".join(result.output.split())
+    assert "Synced Doc b" in output
+    assert "1 fresh, 1 skipped, 1 synced" in output
+
+
+def test_drive_sync_exits_nonzero_on_failure():
+    result, _ = _invoke([_item("a", "failed", "quota")], ["drive-sync", "nb-1", "--confirm"])
+
+    assert result.exit_code == 1
+    assert "quota" in result.output
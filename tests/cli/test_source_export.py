@@ -0,0 +1,62 @@
+"""Tests for the `nlm source export-all` CLI command."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from typer.testing import CliRunner
+
+from notebooklm_tools.cli.commands.source import app
+
+
+def _invoke(records, args):
+    client = MagicMock()
+    client.__enter__ = lambda s: s
+    client.__exit__ = MagicMock(return_value=False)
+    alias_mgr = MagicMock()
+    alias_mgr.resolve.side_effect = lambda value: value
+    export = MagicMock(return_value=iter(records))
+    with (
+        patch("notebooklm_tools.cli.commands.source.get_alias_manager", return_value=alias_mgr),
+        patch("notebooklm_tools.cli.commands.source.get_client", return_value=client),
+        patch(
+            "notebooklm_tools.cli.commands.source.sources_service.export_source_fulltexts", export
+        ),
+    ):
+        return CliRunner().invoke(app, args), export
+
+
+def _record(source_id, error=None, cached=False):
+    content = "" if error else f"text {source_id}"
+    return {
+        "source_id": source_id,
+        "title": source_id,
+        "source_type": "pdf",
+        "url": None,
+        "content": content,
+        "char_count": len(content),
+        "cached": cached,
+        "error": error,
+    }
+
+
+def test_export_all_writes_one_record_per_line(tmp_path):
+    out = tmp_path / "sources.jsonl"
+    result, export = _invoke(
+        [_record("s1", cached=True), _record("s2")],
+        ["export-all", "nb-1", "--out", str(out), "-c", "4", "--refresh"],
+    )
+
+    assert result.exit_code == 0, result.output
+    export.assert_called_once()
+    assert export.call_args.kwargs == {"concurrency": 4, "refresh": True}
+    records = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+    assert [r["source_id"] for r in records] == ["s1", "s2"]
+    assert "2/2 sources exported" in result.output
+    assert "1 from cache" in result.output
+
+
+def test_export_all_exits_nonzero_on_failed_fetch():
+    result, _ = _invoke([_record("s1", error="boom")], ["export-all", "nb-1"])
+
+    assert result.exit_code == 1
+    assert json.loads(result.output.splitlines()[0])["error"] == "boom"
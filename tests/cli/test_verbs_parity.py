@@ -61,8 +61,15 @@ def _collect_pairs():
         ("describe_notebook_verb", verbs.describe_notebook_verb, notebook.describe_notebook, set()),
         ("describe_source_verb", verbs.describe_source_verb, source.describe_source, set()),
         ("query_notebook_verb", verbs.query_notebook_verb, notebook.query_notebook, set()),
+        ("query_batch_verb", verbs.query_batch_verb, notebook.query_batch, set()),
         ("content_source_verb", verbs.content_source_verb, source.get_source_content, set()),
         ("download_slides_verb", verbs.download_slides_verb, download.download_slide_deck, set()),
+        (
+            "download_data_table_verb",
+            verbs.download_data_table_verb,
+            download.download_data_table,
+            set(),
+        ),
         ("delete_alias_verb", verbs.delete_alias_verb, alias.delete_alias, set()),
         ("research_start_verb", verbs.research_start_verb, research.start_research, set()),
     ]
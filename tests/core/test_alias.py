@@ -24,7 +24,7 @@ def test_detect_id_type_returns_source_without_legacy_method(monkeypatch):
         def get_notebook(self, _value):
             raise NLMError("Notebook not found")
 
-        def get_source_fulltext(self, _value):
+        def get_source_fulltext(self, _value, offset=0, limit=None):
             return {
                 "content": "source body",
                 "title": "Source Title",
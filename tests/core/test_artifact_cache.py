@@ -0,0 +1,110 @@
+"""Tests for the local artifact cache."""
+
+import os
+
+from notebooklm_tools.core.artifact_cache import ArtifactCache
+
+
+def _file(tmp_path, name, data):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return path
+
+
+def test_store_then_fetch(tmp_path):
+    cache = ArtifactCache(tmp_path / "cache")
+    src = _file(tmp_path, "report.md", b"# Report")
+    assert not cache.fetch("a1", "report", "", "m1", tmp_path / "out.md")
+
+    cache.store("a1", "report", "", "m1", src)
+
+    dest = tmp_path / "out" / "copy.md"
+    assert cache.fetch("a1", "report", "", "m1", dest)
+    assert dest.read_bytes() == b"# Report"
+    # A different marker (the artifact changed) or format is a miss
+    assert not cache.fetch("a1", "report", "", "m2", tmp_path / "x.md")
+    assert not cache.fetch("a1", "report", "html", "m1", tmp_path / "x.md")
+    cache.close()
+
+
+def test_link_serves_media_without_copying(tmp_path):
+    cache = ArtifactCache(tmp_path / "cache")
+    cache.store("a1", "video", "", "m1", _file(tmp_path, "v.mp4", b"\x00" * 64))
+
+    dest = tmp_path / "served.mp4"
+    assert cache.fetch("a1", "video", "", "m1", dest, link=True)
+    assert dest.read_bytes() == b"\x00" * 64
+    assert os.stat(dest).st_nlink == 2
+    cache.close()
+
+
+def test_copy_is_independent_of_cache(tmp_path):
+    cache = ArtifactCache(tmp_path / "cache")
+    cache.store("a1", "report", "", "m1", _file(tmp_path, "r.md", b"original"))
+    dest = tmp_path / "served.md"
+    cache.fetch("a1", "report", "", "m1", dest)
+
+    dest.write_bytes(b"edited")
+
+    assert cache.fetch("a1", "report", "", "m1", tmp_path / "again.md")
+    assert (tmp_path / "again.md").read_bytes() == b"original"
+    cache.close()
+
+
+def test_new_version_replaces_old(tmp_path):
+    cache = ArtifactCache(tmp_path / "cache")
+    cache.store("a1", "report", "", "m1", _file(tmp_path, "r1.md", b"v1"))
+    cache.store("a1", "report", "", "m2", _file(tmp_path, "r2.md", b"v2"))
+
+    assert not cache.fetch("a1", "report", "", "m1", tmp_path / "old.md")
+    assert cache.total_bytes() == 2
+    cache.close()
+
+
+def test_invalidate_drops_all_formats(tmp_path):
+    cache = ArtifactCache(tmp_path / "cache")
+    cache.store("a1", "quiz", "json", "m1", _file(tmp_path, "q.json", b"{}"))
+    cache.store("a1", "quiz", "html", "m1", _file(tmp_path, "q.html", b"<p>"))
+    cache.store("a2", "quiz", "json", "m1", _file(tmp_path, "q2.json", b"[]"))
+
+    assert cache.invalidate("a1") == 2
+
+    assert not cache.fetch("a1", "quiz", "json", "m1", tmp_path / "x.json")
+    assert cache.fetch("a2", "quiz", "json", "m1", tmp_path / "y.json")
+    assert not list((tmp_path / "cache").glob("*.html"))
+    assert len(list((tmp_path / "cache").glob("*.json"))) == 1
+    cache.close()
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = ArtifactCache(tmp_path / "cache", max_bytes=250)
+    for name in ("a1", "a2"):
+        cache.store(name, "infographic", "", "m", _file(tmp_path, f"{name}.png", b"x" * 100))
+    # Touch a1 so a2 becomes the least recently used
+    assert cache.fetch("a1", "infographic", "", "m", tmp_path / "touch.png")
+
+    cache.store("a3", "infographic", "", "m", _file(tmp_path, "a3.png", b"x" * 100))
+
+    assert cache.total_bytes() == 200
+    assert cache.fetch("a1", "infographic", "", "m", tmp_path / "1.png")
+    assert not cache.fetch("a2", "infographic", "", "m", tmp_path / "2.png")
+    assert cache.fetch("a3", "infographic", "", "m", tmp_path / "3.png")
+    cache.close()
+
+
+def test_file_larger_than_budget_is_not_cached(tmp_path):
+    cache = ArtifactCache(tmp_path / "cache", max_bytes=10)
+    cache.store("a1", "video", "", "m", _file(tmp_path, "big.mp4", b"x" * 11))
+    assert cache.total_bytes() == 0
+    cache.close()
+
+
+def test_missing_blob_is_a_miss(tmp_path):
+    cache = ArtifactCache(tmp_path / "cache")
+    cache.store("a1", "report", "", "m1", _file(tmp_path, "r.md", b"text"))
+    for blob in (tmp_path / "cache").glob("*.md"):
+        blob.unlink()
+
+    assert not cache.fetch("a1", "report", "", "m1", tmp_path / "out.md")
+    assert cache.total_bytes() == 0
+    cache.close()
@@ -207,6 +207,20 @@ def test_close():
         assert client._client is None
 
 
+def test_query_client_is_pooled_and_closed():
+    """The streamed-query client is created once, reused, and closed with the client."""
+    from notebooklm_tools.core.base import BaseClient
+
+    with patch.object(BaseClient, "_refresh_auth_tokens"):
+        client = BaseClient(cookies={"SID": "x"}, csrf_token="token")
+        first = client._get_query_client()
+        assert client._get_query_client() is first
+        assert first.headers["Content-Type"].startswith("application/x-www-form-urlencoded")
+        client.close()
+        assert client._query_client is None
+        assert first.is_closed
+
+
 def test_constants_available():
     """Test that RPC and API constants are available on BaseClient."""
     from notebooklm_tools.core.base import BaseClient
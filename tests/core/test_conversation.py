@@ -2,7 +2,7 @@
 """Tests for ConversationMixin."""
 
 import json
-from unittest.mock import ANY, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 
@@ -153,10 +153,11 @@ class TestQueryUsesServerConversationId:
         mixin = self._make_mixin()
         with (
             patch.object(mixin, "get_conversation_id", return_value="server-conv-id"),
-            patch("notebooklm_tools.core.conversation._httpx.Client") as mock_client_class,
+            patch.object(mixin, "_get_query_client") as mock_get_client,
         ):
-            mock_response = mock_client_class.return_value.__enter__.return_value.post.return_value
-            mock_response.text = ")]}'\n100\n" + json.dumps(
+            mock_http = mock_get_client.return_value
+            mock_response = mock_http.stream.return_value.__enter__.return_value
+            body = ")]}'\n100\n" + json.dumps(
                 [
                     [
                         "wrb.fr",
@@ -165,15 +166,12 @@ class TestQueryUsesServerConversationId:
                     ]
                 ]
             )
+            mock_response.iter_lines.return_value = body.splitlines()
             mock_response.raise_for_status = lambda: None
 
             result = mixin.query("nb-123", "Hello?", source_ids=["src-1"])
 
-        mock_client_class.assert_called_once_with(
-            timeout=120.0,
-            cookies=ANY,
-            headers={"Content-Type": "application/x-www-form-urlencoded;charset=UTF-8"},
-        )
+        mock_http.stream.assert_called_once_with("POST", ANY, content=ANY, timeout=120.0)
         assert result["conversation_id"] == "server-conv-id"
 
     def test_falls_back_to_uuid_when_no_server_id(self):
@@ -181,10 +179,11 @@ class TestQueryUsesServerConversationId:
         mixin = self._make_mixin()
         with (
             patch.object(mixin, "get_conversation_id", return_value=None),
-            patch("notebooklm_tools.core.conversation._httpx.Client") as mock_client_class,
+            patch.object(mixin, "_get_query_client") as mock_get_client,
         ):
-            mock_response = mock_client_class.return_value.__enter__.return_value.post.return_value
-            mock_response.text = ")]}'\n100\n" + json.dumps(
+            mock_http = mock_get_client.return_value
+            mock_response = mock_http.stream.return_value.__enter__.return_value
+            body = ")]}'\n100\n" + json.dumps(
                 [
                     [
                         "wrb.fr",
@@ -193,6 +192,7 @@ class TestQueryUsesServerConversationId:
                     ]
                 ]
             )
+            mock_response.iter_lines.return_value = body.splitlines()
             mock_response.raise_for_status = lambda: None
 
             result = mixin.query("nb-123", "Hello?", source_ids=["src-1"])
@@ -294,6 +294,11 @@ class TestBoundedConversationCache:
         assert stats["max_conversations"] == 3
         assert stats["max_chars_per_turn"] == 42
 
+    def test_max_bytes_env_override(self, monkeypatch):
+        monkeypatch.setenv("NOTEBOOKLM_CONVERSATION_MAX_BYTES", "4096")
+        mixin = ConversationMixin(cookies={"test": "cookie"}, csrf_token="test")
+        assert mixin.get_conversation_cache_stats()["max_bytes"] == 4096
+
     def test_invalid_env_falls_back_to_default(self, monkeypatch, caplog):
         """Unparseable env values fall back to the default and warn."""
         monkeypatch.setenv("NOTEBOOKLM_CONVERSATION_MAX_TURNS", "not-a-number")
@@ -307,6 +312,7 @@ class TestBoundedConversationCache:
         monkeypatch.setenv("NOTEBOOKLM_CONVERSATION_MAX_TURNS", "0")
         monkeypatch.setenv("NOTEBOOKLM_CONVERSATION_MAX_CONVS", "0")
         monkeypatch.setenv("NOTEBOOKLM_CONVERSATION_MAX_CHARS_PER_TURN", "0")
+        monkeypatch.setenv("NOTEBOOKLM_CONVERSATION_MAX_BYTES", "0")
         mixin = ConversationMixin(cookies={"test": "cookie"}, csrf_token="test")
         for i in range(100):
             mixin._cache_conversation_turn("c1", query=f"q{i}", answer=f"a{i}")
@@ -386,6 +392,88 @@ class TestBoundedConversationCache:
         assert stats["conversations"] == 3
         assert stats["total_turns"] == 6
 
+    def test_byte_accounting_tracks_inserts_trims_and_clears(self):
+        """total_bytes always equals the size of the cached turn text."""
+        mixin = ConversationMixin(cookies={"test": "cookie"}, csrf_token="test")
+        mixin._max_turns_per_conversation = 2
+        for cid in ("a", "b"):
+            for i in range(3):
+                mixin._cache_conversation_turn(cid, query=f"q{i}", answer="x" * (100 * i))
+        mixin.clear_conversation("a")
+
+        expected = sum(
+            mixin._turn_size(t) for turns in mixin._conversation_cache.values() for t in turns
+        )
+        stats = mixin.get_conversation_cache_stats()
+        assert stats["total_bytes"] == expected
+        assert stats["total_bytes"] > 0
+        assert stats["max_bytes"] == 256 * 1024 * 1024
+
+    def test_byte_cap_evicts_lru_conversations(self):
+        """Going over the byte budget evicts whole least-recently-used conversations."""
+        mixin = ConversationMixin(cookies={"test": "cookie"}, csrf_token="test")
+        for cid in ("a", "b", "c"):
+            mixin._cache_conversation_turn(cid, query="q", answer="x" * 1_000)
+        per_conv = mixin.get_conversation_cache_stats()["total_bytes"] // 3
+        mixin._max_cache_bytes = per_conv * 3
+        mixin.get_conversation_history("a")  # 'b' is now LRU
+
+        mixin._cache_conversation_turn("d", query="q", answer="x" * 1_000)
+
+        assert list(mixin._conversation_cache) == ["c", "a", "d"]
+        stats = mixin.get_conversation_cache_stats()
+        assert stats["total_bytes"] <= stats["max_bytes"]
+        assert stats["evictions"] == 1
+
+    def test_byte_cap_trims_oldest_turns_of_a_single_conversation(self):
+        """A lone conversation over budget keeps its newest turns, renumbered."""
+        mixin = ConversationMixin(cookies={"test": "cookie"}, csrf_token="test")
+        mixin._cache_conversation_turn("c1", query="q0", answer="x" * 1_000)
+        mixin._max_cache_bytes = mixin.get_conversation_cache_stats()["total_bytes"] * 2
+        for i in range(1, 5):
+            mixin._cache_conversation_turn("c1", query=f"q{i}", answer="x" * 1_000)
+
+        turns = mixin._conversation_cache["c1"]
+        assert [t.query for t in turns] == ["q3", "q4"]
+        assert [t.turn_number for t in turns] == [1, 2]
+        assert mixin.get_conversation_cache_stats()["total_bytes"] <= mixin._max_cache_bytes
+
+    def test_turn_cap_and_byte_cap_together_keep_what_fits(self):
+        """Turns dropped by the turn cap don't push the byte budget into evicting more."""
+        mixin = ConversationMixin(cookies={"test": "cookie"}, csrf_token="test")
+        mixin._max_turns_per_conversation = 3
+        for i in range(3):
+            mixin._cache_conversation_turn("c1", query=f"q{i}", answer="x" * 150)
+        mixin._max_cache_bytes = mixin.get_conversation_cache_stats()["total_bytes"] + 5
+
+        mixin._cache_conversation_turn("c1", query="q3", answer="x" * 150)
+
+        assert [t.query for t in mixin._conversation_cache["c1"]] == ["q1", "q2", "q3"]
+        stats = mixin.get_conversation_cache_stats()
+        assert stats["total_bytes"] <= stats["max_bytes"]
+
+    def test_turn_cap_does_not_evict_other_conversations(self):
+        """A turn-capped insert that fits once trimmed keeps the LRU conversation."""
+        mixin = ConversationMixin(cookies={"test": "cookie"}, csrf_token="test")
+        mixin._max_turns_per_conversation = 2
+        mixin._cache_conversation_turn("a", query="qa", answer="x" * 150)
+        for i in range(2):
+            mixin._cache_conversation_turn("b", query=f"q{i}", answer="x" * 150)
+        mixin._max_cache_bytes = mixin.get_conversation_cache_stats()["total_bytes"]
+
+        mixin._cache_conversation_turn("b", query="q2", answer="x" * 150)
+
+        assert list(mixin._conversation_cache) == ["a", "b"]
+        assert mixin.get_conversation_cache_stats()["evictions"] == 0
+
+    def test_byte_cap_keeps_newest_turn_even_if_oversized(self):
+        """The newest turn survives so follow-ups still have context."""
+        mixin = ConversationMixin(cookies={"test": "cookie"}, csrf_token="test")
+        mixin._max_cache_bytes = 10
+        mixin._cache_conversation_turn("c1", query="q0", answer="a0")
+        mixin._cache_conversation_turn("c1", query="q1", answer="a1")
+        assert [t.query for t in mixin._conversation_cache["c1"]] == ["q1"]
+
     def test_clear_conversation_still_works(self):
         """Clearing a conversation is independent of the new caps."""
         mixin = ConversationMixin(cookies={"test": "cookie"}, csrf_token="test")
@@ -744,6 +832,240 @@ class TestCitationExtraction:
         assert result == {}
 
 
+class TestIncrementalQueryParsing:
+    """Test the frame-at-a-time query response parser."""
+
+    _build_passage = staticmethod(TestCitationExtraction._build_passage)
+    _build_answer_inner = staticmethod(TestCitationExtraction._build_answer_inner)
+    _build_raw_response = staticmethod(TestCitationExtraction._build_raw_response)
+
+    def _make_mixin(self):
+        return ConversationMixin(cookies={"test": "cookie"}, csrf_token="test")
+
+    def _growing_response(self, steps: int) -> tuple[str, str]:
+        """Build a response whose answer frames grow cumulatively, like the real stream."""
+        chunks = []
+        answer = ""
+        for i in range(steps):
+            answer += f"Sentence {i} [{i + 1}]. "
+            passages = [self._build_passage(f"p{j}", f"src-{j % 3}") for j in range(i + 1)]
+            chunks.append(
+                json.dumps([["wrb.fr", None, self._build_answer_inner(answer, passages)]])
+            )
+        return self._build_raw_response(*chunks), answer
+
+    def test_citations_decoded_only_for_winning_frame(self):
+        """Deep citation extraction runs for the final frame's passages only, not per frame."""
+        mixin = self._make_mixin()
+        raw, final_answer = self._growing_response(10)
+
+        with patch.object(
+            ConversationMixin,
+            "_decode_passage_detail",
+            wraps=ConversationMixin._decode_passage_detail,
+        ) as spy:
+            answer, citation_data, conv_id = mixin._parse_query_response(raw)
+
+        # 10 passages in the winning frame; earlier frames' passages never decoded.
+        assert spy.call_count == 10
+        assert answer == final_answer
+        assert len(citation_data["citations"]) == 10
+        assert conv_id == "conv-id"
+
+    def test_on_answer_reports_each_longer_answer_frame(self):
+        """The live-display hook sees the answer grow, frame by frame."""
+        raw, final_answer = self._growing_response(3)
+        from notebooklm_tools.core.conversation import _QueryResponseParser
+
+        seen = []
+        parser = _QueryResponseParser(on_answer=seen.append)
+        for line in raw.splitlines():
+            parser.feed_line(line)
+
+        assert len(seen) == 3
+        assert seen[-1] == final_answer
+        assert all(len(a) < len(b) for a, b in zip(seen, seen[1:], strict=False))
+
+    def test_mid_stream_citations_reuse_decoded_passages(self):
+        """Snapshotting citations while streaming decodes each passage only once."""
+        from notebooklm_tools.core.conversation import _QueryResponseParser
+
+        raw, _ = self._growing_response(6)
+        parser = _QueryResponseParser()
+        with patch.object(
+            ConversationMixin,
+            "_decode_passage_detail",
+            wraps=ConversationMixin._decode_passage_detail,
+        ) as spy:
+            for line in raw.splitlines():
+                parser.feed_line(line)
+                parser.citation_data()
+            _, citation_data, _ = parser.finish()
+
+        assert spy.call_count == 6
+        assert citation_data["citations"] == {i + 1: f"src-{i % 3}" for i in range(6)}
+
+    def test_citation_index_groups_citations_by_source(self):
+        """The per-response index maps each source to its citation numbers."""
+        from notebooklm_tools.core.conversation import _CitationIndex
+
+        passages = [self._build_passage(f"p{i}", f"src-{i % 2}") for i in range(5)]
+        index = _CitationIndex()
+        data = index.build([None, None, None, passages, 1])
+
+        assert index.by_source == {"src-0": [1, 3, 5], "src-1": [2, 4]}
+        assert data["sources_used"] == ["src-0", "src-1"]
+        assert [r["citation_number"] for r in data["references"]] == [1, 2, 3, 4, 5]
+
+    def test_line_by_line_feed_matches_whole_body(self):
+        """Feeding lines as they arrive gives the same result as parsing the full body."""
+        from notebooklm_tools.core.conversation import _QueryResponseParser
+
+        mixin = self._make_mixin()
+        raw, _ = self._growing_response(5)
+
+        parser = _QueryResponseParser()
+        for line in raw.splitlines():
+            parser.feed_line(line)
+
+        assert parser.finish() == mixin._parse_query_response(raw)
+
+    def test_partial_answer_visible_mid_stream(self):
+        """The parser exposes the best answer so far before the stream ends."""
+        from notebooklm_tools.core.conversation import _QueryResponseParser
+
+        parser = _QueryResponseParser()
+        parser.feed_line(")]}'")
+        parser.feed_line("10")
+        parser.feed_line(json.dumps([["wrb.fr", None, self._build_answer_inner("Partial", [])]]))
+
+        assert parser.answer == "Partial"
+
+    def test_query_streams_response(self):
+        """query() reads the body through client.stream() rather than buffering post()."""
+        mixin = self._make_mixin()
+        raw, final_answer = self._growing_response(3)
+        with (
+            patch.object(mixin, "get_conversation_id", return_value="conv-id"),
+            patch.object(mixin, "_get_query_client") as mock_get_client,
+        ):
+            mock_http = mock_get_client.return_value
+            mock_response = mock_http.stream.return_value.__enter__.return_value
+            mock_response.iter_lines.return_value = iter(raw.splitlines())
+
+            result = mixin.query("nb-123", "Hello?", source_ids=["src-1"])
+
+        mock_http.stream.assert_called_once_with("POST", ANY, content=ANY, timeout=120.0)
+        mock_http.post.assert_not_called()
+        assert result["answer"] == final_answer
+        assert len(result["references"]) == 3
+
+
+class TestQueryMany:
+    """Test query_many() batching of independent questions against one notebook."""
+
+    def _make_mixin(self):
+        return ConversationMixin(cookies={"test": "cookie"}, csrf_token="test")
+
+    def test_resolves_sources_once_and_uses_fresh_conversations(self):
+        mixin = self._make_mixin()
+        mixin.get_notebook = MagicMock(return_value=[["Title", [[["src-1"]], [["src-2"]]]]])
+        seen: list[dict] = []
+
+        def fake_query(notebook_id, question, **kwargs):
+            seen.append(kwargs)
+            return {"answer": f"A: {question}", "conversation_id": kwargs["conversation_id"]}
+
+        with (
+            patch.object(mixin, "_query", side_effect=fake_query),
+            patch.object(mixin, "get_conversation_id") as mock_conv,
+        ):
+            results = list(mixin.query_many("nb-1", ["q1", "q2", "q3"], concurrency=2))
+
+        mixin.get_notebook.assert_called_once_with("nb-1")
+        mock_conv.assert_not_called()
+        assert sorted(r["index"] for r in results) == [0, 1, 2]
+        assert all(kw["source_ids"] == ["src-1", "src-2"] for kw in seen)
+        assert len({kw["conversation_id"] for kw in seen}) == 3
+        assert all(kw["cache_turn"] is False for kw in seen)
+        assert all(r["is_follow_up"] is False for r in results)
+        by_index = {r["index"]: r for r in results}
+        assert by_index[1]["question"] == "q2"
+        assert by_index[1]["answer"] == "A: q2"
+
+    def test_failed_question_reported_without_stopping_batch(self):
+        mixin = self._make_mixin()
+
+        def fake_query(notebook_id, question, **kwargs):
+            if question == "bad":
+                raise QueryRejectedError(error_code=3)
+            return {"answer": "ok"}
+
+        with patch.object(mixin, "_query", side_effect=fake_query):
+            results = list(mixin.query_many("nb-1", ["good", "bad"], source_ids=["s"]))
+
+        by_question = {r["question"]: r for r in results}
+        assert by_question["good"]["answer"] == "ok"
+        assert "error code 3" in by_question["bad"]["error"]
+
+    def test_concurrency_is_bounded(self):
+        import threading
+        import time
+
+        mixin = self._make_mixin()
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def fake_query(notebook_id, question, **kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return {"answer": question}
+
+        with patch.object(mixin, "_query", side_effect=fake_query):
+            results = list(
+                mixin.query_many(
+                    "nb-1", [f"q{i}" for i in range(12)], source_ids=["s"], concurrency=3
+                )
+            )
+
+        assert len(results) == 12
+        assert 1 < peak <= 3
+
+    def test_batch_does_not_evict_cached_conversations(self):
+        mixin = self._make_mixin()
+        mixin._max_conversations = 3
+        mixin._cache_conversation_turn("real", query="q", answer="a")
+        response = MagicMock()
+        response.iter_lines.return_value = []
+        client = MagicMock()
+        client.stream.return_value.__enter__.return_value = response
+
+        with (
+            patch.object(mixin, "_get_query_client", return_value=client),
+            patch(
+                "notebooklm_tools.core.conversation._QueryResponseParser.finish",
+                side_effect=lambda: ("answer", {}, None),
+            ),
+        ):
+            results = list(mixin.query_many("nb-1", [f"q{i}" for i in range(20)], source_ids=["s"]))
+
+        assert len(results) == 20
+        assert all(r["turn_number"] == 1 for r in results)
+        assert list(mixin._conversation_cache) == ["real"]
+
+    def test_empty_question_list_yields_nothing(self):
+        mixin = self._make_mixin()
+        with patch.object(mixin, "_query") as mock_query:
+            assert list(mixin.query_many("nb-1", [])) == []
+        mock_query.assert_not_called()
+
+
 class TestShortAnswerRegression:
     """Regression tests for issue #214: short answer chunks must not be discarded.
 
@@ -1,14 +1,21 @@
 #!/usr/bin/env python3
 """Tests for DownloadMixin."""
 
+import asyncio
+import json
+import time
 from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
 import pytest
 
 from notebooklm_tools.core.base import BaseClient
-from notebooklm_tools.core.download import DownloadMixin
-from notebooklm_tools.core.errors import ArtifactDownloadError
+from notebooklm_tools.core.download import (
+    DownloadMixin,
+    limit_download_hosts,
+    use_artifact_snapshots,
+)
+from notebooklm_tools.core.errors import ArtifactDownloadError, ClientAuthenticationError
 
 
 class TestDownloadMixinImport:
@@ -200,6 +207,7 @@ class TestDownloadMixinMethods:
             "https://example.com/audio.m4a",
             "/tmp/audio.m4a",
             None,
+            segments=1,
         )
 
     @pytest.mark.asyncio
@@ -225,8 +233,8 @@ class TestDownloadMixinMethods:
 
         assert result == "/tmp/audio.m4a"
         assert mixin._list_raw.call_count == 2
-        mixin._download_url.assert_any_await(first_url, "/tmp/audio.m4a", None)
-        mixin._download_url.assert_any_await(second_url, "/tmp/audio.m4a", None)
+        mixin._download_url.assert_any_await(first_url, "/tmp/audio.m4a", None, segments=1)
+        mixin._download_url.assert_any_await(second_url, "/tmp/audio.m4a", None, segments=1)
 
     @pytest.mark.asyncio
     async def test_download_audio_does_not_retry_unrelated_404(self):
@@ -246,7 +254,7 @@ class TestDownloadMixinMethods:
 
         assert exc_info.value is non_retryable_error
         assert mixin._list_raw.call_count == 1
-        mixin._download_url.assert_awaited_once_with(url, "/tmp/audio.m4a", None)
+        mixin._download_url.assert_awaited_once_with(url, "/tmp/audio.m4a", None, segments=1)
 
     @pytest.mark.asyncio
     async def test_download_audio_reports_propagation_after_retry_exhaustion(self):
@@ -268,6 +276,59 @@ class TestDownloadMixinMethods:
         assert mixin._list_raw.call_count == 2
         assert mixin._download_url.await_count == 2
 
+    @pytest.mark.asyncio
+    async def test_stream_audio_retries_transient_404_before_first_chunk(self):
+        mixin = DownloadMixin(cookies={"test": "cookie"}, csrf_token="test")
+        first_url = "https://lh3.googleusercontent.com/notebooklm/audio=m140-dv"
+        second_url = "https://lh3.googleusercontent.com/notebooklm/audio2=m140-dv"
+        retryable_error = self._download_error(
+            404,
+            "https://lh3.googleusercontent.com/rd-notebooklm/audio=s512-m140-dv",
+        )
+        requested = []
+
+        async def stream_url(url, chunk_size=65536):
+            requested.append(url)
+            if url == first_url:
+                raise retryable_error
+            yield b"ab"
+            yield b"cd"
+
+        mixin._list_raw = Mock(
+            side_effect=[
+                [self._audio_artifact(first_url)],
+                [self._audio_artifact(second_url)],
+            ]
+        )
+        mixin.stream_url = stream_url
+        mixin._AUDIO_DOWNLOAD_RETRY_DELAYS = (0,)
+
+        chunks = [c async for c in mixin.stream_artifact("nb-1", "audio", "art-1")]
+
+        assert chunks == [b"ab", b"cd"]
+        assert requested == [first_url, second_url]
+
+    @pytest.mark.asyncio
+    async def test_stream_audio_does_not_retry_unrelated_404(self):
+        mixin = DownloadMixin(cookies={"test": "cookie"}, csrf_token="test")
+        url = "https://lh3.googleusercontent.com/notebooklm/audio=m140-dv"
+        error = self._download_error(404, "https://example.com/not-found")
+
+        async def stream_url(url, chunk_size=65536):
+            raise error
+            yield b""  # pragma: no cover - makes this an async generator
+
+        mixin._list_raw = Mock(return_value=[self._audio_artifact(url)])
+        mixin.stream_url = stream_url
+        mixin._AUDIO_DOWNLOAD_RETRY_DELAYS = (0,)
+
+        with pytest.raises(ArtifactDownloadError) as exc_info:
+            async for _ in mixin.stream_artifact("nb-1", "audio", "art-1"):
+                pass
+
+        assert exc_info.value is error
+        assert mixin._list_raw.call_count == 1
+
 
 class TestDownloadUrlCookies:
     """Cookie handling for cross-domain artifact downloads."""
@@ -297,6 +358,7 @@ class TestDownloadUrlCookies:
         captured = {}
 
         class MockStreamResponse:
+            status_code = 200
             headers = {
                 "content-length": "4",
                 "content-type": "application/octet-stream",
@@ -325,7 +387,7 @@ class TestDownloadUrlCookies:
             async def __aexit__(self, exc_type, exc, tb):
                 return None
 
-            def stream(self, method, url):
+            def stream(self, method, url, headers=None):
                 return MockStreamResponse()
 
         output = tmp_path / "out.bin"
@@ -348,3 +410,656 @@ class TestDownloadUrlCookies:
         headers = captured["headers"]
         assert headers.get("Sec-Fetch-Site") == "cross-site"
         assert headers.get("Referer") == f"{mixin._get_base_url()}/"
+
+
+class TestDownloadUrlResume:
+    """Resuming interrupted downloads with Range/If-Range."""
+
+    PAYLOAD = bytes(range(256)) * 40  # 10 KB
+
+    def _mixin(self) -> DownloadMixin:
+        mixin = DownloadMixin(cookies={"SID": "sid"}, csrf_token="token")
+        mixin._DOWNLOAD_RESUME_DELAY = 0
+        return mixin
+
+    def _server(self, requests: list, drop_after: list[int] | None = None, etag='"v1"'):
+        """Range-capable handler; the n-th response drops after drop_after[n] bytes."""
+        drops = list(drop_after or [])
+        payload = self.PAYLOAD
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            headers = {"etag": etag, "content-type": "video/mp4", "accept-ranges": "bytes"}
+            start, end = 0, len(payload) - 1
+            range_header = request.headers.get("range")
+            if range_header and request.headers.get("if-range", etag) == etag:
+                first, _, last = range_header.removeprefix("bytes=").partition("-")
+                start, end = int(first), int(last) if last else end
+                headers["content-range"] = f"bytes {start}-{end}/{len(payload)}"
+            body = payload[start : end + 1]
+            headers["content-length"] = str(len(body))
+            cut = drops.pop(0) if drops else None
+
+            async def stream():
+                if cut is None:
+                    yield body
+                    return
+                yield body[:cut]
+                raise httpx.ReadError("connection reset", request=request)
+
+            status = 206 if "content-range" in headers else 200
+            return httpx.Response(status, headers=headers, content=stream())
+
+        return handler
+
+    def _patch_client(self, handler):
+        real_client = httpx.AsyncClient
+        transport = httpx.MockTransport(handler)
+        return patch(
+            "notebooklm_tools.core.download.httpx.AsyncClient",
+            lambda **kwargs: real_client(transport=transport, **kwargs),
+        )
+
+    @pytest.mark.asyncio
+    async def test_dropped_connection_resumes_with_range(self, tmp_path):
+        requests = []
+        output = tmp_path / "video.mp4"
+
+        with self._patch_client(self._server(requests, drop_after=[4000])):
+            await self._mixin()._download_url("https://cdn.example/v", str(output), chunk_size=1000)
+
+        assert output.read_bytes() == self.PAYLOAD
+        assert len(requests) == 2
+        assert "range" not in requests[0].headers
+        assert requests[1].headers["range"] == "bytes=4000-"
+        assert requests[1].headers["if-range"] == '"v1"'
+        assert not (tmp_path / "video.mp4.tmp").exists()
+        assert not (tmp_path / "video.mp4.tmp.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_shared_client_serves_every_download(self, tmp_path):
+        requests = []
+        real_client = httpx.AsyncClient
+        transport = httpx.MockTransport(self._server(requests))
+        opened = []
+
+        def make_client(**kwargs):
+            opened.append(real_client(transport=transport, **kwargs))
+            return opened[-1]
+
+        mixin = self._mixin()
+        with patch("notebooklm_tools.core.download.httpx.AsyncClient", make_client):
+            async with mixin.share_download_client():
+                for name in ("a.mp4", "b.mp4"):
+                    await mixin._download_url("https://cdn.example/v", str(tmp_path / name))
+                chunks = [c async for c in mixin.stream_url("https://cdn.example/v")]
+            await mixin._download_url("https://cdn.example/v", str(tmp_path / "c.mp4"))
+
+        assert b"".join(chunks) == self.PAYLOAD
+        assert (tmp_path / "b.mp4").read_bytes() == self.PAYLOAD
+        assert len(requests) == 4
+        # One client for the three downloads inside, one for the call outside.
+        assert len(opened) == 2
+        assert all(client.is_closed for client in opened)
+
+    @pytest.mark.asyncio
+    async def test_gzip_encoded_body_is_not_length_checked_or_resumed(self, tmp_path):
+        import gzip
+
+        encoded = gzip.compress(self.PAYLOAD)
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            headers = {
+                "etag": '"v1"',
+                "content-type": "application/pdf",
+                "content-encoding": "gzip",
+                "content-length": str(len(encoded)),
+            }
+            return httpx.Response(200, headers=headers, content=encoded)
+
+        output = tmp_path / "deck.pdf"
+        with self._patch_client(handler):
+            await self._mixin()._download_url("https://cdn.example/d", str(output))
+
+        # Content-Length counts gzip bytes; the decoded file is larger.
+        assert output.read_bytes() == self.PAYLOAD
+        assert len(requests) == 1
+        assert not (tmp_path / "deck.pdf.tmp.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_partial_is_kept_and_resumed_on_next_call(self, tmp_path):
+        requests = []
+        output = tmp_path / "video.mp4"
+        mixin = self._mixin()
+        mixin._DOWNLOAD_RESUME_ATTEMPTS = 0
+
+        with (
+            self._patch_client(self._server(requests, drop_after=[3000])),
+            pytest.raises(ArtifactDownloadError),
+        ):
+            await mixin._download_url("https://cdn.example/v", str(output), chunk_size=1000)
+
+        assert (tmp_path / "video.mp4.tmp").stat().st_size == 3000
+        assert (tmp_path / "video.mp4.tmp.json").exists()
+
+        with self._patch_client(self._server(requests)):
+            await mixin._download_url("https://cdn.example/v", str(output))
+
+        assert requests[-1].headers["range"] == "bytes=3000-"
+        assert output.read_bytes() == self.PAYLOAD
+
+    @pytest.mark.asyncio
+    async def test_changed_file_restarts_from_zero(self, tmp_path):
+        """If-Range mismatch: the server sends the whole new file with a 200."""
+        output = tmp_path / "video.mp4"
+        (tmp_path / "video.mp4.tmp").write_bytes(b"stale" * 100)
+        (tmp_path / "video.mp4.tmp.json").write_text(
+            json.dumps({"url": "https://cdn.example/v", "etag": '"old"', "length": 10240})
+        )
+        requests = []
+
+        with self._patch_client(self._server(requests, etag='"v2"')):
+            await self._mixin()._download_url("https://cdn.example/v", str(output))
+
+        assert requests[0].headers["range"] == "bytes=500-"
+        assert output.read_bytes() == self.PAYLOAD
+
+    @pytest.mark.asyncio
+    async def test_partial_without_sidecar_is_discarded(self, tmp_path):
+        output = tmp_path / "video.mp4"
+        (tmp_path / "video.mp4.tmp").write_bytes(b"orphan")
+        requests = []
+
+        with self._patch_client(self._server(requests)):
+            await self._mixin()._download_url("https://cdn.example/v", str(output))
+
+        assert "range" not in requests[0].headers
+        assert output.read_bytes() == self.PAYLOAD
+
+    @pytest.mark.asyncio
+    async def test_short_body_is_rejected(self, tmp_path):
+        output = tmp_path / "video.mp4"
+        mixin = self._mixin()
+        mixin._DOWNLOAD_RESUME_ATTEMPTS = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            # Claims 10 bytes, closes cleanly after 4 (no ETag, so not resumable)
+            return httpx.Response(200, headers={"content-length": "10"}, content=b"data")
+
+        with self._patch_client(handler), pytest.raises(ArtifactDownloadError):
+            await mixin._download_url("https://cdn.example/v", str(output))
+
+        assert not output.exists()
+        assert not (tmp_path / "video.mp4.tmp").exists()
+
+
+class TestDownloadUrlSegmented:
+    """Segmented downloads: concurrent byte ranges into a preallocated file."""
+
+    PAYLOAD = bytes(range(256)) * 40  # 10 KB
+
+    def _mixin(self) -> DownloadMixin:
+        mixin = DownloadMixin(cookies={"SID": "sid"}, csrf_token="token")
+        mixin._DOWNLOAD_RESUME_DELAY = 0
+        mixin._MIN_SEGMENT_BYTES = 1000
+        return mixin
+
+    _server = TestDownloadUrlResume._server
+    _patch_client = TestDownloadUrlResume._patch_client
+
+    @pytest.mark.asyncio
+    async def test_fetches_ranges_concurrently(self, tmp_path):
+        requests = []
+        output = tmp_path / "video.mp4"
+        progress = []
+
+        with self._patch_client(self._server(requests)):
+            await self._mixin()._download_url(
+                "https://cdn.example/v",
+                str(output),
+                lambda done, total: progress.append((done, total)),
+                segments=4,
+            )
+
+        assert output.read_bytes() == self.PAYLOAD
+        ranges = [r.headers["range"] for r in requests]
+        assert ranges == [
+            "bytes=0-0",
+            "bytes=0-2559",
+            "bytes=2560-5119",
+            "bytes=5120-7679",
+            "bytes=7680-10239",
+        ]
+        assert all(r.headers["if-range"] == '"v1"' for r in requests[1:])
+        assert progress[-1] == (len(self.PAYLOAD), len(self.PAYLOAD))
+        assert not (tmp_path / "video.mp4.tmp").exists()
+
+    @pytest.mark.asyncio
+    async def test_interrupted_segment_resumes_its_range(self, tmp_path):
+        requests = []
+        output = tmp_path / "video.mp4"
+
+        # Probe is served whole; the first segment drops after 1000 bytes.
+        with self._patch_client(self._server(requests, drop_after=[None, 1000])):
+            await self._mixin()._download_url(
+                "https://cdn.example/v", str(output), chunk_size=500, segments=2
+            )
+
+        assert output.read_bytes() == self.PAYLOAD
+        assert "bytes=1000-5119" in [r.headers["range"] for r in requests]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_single_stream_without_range_support(self, tmp_path):
+        output = tmp_path / "video.mp4"
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, content=self.PAYLOAD)
+
+        with self._patch_client(handler):
+            await self._mixin()._download_url("https://cdn.example/v", str(output), segments=4)
+
+        assert output.read_bytes() == self.PAYLOAD
+        assert len(requests) == 2  # probe, then one plain GET
+        assert "range" not in requests[1].headers
+
+    @pytest.mark.asyncio
+    async def test_small_files_are_not_split(self, tmp_path):
+        output = tmp_path / "image.png"
+        requests = []
+        mixin = self._mixin()
+        mixin._MIN_SEGMENT_BYTES = len(self.PAYLOAD)
+
+        with self._patch_client(self._server(requests)):
+            await mixin._download_url("https://cdn.example/v", str(output), segments=4)
+
+        assert output.read_bytes() == self.PAYLOAD
+        assert [r.headers.get("range") for r in requests] == ["bytes=0-0", None]
+
+
+class TestBulkDownloadHelpers:
+    """Artifact snapshots and per-host limits used by bulk downloads."""
+
+    def _mixin(self) -> DownloadMixin:
+        return DownloadMixin(cookies={"SID": "sid"}, csrf_token="token")
+
+    def test_downloadable_artifacts_classifies_completed_artifacts(self):
+        mixin = self._mixin()
+        snapshot = {
+            "artifacts": [
+                ["a1", "Podcast", mixin.STUDIO_TYPE_AUDIO, [], 3],
+                ["r1", "Brief", mixin.STUDIO_TYPE_REPORT, [], 3],
+                ["r2", "Draft", mixin.STUDIO_TYPE_REPORT, [], 1],  # still generating
+                ["q1", "Quiz", mixin.STUDIO_TYPE_FLASHCARDS, [], 3, 0, 0, 0, 0, ["", [2]]],
+                ["f1", "Cards", mixin.STUDIO_TYPE_FLASHCARDS, [], 3, 0, 0, 0, 0, ["", [1]]],
+                ["x1", "Unknown", 99, [], 3],
+            ],
+            "mind_maps": [
+                ["m1", ["m1", "{}", [], None, "Map"]],
+                ["m2", None, 2],  # deleted
+            ],
+        }
+
+        items = mixin.downloadable_artifacts(snapshot)
+
+        assert [(i["artifact_id"], i["type"]) for i in items] == [
+            ("a1", "audio"),
+            ("r1", "report"),
+            ("q1", "quiz"),
+            ("f1", "flashcards"),
+            ("m1", "mind_map"),
+        ]
+        assert items[-1]["title"] == "Map"
+
+    def test_snapshot_serves_artifact_lookups(self, tmp_path):
+        mixin = self._mixin()
+        mixin._call_rpc = Mock(side_effect=AssertionError("list RPC must not run"))
+        report = ["r1", "Brief", mixin.STUDIO_TYPE_REPORT, [], 3, 0, 0, ["# Brief"]]
+        mind_map = ["m1", ["m1", '{"name": "root"}', [], None, "Map"]]
+        snapshots = {"nb-1": {"artifacts": [report], "mind_maps": [mind_map]}}
+
+        with use_artifact_snapshots(snapshots):
+            mixin.download_report("nb-1", str(tmp_path / "r.md"))
+            mixin.download_mind_map("nb-1", str(tmp_path / "m.json"))
+
+        assert (tmp_path / "r.md").read_text() == "# Brief"
+        assert json.loads((tmp_path / "m.json").read_text()) == {"name": "root"}
+
+    @pytest.mark.asyncio
+    async def test_host_slot_limits_concurrency_per_host(self):
+        mixin = self._mixin()
+        active: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        async def fetch(url: str) -> None:
+            host = url.split("/")[2]
+            async with mixin._host_slot(url):
+                active[host] = active.get(host, 0) + 1
+                peak[host] = max(peak.get(host, 0), active[host])
+                await asyncio.sleep(0.01)
+                active[host] -= 1
+
+        with limit_download_hosts(2):
+            await asyncio.gather(
+                *(fetch(f"https://a.example/{i}") for i in range(6)),
+                *(fetch(f"https://b.example/{i}") for i in range(3)),
+            )
+
+        assert peak == {"a.example": 2, "b.example": 2}
+
+
+class TestArtifactVersion:
+    """Resolving which artifact version a download would fetch, for caching."""
+
+    def _mixin(self) -> DownloadMixin:
+        return DownloadMixin(cookies={"SID": "sid"}, csrf_token="token")
+
+    def test_marker_ignores_rotating_urls(self):
+        first = ["i1", "Chart", 7, [], 3, [None, [["https://lh3.example/a?sig=1"]]]]
+        second = ["i1", "Chart", 7, [], 3, [None, [["https://lh3.example/a?sig=2"]]]]
+        revised = ["i1", "Chart v2", 7, [], 3, [None, [["https://lh3.example/a?sig=3"]]]]
+
+        marker = DownloadMixin.artifact_marker(first)
+
+        assert DownloadMixin.artifact_marker(second) == marker
+        assert DownloadMixin.artifact_marker(revised) != marker
+
+    def test_select_artifact_matches_download_selection(self):
+        mixin = self._mixin()
+        reports = [
+            ["r0", "Draft", mixin.STUDIO_TYPE_REPORT, [], 1],
+            ["r1", "Brief", mixin.STUDIO_TYPE_REPORT, [], 3],
+            ["r2", "Other", mixin.STUDIO_TYPE_REPORT, [], 3],
+        ]
+        snapshots = {"nb-1": {"artifacts": reports, "mind_maps": [["m1", ["m1", "{}"]]]}}
+
+        with use_artifact_snapshots(snapshots):
+            assert mixin.select_artifact("nb-1", "report") == (
+                "r1",
+                DownloadMixin.artifact_marker(reports[1]),
+            )
+            assert mixin.select_artifact("nb-1", "report", "r2")[0] == "r2"
+            assert mixin.select_artifact("nb-1", "report", "r0") is None
+            assert mixin.select_artifact("nb-1", "video") is None
+            assert mixin.select_artifact("nb-1", "mind_map")[0] == "m1"
+
+
+async def _max_loop_lag(coro, tick: float = 0.005) -> float:
+    """Run `coro` and return the longest the event loop was blocked meanwhile."""
+    lag = 0.0
+    done = False
+
+    async def ticker():
+        nonlocal lag
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(tick)
+            lag = max(lag, time.perf_counter() - start - tick)
+
+    task = asyncio.create_task(ticker())
+    try:
+        await coro
+    finally:
+        done = True
+        await task
+    return lag
+
+
+class TestDownloadDoesNotBlockEventLoop:
+    """Blocking RPCs and disk writes run off the event loop."""
+
+    BLOCK = 0.2  # seconds each blocking call takes
+    MAX_LAG = 0.1
+
+    PAYLOAD = bytes(range(256)) * 16  # 4 KB
+
+    def _mixin(self) -> DownloadMixin:
+        mixin = DownloadMixin(cookies={"SID": "sid"}, csrf_token="token")
+        mixin._MIN_SEGMENT_BYTES = 1024
+        return mixin
+
+    def _patch_client(self):
+        payload = self.PAYLOAD
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            headers = {"etag": '"v1"', "content-type": "video/mp4"}
+            start, end = 0, len(payload) - 1
+            if range_header := request.headers.get("range"):
+                first, _, last = range_header.removeprefix("bytes=").partition("-")
+                start, end = int(first), int(last) if last else end
+                headers["content-range"] = f"bytes {start}-{end}/{len(payload)}"
+            body = payload[start : end + 1]
+            status = 206 if range_header else 200
+            return httpx.Response(status, headers=headers, content=body)
+
+        real_client = httpx.AsyncClient
+        transport = httpx.MockTransport(handler)
+        return patch(
+            "notebooklm_tools.core.download.httpx.AsyncClient",
+            lambda **kwargs: real_client(transport=transport, **kwargs),
+        )
+
+    @pytest.mark.asyncio
+    async def test_artifact_list_rpc_runs_off_loop(self, tmp_path):
+        mixin = self._mixin()
+        media = [["https://cdn.example/v", 4, "video/mp4"]]
+        video = ["v1", "Video", mixin.STUDIO_TYPE_VIDEO, [], 3, 0, 0, 0, [media]]
+
+        def slow_list(notebook_id):
+            time.sleep(self.BLOCK)
+            return [video]
+
+        mixin._list_raw = slow_list
+        mixin._download_url = AsyncMock(side_effect=lambda url, path, *a, **kw: path)
+
+        # Two downloads overlap their list RPCs instead of queueing on the loop
+        start = time.perf_counter()
+        lag = await _max_loop_lag(
+            asyncio.gather(
+                mixin.download_video("nb-1", str(tmp_path / "a.mp4")),
+                mixin.download_video("nb-2", str(tmp_path / "b.mp4")),
+            )
+        )
+
+        assert lag < self.MAX_LAG
+        assert time.perf_counter() - start < 2 * self.BLOCK
+        assert mixin._download_url.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_writes_run_off_loop(self, tmp_path):
+        real_open = open
+
+        class SlowFile:
+            def __init__(self, path, mode):
+                self._f = real_open(path, mode)
+
+            def write(self, data):
+                time.sleep(self.block)
+                return self._f.write(data)
+
+            def close(self):
+                self._f.close()
+
+        SlowFile.block = self.BLOCK / 4
+        output = tmp_path / "video.mp4"
+
+        with (
+            self._patch_client(),
+            patch("notebooklm_tools.core.download.open", SlowFile, create=True),
+        ):
+            lag = await _max_loop_lag(
+                self._mixin()._download_url("https://cdn.example/v", str(output), chunk_size=1024)
+            )
+
+        assert output.read_bytes() == self.PAYLOAD
+        assert lag < SlowFile.block
+
+    @pytest.mark.asyncio
+    async def test_segment_writes_run_off_loop(self, tmp_path):
+        real_write_at = DownloadMixin._write_at
+        block = self.BLOCK / 4
+
+        def slow_write_at(fd, data, position):
+            time.sleep(block)
+            real_write_at(fd, data, position)
+
+        output = tmp_path / "video.mp4"
+        mixin = self._mixin()
+        mixin._write_at = slow_write_at
+
+        with self._patch_client():
+            lag = await _max_loop_lag(
+                mixin._download_url(
+                    "https://cdn.example/v", str(output), chunk_size=1024, segments=4
+                )
+            )
+
+        assert output.read_bytes() == self.PAYLOAD
+        assert lag < block
+
+
+class TestStreamArtifact:
+    """Streaming artifact bytes without a temp file."""
+
+    def _mixin(self) -> DownloadMixin:
+        return DownloadMixin(
+            cookies=[
+                {"name": "SID", "value": "sid", "domain": ".google.com", "path": "/"},
+                {"name": "OSID", "value": "osid", "domain": ".google.com", "path": "/"},
+            ],
+            csrf_token="token",
+        )
+
+    def _patch_client(self, handler):
+        real_client = httpx.AsyncClient
+        transport = httpx.MockTransport(handler)
+        return patch(
+            "notebooklm_tools.core.download.httpx.AsyncClient",
+            lambda **kwargs: real_client(transport=transport, **kwargs),
+        )
+
+    @pytest.mark.asyncio
+    async def test_stream_artifact_yields_media_bytes(self, tmp_path):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, headers={"content-type": "video/mp4"}, content=b"x" * 3000)
+
+        mixin = self._mixin()
+        media = [["https://cdn.google.com/v", 4, "video/mp4"]]
+        video = ["v1", "Video", mixin.STUDIO_TYPE_VIDEO, [], 3, 0, 0, 0, [media]]
+        snapshots = {"nb-1": {"artifacts": [video], "mind_maps": []}}
+
+        with self._patch_client(handler), use_artifact_snapshots(snapshots):
+            chunks = [c async for c in mixin.stream_artifact("nb-1", "video", chunk_size=1000)]
+
+        assert chunks == [b"x" * 1000] * 3
+        assert not list(tmp_path.iterdir())
+        cookie_header = requests[0].headers["cookie"]
+        assert "SID=sid" in cookie_header
+        assert "OSID" not in cookie_header
+        assert requests[0].headers["sec-fetch-site"] == "cross-site"
+
+    @pytest.mark.asyncio
+    async def test_login_redirect_raises(self):
+        def handler(request):
+            return httpx.Response(
+                200, headers={"content-type": "text/html"}, content=b"<!DOCTYPE html>Sign in"
+            )
+
+        with self._patch_client(handler), pytest.raises(ClientAuthenticationError):
+            async for _ in self._mixin().stream_url("https://cdn.example/a"):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_http_error_raises_download_error(self):
+        with (
+            self._patch_client(lambda request: httpx.Response(403)),
+            pytest.raises(ArtifactDownloadError, match="403"),
+        ):
+            async for _ in self._mixin().stream_url("https://cdn.example/a"):
+                pass
+
+
+class TestDataTableExport:
+    """Streaming data table decoding and CSV/JSONL export."""
+
+    def _mixin(self, *tables: list) -> DownloadMixin:
+        mixin = DownloadMixin(cookies={"test": "cookie"}, csrf_token="test")
+        artifacts = []
+        for i, rows in enumerate(tables):
+            artifact = [f"dt-{i}", "Table", mixin.STUDIO_TYPE_DATA_TABLE, [], 3]
+            artifact += [None] * 13 + [[[[[[None, None, None, None, [None, None, rows]]]]]]]
+            artifacts.append(artifact)
+        mixin._list_raw = Mock(return_value=artifacts)
+        return mixin
+
+    @staticmethod
+    def _row(*cells: str) -> list:
+        return [0, 9, [[0, len(c), [[0, len(c), [c]], [None, 1]]] for c in cells]]
+
+    def test_extract_cell_text_handles_deep_nesting_without_recursion(self):
+        cell: list = ["top"]
+        inner = cell
+        for _ in range(50_000):
+            inner.append([])
+            inner = inner[-1]
+        inner.append("bottom")
+
+        # Text deeper than 100 levels is ignored, as before, without hitting the recursion limit
+        assert DownloadMixin._extract_cell_text(cell) == "top"
+
+    def test_extract_cell_text_depth_cutoff(self):
+        cell: list = ["t0"]
+        for depth in range(1, 102):
+            cell = [cell, f"t{depth}"]
+
+        # "tN" sits 102 - N levels deep, so t0 and t1 are past the 100-level cutoff
+        assert DownloadMixin._extract_cell_text(cell).split() == [f"t{n}" for n in range(2, 102)]
+
+    def test_parse_data_table_pads_and_truncates_rows(self):
+        mixin = self._mixin()
+        rows = [self._row("a", "b"), self._row("1"), self._row("2", "3", "4")]
+        raw = [[[[[None, None, None, None, [None, None, rows]]]]]]
+
+        assert mixin._parse_data_table(raw) == (["a", "b"], [["1", ""], ["2", "3"]])
+
+    def test_download_csv(self, tmp_path):
+        mixin = self._mixin([self._row("Name", "Notes"), self._row("x", 'say "hi", ok')])
+        output = tmp_path / "out" / "table.csv"
+
+        assert mixin.download_data_table("nb-1", str(output)) == str(output)
+        assert output.read_bytes().decode("utf-8-sig") == 'Name,Notes\r\nx,"say ""hi"", ok"\r\n'
+
+    def test_download_jsonl(self, tmp_path):
+        mixin = self._mixin(
+            [self._row("a")],
+            [self._row("Name", "Count"), self._row("é", "1"), self._row("z", "2")],
+        )
+        output = tmp_path / "table.jsonl"
+
+        mixin.download_data_table("nb-1", str(output), "dt-1", output_format="jsonl")
+
+        lines = output.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"Name": "é", "Count": "1"},
+            {"Name": "z", "Count": "2"},
+        ]
+
+    def test_failed_export_leaves_no_file(self, tmp_path):
+        from notebooklm_tools.core.errors import ArtifactParseError
+
+        mixin = self._mixin([self._row("Name"), "not a row"])
+        output = tmp_path / "table.csv"
+
+        with pytest.raises(ArtifactParseError, match="No data rows"):
+            mixin.download_data_table("nb-1", str(output))
+        assert list(tmp_path.iterdir()) == []
+
+    def test_download_rejects_unknown_format(self, tmp_path):
+        with pytest.raises(ValueError, match="jsonl"):
+            self._mixin().download_data_table("nb-1", str(tmp_path / "t.xml"), output_format="xml")
@@ -0,0 +1,29 @@
+"""Tests for the local Drive sync record."""
+
+import time
+from unittest.mock import patch
+
+from notebooklm_tools.core.drive_sync_state import DriveSyncState
+
+
+def test_verified_within_window(tmp_path):
+    state = DriveSyncState(tmp_path / "drive_sync.sqlite3")
+    assert not state.verified_within("s1", "doc-1", 3600)
+
+    state.record("s1", "doc-1")
+
+    assert state.verified_within("s1", "doc-1", 3600)
+    with patch("notebooklm_tools.core.drive_sync_state.time.time", return_value=time.time() + 7200):
+        assert not state.verified_within("s1", "doc-1", 3600)
+    state.close()
+
+
+def test_changed_drive_document_is_rechecked(tmp_path):
+    state = DriveSyncState(tmp_path / "drive_sync.sqlite3")
+    state.record("s1", "doc-1", synced=True)
+    state.record("s1", "doc-1")
+
+    assert not state.verified_within("s1", "doc-2", 3600)
+    synced_at = state._conn.execute("SELECT synced_at FROM drive_sources").fetchone()[0]
+    assert synced_at is not None
+    state.close()
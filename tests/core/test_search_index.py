@@ -0,0 +1,67 @@
+"""Tests for the local FTS5 search index."""
+
+import pytest
+
+from notebooklm_tools.core.search_index import SearchIndex, build_match_query
+
+
+@pytest.fixture
+def index(tmp_path):
+    idx = SearchIndex(tmp_path / "search.sqlite3")
+    yield idx
+    idx.close()
+
+
+def _doc(title, content, source_type="pdf"):
+    return {"title": title, "content": content, "source_type": source_type}
+
+
+def test_build_match_query_quotes_terms():
+    assert build_match_query("C++ e-mail") == '"C++" "e-mail"'
+    assert build_match_query('say "hi"') == '"say" """hi"""'
+    assert build_match_query("retriev*") == '"retriev"*'
+    assert build_match_query("   ") == ""
+
+
+def test_search_ranks_and_snippets(index):
+    index.upsert("nb-1", "s1", _doc("Cooking", "A recipe that mentions attention once."))
+    index.upsert("nb-1", "s2", _doc("Attention", "Attention is all you need: attention heads."))
+    for n in range(3, 8):
+        index.upsert("nb-1", f"s{n}", _doc("Unrelated", "Nothing to see here."))
+
+    hits = index.search("attention")
+
+    assert [h["source_id"] for h in hits] == ["s2", "s1"]
+    assert hits[0]["score"] > hits[1]["score"]
+    assert "[attention]" in hits[1]["snippet"]
+    assert hits[0] == {**hits[0], "notebook_id": "nb-1", "title": "Attention", "source_type": "pdf"}
+
+
+def test_all_terms_prefix_and_stemming(index):
+    index.upsert("nb-1", "s1", _doc("A", "Retrieval augmented generation"))
+    index.upsert("nb-1", "s2", _doc("B", "Generation only"))
+
+    assert [h["source_id"] for h in index.search("retrieval generation")] == ["s1"]
+    assert [h["source_id"] for h in index.search("retriev*")] == ["s1"]
+    assert {h["source_id"] for h in index.search("generating")} == {"s1", "s2"}
+
+
+def test_notebook_filter_reindex_and_remove(index):
+    index.upsert("nb-1", "s1", _doc("A", "shared term"))
+    index.upsert("nb-2", "s2", _doc("B", "shared term"))
+
+    assert [h["source_id"] for h in index.search("shared", notebook_id="nb-2")] == ["s2"]
+    assert index.source_ids("nb-1") == {"s1"}
+
+    index.upsert("nb-1", "s1", _doc("A", "replaced text"))
+    assert [h["source_id"] for h in index.search("shared")] == ["s2"]
+    assert [h["source_id"] for h in index.search("replaced")] == ["s1"]
+
+    index.remove("s2")
+    assert index.search("shared") == []
+    assert index.source_ids("nb-2") == set()
+
+
+def test_persists_across_instances(tmp_path):
+    SearchIndex(tmp_path / "search.sqlite3").upsert("nb-1", "s1", _doc("A", "durable"))
+    assert SearchIndex(tmp_path / "search.sqlite3").search("durable")[0]["source_id"] == "s1"
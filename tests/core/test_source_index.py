@@ -0,0 +1,149 @@
+"""Tests for the content-hash source index and dedupe in the add methods."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from notebooklm_tools.core.source_index import (
+    SourceIndex,
+    file_key,
+    normalize_url,
+    text_key,
+    url_key,
+)
+from notebooklm_tools.core.sources import SourceMixin
+
+
+@pytest.fixture
+def index(tmp_path):
+    idx = SourceIndex(tmp_path / "index.sqlite3")
+    with patch("notebooklm_tools.core.sources.get_source_index", return_value=idx):
+        yield idx
+    idx.close()
+
+
+@pytest.fixture
+def mixin():
+    m = SourceMixin.__new__(SourceMixin)
+    m._state_lock = threading.Lock()
+    m.get_notebook_sources_with_types = MagicMock(return_value=[])
+    return m
+
+
+class TestContentKeys:
+    def test_normalize_url(self):
+        assert normalize_url(" HTTPS://Example.COM:443/docs/#intro ") == "https://example.com/docs"
+        assert normalize_url("http://example.com:8080/a?q=1") == "http://example.com:8080/a?q=1"
+
+    def test_url_key_ignores_trivial_differences(self):
+        assert url_key("https://example.com/a/") == url_key("https://EXAMPLE.com/a#top")
+        assert url_key("https://example.com/a") != url_key("https://example.com/b")
+
+    def test_text_key_ignores_indentation_and_padding(self):
+        assert text_key("  hello\n  world\n") == text_key("hello\nworld")
+
+    def test_file_key_hashes_bytes(self, tmp_path):
+        a, b = tmp_path / "a.txt", tmp_path / "b.txt"
+        a.write_bytes(b"same")
+        b.write_bytes(b"same")
+        assert file_key(a) == file_key(b)
+        b.write_bytes(b"different")
+        assert file_key(a) != file_key(b)
+
+
+class TestSourceIndex:
+    def test_record_lookup_forget(self, tmp_path):
+        idx = SourceIndex(tmp_path / "index.sqlite3")
+        idx.record("nb-1", "url:abc", "src-1", "https://a")
+        assert idx.lookup("nb-1", "url:abc") == "src-1"
+        assert idx.lookup("nb-2", "url:abc") is None
+        idx.forget("nb-1", "url:abc")
+        assert idx.lookup("nb-1", "url:abc") is None
+        idx.close()
+
+    def test_persists_across_instances(self, tmp_path):
+        SourceIndex(tmp_path / "index.sqlite3").record("nb-1", "k", "src-1")
+        assert SourceIndex(tmp_path / "index.sqlite3").lookup("nb-1", "k") == "src-1"
+
+
+class TestDedupe:
+    def test_add_url_source_skips_indexed_live_source(self, index, mixin):
+        index.record("nb-1", url_key("https://a.com"), "src-1")
+        mixin.get_notebook_sources_with_types.return_value = [
+            {"id": "src-1", "title": "A", "status": 2}
+        ]
+        mixin._add_url_source_v1 = MagicMock()
+
+        result = mixin.add_url_source("nb-1", "https://a.com/", dedupe=True)
+
+        assert result == {"id": "src-1", "title": "A", "deduplicated": True}
+        mixin._add_url_source_v1.assert_not_called()
+
+    def test_stale_entry_is_dropped_and_source_re_added(self, index, mixin):
+        index.record("nb-1", url_key("https://a.com"), "deleted-src")
+        mixin._source_rpc_version = "v1"
+        mixin._add_url_source_v1 = MagicMock(return_value="raw")
+        mixin._parse_source_result = MagicMock(return_value={"id": "src-2", "title": "A"})
+
+        result = mixin.add_url_source("nb-1", "https://a.com", dedupe=True)
+
+        assert result == {"id": "src-2", "title": "A"}
+        mixin._add_url_source_v1.assert_called_once()
+        assert index.lookup("nb-1", url_key("https://a.com")) == "src-2"
+
+    def test_add_url_sources_sends_only_new_urls(self, index, mixin):
+        index.record("nb-1", url_key("https://a.com"), "src-a")
+        mixin.get_notebook_sources_with_types.return_value = [
+            {"id": "src-a", "title": "A", "status": 2}
+        ]
+        mixin._source_rpc_version = "v1"
+        mixin._add_url_sources_v1 = MagicMock(return_value="raw")
+        mixin._parse_source_results = MagicMock(return_value=[{"id": "src-b", "title": "B"}])
+
+        results = mixin.add_url_sources("nb-1", ["https://a.com", "https://b.com"], dedupe=True)
+
+        assert [r["id"] for r in results] == ["src-a", "src-b"]
+        assert results[0]["deduplicated"] is True
+        assert mixin._add_url_sources_v1.call_args.args[1] == ["https://b.com"]
+        assert index.lookup("nb-1", url_key("https://b.com")) == "src-b"
+        mixin.get_notebook_sources_with_types.assert_called_once_with("nb-1")
+
+    def test_add_file_uploads_once_then_skips(self, index, mixin, tmp_path):
+        path = tmp_path / "notes.txt"
+        path.write_text("hello", encoding="utf-8")
+        mixin._upload_local_file = MagicMock(return_value="src-f")
+
+        first = mixin.add_file("nb-1", path, dedupe=True)
+        mixin.get_notebook_sources_with_types.return_value = [
+            {"id": "src-f", "title": "notes.txt", "status": 2}
+        ]
+        second = mixin.add_file("nb-1", path, dedupe=True)
+
+        assert first == {"id": "src-f", "title": "notes.txt"}
+        assert second == {"id": "src-f", "title": "notes.txt", "deduplicated": True}
+        mixin._upload_local_file.assert_called_once()
+
+    def test_add_files_verifies_hits_with_one_fetch(self, index, mixin, tmp_path):
+        paths = []
+        for name in ("a.txt", "b.txt", "c.txt"):
+            path = tmp_path / name
+            path.write_text(name, encoding="utf-8")
+            paths.append(path)
+        index.record("nb-1", file_key(paths[0].resolve()), "src-a")
+        index.record("nb-1", file_key(paths[1].resolve()), "src-b")
+        mixin.get_notebook_sources_with_types.return_value = [
+            {"id": "src-a", "title": "a.txt", "status": 2},
+            {"id": "src-b", "title": "b.txt", "status": 2},
+        ]
+        mixin._upload_local_file = MagicMock(return_value="src-c")
+
+        items = sorted(
+            mixin.add_files("nb-1", paths, concurrency=3, dedupe=True),
+            key=lambda item: item["index"],
+        )
+
+        assert [item["id"] for item in items] == ["src-a", "src-b", "src-c"]
+        assert [bool(item.get("deduplicated")) for item in items] == [True, True, False]
+        mixin.get_notebook_sources_with_types.assert_called_once_with("nb-1")
+        mixin._upload_local_file.assert_called_once()
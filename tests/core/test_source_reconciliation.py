@@ -241,3 +241,77 @@ class TestAddUrlSourceReconciliation:
 
         client._add_url_source_v2.assert_called_once()
         assert client._source_rpc_version == "v2"
+
+
+# ---------------------------------------------------------------------------
+# add_url_sources_chunked: chunked bulk URL ingest
+# ---------------------------------------------------------------------------
+
+
+class TestChunkedUrlIngest:
+    """add_url_sources_chunked reconciles failed chunks and retries only the missing URLs."""
+
+    @staticmethod
+    def _urls(n):
+        return [f"https://example.com/{i}" for i in range(n)]
+
+    def test_chunks_are_sent_separately(self):
+        client = _make_client()
+        client.get_notebook_sources_with_types = MagicMock(return_value=[])
+        client.add_url_sources = MagicMock(
+            side_effect=lambda nb, urls: [{"id": f"id-{u[-1]}", "title": u} for u in urls]
+        )
+
+        reports = sorted(
+            client.add_url_sources_chunked(NOTEBOOK_ID, self._urls(5), chunk_size=2, concurrency=3),
+            key=lambda r: r["index"],
+        )
+
+        assert client.add_url_sources.call_count == 3
+        assert [r["status"] for r in reports] == ["added"] * 5
+        assert [r["id"] for r in reports] == [f"id-{i}" for i in range(5)]
+        assert {r["attempts"] for r in reports} == {1}
+
+    def test_timeout_reconciles_then_retries_only_missing(self):
+        client = _make_client()
+        urls = self._urls(3)
+        landed = [{"id": "src-0", "title": "0", "url": urls[0] + "/"}]
+        client.get_notebook_sources_with_types = MagicMock(side_effect=[[], landed, landed])
+        client.add_url_sources = MagicMock(
+            side_effect=[
+                [{"status": "timeout", "message": "timed out"}],
+                [{"id": "src-1", "title": "1"}, {"id": "src-2", "title": "2"}],
+            ]
+        )
+
+        with patch("notebooklm_tools.core.sources.time.sleep"):
+            reports = list(client.add_url_sources_chunked(NOTEBOOK_ID, urls, chunk_size=3))
+
+        assert [(r["status"], r["id"], r["attempts"]) for r in reports] == [
+            ("reconciled", "src-0", 1),
+            ("added", "src-1", 2),
+            ("added", "src-2", 2),
+        ]
+        assert client.add_url_sources.call_args_list[1].args[1] == urls[1:]
+
+    def test_preexisting_source_is_not_mistaken_for_new_one(self):
+        client = _make_client()
+        url = "https://example.com/page"
+        existing = [{"id": "old", "title": "Old", "url": url}]
+        client.get_notebook_sources_with_types = MagicMock(return_value=existing)
+        client.add_url_sources = MagicMock(side_effect=_rpc_error(3))
+
+        with patch("notebooklm_tools.core.sources.time.sleep"):
+            reports = list(client.add_url_sources_chunked(NOTEBOOK_ID, [url], max_attempts=2))
+
+        assert reports == [
+            {
+                "index": 0,
+                "url": url,
+                "status": "failed",
+                "attempts": 2,
+                "error": reports[0]["error"],
+            }
+        ]
+        assert "INVALID_ARGUMENT" in reports[0]["error"]
+        assert client.add_url_sources.call_count == 2
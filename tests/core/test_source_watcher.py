@@ -0,0 +1,153 @@
+"""Tests for SourceReadinessWatcher."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from notebooklm_tools.core import constants
+from notebooklm_tools.core.source_watcher import SourceReadinessWatcher, classify_source
+
+PDF = constants.SOURCE_TYPE_PDF
+AUDIO = 10
+
+
+def _src(source_id, status, source_type=PDF):
+    return {"id": source_id, "status": status, "source_type": source_type}
+
+
+def _client(*frames):
+    """Client whose source list advances one frame per fetch (last frame repeats)."""
+    client = MagicMock()
+    frames = list(frames)
+
+    def fetch(notebook_id):
+        return frames.pop(0) if len(frames) > 1 else frames[0]
+
+    client.get_notebook_sources_with_types.side_effect = fetch
+    return client
+
+
+def test_classify_source():
+    assert classify_source(_src("a", 2)) == "ready"
+    assert classify_source(_src("a", 3)) == "failed"
+    assert classify_source(_src("a", 1)) is None
+    # Audio and unclassified sources may pass through status 3 transiently.
+    assert classify_source(_src("a", 3, AUDIO)) is None
+    assert classify_source(_src("a", 3, None)) is None
+
+
+def test_one_fetch_per_tick_serves_all_pending_sources():
+    client = _client(
+        [_src("a", 1), _src("b", 1), _src("c", 1)],
+        [_src("a", 2), _src("b", 1), _src("c", 3)],
+        [_src("a", 2), _src("b", 2)],
+    )
+    watcher = SourceReadinessWatcher(client, "nb-1", min_interval=0, max_interval=0)
+    futures = watcher.watch_many(["a", "b", "c"])
+
+    events = watcher.wait()
+
+    assert client.get_notebook_sources_with_types.call_count == 3
+    assert {sid: e.state for sid, e in events.items()} == {
+        "a": "ready",
+        "b": "ready",
+        "c": "failed",
+    }
+    assert futures["a"].result()["status"] == 2
+    with pytest.raises(RuntimeError, match="Source c failed to process"):
+        futures["c"].result()
+    assert watcher.pending == set()
+
+
+def test_timeout_fails_future_and_calls_on_failed():
+    failed = []
+    client = _client([_src("a", 1)])
+    watcher = SourceReadinessWatcher(
+        client, "nb-1", timeout=0, min_interval=0, on_failed=failed.append
+    )
+    future = watcher.watch("a")
+
+    events = watcher.poll()
+
+    assert [e.state for e in events] == ["timeout"]
+    assert failed == events
+    with pytest.raises(TimeoutError, match="not ready after 0s"):
+        future.result()
+
+
+def test_fetch_errors_are_retried_until_deadline():
+    client = MagicMock()
+    request = httpx.Request("POST", "https://notebooklm.google.com/")
+    client.get_notebook_sources_with_types.side_effect = [
+        httpx.ConnectError("down", request=request),
+        httpx.HTTPStatusError("busy", request=request, response=httpx.Response(503)),
+        [_src("a", 2)],
+    ]
+    ready = []
+    watcher = SourceReadinessWatcher(client, "nb-1", min_interval=0, on_ready=ready.append)
+    watcher.watch("a")
+
+    assert watcher.poll() == []
+    assert watcher.poll() == []
+    assert [e.source_id for e in watcher.poll()] == ["a"]
+    assert [e.state for e in ready] == ["ready"]
+
+
+def test_non_transient_fetch_error_fails_all_pending_sources():
+    from notebooklm_tools.core.errors import ClientAuthenticationError
+
+    client = MagicMock()
+    client.get_notebook_sources_with_types.side_effect = ClientAuthenticationError("expired")
+    failed = []
+    watcher = SourceReadinessWatcher(client, "nb-1", min_interval=0, on_failed=failed.append)
+    futures = watcher.watch_many(["a", "b"])
+
+    events = watcher.wait()
+
+    assert client.get_notebook_sources_with_types.call_count == 1
+    assert {sid: e.state for sid, e in events.items()} == {"a": "failed", "b": "failed"}
+    assert len(failed) == 2
+    for future in futures.values():
+        with pytest.raises(ClientAuthenticationError, match="expired"):
+            future.result()
+
+
+def test_interval_backs_off_and_resets_on_watch():
+    watcher = SourceReadinessWatcher(
+        _client([_src("a", 1)]), "nb-1", min_interval=1.0, max_interval=4.0, backoff=2.0
+    )
+    watcher.watch("a")
+    for _ in range(4):
+        watcher.poll()
+    assert watcher._interval == 4.0
+
+    watcher.watch("b")
+    assert watcher._interval == 1.0
+
+
+def test_background_driver_resolves_futures():
+    client = _client([_src("a", 1)], [_src("a", 2)])
+    with SourceReadinessWatcher(client, "nb-1", min_interval=0.01) as watcher:
+        future = watcher.watch("a")
+        assert future.result(timeout=5)["id"] == "a"
+
+
+def test_add_url_sources_wait_uses_one_watcher():
+    from notebooklm_tools.core.sources import SourceMixin
+
+    mixin = SourceMixin.__new__(SourceMixin)
+    mixin._state_lock = threading.Lock()
+    mixin._source_rpc_version = "v1"
+    mixin._add_url_sources_v1 = MagicMock(return_value="raw")
+    mixin._parse_source_results = MagicMock(
+        return_value=[{"id": "a", "title": "A"}, {"id": "b", "title": "B"}]
+    )
+    mixin.get_notebook_sources_with_types = MagicMock(return_value=[_src("a", 2), _src("b", 2)])
+
+    with patch("notebooklm_tools.core.source_watcher.time.sleep"):
+        results = mixin.add_url_sources("nb-1", ["https://a", "https://b"], wait=True)
+
+    assert [r["id"] for r in results] == ["a", "b"]
+    mixin.get_notebook_sources_with_types.assert_called_once_with("nb-1")
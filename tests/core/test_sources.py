@@ -99,3 +99,82 @@ def test_get_source_guide_uses_call_rpc():
 
             mock_rpc.assert_called_once()
             assert result == {"summary": "", "keywords": []}
+
+
+def test_get_source_fulltexts_bounds_in_flight_fetches():
+    """get_source_fulltexts keeps at most `concurrency` fetches running and reports errors."""
+    import threading
+    import time
+
+    from notebooklm_tools.core.sources import SourceMixin
+
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def fetch(source_id):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        if source_id == "bad":
+            raise ValueError("boom")
+        return {"content": f"text of {source_id}", "title": source_id}
+
+    mixin = SourceMixin.__new__(SourceMixin)
+    mixin.get_source_fulltext = fetch
+    ids = [f"s{i}" for i in range(10)] + ["bad"]
+
+    items = {item["source_id"]: item for item in mixin.get_source_fulltexts(ids, concurrency=3)}
+
+    assert peak <= 3
+    assert len(items) == 11
+    assert items["s4"]["content"] == "text of s4"
+    assert items["s4"]["index"] == 4
+    assert items["bad"]["error"] == "boom"
+
+
+def _fulltext_response(blocks):
+    meta = [None, None, None, None, 8]
+    return [[["src-1"], "Doc", meta], None, None, [blocks]]
+
+
+def test_iter_text_segments_is_iterative_and_keeps_offsets():
+    """Deeply nested content is walked without recursion, with block offsets."""
+    from notebooklm_tools.core.sources import iter_text_segments
+
+    deep: list = ["bottom"]
+    for _ in range(5000):
+        deep = [deep]
+    blocks = [[0, 5, [["alpha", None, ""]]], [5, 9, [[7, 9, ["beta"]], "gamma"]], [9, 10, deep]]
+
+    assert list(iter_text_segments(blocks)) == [
+        (0, 5, "alpha"),
+        (7, 9, "beta"),
+        (5, 9, "gamma"),
+        (9, 10, "bottom"),
+    ]
+
+
+def test_get_source_fulltext_pages_through_content():
+    """offset/limit windows match slices of the full text; char_count is the total."""
+    from notebooklm_tools.core.sources import SourceMixin
+
+    blocks = [[0, 10, [["first block"]]], [10, 20, [["second", "third"]]], "stray"]
+    mixin = SourceMixin.__new__(SourceMixin)
+
+    with patch.object(mixin, "_call_rpc", return_value=_fulltext_response(blocks)):
+        full = mixin.get_source_fulltext("src-1")
+        pages = [
+            mixin.get_source_fulltext("src-1", offset=offset, limit=7)
+            for offset in range(0, full["char_count"], 7)
+        ]
+
+    assert full["content"] == "first block\n\nsecond\n\nthird"
+    assert full["char_count"] == len(full["content"])
+    assert "".join(page["content"] for page in pages) == full["content"]
+    assert {page["char_count"] for page in pages} == {full["char_count"]}
+    assert pages[0]["title"] == "Doc"
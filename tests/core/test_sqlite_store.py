@@ -0,0 +1,54 @@
+"""Tests for the shared SQLite store base."""
+
+from unittest.mock import patch
+
+from notebooklm_tools.core.drive_sync_state import DriveSyncState
+from notebooklm_tools.core.fulltext_cache import FulltextCache
+from notebooklm_tools.core.search_index import SearchIndex
+from notebooklm_tools.core.source_index import SourceIndex
+from notebooklm_tools.core.sqlite_store import SQLiteStore
+from notebooklm_tools.core.studio_jobs import StudioJobStore
+
+
+def test_stores_share_one_database(tmp_path):
+    path = tmp_path / "local.sqlite3"
+    stores = [
+        SourceIndex(path),
+        FulltextCache(path),
+        SearchIndex(path),
+        DriveSyncState(path),
+        StudioJobStore(path),
+    ]
+    source_index, fulltext, search, drive, jobs = stores
+
+    source_index.record("nb-1", "url:abc", "s1")
+    fulltext.put("s1", {"content": "alpha text", "title": "A"})
+    search.upsert("nb-1", "s1", {"content": "alpha text", "title": "A"})
+    drive.record("s1", "doc-1")
+    jobs.enqueue("default", "nb-1", "report")
+
+    assert source_index.lookup("nb-1", "url:abc") == "s1"
+    assert fulltext.get("s1")["content"] == "alpha text"
+    assert search.source_ids("nb-1") == {"s1"}
+    assert drive.verified_within("s1", "doc-1", 60)
+    assert [job["notebook_id"] for job in jobs.jobs()] == ["nb-1"]
+    for store in stores:
+        store.close()
+
+
+def test_shared_opens_one_instance_per_store_class(tmp_path):
+    class Store(SQLiteStore):
+        SCHEMA = ("CREATE TABLE IF NOT EXISTS t (x)",)
+
+    with patch("notebooklm_tools.core.sqlite_store.default_db_path", return_value=tmp_path / "db"):
+        first = Store.shared()
+        assert Store.shared() is first
+        assert first.path == tmp_path / "db"
+
+    class Other(Store):
+        pass
+
+    with patch("notebooklm_tools.core.sqlite_store.default_db_path", return_value=tmp_path / "db"):
+        assert Other.shared() is not first
+    first.close()
+    Other.shared().close()
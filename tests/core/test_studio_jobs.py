@@ -0,0 +1,90 @@
+"""Tests for StudioJobStore."""
+
+import time
+
+import pytest
+
+from notebooklm_tools.core.studio_jobs import DAY_SECONDS, StudioJobStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = StudioJobStore(tmp_path / "jobs.sqlite3")
+    yield store
+    store.close()
+
+
+def test_jobs_survive_reopening(tmp_path):
+    path = tmp_path / "jobs.sqlite3"
+    first = StudioJobStore(path)
+    job_id = first.enqueue("acct", "nb-1", "audio", {"audio_format": "brief"}, "/out")
+    first.close()
+
+    second = StudioJobStore(path)
+    [job] = second.jobs("acct")
+    assert job["job_id"] == job_id
+    assert job["options"] == {"audio_format": "brief"}
+    assert job["state"] == "queued"
+    second.close()
+
+
+def test_claim_retry_and_fail(store):
+    job_id = store.enqueue("acct", "nb-1", "audio", max_attempts=2)
+
+    job = store.claim_next("acct")
+    assert job["job_id"] == job_id and job["attempts"] == 1
+    assert store.claim_next("acct") is None  # Already claimed
+
+    assert store.retry_or_fail(job_id, "boom", delay=3600) == "queued"
+    assert store.claim_next("acct") is None  # Retry delay not over
+    assert store.next_runnable_at("acct") > time.time()
+
+    store.retry_or_fail(job_id, "boom")  # Not claimed again; still attempt 1
+    store.claim_next("acct")
+    assert store.retry_or_fail(job_id, "boom again") == "failed"
+    assert store.counts("acct") == {"failed": 1}
+
+
+def test_recover_requeues_jobs_left_mid_create(store):
+    store.enqueue("acct", "nb-1", "audio")
+    store.enqueue("acct", "nb-2", "audio")
+    first = store.claim_next("acct")
+    second = store.claim_next("acct")
+    store.mark_generating(second["job_id"], "art-2")
+
+    assert store.recover("acct") == 1
+
+    states = {job["job_id"]: (job["state"], job["attempts"]) for job in store.jobs("acct")}
+    assert states[first["job_id"]] == ("queued", 0)
+    assert states[second["job_id"]] == ("generating", 1)
+
+
+def test_quota_escalates_from_throttling_to_daily_limit(store):
+    for _ in range(3):
+        store.record_start("acct")
+
+    limit, until = store.record_exhausted("acct", cooldown=60)
+    assert limit is None
+    assert until == pytest.approx(time.time() + 60, abs=5)
+
+    # Still exhausted after the cooldown: the day's starts were the quota.
+    limit, until = store.record_exhausted("acct", cooldown=60)
+    assert limit == 3
+    assert until == pytest.approx(time.time() + DAY_SECONDS, abs=5)
+    assert store.quota("acct") == (3, until)
+
+    # A start getting through resets the escalation, keeping the learned limit.
+    store.record_start("acct")
+    limit, until = store.record_exhausted("acct", cooldown=60)
+    assert limit == 3
+    assert until == pytest.approx(time.time() + 60, abs=5)
+
+
+def test_start_slot_at(store):
+    assert store.start_slot_at("acct", 2) <= time.time()
+    store.record_start("acct")
+    store.record_start("acct")
+    assert store.start_slot_at("acct", 2) == pytest.approx(time.time() + DAY_SECONDS, abs=5)
+    assert store.start_slot_at("acct", 3) <= time.time()
+    assert store.starts_today("acct") == 2
+    assert store.starts_today("other") == 0
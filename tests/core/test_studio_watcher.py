@@ -0,0 +1,191 @@
+"""Tests for StudioWatcher."""
+
+import time
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from notebooklm_tools.core.errors import ArtifactNotFoundError, ClientAuthenticationError
+from notebooklm_tools.core.studio_watcher import (
+    TYPE_INTERVALS,
+    StudioGenerationError,
+    StudioWatcher,
+)
+
+
+def _art(artifact_id, status, artifact_type="report", **extra):
+    return {"artifact_id": artifact_id, "status": status, "type": artifact_type, **extra}
+
+
+def _client(*frames):
+    """Client whose studio list advances one frame per poll (last frame repeats)."""
+    client = MagicMock()
+    frames = list(frames)
+
+    def poll(notebook_id):
+        return frames.pop(0) if len(frames) > 1 else frames[0]
+
+    client.poll_studio_status.side_effect = poll
+    return client
+
+
+def test_one_poll_per_notebook_serves_all_pending_artifacts():
+    client = _client(
+        [_art("a", "in_progress"), _art("b", "in_progress")],
+        [_art("a", "completed", url="https://x/a"), _art("b", "failed", error_reason="quota")],
+    )
+    watcher = StudioWatcher(client)
+    futures = watcher.watch_many("nb-1", ["a", "b"])
+
+    assert watcher.poll("nb-1") == []
+    events = watcher.poll("nb-1")
+
+    assert client.poll_studio_status.call_count == 2
+    assert {e.artifact_id: e.state for e in events} == {"a": "completed", "b": "failed"}
+    assert futures["a"].result()["url"] == "https://x/a"
+    with pytest.raises(StudioGenerationError, match="quota"):
+        futures["b"].result()
+    assert watcher.pending == {}
+
+
+def test_intervals_adapt_to_artifact_type():
+    watcher = StudioWatcher(_client([]), backoff=2.0)
+    now = time.monotonic()
+    watcher.watch("nb-video", "v", "video")
+    watcher.watch("nb-mixed", "v2", "video")
+    watcher.watch("nb-mixed", "r", "report")
+
+    video_first, video_max = TYPE_INTERVALS["video"]
+    report_first, _ = TYPE_INTERVALS["report"]
+    assert watcher._due["nb-video"] >= now + video_first
+    # A notebook is polled at the pace of its fastest pending artifact.
+    assert watcher._due["nb-mixed"] < now + report_first + 1
+
+    for _ in range(10):
+        watcher.poll("nb-video")
+    assert watcher._notebooks["nb-video"]["v"].interval == video_max
+
+
+def test_unknown_type_is_polled_now_and_learned():
+    client = _client([_art("a", "in_progress", "audio")])
+    watcher = StudioWatcher(client)
+    watcher.watch("nb-1", "a")
+
+    watcher.poll_due()
+
+    assert client.poll_studio_status.call_count == 1
+    watch = watcher._notebooks["nb-1"]["a"]
+    assert watch.artifact_type == "audio"
+    assert watch.interval > TYPE_INTERVALS["audio"][0]
+    # Not due again until the audio interval elapses.
+    assert watcher.poll_due() == []
+    assert client.poll_studio_status.call_count == 1
+
+
+def test_timeout_fails_future_and_notifies_subscribers():
+    watcher = StudioWatcher(_client([_art("a", "in_progress")]), timeout=0)
+    seen = []
+    unsubscribe = watcher.subscribe(seen.append)
+    future = watcher.watch("nb-1", "a")
+
+    watcher.poll("nb-1")
+
+    with pytest.raises(TimeoutError):
+        future.result()
+    assert [(e.artifact_id, e.state) for e in seen] == [("a", "timeout")]
+    unsubscribe()
+    watcher.watch("nb-1", "b")
+    watcher.poll("nb-1")
+    assert len(seen) == 1
+
+
+def test_poll_errors_keep_artifacts_pending():
+    client = MagicMock()
+    client.poll_studio_status.side_effect = [
+        httpx.ConnectError("boom"),
+        [_art("a", "completed")],
+    ]
+    watcher = StudioWatcher(client)
+    future = watcher.watch("nb-1", "a")
+
+    watcher.poll("nb-1")
+    assert not future.done()
+    watcher.poll("nb-1")
+    assert future.result()["status"] == "completed"
+
+
+def test_non_transient_poll_error_fails_pending_artifacts():
+    client = MagicMock()
+    client.poll_studio_status.side_effect = ClientAuthenticationError("expired")
+    watcher = StudioWatcher(client)
+    seen = []
+    watcher.subscribe(seen.append)
+    futures = watcher.watch_many("nb-1", ["a", "b"])
+    other = watcher.watch("nb-2", "c")
+
+    watcher.poll("nb-1")
+
+    for future in futures.values():
+        with pytest.raises(ClientAuthenticationError):
+            future.result()
+    assert {(e.artifact_id, e.state) for e in seen} == {("a", "error"), ("b", "error")}
+    assert watcher.pending == {"nb-2": {"c"}}
+    assert not other.done()
+
+
+def test_artifact_missing_from_the_list_fails_as_not_found():
+    client = _client([_art("a", "in_progress")])
+    watcher = StudioWatcher(client, missing_grace=60)
+    seen = []
+    watcher.subscribe(seen.append)
+    missing = watcher.watch("nb-1", "typo")
+    fresh = watcher.watch("nb-1", "new", "report")
+
+    watcher.poll("nb-1")
+
+    with pytest.raises(ArtifactNotFoundError, match="typo"):
+        missing.result()
+    assert [(e.artifact_id, e.state) for e in seen] == [("typo", "failed")]
+    # A generation that just started may not be listed yet.
+    assert not fresh.done()
+    watcher._notebooks["nb-1"]["new"].missing_after = 0.0
+    watcher.poll("nb-1")
+    with pytest.raises(ArtifactNotFoundError):
+        fresh.result()
+
+
+def test_failed_poll_does_not_count_as_missing():
+    client = MagicMock()
+    client.poll_studio_status.side_effect = httpx.ReadTimeout("slow")
+    watcher = StudioWatcher(client)
+    future = watcher.watch("nb-1", "a")
+
+    watcher.poll("nb-1")
+
+    assert not future.done()
+
+
+def test_unwatch_stops_polling_once_no_caller_holds_the_watch():
+    client = _client([_art("a", "in_progress")])
+    watcher = StudioWatcher(client)
+    first = watcher.watch("nb-1", "a")
+    second = watcher.watch("nb-1", "a")
+
+    watcher.unwatch("nb-1", "a")
+    assert watcher.pending == {"nb-1": {"a"}}
+    assert not first.done()
+
+    watcher.unwatch("nb-1", "a")
+    assert watcher.pending == {} and watcher._due == {}
+    assert second.cancelled()
+    assert watcher.poll_due() == []
+    client.poll_studio_status.assert_not_called()
+    watcher.unwatch("nb-1", "a")  # Already released: ignored
+
+
+def test_background_driver_resolves_futures():
+    client = _client([_art("a", "completed")])
+    with StudioWatcher(client) as watcher:
+        future = watcher.watch("nb-1", "a")
+        assert future.result(timeout=5)["artifact_id"] == "a"
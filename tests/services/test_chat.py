@@ -8,6 +8,7 @@ from notebooklm_tools.services.chat import (
     configure_chat,
     delete_chat_history,
     query,
+    query_many,
     query_start,
     query_status,
 )
@@ -84,6 +85,58 @@ class TestQuery:
         )
 
 
+class TestQueryMany:
+    """Test query_many batch service function."""
+
+    @patch("notebooklm_tools.services.chat.notebook_service")
+    def test_resolves_sources_once_and_normalizes_items(self, mock_notebook_service, mock_client):
+        mock_notebook_service.get_notebook.return_value = {
+            "source_count": 2,
+            "sources": [{"id": "src-1", "title": "A"}, {"id": "src-2", "title": "B"}],
+        }
+        mock_client.query_many.return_value = iter(
+            [
+                {"index": 1, "question": "q2", "answer": "a2", "conversation_id": "c2"},
+                {"index": 0, "question": "q1", "error": "boom"},
+            ]
+        )
+
+        items = list(query_many(mock_client, "nb-123", ["q1", "", "q2"], concurrency=3))
+
+        mock_notebook_service.get_notebook.assert_called_once()
+        mock_client.query_many.assert_called_once_with(
+            "nb-123", ["q1", "q2"], source_ids=["src-1", "src-2"], concurrency=3
+        )
+        assert items[0]["answer"] == "a2"
+        assert items[0]["index"] == 2  # Input position, not counting from the skipped blank
+        assert items[0]["error"] is None
+        assert items[1]["index"] == 0
+        assert items[1]["error"] == "boom"
+        assert items[1]["references"] == []
+
+    def test_explicit_source_ids_skip_notebook_lookup(self, mock_client):
+        mock_client.query_many.return_value = iter([])
+        list(query_many(mock_client, "nb-123", ["q"], source_ids=["s1"], timeout=30))
+        mock_client.get_notebook.assert_not_called()
+        mock_client.query_many.assert_called_once_with(
+            "nb-123", ["q"], source_ids=["s1"], concurrency=4, timeout=30
+        )
+
+    def test_no_questions_raises_validation_error(self, mock_client):
+        with pytest.raises(ValidationError, match="At least one question"):
+            query_many(mock_client, "nb-123", ["", "   "])
+
+    def test_concurrency_out_of_range_raises(self, mock_client):
+        with pytest.raises(ValidationError, match="Invalid concurrency"):
+            query_many(mock_client, "nb-123", ["q"], source_ids=["s"], concurrency=0)
+
+    @patch("notebooklm_tools.services.chat.notebook_service")
+    def test_empty_notebook_raises_validation_error(self, mock_notebook_service, mock_client):
+        mock_notebook_service.get_notebook.return_value = {"source_count": 0, "sources": []}
+        with pytest.raises(ValidationError, match="Cannot query an empty notebook"):
+            query_many(mock_client, "nb-123", ["q"])
+
+
 class TestConfigureChat:
     """Test configure_chat service function."""
 
@@ -1,16 +1,22 @@
 """Tests for services.downloads module."""
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from notebooklm_tools.core.errors import ArtifactDownloadError
+from notebooklm_tools.core.errors import ArtifactDownloadError, ArtifactNotReadyError
 from notebooklm_tools.services.downloads import (
     VALID_ARTIFACT_TYPES,
     VALID_OUTPUT_FORMATS,
     download_async,
     download_sync,
     get_default_extension,
+    plan_bulk_download,
+    run_bulk_download,
+    stream_artifact,
     validate_artifact_type,
     validate_audio_extension,
     validate_output_format,
@@ -80,6 +86,10 @@ class TestGetDefaultExtension:
     def test_flashcards_markdown(self):
         assert get_default_extension("flashcards", "markdown") == "md"
 
+    def test_data_table_formats(self):
+        assert get_default_extension("data_table") == "csv"
+        assert get_default_extension("data_table", "jsonl") == "jsonl"
+
 
 class TestDownloadSync:
     """Test download_sync for non-streaming artifacts."""
@@ -96,6 +106,17 @@ class TestDownloadSync:
     def test_download_data_table(self, mock_client):
         result = download_sync(mock_client, "nb-1", "data_table", "/tmp/t.csv")
         assert result["path"] == "/tmp/table.csv"
+        mock_client.download_data_table.assert_called_once_with("nb-1", "/tmp/t.csv", None, "csv")
+
+    def test_download_data_table_jsonl(self, mock_client):
+        download_sync(mock_client, "nb-1", "data_table", "/tmp/t.jsonl", output_format="jsonl")
+        mock_client.download_data_table.assert_called_once_with(
+            "nb-1", "/tmp/t.jsonl", None, "jsonl"
+        )
+
+    def test_invalid_data_table_format_raises_validation_error(self, mock_client):
+        with pytest.raises(ValidationError, match="data table format"):
+            download_sync(mock_client, "nb-1", "data_table", "/tmp/t.md", output_format="markdown")
 
     def test_invalid_type_raises_validation_error(self, mock_client):
         with pytest.raises(ValidationError, match="Unknown"):
@@ -219,8 +240,27 @@ class TestDownloadAsync:
             "/tmp/a.m4a",
             None,
             progress_callback=cb,
+            segments=1,
+        )
+
+    @pytest.mark.asyncio
+    async def test_segments_passed_through_for_video(self, mock_client):
+        await download_async(mock_client, "nb-1", "video", "/tmp/v.mp4", segments=4)
+        mock_client.download_video.assert_called_once_with(
+            "nb-1", "/tmp/v.mp4", None, progress_callback=None, segments=4
         )
 
+    @pytest.mark.asyncio
+    async def test_segments_out_of_range_raises(self, mock_client):
+        with pytest.raises(ValidationError, match="segments must be between 1 and 16"):
+            await download_async(mock_client, "nb-1", "video", "/tmp/v.mp4", segments=0)
+        mock_client.download_video.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_segments_rejected_for_small_artifacts(self, mock_client):
+        with pytest.raises(ValidationError, match="only supported for: audio, video"):
+            await download_async(mock_client, "nb-1", "infographic", "/tmp/i.png", segments=4)
+
     @pytest.mark.asyncio
     async def test_download_report_via_async(self, mock_client):
         """Issue #107: report must be downloadable via download_async."""
@@ -243,7 +283,7 @@ class TestDownloadAsync:
         result = await download_async(mock_client, "nb-1", "data_table", "/tmp/dt.csv")
         assert result["artifact_type"] == "data_table"
         assert result["path"] == "/tmp/table.csv"
-        mock_client.download_data_table.assert_called_once_with("nb-1", "/tmp/dt.csv", None)
+        mock_client.download_data_table.assert_called_once_with("nb-1", "/tmp/dt.csv", None, "csv")
 
 
 class TestValidateAudioExtension:
@@ -275,3 +315,274 @@ class TestValidateAudioExtension:
         """Issue #185: download_sync must also reject .mp3 for audio."""
         with pytest.raises(ValidationError, match="cannot honor"):
             download_sync(mock_client, "nb-1", "audio", "/tmp/out.mp3")
+
+
+class TestBulkDownload:
+    """plan_bulk_download / run_bulk_download."""
+
+    def _client(self, per_notebook):
+        client = MagicMock()
+        client.snapshot_artifacts.side_effect = lambda nb, mind_maps=True: {"nb": nb}
+        client.downloadable_artifacts.side_effect = lambda snap: per_notebook[snap["nb"]]
+        client.download_audio = AsyncMock(side_effect=lambda nb, path, aid, **kw: path)
+        client.download_video = AsyncMock(side_effect=lambda nb, path, aid, **kw: path)
+        client.download_report.side_effect = lambda nb, path, aid: path
+        return client
+
+    async def _collect(self, results):
+        return [item async for item in results]
+
+    def test_plan_lists_each_notebook_once_and_skips_existing(self, tmp_path):
+        client = self._client(
+            {
+                "nb-1": [
+                    {"artifact_id": "a1", "title": "Pod", "type": "audio"},
+                    {"artifact_id": "r1", "title": "Brief", "type": "report"},
+                ],
+                "nb-2": [{"artifact_id": "v1", "title": "Clip", "type": "video"}],
+            }
+        )
+        (tmp_path / "nb-1").mkdir()
+        (tmp_path / "nb-1" / "report_r1.md").write_text("done")
+
+        plan = plan_bulk_download(
+            client, ["nb-1", "nb-2", "nb-1"], str(tmp_path), types=["audio", "report", "video"]
+        )
+
+        assert client.snapshot_artifacts.call_count == 2
+        assert client.snapshot_artifacts.call_args.kwargs == {"mind_maps": False}
+        assert [(i["artifact_id"], i["status"]) for i in plan["items"]] == [
+            ("a1", "pending"),
+            ("r1", "skipped"),
+            ("v1", "pending"),
+        ]
+        assert plan["items"][0]["path"] == str(tmp_path / "nb-1" / "audio_a1.m4a")
+
+    def test_plan_filters_types(self, tmp_path):
+        client = self._client(
+            {
+                "nb-1": [
+                    {"artifact_id": "a1", "title": "Pod", "type": "audio"},
+                    {"artifact_id": "r1", "title": "Brief", "type": "report"},
+                ]
+            }
+        )
+        plan = plan_bulk_download(client, ["nb-1"], str(tmp_path), types=["report"])
+        assert [i["artifact_id"] for i in plan["items"]] == ["r1"]
+
+    def test_plan_validates_eagerly(self, tmp_path):
+        client = self._client({})
+        with pytest.raises(ValidationError, match="No notebook IDs"):
+            plan_bulk_download(client, [], str(tmp_path))
+        with pytest.raises(ValidationError, match="Unknown artifact type"):
+            plan_bulk_download(client, ["nb-1"], str(tmp_path), types=["podcast"])
+        client.snapshot_artifacts.assert_not_called()
+
+    def test_plan_wraps_listing_errors(self, tmp_path):
+        client = self._client({})
+        client.snapshot_artifacts.side_effect = RuntimeError("boom")
+        with pytest.raises(ServiceError) as exc_info:
+            plan_bulk_download(client, ["nb-1"], str(tmp_path))
+        assert exc_info.value.user_message == "Could not list artifacts of notebook nb-1."
+
+    @pytest.mark.asyncio
+    async def test_run_downloads_pending_items_with_snapshots(self, tmp_path):
+        from notebooklm_tools.core import download as core_download
+
+        client = self._client(
+            {
+                "nb-1": [
+                    {"artifact_id": "a1", "title": "Pod", "type": "audio"},
+                    {"artifact_id": "v1", "title": "Clip", "type": "video"},
+                    {"artifact_id": "r1", "title": "Brief", "type": "report"},
+                ]
+            }
+        )
+        (tmp_path / "nb-1").mkdir()
+        (tmp_path / "nb-1" / "report_r1.md").write_text("done")
+        seen_snapshots = []
+
+        async def fake_audio(nb, path, aid, progress_callback=None, segments=1):
+            seen_snapshots.append(core_download._artifact_snapshots.get())
+            progress_callback(50, 100)
+            return path
+
+        client.download_audio = AsyncMock(side_effect=fake_audio)
+        client.download_video = AsyncMock(side_effect=RuntimeError("403"))
+        progress = []
+
+        plan = plan_bulk_download(client, ["nb-1"], str(tmp_path))
+        items = await self._collect(
+            run_bulk_download(
+                client, plan, concurrency=2, progress_callback=lambda d, t: progress.append((d, t))
+            )
+        )
+
+        statuses = {i["artifact_id"]: i["status"] for i in items}
+        assert statuses == {"a1": "downloaded", "v1": "failed", "r1": "skipped"}
+        assert items[0]["artifact_id"] == "r1"  # skipped files come first
+        assert next(i for i in items if i["artifact_id"] == "v1")["error"] == "403"
+        assert seen_snapshots == [plan["snapshots"]]
+        assert progress == [(50, 100)]
+        client.download_report.assert_not_called()
+        client.share_download_client.assert_called_once_with()
+
+    def test_run_validates_limits(self):
+        plan = {"items": [], "snapshots": {}}
+        with pytest.raises(ValidationError, match="concurrency"):
+            run_bulk_download(MagicMock(), plan, concurrency=0)
+        with pytest.raises(ValidationError, match="per_host"):
+            run_bulk_download(MagicMock(), plan, per_host=17)
+
+
+class TestDownloadCache:
+    """use_cache serves unchanged artifacts locally and caches fresh downloads."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        from notebooklm_tools.core.artifact_cache import ArtifactCache
+
+        cache = ArtifactCache(tmp_path / "cache")
+        with patch("notebooklm_tools.services.downloads.get_artifact_cache", return_value=cache):
+            yield cache
+        cache.close()
+
+    def test_miss_downloads_resolved_artifact_then_hit_serves_copy(self, cache, tmp_path):
+        client = MagicMock()
+        client.select_artifact.return_value = ("r1", "marker-1")
+
+        def download_report(notebook_id, output_path, artifact_id):
+            Path(output_path).write_text("# Brief")
+            return output_path
+
+        client.download_report.side_effect = download_report
+        first = str(tmp_path / "first.md")
+
+        download_sync(client, "nb-1", "report", first, use_cache=True)
+
+        client.download_report.assert_called_once_with("nb-1", first, "r1")
+
+        second = tmp_path / "second.md"
+        result = download_sync(client, "nb-1", "report", str(second), use_cache=True)
+
+        assert result == {"artifact_type": "report", "path": str(second)}
+        assert second.read_text() == "# Brief"
+        assert client.download_report.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_marker_downloads_again(self, cache, tmp_path):
+        client = MagicMock()
+        client.select_artifact.return_value = ("s1", "marker-1")
+
+        async def download_slide_deck(notebook_id, output_path, artifact_id, **kwargs):
+            Path(output_path).write_bytes(b"%PDF")
+            return output_path
+
+        client.download_slide_deck = AsyncMock(side_effect=download_slide_deck)
+        out = str(tmp_path / "deck.pdf")
+
+        await download_async(client, "nb-1", "slide_deck", out, use_cache=True)
+        await download_async(client, "nb-1", "slide_deck", out, use_cache=True)
+        assert client.download_slide_deck.call_count == 1
+
+        # PPTX is cached separately from PDF
+        await download_async(
+            client,
+            "nb-1",
+            "slide_deck",
+            str(tmp_path / "deck.pptx"),
+            slide_deck_format="pptx",
+            use_cache=True,
+        )
+        assert client.download_slide_deck.call_count == 2
+
+        client.select_artifact.return_value = ("s1", "marker-2")
+        await download_async(client, "nb-1", "slide_deck", out, use_cache=True)
+        assert client.download_slide_deck.call_count == 3
+
+    def test_miss_reuses_the_lookup_listing(self, cache, tmp_path):
+        from notebooklm_tools.core.download import DownloadMixin
+
+        client = DownloadMixin(cookies={"test": "cookie"}, csrf_token="test")
+        report = ["r1", "Brief", client.STUDIO_TYPE_REPORT, [], 3, None, None, ["# Brief"]]
+        client._call_rpc = MagicMock(return_value=[[report]])
+        out = tmp_path / "report.md"
+
+        download_sync(client, "nb-1", "report", str(out), use_cache=True)
+
+        assert out.read_text() == "# Brief"
+        client._call_rpc.assert_called_once()  # One artifact list serves lookup and download
+
+    def test_cache_errors_fall_back_to_download(self, mock_client):
+        mock_client.select_artifact.side_effect = RuntimeError("list failed")
+
+        result = download_sync(mock_client, "nb-1", "report", "/tmp/report.md", use_cache=True)
+
+        assert result["path"] == "/tmp/report.md"
+        mock_client.download_report.assert_called_once_with("nb-1", "/tmp/report.md", None)
+
+
+class TestDownloadAsyncNonBlocking:
+    @pytest.mark.asyncio
+    async def test_sync_artifact_types_run_in_worker_thread(self):
+        client = MagicMock()
+        client.download_report.side_effect = lambda nb, path, aid: time.sleep(0.2) or path
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        await download_async(client, "nb-1", "report", "/tmp/report.md")
+        task.cancel()
+
+        assert ticks >= 5
+
+
+class TestStreamArtifact:
+    """stream_artifact yields bytes and maps failures to ServiceError."""
+
+    def _client(self, chunks=(), error=None):
+        client = MagicMock()
+
+        async def stream(*args, **kwargs):
+            for chunk in chunks:
+                yield chunk
+            if error:
+                raise error
+
+        client.stream_artifact = MagicMock(side_effect=stream)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_yields_chunks(self):
+        client = self._client([b"ab", b"cd"])
+
+        stream = stream_artifact(client, "nb-1", "slide_deck", "s1", slide_deck_format="pptx")
+        chunks = [chunk async for chunk in stream]
+
+        assert chunks == [b"ab", b"cd"]
+        client.stream_artifact.assert_called_once_with(
+            "nb-1", "slide_deck", "s1", file_format="pptx"
+        )
+
+    def test_validates_eagerly(self):
+        client = self._client()
+        with pytest.raises(ValidationError, match="only supported"):
+            stream_artifact(client, "nb-1", "report")
+        with pytest.raises(ValidationError, match="slide_deck_format"):
+            stream_artifact(client, "nb-1", "slide_deck", slide_deck_format="key")
+        client.stream_artifact.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_not_ready_maps_to_service_error(self):
+        client = self._client(error=ArtifactNotReadyError("audio"))
+
+        with pytest.raises(ServiceError) as exc_info:
+            async for _ in stream_artifact(client, "nb-1", "audio"):
+                pass
+
+        assert exc_info.value.user_message == "audio is not ready or does not exist."
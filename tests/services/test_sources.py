@@ -1,21 +1,34 @@
 """Tests for services.sources module."""
 
-from unittest.mock import MagicMock
+import dataclasses
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from notebooklm_tools.core.constants import SOURCE_TYPE_PDF
+from notebooklm_tools.core.drive_sync_state import DriveSyncState
+from notebooklm_tools.core.fulltext_cache import FulltextCache
+from notebooklm_tools.core.search_index import SearchIndex
 from notebooklm_tools.services.errors import ServiceError, ValidationError
 from notebooklm_tools.services.sources import (
     VALID_SOURCE_TYPES,
+    add_directory,
     add_source,
     add_sources,
     delete_source,
     delete_sources,
     describe_source,
+    drive_sync,
+    export_source_fulltexts,
     get_source_content,
+    ingest_urls,
     list_drive_sources,
+    plan_directory_ingest,
     resolve_drive_mime_type,
+    search_sources,
     sync_drive_sources,
+    sync_search_index,
+    upload_files,
     validate_source_type,
 )
 
@@ -105,6 +118,7 @@ class TestAddSource:
             "Pasted Text",
             wait=False,
             wait_timeout=120.0,
+            dedupe=False,
         )
 
     def test_add_drive_source(self, mock_client):
@@ -264,6 +278,7 @@ class TestAddSource:
             "http://ex.com",
             wait=True,
             wait_timeout=60,
+            dedupe=False,
         )
 
 
@@ -378,21 +393,48 @@ class TestListDriveSources:
         assert result["stale_count"] == 1
 
 
+@pytest.fixture
+def text_stores(tmp_path):
+    """Full-text cache and search index in a temp dir."""
+    cache = FulltextCache(tmp_path / "fulltext.sqlite3")
+    index = SearchIndex(tmp_path / "search.sqlite3")
+    with (
+        patch("notebooklm_tools.services.sources.get_fulltext_cache", return_value=cache),
+        patch("notebooklm_tools.services.sources.get_search_index", return_value=index),
+    ):
+        yield cache, index
+    cache.close()
+    index.close()
+
+
 class TestSyncDriveSources:
     """Test sync_drive_sources function."""
 
-    def test_sync_success(self, mock_client):
+    def test_sync_success(self, mock_client, text_stores):
         results = sync_drive_sources(mock_client, ["s1", "s2"])
         assert len(results) == 2
         assert all(r["synced"] for r in results)
 
-    def test_sync_partial_failure(self, mock_client):
+    def test_sync_partial_failure(self, mock_client, text_stores):
         mock_client.sync_drive_source.side_effect = [True, RuntimeError("fail")]
         results = sync_drive_sources(mock_client, ["s1", "s2"])
         assert results[0]["synced"] is True
         assert results[1]["synced"] is False
         assert results[1]["error"] == "fail"
 
+    def test_synced_sources_drop_cached_text(self, mock_client, text_stores):
+        cache, index = text_stores
+        for sid in ("s1", "s2"):
+            cache.put(sid, {"content": f"old {sid}", "title": ""})
+            index.upsert("nb-1", sid, {"content": f"old {sid}"})
+        mock_client.sync_drive_source.side_effect = [True, RuntimeError("fail")]
+
+        sync_drive_sources(mock_client, ["s1", "s2"])
+
+        assert cache.get("s1") is None
+        assert index.source_ids("nb-1") == {"s2"}
+        assert cache.get("s2")["content"] == "old s2"
+
     def test_empty_list_raises(self, mock_client):
         with pytest.raises(ValidationError, match="No source IDs"):
             sync_drive_sources(mock_client, [])
@@ -440,6 +482,26 @@ class TestGetSourceContent:
         assert result["source_type"] == "url"
         assert result["char_count"] == 11
 
+    def test_paging(self, mock_client):
+        mock_client.get_source_fulltext.return_value = {
+            "content": "world",
+            "title": "Test Source",
+            "type": "url",
+            "char_count": 20,
+        }
+        page = get_source_content(mock_client, "src-1", offset=6, limit=5)
+        mock_client.get_source_fulltext.assert_called_once_with("src-1", offset=6, limit=5)
+        assert (page["offset"], page["next_offset"], page["char_count"]) == (6, 11, 20)
+
+        mock_client.get_source_fulltext.return_value["char_count"] = 11
+        assert get_source_content(mock_client, "src-1", offset=6, limit=5)["next_offset"] is None
+
+    def test_invalid_paging_raises(self, mock_client):
+        with pytest.raises(ValidationError, match="offset"):
+            get_source_content(mock_client, "src-1", offset=-1)
+        with pytest.raises(ValidationError, match="limit"):
+            get_source_content(mock_client, "src-1", limit=0)
+
     def test_empty_result_raises(self, mock_client):
         mock_client.get_source_fulltext.return_value = None
         with pytest.raises(ServiceError, match="No content returned"):
@@ -551,7 +613,126 @@ class TestAddSources:
             ["https://example.com"],
             wait=True,
             wait_timeout=60,
+            dedupe=False,
+        )
+
+    def test_file_sources_use_upload_pipeline_in_input_order(self, mock_client):
+        mock_client.add_files.return_value = iter(
+            [
+                {"index": 1, "file_path": "/d/b.pdf", "id": "f2", "title": "b.pdf", "bytes": 2},
+                {"index": 0, "file_path": "/d/a.pdf", "id": "f1", "title": "a.pdf", "bytes": 1},
+            ]
+        )
+        result = add_sources(
+            mock_client,
+            "nb-1",
+            [
+                {"source_type": "file", "file_path": "/d/a.pdf"},
+                {"source_type": "file", "file_path": "/d/b.pdf"},
+            ],
+            upload_concurrency=8,
+        )
+        assert [r["source_id"] for r in result["results"]] == ["f1", "f2"]
+        mock_client.add_file.assert_not_called()
+        args, kwargs = mock_client.add_files.call_args
+        assert args == ("nb-1", ["/d/a.pdf", "/d/b.pdf"])
+        assert kwargs["concurrency"] == 8
+
+    def test_file_titles_force_wait_and_rename(self, mock_client):
+        mock_client.add_files.return_value = iter(
+            [{"index": 0, "file_path": "/d/a.pdf", "id": "f1", "title": "a.pdf", "bytes": 1}]
+        )
+        mock_client.rename_source.return_value = {"title": "Custom"}
+        result = add_sources(
+            mock_client,
+            "nb-1",
+            [{"source_type": "file", "file_path": "/d/a.pdf", "title": "Custom"}],
+        )
+        assert mock_client.add_files.call_args.kwargs["wait"] is True
+        mock_client.rename_source.assert_called_once_with("nb-1", "f1", "Custom")
+        assert result["results"][0]["title"] == "Custom"
+
+    def test_file_failures_reported_after_all_uploads(self, mock_client):
+        mock_client.add_url_sources.return_value = [{"id": "u1", "title": "Example"}]
+        mock_client.add_files.return_value = iter(
+            [
+                {"index": 0, "file_path": "/d/a.pdf", "id": "f1", "title": "a.pdf", "bytes": 1},
+                {"index": 1, "file_path": "/d/b.pdf", "bytes": 0, "error": "File not found"},
+            ]
+        )
+        result = add_sources(
+            mock_client,
+            "nb-1",
+            [
+                {"source_type": "url", "url": "https://example.com"},
+                {"source_type": "file", "file_path": "/d/a.pdf"},
+                {"source_type": "file", "file_path": "/d/b.pdf"},
+                {"source_type": "text", "text": "hello world"},
+            ],
+        )
+        # What landed is reported, and the text source is still added.
+        assert [r["source_id"] for r in result["results"]][:2] == ["u1", "f1"]
+        assert result["added_count"] == 3
+        assert result["failed"] == [
+            {"source_type": "file", "source": "/d/b.pdf", "error": "File not found"}
+        ]
+        mock_client.add_text_source.assert_called_once()
+
+    def test_text_failure_does_not_stop_the_rest(self, mock_client):
+        mock_client.add_text_source.side_effect = [RuntimeError("boom"), {"id": "t2", "title": "B"}]
+        result = add_sources(
+            mock_client,
+            "nb-1",
+            [
+                {"source_type": "text", "text": "first", "title": "A"},
+                {"source_type": "text", "text": "second", "title": "B"},
+            ],
         )
+        assert [r["source_id"] for r in result["results"]] == ["t2"]
+        assert [(f["source"], f["source_type"]) for f in result["failed"]] == [("A", "text")]
+
+    def test_missing_file_path_raises_before_adding_anything(self, mock_client):
+        with pytest.raises(ValidationError, match="file_path is required"):
+            add_sources(
+                mock_client,
+                "nb-1",
+                [
+                    {"source_type": "url", "url": "https://example.com"},
+                    {"source_type": "file"},
+                ],
+            )
+        mock_client.add_url_sources.assert_not_called()
+
+
+class TestUploadFiles:
+    """Test upload_files (concurrent file upload) function."""
+
+    def test_normalizes_items(self, mock_client):
+        mock_client.add_files.return_value = iter(
+            [
+                {
+                    "index": 0,
+                    "file_path": "/d/a.pdf",
+                    "id": "f1",
+                    "title": "a.pdf",
+                    "bytes": 10,
+                    "seconds": 0.5,
+                },
+                {"index": 1, "file_path": "/d/b.pdf", "bytes": 0, "error": "boom"},
+            ]
+        )
+        items = list(upload_files(mock_client, "nb-1", ["/d/a.pdf", "/d/b.pdf"]))
+        assert items[0]["source_id"] == "f1"
+        assert items[0]["error"] is None
+        assert items[1]["source_id"] is None
+        assert items[1]["error"] == "boom"
+
+    def test_validates_eagerly(self, mock_client):
+        with pytest.raises(ValidationError, match="No files"):
+            upload_files(mock_client, "nb-1", [])
+        with pytest.raises(ValidationError, match="concurrency"):
+            upload_files(mock_client, "nb-1", ["/d/a.pdf"], concurrency=0)
+        mock_client.add_files.assert_not_called()
 
 
 class TestDeleteSources:
@@ -575,3 +756,508 @@ class TestDeleteSources:
         mock_client.delete_sources.side_effect = RuntimeError("fail")
         with pytest.raises(ServiceError, match="Failed to delete"):
             delete_sources(mock_client, ["s1"])
+
+
+class TestDirectoryIngest:
+    """Test plan_directory_ingest / add_directory."""
+
+    @pytest.fixture
+    def corpus(self, tmp_path):
+        root = tmp_path / "corpus"
+        (root / "sub").mkdir(parents=True)
+        (root / "a.pdf").write_bytes(b"a")
+        (root / "sub" / "b.md").write_text("b", encoding="utf-8")
+        (root / "skip.exe").write_bytes(b"x")
+        (root / "empty.txt").write_bytes(b"")
+        return root
+
+    @staticmethod
+    def _uploads(client, ids):
+        def add_files(notebook_id, paths, **kwargs):
+            for index, path in enumerate(paths):
+                yield {"index": index, "file_path": path, "id": ids[path.rsplit("/", 1)[-1]]}
+
+        client.add_files.side_effect = add_files
+
+    def test_plan_filters_unsupported_before_network(self, mock_client, corpus, tmp_path):
+        plan, manifest = plan_directory_ingest(
+            "nb-1", str(corpus), manifest_path=str(tmp_path / "m.jsonl")
+        )
+        assert plan["total"] == 2
+        assert plan["to_upload"] == 2
+        assert sorted(manifest.entries) == ["a.pdf", "sub/b.md"]
+        assert len(manifest.entries["a.pdf"].sha256) == 64
+        mock_client.assert_not_called()
+
+    def test_plan_glob(self, corpus, tmp_path):
+        plan, _ = plan_directory_ingest(
+            "nb-1", str(corpus), pattern="**/*.md", manifest_path=str(tmp_path / "m.jsonl")
+        )
+        assert plan["total"] == 1
+
+    def test_plan_rejects_missing_directory_and_empty_match(self, corpus, tmp_path):
+        with pytest.raises(ValidationError, match="Not a directory"):
+            plan_directory_ingest("nb-1", str(tmp_path / "nope"))
+        with pytest.raises(ValidationError, match="No supported files"):
+            plan_directory_ingest(
+                "nb-1", str(corpus), pattern="*.docx", manifest_path=str(tmp_path / "m.jsonl")
+            )
+
+    def test_rerun_resumes_from_manifest(self, mock_client, corpus, tmp_path):
+        manifest_path = str(tmp_path / "m.jsonl")
+        mock_client.add_files.side_effect = lambda notebook_id, paths, **kw: iter(
+            [
+                {"index": 0, "file_path": paths[0], "id": "src-a"},
+                {"index": 1, "file_path": paths[1], "error": "boom"},
+            ]
+        )
+        plan, manifest = plan_directory_ingest("nb-1", str(corpus), manifest_path=manifest_path)
+        first = list(add_directory(mock_client, "nb-1", plan, manifest))
+        assert sorted(i["status"] for i in first) == ["failed", "uploaded"]
+        assert mock_client.add_files.call_args.kwargs["resume"] is True
+
+        # The second run only re-sends the failed file.
+        self._uploads(mock_client, {"b.md": "src-b"})
+        plan, manifest = plan_directory_ingest("nb-1", str(corpus), manifest_path=manifest_path)
+        assert (plan["done"], plan["to_upload"]) == (1, 1)
+        second = {i["path"]: i for i in add_directory(mock_client, "nb-1", plan, manifest)}
+        assert second["a.pdf"]["status"] == "skipped"
+        assert second["sub/b.md"]["source_id"] == "src-b"
+        assert mock_client.add_files.call_args.args[1] == [str(corpus / "sub" / "b.md")]
+
+    def test_wait_uses_one_watcher_for_all_sources(self, mock_client, corpus, tmp_path):
+        self._uploads(mock_client, {"a.pdf": "src-a", "b.md": "src-b"})
+        mock_client.get_notebook_sources_with_types.return_value = [
+            {"id": "src-a", "status": 2},
+            {"id": "src-b", "status": 2},
+        ]
+        plan, manifest = plan_directory_ingest(
+            "nb-1", str(corpus), manifest_path=str(tmp_path / "m.jsonl")
+        )
+
+        items = list(add_directory(mock_client, "nb-1", plan, manifest, wait=True))
+
+        assert [i["status"] for i in items] == ["ready", "ready"]
+        assert mock_client.add_files.call_args.kwargs["wait"] is False
+        mock_client.get_notebook_sources_with_types.assert_called_once_with("nb-1")
+        manifest.load()
+        assert {e.status for e in manifest.entries.values()} == {"ready"}
+
+    def test_wait_timeout_starts_after_uploads(self, mock_client, corpus, tmp_path):
+        clock = [0.0]
+
+        def sleep(seconds):
+            clock[0] += seconds
+
+        def add_files(notebook_id, paths, **kwargs):
+            for index, path in enumerate(paths):
+                clock[0] += 200  # Each upload outlasts the readiness timeout
+                yield {"index": index, "file_path": path, "id": f"src-{index}"}
+
+        polls = iter([1, 2])
+        mock_client.add_files.side_effect = add_files
+        mock_client.get_notebook_sources_with_types.side_effect = lambda nb: [
+            {"id": sid, "status": status} for status in [next(polls)] for sid in ("src-0", "src-1")
+        ]
+        plan, manifest = plan_directory_ingest(
+            "nb-1", str(corpus), manifest_path=str(tmp_path / "m.jsonl")
+        )
+
+        with patch(
+            "notebooklm_tools.core.source_watcher.time",
+            MagicMock(monotonic=lambda: clock[0], sleep=sleep),
+        ):
+            items = list(
+                add_directory(mock_client, "nb-1", plan, manifest, wait=True, wait_timeout=150)
+            )
+
+        assert [i["status"] for i in items] == ["ready", "ready"]
+        assert mock_client.get_notebook_sources_with_types.call_count == 2
+
+    def test_rerun_replaces_sources_that_failed_processing(self, mock_client, corpus, tmp_path):
+        manifest_path = str(tmp_path / "m.jsonl")
+        self._uploads(mock_client, {"a.pdf": "src-a", "b.md": "src-b"})
+        mock_client.get_notebook_sources_with_types.return_value = [
+            {"id": "src-a", "status": 2},
+            {"id": "src-b", "status": 3, "source_type": SOURCE_TYPE_PDF},
+        ]
+        plan, manifest = plan_directory_ingest("nb-1", str(corpus), manifest_path=manifest_path)
+        first = {
+            i["path"]: i for i in add_directory(mock_client, "nb-1", plan, manifest, wait=True)
+        }
+        assert first["sub/b.md"]["status"] == "failed"
+
+        # The failed source is deleted before its file is uploaded again.
+        self._uploads(mock_client, {"b.md": "src-b2"})
+        mock_client.delete_sources.return_value = True
+        plan, manifest = plan_directory_ingest("nb-1", str(corpus), manifest_path=manifest_path)
+        second = {i["path"]: i for i in add_directory(mock_client, "nb-1", plan, manifest)}
+        mock_client.delete_sources.assert_called_once_with(["src-b"])
+        assert second["sub/b.md"]["source_id"] == "src-b2"
+
+    def test_failed_source_that_cannot_be_deleted_is_not_reuploaded(
+        self, mock_client, corpus, tmp_path
+    ):
+        manifest_path = str(tmp_path / "m.jsonl")
+        plan, manifest = plan_directory_ingest(
+            "nb-1", str(corpus), pattern="*.pdf", manifest_path=manifest_path
+        )
+        manifest.update(
+            dataclasses.replace(manifest.entries["a.pdf"], status="failed", source_id="src-a")
+        )
+        mock_client.get_notebook_sources_with_types.return_value = [{"id": "src-a", "status": 3}]
+        mock_client.delete_sources.side_effect = RuntimeError("denied")
+
+        [item] = add_directory(mock_client, "nb-1", plan, manifest)
+
+        assert item["status"] == "failed"
+        assert "Could not remove failed source src-a" in item["error"]
+        mock_client.add_files.assert_not_called()
+
+    def test_wait_reports_deduplicated_files(self, mock_client, corpus, tmp_path):
+        mock_client.add_files.side_effect = lambda notebook_id, paths, **kw: iter(
+            [{"index": 0, "file_path": paths[0], "id": "src-a", "deduplicated": True}]
+        )
+        mock_client.get_notebook_sources_with_types.return_value = [{"id": "src-a", "status": 2}]
+        plan, manifest = plan_directory_ingest(
+            "nb-1", str(corpus), pattern="*.pdf", manifest_path=str(tmp_path / "m.jsonl")
+        )
+
+        [item] = add_directory(mock_client, "nb-1", plan, manifest, wait=True, dedupe=True)
+
+        assert item["status"] == "deduplicated"
+
+    def test_validates_concurrency(self, mock_client, corpus, tmp_path):
+        plan, manifest = plan_directory_ingest(
+            "nb-1", str(corpus), manifest_path=str(tmp_path / "m.jsonl")
+        )
+        with pytest.raises(ValidationError, match="concurrency"):
+            add_directory(mock_client, "nb-1", plan, manifest, concurrency=0)
+
+
+class TestExportSourceFulltexts:
+    """Test export_source_fulltexts."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        cache = FulltextCache(tmp_path / "fulltext.sqlite3")
+        with patch("notebooklm_tools.services.sources.get_fulltext_cache", return_value=cache):
+            yield cache
+        cache.close()
+
+    @staticmethod
+    def _fetches(mock_client, fail=()):
+        def get_source_fulltexts(ids, concurrency=8):
+            for index, sid in enumerate(ids):
+                if sid in fail:
+                    yield {"index": index, "source_id": sid, "error": "boom"}
+                else:
+                    yield {
+                        "index": index,
+                        "source_id": sid,
+                        "content": f"text {sid}",
+                        "title": f"T {sid}",
+                        "source_type": "web_page",
+                        "url": None,
+                    }
+
+        mock_client.get_source_fulltexts.side_effect = get_source_fulltexts
+
+    def test_rerun_only_fetches_new_sources(self, mock_client, cache):
+        self._fetches(mock_client, fail={"s2"})
+        first = list(export_source_fulltexts(mock_client, "nb-1", concurrency=4))
+        assert [r["source_id"] for r in first] == ["s1", "s2"]
+        assert first[0]["content"] == "text s1"
+        assert first[1]["error"] == "boom"
+        mock_client.get_source_fulltexts.assert_called_with(["s1", "s2"], concurrency=4)
+
+        self._fetches(mock_client)
+        second = {r["source_id"]: r for r in export_source_fulltexts(mock_client, "nb-1")}
+        assert second["s1"]["cached"] is True
+        assert second["s1"]["char_count"] == len("text s1")
+        assert second["s2"]["cached"] is False
+        mock_client.get_source_fulltexts.assert_called_with(["s2"], concurrency=8)
+
+    def test_refresh_ignores_cache(self, mock_client, cache):
+        cache.put("s1", {"content": "old", "title": "Old"})
+        self._fetches(mock_client)
+        records = list(export_source_fulltexts(mock_client, "nb-1", refresh=True))
+        assert {r["source_id"]: r["content"] for r in records}["s1"] == "text s1"
+        assert cache.get("s1")["content"] == "text s1"
+
+    def test_validation_and_listing_errors(self, mock_client, cache):
+        with pytest.raises(ValidationError, match="concurrency"):
+            export_source_fulltexts(mock_client, "nb-1", concurrency=0)
+        mock_client.get_notebook_sources_with_types.side_effect = RuntimeError("down")
+        with pytest.raises(ServiceError, match="Failed to list sources"):
+            export_source_fulltexts(mock_client, "nb-1")
+
+
+class TestSearchIndex:
+    """Test sync_search_index and search_sources."""
+
+    @pytest.fixture
+    def stores(self, tmp_path):
+        cache = FulltextCache(tmp_path / "fulltext.sqlite3")
+        index = SearchIndex(tmp_path / "search.sqlite3")
+        with (
+            patch("notebooklm_tools.services.sources.get_fulltext_cache", return_value=cache),
+            patch("notebooklm_tools.services.sources.get_search_index", return_value=index),
+        ):
+            yield cache, index
+        cache.close()
+        index.close()
+
+    def test_sync_is_incremental(self, mock_client, stores):
+        cache, index = stores
+        cache.put("s1", {"content": "cached alpha text", "title": ""})
+        mock_client.get_source_fulltexts.side_effect = lambda ids, concurrency=8: iter(
+            {"index": i, "source_id": sid, "content": "fetched beta text", "title": "B"}
+            for i, sid in enumerate(ids)
+        )
+
+        first = sync_search_index(mock_client, "nb-1", concurrency=2)
+
+        assert first == {
+            "notebook_id": "nb-1",
+            "added": 2,
+            "updated": 0,
+            "removed": 0,
+            "unchanged": 0,
+            "pending": 0,
+        }
+        mock_client.get_source_fulltexts.assert_called_once_with(["s2"], concurrency=2)
+        assert search_sources("alpha")[0]["title"] == "Source 1"
+        assert cache.get("s2")["content"] == "fetched beta text"
+
+        mock_client.get_notebook_sources_with_types.return_value = [
+            {"id": "s2", "title": "Source 2"}
+        ]
+        second = sync_search_index(mock_client, "nb-1")
+
+        assert second == {
+            "notebook_id": "nb-1",
+            "added": 0,
+            "updated": 0,
+            "removed": 1,
+            "unchanged": 1,
+            "pending": 0,
+        }
+        assert mock_client.get_source_fulltexts.call_args.args[0] == []
+        assert search_sources("alpha") == []
+        assert [h["source_id"] for h in search_sources("beta", notebook_id="nb-1")] == ["s2"]
+
+    def test_renamed_sources_are_reindexed(self, mock_client, stores):
+        cache, _ = stores
+        cache.put("s1", {"content": "alpha text", "title": ""})
+        cache.put("s2", {"content": "beta text", "title": ""})
+        sync_search_index(mock_client, "nb-1")
+
+        mock_client.get_notebook_sources_with_types.return_value = [
+            {"id": "s1", "title": "Renamed"},
+            {"id": "s2", "title": "Source 2"},
+        ]
+        result = sync_search_index(mock_client, "nb-1")
+
+        assert (result["updated"], result["unchanged"]) == (1, 1)
+        assert search_sources("renamed")[0]["source_id"] == "s1"
+        mock_client.get_source_fulltexts.assert_called_with([], concurrency=8)
+
+    def test_refresh_refetches_indexed_sources(self, mock_client, stores):
+        cache, index = stores
+        cache.put("s1", {"content": "old alpha text", "title": ""})
+        cache.put("s2", {"content": "old beta text", "title": ""})
+        sync_search_index(mock_client, "nb-1")
+        mock_client.get_source_fulltexts.side_effect = lambda ids, concurrency=8: iter(
+            [
+                {"index": 0, "source_id": "s1", "content": "new gamma text"},
+                {"index": 1, "source_id": "s2", "error": "boom"},
+            ]
+        )
+
+        result = sync_search_index(mock_client, "nb-1", refresh=True)
+
+        mock_client.get_source_fulltexts.assert_called_with(["s1", "s2"], concurrency=8)
+        assert (result["updated"], result["pending"], result["unchanged"]) == (1, 1, 0)
+        assert [h["source_id"] for h in search_sources("gamma")] == ["s1"]
+        assert search_sources("alpha") == []
+        # A failed re-fetch keeps the old entry searchable.
+        assert [h["source_id"] for h in search_sources("beta")] == ["s2"]
+        assert index.source_ids("nb-1") == {"s1", "s2"}
+
+    def test_sources_without_text_stay_pending(self, mock_client, stores):
+        _, index = stores
+        mock_client.get_source_fulltexts.side_effect = lambda ids, concurrency=8: iter(
+            [
+                {"index": 0, "source_id": "s1", "content": ""},
+                {"index": 1, "source_id": "s2", "error": "boom"},
+            ]
+        )
+
+        result = sync_search_index(mock_client, "nb-1")
+
+        assert (result["added"], result["pending"]) == (0, 2)
+        assert index.source_ids("nb-1") == set()
+
+    def test_validation_and_listing_errors(self, mock_client, stores):
+        with pytest.raises(ValidationError, match="empty"):
+            search_sources("  ")
+        with pytest.raises(ValidationError, match="limit"):
+            search_sources("x", limit=0)
+        with pytest.raises(ValidationError, match="concurrency"):
+            sync_search_index(mock_client, "nb-1", concurrency=17)
+        mock_client.get_notebook_sources_with_types.side_effect = RuntimeError("down")
+        with pytest.raises(ServiceError, match="Failed to list sources"):
+            sync_search_index(mock_client, "nb-1")
+
+
+class TestIngestUrls:
+    """Test ingest_urls."""
+
+    def test_maps_reports(self, mock_client):
+        mock_client.add_url_sources_chunked.return_value = iter(
+            [
+                {
+                    "index": 0,
+                    "url": "https://a",
+                    "status": "added",
+                    "id": "s1",
+                    "title": "A",
+                    "attempts": 1,
+                },
+                {
+                    "index": 1,
+                    "url": "https://b",
+                    "status": "failed",
+                    "attempts": 3,
+                    "error": "boom",
+                },
+            ]
+        )
+
+        items = list(ingest_urls(mock_client, "nb-1", ["https://a", "https://b"], chunk_size=10))
+
+        assert items[0]["source_id"] == "s1"
+        assert items[1] == {
+            "index": 1,
+            "url": "https://b",
+            "status": "failed",
+            "source_id": None,
+            "title": None,
+            "attempts": 3,
+            "error": "boom",
+        }
+        mock_client.add_url_sources_chunked.assert_called_once_with(
+            "nb-1", ["https://a", "https://b"], chunk_size=10, concurrency=4, max_attempts=3
+        )
+
+    def test_validates_eagerly(self, mock_client):
+        with pytest.raises(ValidationError, match="No URLs"):
+            ingest_urls(mock_client, "nb-1", [])
+        with pytest.raises(ValidationError, match="not allowed"):
+            ingest_urls(mock_client, "nb-1", ["ftp://a"])
+        with pytest.raises(ValidationError, match="chunk size"):
+            ingest_urls(mock_client, "nb-1", ["https://a"], chunk_size=0)
+        with pytest.raises(ValidationError, match="concurrency"):
+            ingest_urls(mock_client, "nb-1", ["https://a"], concurrency=9)
+        mock_client.add_url_sources_chunked.assert_not_called()
+
+
+class TestDriveSync:
+    """Test drive_sync."""
+
+    @pytest.fixture
+    def state(self, tmp_path, text_stores):
+        state = DriveSyncState(tmp_path / "drive_sync.sqlite3")
+        with patch("notebooklm_tools.services.sources.get_drive_sync_state", return_value=state):
+            yield state
+        state.close()
+
+    @staticmethod
+    def _drive(source_id):
+        return {
+            "id": source_id,
+            "title": source_id.upper(),
+            "can_sync": True,
+            "drive_doc_id": f"d-{source_id}",
+        }
+
+    def test_syncs_only_stale_sources(self, mock_client, state):
+        mock_client.get_notebook_sources_with_types.side_effect = lambda nb: {
+            "nb-1": [self._drive("a"), self._drive("b"), {"id": "web", "can_sync": False}],
+            "nb-2": [self._drive("c")],
+        }[nb]
+        freshness = {"a": True, "b": False, "c": None}
+        mock_client.check_source_freshness.side_effect = freshness.get
+        mock_client.sync_drive_source.return_value = {"id": "b", "synced_at": 1700000000}
+
+        items = {
+            i["source_id"]: i for i in drive_sync(mock_client, ["nb-1", "nb-2"], concurrency=3)
+        }
+
+        assert {sid: i["status"] for sid, i in items.items()} == {
+            "a": "fresh",
+            "b": "synced",
+            "c": "unknown",
+        }
+        assert items["b"]["synced_at"] == 1700000000
+        assert items["c"]["notebook_id"] == "nb-2"
+        mock_client.sync_drive_source.assert_called_once_with("b")
+        assert state.verified_within("a", "d-a", 60)
+        assert state.verified_within("b", "d-b", 60)
+
+    def test_synced_source_text_is_fetched_again(self, mock_client, state, text_stores):
+        cache, index = text_stores
+        for sid in ("a", "b"):
+            cache.put(sid, {"content": f"old {sid}", "title": sid.upper()})
+            index.upsert("nb-1", sid, {"content": f"old {sid}"})
+        mock_client.get_notebook_sources_with_types.return_value = [
+            self._drive("a"),
+            self._drive("b"),
+        ]
+        mock_client.check_source_freshness.side_effect = {"a": True, "b": False}.get
+        mock_client.sync_drive_source.return_value = {"id": "b", "synced_at": 1700000000}
+        list(drive_sync(mock_client, ["nb-1"]))
+
+        mock_client.get_source_fulltexts.side_effect = lambda ids, concurrency=8: iter(
+            {"index": i, "source_id": sid, "content": f"new {sid}", "title": ""}
+            for i, sid in enumerate(ids)
+        )
+        records = {r["source_id"]: r for r in export_source_fulltexts(mock_client, "nb-1")}
+
+        mock_client.get_source_fulltexts.assert_called_once_with(["b"], concurrency=8)
+        assert records["a"]["content"] == "old a"
+        assert records["b"]["content"] == "new b"
+        assert index.source_ids("nb-1") == {"a"}
+
+    def test_recheck_after_skips_recently_verified(self, mock_client, state):
+        mock_client.get_notebook_sources_with_types.return_value = [
+            self._drive("a"),
+            self._drive("b"),
+        ]
+        mock_client.check_source_freshness.return_value = True
+        state.record("a", "d-a")
+
+        items = list(drive_sync(mock_client, ["nb-1"], recheck_after=3600))
+
+        assert [(i["source_id"], i["status"]) for i in items] == [("a", "skipped"), ("b", "fresh")]
+        mock_client.check_source_freshness.assert_called_once_with("b")
+
+    def test_force_and_failures(self, mock_client, state):
+        mock_client.get_notebook_sources_with_types.return_value = [self._drive("a")]
+        mock_client.sync_drive_source.side_effect = RuntimeError("quota")
+
+        items = list(drive_sync(mock_client, ["nb-1"], force=True))
+
+        assert items[0]["status"] == "failed"
+        assert items[0]["error"] == "quota"
+        mock_client.check_source_freshness.assert_not_called()
+
+    def test_validation_and_listing_errors(self, mock_client, state):
+        with pytest.raises(ValidationError, match="No notebook IDs"):
+            drive_sync(mock_client, [])
+        with pytest.raises(ValidationError, match="concurrency"):
+            drive_sync(mock_client, ["nb-1"], concurrency=0)
+        mock_client.get_notebook_sources_with_types.side_effect = RuntimeError("down")
+        with pytest.raises(ServiceError, match="Failed to list sources"):
+            drive_sync(mock_client, ["nb-1"])
@@ -1,7 +1,7 @@
 """Tests for services.studio module."""
 
 import json
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -392,6 +392,54 @@ class TestGetStudioStatus:
         with pytest.raises(ServiceError, match="Failed to poll"):
             get_studio_status(mock_client, "nb-1")
 
+    def test_since_returns_only_changed_artifacts(self, mock_client):
+        first = get_studio_status(mock_client, "nb-1")
+        assert first["incremental"] is False
+        assert len(first["artifacts"]) == 3
+
+        unchanged = get_studio_status(mock_client, "nb-1", since=first["cursor"])
+        assert unchanged["incremental"] is True
+        assert unchanged["artifacts"] == []
+        assert unchanged["cursor"] == first["cursor"]
+        assert unchanged["total"] == 3
+
+        mock_client.poll_studio_status.return_value = [
+            {
+                "artifact_id": "a1",
+                "type": "audio",
+                "status": "completed",
+                "audio_url": "https://signed/rotated",
+            },
+            {"artifact_id": "a2", "type": "report", "status": "completed", "report_content": "x"},
+        ]
+        mock_client.list_mind_maps.return_value = []
+        changed = get_studio_status(mock_client, "nb-1", since=first["cursor"])
+        # A rotated signed URL is not a change; a new status is.
+        assert [a["artifact_id"] for a in changed["artifacts"]] == ["a2"]
+        assert changed["removed"] == ["mm-1"]
+        assert changed["cursor"] != first["cursor"]
+
+    def test_unknown_cursor_returns_everything(self, mock_client):
+        result = get_studio_status(mock_client, "nb-1", since="expired")
+        assert result["incremental"] is False
+        assert len(result["artifacts"]) == 3
+
+    def test_heavy_fields_omitted_unless_requested(self, mock_client):
+        mock_client.poll_studio_status.return_value = [
+            {
+                "artifact_id": "r1",
+                "type": "report",
+                "status": "completed",
+                "report_content": "long body",
+                "custom_instructions": "focus",
+            }
+        ]
+        light = get_studio_status(mock_client, "nb-1", include_content=False)
+        assert "report_content" not in light["artifacts"][0]
+        assert "custom_instructions" not in light["artifacts"][0]
+        full = get_studio_status(mock_client, "nb-1")
+        assert full["artifacts"][0]["report_content"] == "long body"
+
 
 class TestReviseArtifact:
     """Test revise_artifact function."""
@@ -468,6 +516,16 @@ class TestReviseArtifact:
         assert err.hint is not None
         assert "1-2 minutes" in err.hint
 
+    def test_success_invalidates_cached_original(self, mock_client):
+        mock_client.revise_slide_deck.return_value = {"artifact_id": "art-456"}
+        cache = MagicMock()
+        with patch("notebooklm_tools.services.studio.get_artifact_cache", return_value=cache):
+            result = revise_artifact(
+                mock_client, "art-123", [{"slide": 1, "instruction": "Tighten the title"}]
+            )
+        assert result["artifact_id"] == "art-456"
+        cache.invalidate.assert_called_once_with("art-123")
+
 
 class TestRenameArtifact:
     """Test rename_artifact function."""
@@ -500,14 +558,24 @@ class TestDeleteArtifact:
     """Test delete_artifact function."""
 
     def test_success(self, mock_client):
-        delete_artifact(mock_client, "art-1", "nb-1")
+        cache = MagicMock()
+        with patch("notebooklm_tools.services.studio.get_artifact_cache", return_value=cache):
+            delete_artifact(mock_client, "art-1", "nb-1")
         mock_client.delete_studio_artifact.assert_called_once_with("art-1", notebook_id="nb-1")
+        cache.invalidate.assert_called_once_with("art-1")
 
     def test_falsy_result(self, mock_client):
         mock_client.delete_studio_artifact.return_value = False
         with pytest.raises(ServiceError, match="Delete returned falsy"):
             delete_artifact(mock_client, "art-1", "nb-1")
 
+    def test_cache_failure_does_not_fail_delete(self, mock_client):
+        with patch(
+            "notebooklm_tools.services.studio.get_artifact_cache",
+            side_effect=OSError("read-only"),
+        ):
+            delete_artifact(mock_client, "art-1", "nb-1")
+
     def test_api_error(self, mock_client):
         mock_client.delete_studio_artifact.side_effect = RuntimeError("fail")
         with pytest.raises(ServiceError, match="Failed to delete"):
@@ -0,0 +1,232 @@
+"""Tests for the durable studio queue service."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from notebooklm_tools.core.errors import ClientAuthenticationError, ResourceExhaustedError
+from notebooklm_tools.core.studio_jobs import StudioJobStore
+from notebooklm_tools.core.studio_watcher import TYPE_INTERVALS, StudioWatcher
+from notebooklm_tools.services.errors import ServiceError, ValidationError
+from notebooklm_tools.services.studio_queue import enqueue_studio_jobs, run_studio_queue
+
+CREATE = "notebooklm_tools.services.studio_queue.studio_service.create_artifact"
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = StudioJobStore(tmp_path / "jobs.sqlite3")
+    yield store
+    store.close()
+
+
+@pytest.fixture(autouse=True)
+def fast_polling():
+    with patch.dict(TYPE_INTERVALS, {"report": (0.0, 0.0)}):
+        yield
+
+
+def _client(statuses):
+    """Client whose studio list reports `statuses` (artifact_id -> status)."""
+    client = MagicMock()
+    client.poll_studio_status.side_effect = lambda nb: [
+        {"artifact_id": aid, "status": status, "type": "report"} for aid, status in statuses.items()
+    ]
+    return client
+
+
+def _created(artifact_id):
+    return {"artifact_type": "report", "artifact_id": artifact_id, "status": "in_progress"}
+
+
+class TestEnqueue:
+    def test_validates_type_and_options(self, store):
+        with pytest.raises(ValidationError):
+            enqueue_studio_jobs(["nb-1"], "podcast", store=store)
+        with pytest.raises(ValidationError, match="Unknown report option"):
+            enqueue_studio_jobs(["nb-1"], "report", options={"bogus": 1}, store=store)
+        with pytest.raises(ValidationError):
+            enqueue_studio_jobs([], "report", store=store)
+
+    def test_one_job_per_notebook(self, store):
+        ids = enqueue_studio_jobs(
+            ["nb-1", "nb-2", "nb-1"],
+            "report",
+            options={"report_format": "Study Guide"},
+            store=store,
+        )
+        assert len(ids) == 2
+        assert [j["options"] for j in store.jobs("default")] == [
+            {"report_format": "Study Guide"}
+        ] * 2
+
+
+class TestRunQueue:
+    def test_generates_tracks_and_downloads(self, store, tmp_path):
+        enqueue_studio_jobs(
+            ["nb-1", "nb-2"], "report", download_dir=str(tmp_path / "out"), store=store
+        )
+        client = _client({"art-nb-1": "completed", "art-nb-2": "completed"})
+        events = []
+
+        async def fake_download(client, notebook_id, artifact_type, path, artifact_id):
+            return {"artifact_type": artifact_type, "path": path}
+
+        with (
+            patch(CREATE, side_effect=lambda c, nb, t, **kw: _created(f"art-{nb}")) as create,
+            patch(
+                "notebooklm_tools.services.studio_queue.downloads_service.download_async",
+                side_effect=fake_download,
+            ),
+        ):
+            result = run_studio_queue(
+                client, concurrency=2, store=store, on_event=events.append, sleep=lambda s: None
+            )
+
+        assert create.call_count == 2
+        assert result["completed"] == 2 and result["queued"] == 0
+        assert [e["state"] for e in events].count("completed") == 2
+        paths = sorted(job["path"] for job in store.jobs("default"))
+        assert paths == [
+            str(tmp_path / "out" / "nb-1" / "report_art-nb-1.md"),
+            str(tmp_path / "out" / "nb-2" / "report_art-nb-2.md"),
+        ]
+        assert store.starts_today("default") == 2
+
+    def test_respects_concurrency(self, store):
+        enqueue_studio_jobs(["nb-1", "nb-2", "nb-3"], "report", store=store)
+        statuses = {}
+        client = _client(statuses)
+        in_flight = []
+
+        def create(c, nb, t, **kw):
+            in_flight.append(sum(s == "in_progress" for s in statuses.values()))
+            statuses[f"art-{nb}"] = "in_progress"
+            return _created(f"art-{nb}")
+
+        def finish_all(seconds):
+            for aid in statuses:
+                statuses[aid] = "completed"
+
+        with patch(CREATE, side_effect=create):
+            result = run_studio_queue(client, concurrency=1, store=store, sleep=finish_all)
+
+        assert result["completed"] == 3
+        assert max(in_flight) == 0  # Never a second generation while one was in flight
+
+    def test_failed_generation_is_retried(self, store):
+        enqueue_studio_jobs(["nb-1"], "report", max_attempts=2, store=store)
+        attempts = iter(["art-bad", "art-good"])
+        client = _client({"art-bad": "failed", "art-good": "completed"})
+
+        with patch(CREATE, side_effect=lambda c, nb, t, **kw: _created(next(attempts))):
+            result = run_studio_queue(client, store=store, retry_delay=0, sleep=lambda s: None)
+
+        [job] = store.jobs("default")
+        assert result["completed"] == 1
+        assert job["state"] == "completed" and job["attempts"] == 2
+
+    def test_timed_out_generation_is_checked_not_regenerated(self, store):
+        enqueue_studio_jobs(["nb-1"], "report", store=store)
+        statuses = {"art-1": "in_progress"}
+        client = _client(statuses)
+        watcher = StudioWatcher(client, timeout=0)
+        naps = []
+
+        def sleep(seconds):
+            naps.append(seconds)
+            if len(naps) == 2:
+                statuses["art-1"] = "completed"
+
+        with patch(CREATE, side_effect=lambda c, nb, t, **kw: _created("art-1")) as create:
+            result = run_studio_queue(client, store=store, watcher=watcher, sleep=sleep)
+
+        create.assert_called_once()
+        [job] = store.jobs("default")
+        assert result["completed"] == 1
+        assert job["state"] == "completed" and job["attempts"] == 1
+
+    def test_timed_out_generation_that_vanished_fails_without_regenerating(self, store):
+        enqueue_studio_jobs(["nb-1"], "report", max_attempts=3, store=store)
+        client = _client({})  # Deleted before it ever showed up in the studio list
+        watcher = StudioWatcher(client, timeout=0)
+
+        with patch(CREATE, side_effect=lambda c, nb, t, **kw: _created("art-1")) as create:
+            result = run_studio_queue(client, store=store, watcher=watcher, sleep=lambda s: None)
+
+        create.assert_called_once()
+        [job] = store.jobs("default")
+        assert result["failed"] == 1
+        assert job["state"] == "failed" and "no longer exists" in job["error"]
+
+    def test_generation_missing_from_the_list_fails_without_regenerating(self, store):
+        enqueue_studio_jobs(["nb-1"], "report", max_attempts=3, store=store)
+        client = _client({})
+        watcher = StudioWatcher(client, missing_grace=0)
+
+        with patch(CREATE, side_effect=lambda c, nb, t, **kw: _created("art-1")) as create:
+            result = run_studio_queue(client, store=store, watcher=watcher, sleep=lambda s: None)
+
+        create.assert_called_once()
+        [job] = store.jobs("default")
+        assert result["failed"] == 1
+        assert job["state"] == "failed" and "no longer exists" in job["error"]
+
+    def test_auth_error_while_tracking_propagates(self, store):
+        [job_id] = enqueue_studio_jobs(["nb-1"], "report", store=store)
+        store.claim_next("default")
+        store.mark_generating(job_id, "art-1")
+        client = MagicMock()
+        client.poll_studio_status.side_effect = ClientAuthenticationError("expired")
+
+        with patch(CREATE) as create, pytest.raises(ServiceError, match="expired"):
+            run_studio_queue(client, store=store, sleep=lambda s: None)
+
+        create.assert_not_called()
+        [job] = store.jobs("default")
+        assert job["state"] == "generating"  # Picked up again by the next run
+
+    def test_resource_exhausted_pauses_account(self, store):
+        enqueue_studio_jobs(["nb-1", "nb-2"], "report", store=store)
+        exhausted = ServiceError("rate limited", user_message="Rate limited")
+        exhausted.__cause__ = ResourceExhaustedError("quota")
+        events = []
+
+        with patch(CREATE, side_effect=exhausted):
+            result = run_studio_queue(
+                _client({}), store=store, on_event=events.append, sleep=lambda s: None
+            )
+
+        assert result["paused_until"] is not None
+        assert result["queued"] == 2
+        assert [e["state"] for e in events] == ["paused"]
+        # The paused job did not spend an attempt.
+        assert all(job["attempts"] == 0 for job in store.jobs("default"))
+
+    def test_daily_limit_stops_starting(self, store):
+        enqueue_studio_jobs(["nb-1", "nb-2"], "report", store=store)
+        client = _client({"art-nb-1": "completed"})
+
+        with patch(CREATE, side_effect=lambda c, nb, t, **kw: _created(f"art-{nb}")) as create:
+            result = run_studio_queue(client, daily_limit=1, store=store, sleep=lambda s: None)
+
+        assert create.call_count == 1
+        assert result["completed"] == 1 and result["queued"] == 1
+        assert result["paused_until"] is not None
+
+    def test_resumes_tracking_generating_jobs(self, store):
+        [job_id] = enqueue_studio_jobs(["nb-1"], "report", store=store)
+        store.claim_next("default")
+        store.mark_generating(job_id, "art-1")
+
+        with patch(CREATE) as create:
+            result = run_studio_queue(
+                _client({"art-1": "completed"}), store=store, sleep=lambda s: None
+            )
+
+        create.assert_not_called()
+        assert result["completed"] == 1
+
+    def test_invalid_concurrency(self, store):
+        with pytest.raises(ValidationError):
+            run_studio_queue(MagicMock(), concurrency=0, store=store)
@@ -150,17 +150,13 @@ class TestFileUploadProtocol:
         mock_response.status_code = 200
         mock_response.raise_for_status = Mock()
 
-        with patch("httpx.Client") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client.__enter__ = Mock(return_value=mock_client)
-            mock_client.__exit__ = Mock(return_value=False)
-            mock_client.post = Mock(return_value=mock_response)
-            mock_client_class.return_value = mock_client
+        mock_client = MagicMock()
+        mock_client.post = Mock(return_value=mock_response)
 
-            with patch.object(client, "_get_httpx_cookies", return_value=httpx.Cookies()):
-                upload_url = client._start_resumable_upload(
-                    "notebook-123", "test.pdf", 1024, "source-id-123"
-                )
+        with patch.object(client, "_get_upload_client", return_value=mock_client):
+            upload_url = client._start_resumable_upload(
+                "notebook-123", "test.pdf", 1024, "source-id-123"
+            )
 
         assert upload_url == "https://upload.url/session123"
 
@@ -181,18 +177,14 @@ class TestFileUploadProtocol:
         mock_response.status_code = 200
         mock_response.raise_for_status = Mock()
 
-        with patch("httpx.Client") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client.__enter__ = Mock(return_value=mock_client)
-            mock_client.__exit__ = Mock(return_value=False)
-            mock_client.post = Mock(return_value=mock_response)
-            mock_client_class.return_value = mock_client
+        mock_client = MagicMock()
+        mock_client.post = Mock(return_value=mock_response)
 
-            with patch.object(client, "_get_httpx_cookies", return_value=httpx.Cookies()):  # noqa: SIM117
-                with pytest.raises(FileUploadError, match="Failed to get upload URL"):
-                    client._start_resumable_upload(
-                        "notebook-123", "test.pdf", 1024, "source-id-123"
-                    )
+        with (
+            patch.object(client, "_get_upload_client", return_value=mock_client),
+            pytest.raises(FileUploadError, match="Failed to get upload URL"),
+        ):
+            client._start_resumable_upload("notebook-123", "test.pdf", 1024, "source-id-123")
 
     def test_upload_file_streaming_success(self):
         """Test streaming file upload (step 3)."""
@@ -215,15 +207,11 @@ class TestFileUploadProtocol:
             mock_response.status_code = 200
             mock_response.raise_for_status = Mock()
 
-            with patch("httpx.Client") as mock_client_class:
-                mock_client = MagicMock()
-                mock_client.__enter__ = Mock(return_value=mock_client)
-                mock_client.__exit__ = Mock(return_value=False)
-                mock_client.post = Mock(return_value=mock_response)
-                mock_client_class.return_value = mock_client
+            mock_client = MagicMock()
+            mock_client.post = Mock(return_value=mock_response)
 
-                with patch.object(client, "_get_httpx_cookies", return_value=httpx.Cookies()):
-                    client._upload_file_streaming("https://upload.url/session123", temp_path)
+            with patch.object(client, "_get_upload_client", return_value=mock_client):
+                client._upload_file_streaming("https://upload.url/session123", temp_path)
 
             # Verify post was called
             mock_client.post.assert_called_once()
@@ -265,7 +253,9 @@ class TestAddFileIntegration:
             # Verify all three steps were called
             mock_register.assert_called_once_with("notebook-123", temp_path.name)
             mock_start.assert_called_once()
-            mock_upload.assert_called_once_with("https://upload.url/session", temp_path.resolve())
+            mock_upload.assert_called_once()
+            assert mock_upload.call_args.args == ("https://upload.url/session", temp_path.resolve())
+            assert mock_upload.call_args.kwargs["offset"] == 0
 
             # Verify result
             assert result["id"] == "source-id-123"
@@ -301,7 +291,9 @@ class TestAddFileIntegration:
 
             mock_register.assert_called_once_with("notebook-123", temp_path.name)
             mock_start.assert_called_once()
-            mock_upload.assert_called_once_with("https://upload.url/session", temp_path.resolve())
+            mock_upload.assert_called_once()
+            assert mock_upload.call_args.args == ("https://upload.url/session", temp_path.resolve())
+            assert mock_upload.call_args.kwargs["offset"] == 0
 
             assert result["id"] == "source-id-epub"
             assert result["title"] == temp_path.name
@@ -309,6 +301,264 @@ class TestAddFileIntegration:
             temp_path.unlink()
 
 
+class TestAddFilesPipeline:
+    """Test concurrent multi-file uploads."""
+
+    def _make_client(self):
+        from notebooklm_tools.core.sources import SourceMixin
+
+        client = SourceMixin.__new__(SourceMixin)
+        client.cookies = {"test": "cookie"}
+        client.csrf_token = "test-csrf"
+        client._session_id = "test-session"
+        client._client = None
+        return client
+
+    def test_add_files_uploads_each_file_and_reports_progress(self, tmp_path):
+        client = self._make_client()
+        paths = []
+        for name in ("a.txt", "b.md", "c.pdf"):
+            path = tmp_path / name
+            path.write_text(f"content of {name}")
+            paths.append(path)
+        progress = []
+
+        def fake_stream(upload_url, file_path, on_progress=None, **kwargs):
+            on_progress(file_path.stat().st_size)
+
+        with (
+            patch.object(
+                client, "_register_file_source", side_effect=lambda nb, name: f"id-{name}"
+            ),
+            patch.object(
+                client,
+                "_start_resumable_upload",
+                side_effect=lambda nb, name, size, sid: f"https://upload/{sid}",
+            ) as mock_start,
+            patch.object(client, "_upload_file_streaming", side_effect=fake_stream),
+        ):
+            results = sorted(
+                client.add_files(
+                    "nb-1",
+                    paths,
+                    concurrency=2,
+                    on_progress=lambda *args: progress.append(args),
+                ),
+                key=lambda r: r["index"],
+            )
+
+        assert [r["id"] for r in results] == ["id-a.txt", "id-b.md", "id-c.pdf"]
+        assert [r["bytes"] for r in results] == [p.stat().st_size for p in paths]
+        assert all("error" not in r for r in results)
+        assert mock_start.call_count == 3
+        assert sorted(progress) == sorted(
+            (i, p.stat().st_size, p.stat().st_size) for i, p in enumerate(paths)
+        )
+
+    def test_add_files_reports_failures_without_stopping_others(self, tmp_path):
+        client = self._make_client()
+        good = tmp_path / "good.txt"
+        good.write_text("ok")
+        missing = tmp_path / "missing.txt"
+
+        with (
+            patch.object(client, "_register_file_source", return_value="src-1"),
+            patch.object(client, "_start_resumable_upload", return_value="https://upload/s"),
+            patch.object(client, "_upload_file_streaming"),
+        ):
+            results = {r["index"]: r for r in client.add_files("nb-1", [missing, good])}
+
+        assert "File not found" in results[0]["error"]
+        assert results[1]["id"] == "src-1"
+
+
+class _FakeUploadServer:
+    """In-memory resumable upload endpoint for httpx.MockTransport."""
+
+    def __init__(self, fail_at_request=None, fail_status=503, partial_bytes=0):
+        self.data = b""
+        self.final = False
+        self.commands = []
+        self.requests = 0
+        self.fail_at_request = fail_at_request
+        self.fail_status = fail_status
+        self.partial_bytes = partial_bytes
+
+    def __call__(self, request):
+        command = request.headers["x-goog-upload-command"]
+        self.commands.append((command, request.headers.get("x-goog-upload-offset")))
+        if command == "query":
+            return httpx.Response(
+                200,
+                headers={
+                    "x-goog-upload-status": "final" if self.final else "active",
+                    "x-goog-upload-size-received": str(len(self.data)),
+                },
+            )
+        self.requests += 1
+        body = request.read()
+        assert int(request.headers["x-goog-upload-offset"]) == len(self.data)
+        if self.requests == self.fail_at_request:
+            # Server keeps part of the chunk before the connection fails.
+            self.data += body[: self.partial_bytes]
+            return httpx.Response(self.fail_status)
+        self.data += body
+        self.final = "finalize" in command
+        return httpx.Response(200)
+
+
+class TestChunkedResumableUpload:
+    """Chunked uploads, offset recovery and cross-process resume."""
+
+    def _make_client(self, server, chunk_size=1024):
+        from notebooklm_tools.core.sources import SourceMixin
+
+        client = SourceMixin.__new__(SourceMixin)
+        client.cookies = {"test": "cookie"}
+        client.csrf_token = "test-csrf"
+        client._session_id = "test-session"
+        client._client = None
+        client.UPLOAD_CHUNK_SIZE = chunk_size
+        http = httpx.Client(transport=httpx.MockTransport(server))
+        return client, patch.object(client, "_get_upload_client", return_value=http)
+
+    def test_large_file_is_sent_in_chunks_then_finalized(self, tmp_path):
+        payload = bytes(range(256)) * 12  # 3072 bytes
+        path = tmp_path / "big.pdf"
+        path.write_bytes(payload)
+        server = _FakeUploadServer()
+        client, upload_client = self._make_client(server)
+        commits = []
+
+        with upload_client:
+            client._upload_file_streaming("https://upload/s", path, on_commit=commits.append)
+
+        assert server.data == payload
+        assert server.commands == [
+            ("upload", "0"),
+            ("upload", "1024"),
+            ("upload, finalize", "2048"),
+        ]
+        assert commits == [1024, 2048, 3072]
+
+    def test_failed_chunk_resumes_from_committed_offset(self, tmp_path):
+        payload = b"x" * 3000
+        path = tmp_path / "big.pdf"
+        path.write_bytes(payload)
+        server = _FakeUploadServer(fail_at_request=2, partial_bytes=300)
+        client, upload_client = self._make_client(server)
+
+        with upload_client, patch("notebooklm_tools.core.sources.time.sleep"):
+            client._upload_file_streaming("https://upload/s", path)
+
+        assert server.data == payload
+        # Second chunk failed after 300 bytes; the query reports 1324 committed
+        # and the upload continues from there instead of from byte zero.
+        assert ("query", None) in server.commands
+        assert server.commands[-2:] == [("upload", "1324"), ("upload, finalize", "2348")]
+
+    def test_non_retryable_rejection_raises(self, tmp_path):
+        path = tmp_path / "big.pdf"
+        path.write_bytes(b"x" * 3000)
+        server = _FakeUploadServer(fail_at_request=1, fail_status=400)
+        client, upload_client = self._make_client(server)
+
+        with upload_client, pytest.raises(FileUploadError, match="rejected"):
+            client._upload_file_streaming("https://upload/s", path)
+
+    def test_failed_offset_query_is_retried(self, tmp_path):
+        payload = b"x" * 3000
+        path = tmp_path / "big.pdf"
+        path.write_bytes(payload)
+        server = _FakeUploadServer(fail_at_request=2, partial_bytes=300)
+        queries = []
+
+        def flaky(request):
+            if request.headers["x-goog-upload-command"] == "query" and not queries:
+                queries.append(request)
+                raise httpx.ReadTimeout("slow", request=request)
+            return server(request)
+
+        client, upload_client = self._make_client(flaky)
+
+        with upload_client, patch("notebooklm_tools.core.sources.time.sleep"):
+            client._upload_file_streaming("https://upload/s", path)
+
+        assert server.data == payload
+
+    def test_offset_query_failures_end_in_file_upload_error(self, tmp_path):
+        path = tmp_path / "big.pdf"
+        path.write_bytes(b"x" * 3000)
+        server = _FakeUploadServer(fail_at_request=1)
+
+        def unreachable_query(request):
+            if request.headers["x-goog-upload-command"] == "query":
+                raise httpx.ReadTimeout("slow", request=request)
+            return server(request)
+
+        client, upload_client = self._make_client(unreachable_query)
+
+        with (
+            upload_client,
+            patch("notebooklm_tools.core.sources.time.sleep") as sleep,
+            pytest.raises(FileUploadError, match="Upload failed at byte 0"),
+        ):
+            client._upload_file_streaming("https://upload/s", path)
+
+        assert sleep.call_count == client.UPLOAD_MAX_RECOVERIES
+
+    def test_resume_continues_saved_session_without_reregistering(self, tmp_path, monkeypatch):
+        from notebooklm_tools.core import sources
+        from notebooklm_tools.core.uploads import UploadStateStore
+
+        store = UploadStateStore(tmp_path / "uploads")
+        monkeypatch.setattr(sources, "get_upload_state_store", lambda: store)
+        payload = b"y" * 3000
+        path = tmp_path / "audio.mp3"
+        path.write_bytes(payload)
+
+        # First process: the second chunk is rejected and the upload aborts.
+        server = _FakeUploadServer(fail_at_request=2, fail_status=400)
+        client, upload_client = self._make_client(server)
+        with (
+            upload_client,
+            patch.object(client, "_register_file_source", return_value="src-1"),
+            patch.object(client, "_start_resumable_upload", return_value="https://upload/s"),
+            pytest.raises(FileUploadError),
+        ):
+            client.add_file("nb-1", path)
+
+        resolved = path.resolve()
+        stat = resolved.stat()
+        saved = store.load("nb-1", str(resolved), stat.st_size, stat.st_mtime_ns)
+        assert saved is not None and saved.offset == 1024
+
+        # Second process: --resume picks up at the committed offset.
+        server.fail_at_request = None
+        client, upload_client = self._make_client(server)
+        with upload_client, patch.object(client, "_register_file_source") as register:
+            result = client.add_file("nb-1", path, resume=True)
+
+        register.assert_not_called()
+        assert result == {"id": "src-1", "title": "audio.mp3"}
+        assert server.data == payload
+        assert server.commands[-2:] == [("upload", "1024"), ("upload, finalize", "2048")]
+        assert store.load("nb-1", str(resolved), stat.st_size, stat.st_mtime_ns) is None
+
+
+def test_upload_client_is_pooled_and_closed():
+    """Uploads share one pooled client that is closed with the API client."""
+    from notebooklm_tools.core.base import BaseClient
+
+    with patch.object(BaseClient, "_refresh_auth_tokens"):
+        client = BaseClient(cookies={"SID": "x"}, csrf_token="token")
+        first = client._get_upload_client()
+        assert client._get_upload_client() is first
+        client.close()
+        assert client._upload_client is None
+        assert first.is_closed
+
+
 @pytest.mark.e2e
 class TestFileUploadE2E:
     """E2E tests for file upload - requires NOTEBOOKLM_E2E=1."""
@@ -38,7 +38,12 @@ class TestMCPSourceAddFile:
 
             # Verify client.add_file was called with correct args
             mock_client.add_file.assert_called_once_with(
-                "test-notebook-123", temp_path, wait=False, wait_timeout=120.0
+                "test-notebook-123",
+                temp_path,
+                wait=False,
+                wait_timeout=120.0,
+                resume=False,
+                dedupe=False,
             )
 
             # Verify return value
@@ -84,3 +89,37 @@ class TestMCPSourceAddFile:
         assert result["error"] == f"Could not add file source: File not found: {resolved_path}"
         assert "machine running nlm or the MCP server" in result["hint"]
         assert str(requested_path) in result["hint"]
+
+
+class TestMCPSourceAddDirectory:
+    """Test the source_add_directory MCP tool."""
+
+    def test_uploads_directory_and_reports_counts(self, tmp_path, monkeypatch):
+        from notebooklm_tools.mcp.tools import sources
+
+        monkeypatch.setenv("NOTEBOOKLM_MCP_CLI_PATH", str(tmp_path / "store"))
+        corpus = tmp_path / "corpus"
+        corpus.mkdir()
+        (corpus / "a.pdf").write_bytes(b"a")
+        (corpus / "notes.bin").write_bytes(b"ignored")
+        mock_client = MagicMock()
+        mock_client.add_files.side_effect = lambda nb, paths, **kw: iter(
+            [{"index": 0, "file_path": paths[0], "id": "src-a"}]
+        )
+
+        with patch("notebooklm_tools.mcp.tools.sources.get_client", return_value=mock_client):
+            result = sources.source_add_directory(notebook_id="nb-1", directory=str(corpus))
+
+        assert result["status"] == "success"
+        assert result["counts"] == {"uploaded": 1}
+        assert result["results"][0]["path"] == "a.pdf"
+        assert result["manifest_path"].startswith(str(tmp_path / "store"))
+
+    def test_missing_directory_is_an_error(self, tmp_path):
+        from notebooklm_tools.mcp.tools import sources
+
+        with patch("notebooklm_tools.mcp.tools.sources.get_client", return_value=MagicMock()):
+            result = sources.source_add_directory(notebook_id="nb-1", directory=str(tmp_path / "x"))
+
+        assert result["status"] == "error"
+        assert "Not a directory" in result["error"]
@@ -0,0 +1,30 @@
+"""Tests for the MCP server_info tool."""
+
+from unittest.mock import MagicMock, patch
+
+from notebooklm_tools.mcp.tools import server
+
+
+def _server_info(client):
+    with (
+        patch.object(server, "get_existing_client", return_value=client),
+        patch.object(server, "_get_latest_pypi_version", return_value=None),
+        patch.object(server, "_check_auth_status", return_value="configured"),
+    ):
+        return server.server_info()
+
+
+def test_server_info_reports_conversation_cache_stats():
+    client = MagicMock()
+    client.get_conversation_cache_stats.return_value = {"conversations": 2, "total_bytes": 512}
+
+    result = _server_info(client)
+
+    assert result["conversation_cache"] == {"conversations": 2, "total_bytes": 512}
+
+
+def test_server_info_does_not_create_a_client():
+    result = _server_info(None)
+
+    assert result["status"] == "success"
+    assert result["conversation_cache"] is None
@@ -2,7 +2,11 @@
 
 from unittest.mock import MagicMock, patch
 
-from notebooklm_tools.mcp.tools.sources import source_list_drive
+from notebooklm_tools.mcp.tools.sources import (
+    source_get_content,
+    source_list_drive,
+    source_search,
+)
 
 
 def test_source_list_drive_forwards_skip_freshness():
@@ -25,3 +29,56 @@ def test_source_list_drive_forwards_skip_freshness():
 
     assert result["status"] == "success"
     list_drive_sources.assert_called_once_with(client, "nb-1", skip_freshness=True)
+
+
+def test_source_search_syncs_notebook_then_searches():
+    client = MagicMock()
+    hits = [{"source_id": "s1", "snippet": "[term]"}]
+    with (
+        patch("notebooklm_tools.mcp.tools.sources.get_client", return_value=client),
+        patch(
+            "notebooklm_tools.mcp.tools.sources.sources_service.sync_search_index",
+            return_value={"added": 1},
+        ) as sync,
+        patch(
+            "notebooklm_tools.mcp.tools.sources.sources_service.search_sources",
+            return_value=hits,
+        ) as search,
+    ):
+        result = source_search("term", notebook_id="nb-1", limit=5)
+
+    assert result == {
+        "status": "success",
+        "query": "term",
+        "count": 1,
+        "results": hits,
+        "sync": {"added": 1},
+    }
+    sync.assert_called_once_with(client, "nb-1", refresh=False)
+    search.assert_called_once_with("term", notebook_id="nb-1", limit=5)
+
+
+def test_source_search_without_notebook_stays_offline():
+    with (
+        patch("notebooklm_tools.mcp.tools.sources.get_client") as get_client,
+        patch("notebooklm_tools.mcp.tools.sources.sources_service.search_sources", return_value=[]),
+    ):
+        result = source_search("term")
+
+    assert result["status"] == "success"
+    assert result["sync"] is None
+    get_client.assert_not_called()
+
+
+def test_source_get_content_forwards_paging():
+    client = MagicMock()
+    client.get_source_fulltext.return_value = {"content": "abc", "title": "T", "char_count": 10}
+    with patch("notebooklm_tools.mcp.tools.sources.get_client", return_value=client):
+        result = source_get_content("src-1", offset=3, limit=3)
+
+    assert result["status"] == "success"
+    assert (result["content"], result["next_offset"]) == ("abc", 6)
+    client.get_source_fulltext.assert_called_once_with("src-1", offset=3, limit=3)
+
+    with patch("notebooklm_tools.mcp.tools.sources.get_client", return_value=client):
+        assert source_get_content("src-1", limit=0)["status"] == "error"
@@ -1,7 +1,9 @@
 """Unit tests for MCP studio tools."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
+from notebooklm_tools.core.studio_watcher import TYPE_INTERVALS, StudioWatcher
 from notebooklm_tools.mcp.tools import studio
 from notebooklm_tools.services.errors import ServiceError
 
@@ -33,3 +35,137 @@ def test_studio_revise_preserves_hint_on_service_error():
     assert result["status"] == "error"
     assert "PERMISSION_DENIED" in result["error"]
     assert "editable notebook you own" in result["hint"]
+
+
+def _watcher_for(frames):
+    client = MagicMock()
+    frames = list(frames)
+    client.poll_studio_status.side_effect = lambda nb: (
+        frames.pop(0) if len(frames) > 1 else frames[0]
+    )
+    return StudioWatcher(client).start(), client
+
+
+def test_studio_wait_reports_each_artifact_as_it_settles():
+    watcher, client = _watcher_for(
+        [
+            [
+                {
+                    "artifact_id": "a",
+                    "status": "completed",
+                    "type": "audio",
+                    "title": "R",
+                    "audio_url": "https://x/a.m4a",
+                    "video_url": None,
+                },
+                {"artifact_id": "b", "status": "failed", "type": "audio"},
+            ]
+        ]
+    )
+    ctx = MagicMock()
+    ctx.info = AsyncMock()
+    ctx.report_progress = AsyncMock()
+
+    with patch.object(studio, "_watcher", watcher):
+        result = asyncio.run(
+            studio.studio_wait(artifact_ids=["a", "b"], notebook_id="nb-1", timeout=5, ctx=ctx)
+        )
+    watcher.close()
+
+    assert result["status"] == "partial"
+    assert result["artifacts"][0] == {
+        "artifact_id": "a",
+        "status": "completed",
+        "type": "audio",
+        "title": "R",
+        "audio_url": "https://x/a.m4a",
+    }
+    assert result["artifacts"][1]["status"] == "failed"
+    assert result["summary"] == {"completed": 1, "failed": 1, "in_progress": 0}
+    client.poll_studio_status.assert_called_once_with("nb-1")
+    assert ctx.info.await_count == 2
+    ctx.report_progress.assert_awaited_with(2, 2)
+
+
+def test_studio_wait_returns_in_progress_after_timeout():
+    watcher, _ = _watcher_for([[{"artifact_id": "a", "status": "in_progress"}]])
+
+    with patch.object(studio, "_watcher", watcher):
+        result = asyncio.run(studio.studio_wait(artifact_ids="a", notebook_id="nb-1", timeout=0.2))
+    watcher.close()
+
+    assert result["status"] == "partial"
+    assert result["artifacts"] == [{"artifact_id": "a", "status": "in_progress"}]
+    # Nobody is waiting any more, so the shared poller stops checking it.
+    assert watcher.pending == {}
+
+
+def test_studio_wait_reports_unknown_artifacts_as_failed():
+    watcher, _ = _watcher_for([[{"artifact_id": "a", "status": "in_progress"}]])
+
+    with patch.object(studio, "_watcher", watcher):
+        result = asyncio.run(
+            studio.studio_wait(artifact_ids=["does-not-exist"], notebook_id="nb", timeout=3)
+        )
+    watcher.close()
+
+    assert result["status"] == "partial"
+    assert result["artifacts"][0]["status"] == "failed"
+    assert "not found" in result["artifacts"][0]["error"]
+    assert result["summary"] == {"completed": 0, "failed": 1, "in_progress": 0}
+
+
+def test_studio_wait_keeps_watches_other_callers_hold():
+    watcher, _ = _watcher_for([[{"artifact_id": "a", "status": "in_progress"}]])
+    other = watcher.watch("nb-1", "a")
+
+    with patch.object(studio, "_watcher", watcher):
+        asyncio.run(studio.studio_wait(artifact_ids=["a", "a"], notebook_id="nb-1", timeout=0.1))
+    watcher.close()
+
+    assert watcher.pending == {"nb-1": {"a"}}
+    assert not other.done()
+
+
+def test_studio_wait_finds_notebook_of_created_artifacts():
+    watcher, client = _watcher_for([[{"artifact_id": "new", "status": "completed"}]])
+
+    with (
+        patch.object(studio, "_watcher", watcher),
+        patch.dict(studio._created, {"new": ("nb-7", "report")}),
+        patch.dict(TYPE_INTERVALS, {"report": (0.0, 0.0)}),
+    ):
+        result = asyncio.run(studio.studio_wait(artifact_ids=["new"], timeout=10))
+        missing = asyncio.run(studio.studio_wait(artifact_ids=["other"], timeout=1))
+    watcher.close()
+
+    assert result["status"] == "success"
+    client.poll_studio_status.assert_called_with("nb-7")
+    assert missing["status"] == "error"
+    assert "notebook_id is required" in missing["error"]
+
+
+def test_studio_status_passes_cursor_and_omits_content_by_default():
+    status_result = {
+        "artifacts": [],
+        "total": 2,
+        "completed": 2,
+        "in_progress": 0,
+        "cursor": "c2",
+        "incremental": True,
+        "removed": ["gone"],
+    }
+    with (
+        patch("notebooklm_tools.mcp.tools.studio.get_client", return_value=MagicMock()),
+        patch(
+            "notebooklm_tools.mcp.tools.studio.studio_service.get_studio_status",
+            return_value=status_result,
+        ) as get_status,
+    ):
+        result = studio.studio_status(notebook_id="nb-1", since="c1")
+
+    get_status.assert_called_once_with(ANY, "nb-1", since="c1", include_content=False)
+    assert result["cursor"] == "c2"
+    assert result["incremental"] is True
+    assert result["removed"] == ["gone"]
+    assert result["summary"]["total"] == 2